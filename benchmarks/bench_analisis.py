@@ -0,0 +1,81 @@
+"""
+Benchmark de la exportación para análisis
+Compara la exportación de transacciones a Excel (openpyxl, solo escritura) con
+la exportación columnar de pandas a CSV comprimido y, si hay pyarrow, a Parquet
+
+Uso:
+    python benchmarks/bench_analisis.py [cantidad_filas]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.database import DatabaseManager
+from utils.analytics_exporter import PARQUET_DISPONIBLE, AnalyticsExporter
+from utils.excel_exporter import ExcelExporter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_excel import DESDE, HASTA, poblar
+
+
+def tamanio(ruta: Path) -> float:
+    """Tamaño en MB de un archivo o de todos los archivos de una carpeta"""
+    archivos = ruta.rglob('*') if ruta.is_dir() else [ruta]
+    return sum(p.stat().st_size for p in archivos if p.is_file()) / 1024 / 1024
+
+
+def medir(nombre: str, funcion, carpeta: Path, cantidad: int) -> float:
+    inicio = time.perf_counter()
+    resultado = funcion()
+    duracion = time.perf_counter() - inicio
+    print(f"{nombre:<35} {duracion:8.2f} s   {cantidad / duracion:10,.0f} filas/s   "
+          f"{tamanio(carpeta / resultado):8.2f} MB")
+    return duracion
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db = DatabaseManager(tmp / 'bench.db')
+        poblar(db, cantidad)
+        print(f"Exportación de {cantidad:,} transacciones")
+
+        excel = ExcelExporter()
+        excel.exports_path = tmp
+        analisis = AnalyticsExporter()
+        analisis.exports_path = tmp
+
+        duracion_excel = medir(
+            "Excel (openpyxl, solo escritura)",
+            lambda: excel.exportar_transacciones(db.iterar_transacciones_periodo(DESDE, HASTA), DESDE, HASTA),
+            tmp, cantidad
+        )
+        duracion_csv = medir(
+            "CSV gzip (pandas por lotes)",
+            lambda: analisis.exportar(db, tablas=('transacciones',), formato='csv'),
+            tmp, cantidad
+        )
+        print(f"Aceleración CSV: x{duracion_excel / duracion_csv:.1f}")
+
+        if PARQUET_DISPONIBLE:
+            duracion_parquet = medir(
+                "Parquet zstd (pandas por lotes)",
+                lambda: analisis.exportar(db, tablas=('transacciones',), formato='parquet'),
+                tmp, cantidad
+            )
+            print(f"Aceleración Parquet: x{duracion_excel / duracion_parquet:.1f}")
+        else:
+            print("Parquet omitido: pyarrow no está instalado")
+
+
+if __name__ == '__main__':
+    main()
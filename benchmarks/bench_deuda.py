@@ -0,0 +1,74 @@
+"""
+Benchmark de las cuotas esperadas
+Mide la generación de una temporada completa, su repetición (no inserta nada),
+un aumento de aranceles, la consulta de deuda y de morosos sobre las cuotas
+impagas y la antigüedad de la deuda (resumen por tramos y recorrido del detalle)
+
+Uso:
+    python benchmarks/bench_deuda.py [cantidad_socios]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.database import DatabaseManager
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_proyeccion import poblar_socios
+
+
+def cronometrar(nombre: str, funcion):
+    """Ejecuta la función una vez e imprime cuánto tardó"""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    print(f"{nombre:<36} {(time.perf_counter() - inicio) * 1000:8.1f} ms")
+    return resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(Path(tmp) / 'bench.db')
+        poblar_socios(db, cantidad)
+
+        # Inscriptos antes de la temporada, y un 15% de las cuotas sin pagar
+        conn = db.connect()
+        conn.execute("UPDATE socios SET fecha_inscripcion = '2024-03-01'")
+        conn.execute('DELETE FROM cuotas WHERE abs(random()) % 100 < 15')
+        conn.commit()
+        db.disconnect()
+        print(f"Temporada 2025 con {cantidad:,} socios")
+
+        resultado = cronometrar("generar la temporada",
+                                lambda: db.generar_cuotas_esperadas(2025, 12))
+        print(f"    {resultado['generadas']:,} cuotas esperadas, {resultado['morosos']:,} morosos")
+        resultado = cronometrar("repetir la generación",
+                                lambda: db.generar_cuotas_esperadas(2025, 12))
+        print(f"    {resultado['generadas']:,} cuotas nuevas")
+
+        resultado = cronometrar("aumento del 20% desde julio",
+                                lambda: db.actualizar_aranceles({'U15': 6000}, 2025, 7))
+        print(f"    {resultado['cuotas_revaluadas']:,} cuotas impagas revaluadas")
+
+        deuda = cronometrar("deuda desde cuotas impagas", lambda: db.obtener_deuda_socios(2025, 12))
+        morosos = cronometrar("morosos desde cuotas impagas", lambda: db.obtener_socios_morosos(2025, 12))
+        print(f"    {len(deuda):,} socios con deuda, {len(morosos):,} con cuotas vencidas")
+
+        resumen = cronometrar("antigüedad: resumen por tramos",
+                              lambda: db.obtener_resumen_atrasos('2026-01-15'))
+        detalle = cronometrar("antigüedad: recorrer el detalle",
+                              lambda: sum(1 for _ in db.iterar_atrasos('2026-01-15')))
+        print(f"    {sum(fila['socios'] for fila in resumen):,} socios en {len(resumen)} tramos, "
+              f"{detalle:,} en el detalle")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark de la exportación de transacciones a Excel
+Mide tiempo y pico de memoria de la exportación en modo streaming (lectura por
+lotes + libro de solo escritura) contra el libro en memoria con estilos por celda
+
+Uso:
+    python benchmarks/bench_excel.py [cantidad_filas] [filas_comparacion]
+"""
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import openpyxl
+from openpyxl.styles import Border, Font, PatternFill, Side
+
+from database.database import DatabaseManager
+from utils.excel_exporter import ExcelExporter
+
+DESDE = '2020-01-01'
+HASTA = '2025-12-31'
+
+
+def poblar(db: DatabaseManager, cantidad: int):
+    """Inserta transacciones sintéticas repartidas en seis años"""
+    inicio = date(2020, 1, 1)
+    categorias = ['Cuotas', 'Sponsors', 'Buffet', 'Mantenimiento', 'Servicios', 'Arbitrajes']
+    filas = (
+        (
+            'ingreso' if i % 3 else 'egreso',
+            random.choice(categorias),
+            f"Movimiento {i}",
+            round(random.uniform(100, 50000), 2),
+            (inicio + timedelta(days=random.randrange(2190))).isoformat(),
+            'Efectivo',
+            f"C-{i:07d}",
+            'Tesorería'
+        )
+        for i in range(cantidad)
+    )
+
+    conn = db.connect()
+    conn.executemany('''
+        INSERT INTO transacciones (tipo, categoria, descripcion, monto, fecha,
+                                   metodo_pago, comprobante, responsable)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', filas)
+    conn.commit()
+    db.disconnect()
+
+
+def exportar_en_memoria(transacciones: list, ruta: Path):
+    """Exportación anterior: libro completo en memoria y estilos celda por celda"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    borde = Border(left=Side(style='thin'), right=Side(style='thin'),
+                   top=Side(style='thin'), bottom=Side(style='thin'))
+
+    ws.append(["Fecha", "Tipo", "Categoría", "Descripción", "Monto", "Método", "Comprobante", "Responsable"])
+    for cell in ws[1]:
+        cell.fill = PatternFill(start_color="1D71B8", end_color="1D71B8", fill_type="solid")
+        cell.font = Font(bold=True, color="FFFFFF", size=12)
+
+    for trans in transacciones:
+        ws.append([
+            trans['fecha'], trans['tipo'].capitalize(), trans['categoria'], trans['descripcion'],
+            trans['monto'], trans['metodo_pago'], trans['comprobante'], trans['responsable']
+        ])
+        for cell in ws[ws.max_row]:
+            cell.border = borde
+
+    for row in range(2, ws.max_row + 1):
+        ws[f'E{row}'].number_format = '"$"#,##0.00'
+
+    wb.save(str(ruta))
+
+
+def medir(nombre: str, funcion, *args):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcion(*args)
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<45} {duracion:8.1f} s   pico {pico / 1024 / 1024:8.1f} MB")
+    return duracion, pico
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    comparacion = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        exporter = ExcelExporter()
+        exporter.exports_path = tmp
+
+        db = DatabaseManager(tmp / 'bench.db')
+        poblar(db, comparacion)
+        print(f"Exportación de {comparacion:,} transacciones")
+
+        _, pico_memoria = medir(
+            "en memoria (lista + estilos por celda)",
+            lambda: exportar_en_memoria(db.obtener_transacciones_periodo(DESDE, HASTA), tmp / 'legacy.xlsx')
+        )
+        _, pico_stream = medir(
+            "streaming (lotes + solo escritura)",
+            lambda: exporter.exportar_transacciones(db.iterar_transacciones_periodo(DESDE, HASTA), DESDE, HASTA)
+        )
+        print(f"Reducción del pico de memoria: x{pico_memoria / pico_stream:.1f}")
+
+        if cantidad > comparacion:
+            poblar(db, cantidad - comparacion)
+            print(f"\nExportación de {cantidad:,} transacciones")
+            medir(
+                "streaming (lotes + solo escritura)",
+                lambda: exporter.exportar_transacciones(db.iterar_transacciones_periodo(DESDE, HASTA), DESDE, HASTA)
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Micro-benchmark del formateo de filas para mostrar
+Compara el strptime/f-string por fila contra la etapa de formateo por lote
+
+Uso:
+    python benchmarks/bench_formato.py [cantidad_filas]
+"""
+
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.formatters import fecha_a_texto, monto_a_texto, preparar_para_mostrar
+
+
+def generar_transacciones(cantidad: int) -> list:
+    """Genera transacciones sintéticas con fechas y montos de dos años"""
+    inicio = date(2024, 1, 1)
+    montos = [5000.0, 7500.0, 12000.0, 1500.5, 320.0, 98000.0]
+    return [
+        {
+            'id': i,
+            'fecha': (inicio + timedelta(days=random.randrange(730))).isoformat(),
+            'monto': random.choice(montos) if i % 5 else round(random.uniform(1, 100000), 2)
+        }
+        for i in range(cantidad)
+    ]
+
+
+def formateo_por_fila(transacciones: list) -> list:
+    """Formateo original: strptime y f-string en cada render"""
+    return [
+        (
+            datetime.strptime(t['fecha'], '%Y-%m-%d').strftime('%d/%m/%Y'),
+            f"${t['monto']:,.2f}"
+        )
+        for t in transacciones
+    ]
+
+
+def medir(nombre: str, funcion, *args):
+    inicio = time.perf_counter()
+    funcion(*args)
+    duracion = time.perf_counter() - inicio
+    print(f"{nombre:<45} {duracion * 1000:10.1f} ms")
+    return duracion
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(42)
+    transacciones = generar_transacciones(cantidad)
+    print(f"Formateo de {cantidad:,} filas")
+
+    base = medir("strptime + f-string por fila", formateo_por_fila, transacciones)
+
+    fecha_a_texto.cache_clear()
+    monto_a_texto.cache_clear()
+    lote = [dict(t) for t in transacciones]
+    frio = medir("por lote, caché vacía", preparar_para_mostrar, lote, ('fecha',), ('monto',))
+
+    otro_lote = [dict(t) for t in transacciones]
+    caliente = medir("por lote, caché caliente (otra pestaña)", preparar_para_mostrar,
+                     otro_lote, ('fecha',), ('monto',))
+
+    reuso = medir("mismas filas ya preparadas (exportación)", preparar_para_mostrar, lote, ('fecha',), ('monto',))
+
+    print(f"Aceleración caché vacía:   x{base / frio:.1f}")
+    print(f"Aceleración caché caliente: x{base / caliente:.1f}")
+    print(f"Aceleración reutilización: x{base / reuso:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark de la grilla de pagos
+Compara la consulta pivot de un año contra armar la grilla pidiendo el
+historial de cada socio, y muestra el plan de la consulta
+
+Uso:
+    python benchmarks/bench_grilla.py [cantidad_socios]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.database import DatabaseManager
+from ui.views.socios_view import COLUMNAS_HISTORIAL
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_proyeccion import poblar_socios
+
+
+def grilla_por_socio(db: DatabaseManager, anio: int) -> dict:
+    """La misma grilla, con una consulta de historial por socio"""
+    grilla = {}
+    for socio in db.obtener_todos_socios(columnas=('apellido', 'nombre')):
+        pagos = [None] * 12
+        for cuota in db.obtener_cuotas_socio(socio['id'], columnas=COLUMNAS_HISTORIAL):
+            if cuota['anio'] == anio:
+                pagos[cuota['mes'] - 1] = cuota['monto']
+        grilla[socio['id']] = pagos
+    return grilla
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(Path(tmp) / 'bench.db')
+        poblar_socios(db, cantidad)
+        print(f"Grilla de pagos 2025 con {cantidad:,} socios")
+
+        inicio = time.perf_counter()
+        grilla_por_socio(db, 2025)
+        print(f"{'un historial por socio':<24} {(time.perf_counter() - inicio) * 1000:8.1f} ms  "
+              f"{cantidad + 1:,} consultas")
+
+        inicio = time.perf_counter()
+        filas = db.obtener_grilla_pagos(2025)
+        print(f"{'consulta pivot':<24} {(time.perf_counter() - inicio) * 1000:8.1f} ms  "
+              f"1 consulta, {len(filas):,} filas")
+        print("Plan: " + ' / '.join(db.plan_consulta('obtener_grilla_pagos')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark de la importación de planillas
+Genera planillas de socios (.xlsx) y cuotas (.csv) y mide las filas importadas
+por segundo, incluyendo lectura, validación e inserción
+
+Uso:
+    python benchmarks/bench_importacion.py [cantidad_filas]
+"""
+
+import csv
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import openpyxl
+
+from config.settings import CATEGORIAS_BASQUET, MESES
+from database.database import DatabaseManager
+from utils.importer import DataImporter
+
+
+def generar_socios(ruta: Path, cantidad: int):
+    """Planilla de socios con un título arriba, como las heredadas"""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Socios")
+    ws.append(["Padrón de socios"])
+    ws.append(["Apellido", "Nombre", "DNI", "Categoría", "Fecha de nacimiento", "Teléfono", "Email"])
+    for i in range(cantidad):
+        ws.append([
+            f"Apellido{i}", f"Nombre{i}", f"{30000000 + i:,}".replace(',', '.'),
+            random.choice(CATEGORIAS_BASQUET), f"{random.randint(1, 28):02d}/05/20{random.randint(5, 15):02d}",
+            "3794 123456", f"socio{i}@correo.com"
+        ])
+    wb.save(str(ruta))
+
+
+def generar_cuotas(ruta: Path, cantidad: int):
+    """CSV de cuotas con separador ';' y montos con coma decimal"""
+    with open(ruta, 'w', newline='', encoding='cp1252') as archivo:
+        escritor = csv.writer(archivo, delimiter=';')
+        escritor.writerow(["DNI", "Mes", "Año", "Importe", "Fecha de pago"])
+        for i in range(cantidad):
+            mes = i % 12 + 1
+            escritor.writerow([30000000 + i // 12, MESES[mes - 1], 2024, "5.000,00", f"10/{mes:02d}/2024"])
+
+
+def medir(nombre: str, importer: DataImporter, db: DatabaseManager, ruta: Path, tipo: str):
+    resultado = importer.importar(db, ruta, tipo)
+    print(f"{nombre:<20} {resultado['importadas']:8,} importadas   {resultado['rechazadas']:6,} rechazadas   "
+          f"{resultado['segundos']:6.2f} s   {resultado['leidas'] / resultado['segundos']:8,.0f} filas/s")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        generar_socios(tmp / 'socios.xlsx', cantidad)
+        generar_cuotas(tmp / 'cuotas.csv', cantidad)
+
+        db = DatabaseManager(tmp / 'bench.db')
+        importer = DataImporter()
+        importer.exports_path = tmp
+        print(f"Importación de {cantidad:,} filas por archivo")
+
+        medir("socios (.xlsx)", importer, db, tmp / 'socios.xlsx', 'socios')
+        medir("cuotas (.csv)", importer, db, tmp / 'cuotas.csv', 'cuotas')
+
+
+if __name__ == '__main__':
+    main()
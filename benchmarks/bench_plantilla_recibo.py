@@ -0,0 +1,60 @@
+"""
+Benchmark de la plantilla de recibos
+Mide recibos por segundo y tamaño de los archivos generados, tanto de a un
+recibo por archivo como en un PDF combinado
+
+Uso:
+    python benchmarks/bench_plantilla_recibo.py [cantidad_recibos]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import ASSETS_PATH
+from utils.pdf_generator import PDFGenerator, datos_recibo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_recibos import generar_cuotas
+
+
+def tamanio_total(carpeta: Path) -> int:
+    return sum(p.stat().st_size for p in carpeta.rglob('*.pdf'))
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    cuotas = generar_cuotas(cantidad)
+
+    generador = PDFGenerator()
+    # El logo puede venir con otra capitalización según el sistema de archivos
+    logo = next(ASSETS_PATH.glob('[Ll]ogo.png'), None)
+    if logo is not None:
+        generador.logo_path = logo
+    print(f"Generación de {cantidad:,} recibos (logo: {logo is not None})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generador.exports_path = Path(tmp) / 'individuales'
+        generador.exports_path.mkdir()
+        inicio = time.perf_counter()
+        for cuota in cuotas:
+            generador.generar_recibo_cuota(datos_recibo(cuota))
+        segundos = time.perf_counter() - inicio
+        tamanio = tamanio_total(generador.exports_path)
+        print(f"{'un recibo por llamada':<25} {cantidad / segundos:8.1f} recibos/s   "
+              f"{tamanio / cantidad / 1024:8.1f} KB por recibo")
+
+        generador.exports_path = Path(tmp) / 'combinado'
+        generador.exports_path.mkdir()
+        resultado = generador.generar_recibos_lote(cuotas, combinar=True)
+        tamanio = tamanio_total(generador.exports_path)
+        print(f"{'PDF combinado':<25} {resultado['recibos_por_segundo']:8.1f} recibos/s   "
+              f"{tamanio / cantidad / 1024:8.1f} KB por recibo ({tamanio / 1024 / 1024:.2f} MB en total)")
+
+
+if __name__ == '__main__':
+    main()
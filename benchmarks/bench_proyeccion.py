@@ -0,0 +1,90 @@
+"""
+Benchmark de las proyecciones de los listados
+Compara SELECT * con las columnas que declaran las vistas: tiempo, bytes
+leídos y si SQLite responde solo con el índice de cobertura
+
+Uso:
+    python benchmarks/bench_proyeccion.py [cantidad_socios]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.database import DatabaseManager
+from ui.views.finanzas_view import COLUMNAS_LISTADO as COLUMNAS_TRANSACCIONES
+from ui.views.socios_view import COLUMNAS_HISTORIAL
+from ui.views.socios_view import COLUMNAS_LISTADO as COLUMNAS_SOCIOS
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_excel import DESDE, HASTA, poblar
+
+
+def poblar_socios(db: DatabaseManager, cantidad: int):
+    """Inserta socios con dirección y observaciones, y doce cuotas para cada uno"""
+    conn = db.connect()
+    conn.executemany('''
+        INSERT INTO socios (nombre, apellido, dni, telefono, email, direccion, categoria, observaciones)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        (f"Nombre{i}", f"Apellido{random.randrange(5000)}", str(20000000 + i), f"379 4{i % 1000000:06d}",
+         f"socio{i}@correo.com", f"Calle {random.randrange(3000)} N° {i % 900}, Corrientes", 'U15',
+         "Autorización médica presentada; retira un familiar; beca parcial por hermanos " * 2)
+        for i in range(cantidad)
+    ))
+    conn.executemany('''
+        INSERT INTO cuotas (socio_id, mes, anio, monto, fecha_pago, metodo_pago, recibo_numero, observaciones)
+        VALUES (?, ?, 2025, 5000, ?, 'Efectivo', ?, 'Pago en secretaría')
+    ''', ((socio_id, mes, f"2025-{mes:02d}-10", f"R-{socio_id}-{mes}")
+          for socio_id in range(1, cantidad + 1) for mes in range(1, 13)))
+    conn.commit()
+    db.disconnect()
+
+
+def medir(db: DatabaseManager, nombre: str, consulta: str, funcion, repeticiones: int = 3):
+    """Mejor tiempo de varias ejecuciones, con las filas, bytes y plan de la última"""
+    db.lecturas.clear()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    lectura = db.estadisticas_lecturas()[consulta]
+    plan = ' / '.join(db.plan_consulta(consulta))
+    print(f"{nombre:<34} {min(tiempos) * 1000:8.1f} ms  {lectura['filas'] // repeticiones:>8,} filas  "
+          f"{lectura['bytes'] / repeticiones / 1024 / 1024:7.2f} MB   {plan}")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(Path(tmp) / 'bench.db')
+        poblar_socios(db, cantidad)
+        poblar(db, cantidad * 4)
+        db.medir_bytes = True
+        print(f"Listados con {cantidad:,} socios y {cantidad * 4:,} transacciones")
+
+        medir(db, "socios SELECT *", 'obtener_todos_socios', lambda: db.obtener_todos_socios())
+        medir(db, "socios proyección", 'obtener_todos_socios',
+              lambda: db.obtener_todos_socios(columnas=COLUMNAS_SOCIOS))
+        medir(db, "transacciones SELECT *", 'obtener_transacciones_periodo',
+              lambda: db.obtener_transacciones_periodo(DESDE, HASTA))
+        medir(db, "transacciones proyección", 'obtener_transacciones_periodo',
+              lambda: db.obtener_transacciones_periodo(DESDE, HASTA, columnas=COLUMNAS_TRANSACCIONES))
+
+        socio_ids = random.sample(range(1, cantidad + 1), 200)
+        medir(db, "200 historiales SELECT *", 'obtener_cuotas_socio',
+              lambda: [db.obtener_cuotas_socio(socio_id) for socio_id in socio_ids])
+        medir(db, "200 historiales proyección", 'obtener_cuotas_socio',
+              lambda: [db.obtener_cuotas_socio(socio_id, columnas=COLUMNAS_HISTORIAL) for socio_id in socio_ids])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark de la generación de recibos en lote
+Compara la generación secuencial, el pool de procesos y el PDF combinado
+
+Uso:
+    python benchmarks/bench_recibos.py [cantidad_recibos] [procesos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.pdf_generator import PDFGenerator
+
+
+def generar_cuotas(cantidad: int) -> list:
+    """Genera cuotas sintéticas con los datos de socio que usa el recibo"""
+    categorias = ['Mini', 'U13', 'U15', 'U17', 'Mayores']
+    return [
+        {
+            'id': i,
+            'socio_id': i,
+            'nombre': f"Nombre{i}",
+            'apellido': f"Apellido{i}",
+            'dni': str(30000000 + i),
+            'categoria': random.choice(categorias),
+            'mes': 3,
+            'anio': 2026,
+            'monto': 5000.0,
+            'metodo_pago': 'Efectivo',
+            'fecha_pago': '2026-03-05',
+            'recibo_numero': None
+        }
+        for i in range(1, cantidad + 1)
+    ]
+
+
+def medir(nombre: str, generador: PDFGenerator, cuotas: list, **kwargs) -> float:
+    resultado = generador.generar_recibos_lote(cuotas, **kwargs)
+    print(f"{nombre:<30} {resultado['segundos']:8.2f} s   {resultado['recibos_por_segundo']:8.1f} recibos/s")
+    return resultado['recibos_por_segundo']
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    random.seed(42)
+    cuotas = generar_cuotas(cantidad)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generador = PDFGenerator()
+        generador.exports_path = Path(tmp)
+        print(f"Generación de {cantidad:,} recibos ({procesos} procesos)")
+
+        secuencial = medir("secuencial, un PDF por recibo", generador, cuotas, procesos=1)
+        paralelo = medir("pool de procesos", generador, cuotas, procesos=procesos)
+        medir("un solo PDF combinado", generador, cuotas, combinar=True)
+
+        print(f"Aceleración del pool: x{paralelo / secuencial:.1f}")
+
+
+if __name__ == '__main__':
+    main()
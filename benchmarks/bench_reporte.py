@@ -0,0 +1,56 @@
+"""
+Benchmark del reporte financiero
+Mide el tiempo de las consultas agregadas y de la generación del PDF para el
+reporte mensual y el anual sobre una base con un año completo de movimientos
+
+Uso:
+    python benchmarks/bench_reporte.py [cantidad_transacciones]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.database import DatabaseManager
+from utils.pdf_generator import PDFGenerator
+from utils.reportes import datos_reporte_financiero
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_excel import poblar
+
+
+def medir(nombre: str, db: DatabaseManager, generador: PDFGenerator, anio: int, mes=None):
+    inicio = time.perf_counter()
+    datos = datos_reporte_financiero(db, anio, mes)
+    consultas = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    generador.generar_reporte_financiero(datos)
+    pdf = time.perf_counter() - inicio
+
+    print(f"{nombre:<20} consultas {consultas * 1000:8.1f} ms   PDF {pdf * 1000:8.1f} ms   "
+          f"total {(consultas + pdf) * 1000:8.1f} ms")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(Path(tmp) / 'bench.db')
+        poblar(db, cantidad)
+        generador = PDFGenerator()
+        generador.exports_path = Path(tmp)
+        print(f"Reporte financiero sobre {cantidad:,} transacciones (2020-2025)")
+
+        medir("mensual (jun 2025)", db, generador, 2025, 6)
+        medir("anual (2025)", db, generador, 2025)
+
+
+if __name__ == '__main__':
+    main()
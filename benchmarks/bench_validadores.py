@@ -0,0 +1,98 @@
+"""
+Benchmark de los validadores por lote
+Compara validar valor por valor contra validar columnas completas, y mide la
+validación de lotes de socios y cuotas como se usa en la importación
+
+Uso:
+    python benchmarks/bench_validadores.py [cantidad_filas]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import CATEGORIAS_BASQUET, IMPORT_CONFIG, MESES
+from utils.importer import a_dni, a_texto, validar_lote_cuotas, validar_lote_socios
+from utils.validators import (
+    validar_dni,
+    validar_dnis,
+    validar_email,
+    validar_emails,
+    validar_fecha,
+    validar_fechas,
+    validar_telefono,
+    validar_telefonos,
+)
+
+
+def generar_columnas(cantidad: int):
+    """Columnas con los formatos que traen las planillas heredadas y algunos errores"""
+    dnis = [f"{30000000 + i:,}".replace(',', '.') if i % 3 else float(30000000 + i) for i in range(cantidad)]
+    emails = [f"socio{i}@correo.com" if i % 50 else "sin-arroba" for i in range(cantidad)]
+    telefonos = [f"(379) 4{i % 1000000:06d}" if i % 4 else None for i in range(cantidad)]
+    fechas = [f"{random.randint(1, 31):02d}/{random.randint(1, 12):02d}/20{random.randint(5, 15):02d}"
+              for _ in range(cantidad)]
+    return {'dni': dnis, 'email': emails, 'telefono': telefonos, 'fecha': fechas}
+
+
+def por_valor(columnas):
+    """Validación fila por fila con los validadores de a un valor"""
+    for dni, email, telefono, fecha in zip(*columnas.values(), strict=True):
+        validar_dni(a_dni(dni))
+        validar_email(a_texto(email))
+        validar_telefono(a_texto(telefono))
+        validar_fecha(a_texto(fecha))
+
+
+def por_columna(columnas):
+    """Validación por columnas con los validadores por lote"""
+    validar_dnis(columnas['dni'])
+    validar_emails(columnas['email'])
+    validar_telefonos(columnas['telefono'])
+    validar_fechas(columnas['fecha'], ('%d/%m/%Y',))
+
+
+def lotes(filas, tamanio):
+    for inicio in range(0, len(filas), tamanio):
+        yield filas[inicio:inicio + tamanio]
+
+
+def medir(nombre: str, funcion, cantidad: int):
+    inicio = time.perf_counter()
+    funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<32} {segundos:6.2f} s   {cantidad / segundos:10,.0f} filas/s")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(42)
+    columnas = generar_columnas(cantidad)
+    print(f"Validación de {cantidad:,} filas")
+
+    medir("por valor (DNI/email/tel/fecha)", lambda: por_valor(columnas), cantidad)
+    medir("por columna", lambda: por_columna(columnas), cantidad)
+
+    socios = [(i, {
+        'dni': columnas['dni'][i], 'apellido': f"Apellido{i}", 'nombre': f"Nombre{i}",
+        'categoria': random.choice(CATEGORIAS_BASQUET).upper(), 'fecha_nacimiento': columnas['fecha'][i],
+        'telefono': columnas['telefono'][i], 'email': columnas['email'][i]
+    }) for i in range(cantidad)]
+    ids_por_dni = {str(30000000 + i): i for i in range(cantidad)}
+    cuotas = [(i, {
+        'dni': str(30000000 + i // 12), 'mes': MESES[i % 12], 'anio': 2024,
+        'monto': "$ 5.000,00", 'fecha_pago': f"10/{i % 12 + 1:02d}/2024"
+    }) for i in range(cantidad)]
+
+    tamanio = IMPORT_CONFIG['lote']
+    medir(f"lotes de socios ({tamanio:,})",
+          lambda: [validar_lote_socios(lote, set()) for lote in lotes(socios, tamanio)], cantidad)
+    medir(f"lotes de cuotas ({tamanio:,})",
+          lambda: [validar_lote_cuotas(lote, ids_por_dni, set()) for lote in lotes(cuotas, tamanio)], cantidad)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATABASE_PATH = BASE_DIR / "data" / "club_donbosco.db"
 ASSETS_PATH = BASE_DIR / "assets"
 EXPORTS_PATH = BASE_DIR / "exports"
+DASHBOARD_SNAPSHOT_PATH = BASE_DIR / "data" / "dashboard_snapshot.json"
 
 # Crear directorios si no existen
 os.makedirs(BASE_DIR / "data", exist_ok=True)
@@ -53,6 +54,21 @@ CATEGORIAS_BASQUET = [
     'Escuelita'
 ]
 
+# Cuota mensual inicial de cada categoría: se carga como primer arancel al
+# crear la base; los aumentos se registran después desde "Aranceles"
+MONTO_CUOTA_BASE = 5000
+MONTOS_CUOTA = {categoria: MONTO_CUOTA_BASE for categoria in CATEGORIAS_BASQUET}
+
+# Tramos de antigüedad de la deuda: días desde el vencimiento de la cuota impaga
+# más antigua (vence el primer día del mes siguiente) y su nombre. El último no
+# tiene tope
+TRAMOS_ATRASO = (
+    (30, 'Hasta 30 días'),
+    (60, '31 a 60 días'),
+    (90, '61 a 90 días'),
+    (None, 'Más de 90 días')
+)
+
 # Categorías de Transacciones Financieras
 CATEGORIAS_INGRESOS = [
     'Cuotas Socios',
@@ -81,6 +97,12 @@ ESTADOS_PAGO = {
     'exento': 'Exento'
 }
 
+# Nombres de los meses (índice 0 = enero)
+MESES = [
+    'Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio',
+    'Julio', 'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre'
+]
+
 # Configuración de la ventana principal
 WINDOW_CONFIG = {
     'title': 'Club Don Bosco - Sistema de Gestión',
@@ -88,4 +110,25 @@ WINDOW_CONFIG = {
     'height': 900,
     'min_width': 1200,
     'min_height':  700
-}
\ No newline at end of file
+}
+
+# Precarga de datos en segundo plano
+PREFETCH_CONFIG = {
+    'espera_ms': 1500,          # Inactividad requerida antes de precargar
+    'presupuesto_mb': 32,       # Memoria máxima para datos precargados
+    'socios_recientes': 5       # Historiales de cuotas a mantener precargados
+}
+
+# Exportaciones en segundo plano
+EXPORT_CONFIG = {
+    'max_trabajos': 2,          # Exportaciones simultáneas
+    'historial': 20,            # Trabajos finalizados que se conservan en el panel
+    'lote_analisis': 20000,     # Filas por lote en la exportación para análisis
+    'retencion_dias': 90,       # Antigüedad máxima de los archivos en exports/
+    'retencion_mb': 1024        # Tamaño máximo de la carpeta exports/
+}
+
+# Importación de planillas
+IMPORT_CONFIG = {
+    'lote': 10000               # Filas validadas e insertadas por vez (validación por columnas)
+}
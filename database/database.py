@@ -3,16 +3,183 @@ Gestor de Base de Datos SQLite
 Maneja todas las operaciones CRUD del sistema
 """
 
+import logging
 import sqlite3
+import threading
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-import logging
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from config.settings import MONTO_CUOTA_BASE, MONTOS_CUOTA, TRAMOS_ATRASO
+from utils.formatters import preparar_para_mostrar
+from utils.validators import normalizar_dni
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Campos que se formatean para mostrar al leer cada tabla
+CAMPOS_SOCIOS = {'fechas': ('fecha_ultimo_pago', 'fecha_inscripcion')}
+CAMPOS_CUOTAS = {'fechas': ('fecha_pago',), 'montos': ('monto',)}
+CAMPOS_TRANSACCIONES = {'fechas': ('fecha',), 'montos': ('monto',)}
+
+# Cuotas esperadas impagas y vencidas de cada socio (parámetro: el último período
+# vencido), las mismas que definen su estado de pago
+SQL_DEUDA_VENCIDA = '''
+    SELECT socio_id, COUNT(*) AS meses_adeudados, SUM(monto) AS monto_adeudado
+    FROM cuotas_esperadas
+    WHERE cuota_id IS NULL AND periodo <= ?
+    GROUP BY socio_id
+'''
+
+# Período (anio * 12 + mes - 1) en que se inscribió el socio
+SQL_PERIODO_INSCRIPCION = '''(
+    CAST(strftime('%Y', s.fecha_inscripcion) AS INTEGER) * 12
+        + CAST(strftime('%m', s.fecha_inscripcion) AS INTEGER) - 1
+)'''
+
+# Vigencia de los aranceles iniciales, tomados de MONTOS_CUOTA
+VIGENCIA_ARANCELES_INICIALES = '2020-01-01'
+
+# Pivot de las cuotas de un año: una columna por mes con el monto pagado (NULL si no pagó)
+SQL_PIVOT_MESES = ',\n'.join(
+    f'MAX(CASE WHEN mes = {mes} THEN monto END) AS mes_{mes}' for mes in range(1, 13)
+)
+
+# Tramo de atraso (índice en TRAMOS_ATRASO) según los días de atraso
+SQL_TRAMO_ATRASO = 'CASE {} ELSE {} END'.format(
+    ' '.join(f'WHEN dias_atraso <= {tope} THEN {i}'
+             for i, (tope, _) in enumerate(TRAMOS_ATRASO) if tope is not None),
+    len(TRAMOS_ATRASO) - 1
+)
+
+# Atraso de cada socio a una fecha de corte (parámetros :fecha_corte y :vencido,
+# el último período vencido), listo para consultar la tabla "atrasos". Recorre
+# una sola vez las cuotas esperadas impagas: la ventana por socio numera sus
+# cuotas desde la más antigua y las cuenta y suma, así se queda con una fila por
+# socio sin agrupar ni volver a leer la tabla. Cada cuota vence el primer día
+# del mes siguiente
+SQL_ATRASOS = f'''
+    WITH impagas AS (
+        SELECT socio_id, periodo,
+               ROW_NUMBER() OVER socio AS orden,
+               COUNT(*) OVER socio AS cuotas_impagas,
+               SUM(monto) OVER socio AS monto_adeudado
+        FROM cuotas_esperadas
+        WHERE cuota_id IS NULL AND periodo <= :vencido
+        WINDOW socio AS (PARTITION BY socio_id ORDER BY periodo
+                         ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING)
+    ),
+    dias AS (
+        SELECT s.id, s.apellido, s.nombre, s.dni, s.categoria, s.telefono,
+               i.periodo AS primer_periodo, i.cuotas_impagas, i.monto_adeudado,
+               CAST(julianday(:fecha_corte) - julianday(
+                   printf('%04d-%02d-01', i.periodo / 12, i.periodo % 12 + 1), '+1 month'
+               ) AS INTEGER) AS dias_atraso
+        FROM impagas i
+        JOIN socios s ON s.id = i.socio_id
+        WHERE i.orden = 1 AND s.activo = 1 AND s.estado_pago != 'exento'
+    ),
+    atrasos AS (
+        SELECT *, {SQL_TRAMO_ATRASO} AS tramo FROM dias
+    )
+'''
+
+# DNI como número, sin puntos, comas, guiones ni espacios (NULL si queda algo que
+# no sea un dígito). Debe coincidir con utils.validators.normalizar_dni
+SQL_DNI_LIMPIO = "REPLACE(REPLACE(REPLACE(REPLACE(TRIM(dni), '.', ''), ',', ''), '-', ''), ' ', '')"
+SQL_DNI_NORMALIZADO = f"""
+    CASE WHEN {SQL_DNI_LIMPIO} <> '' AND {SQL_DNI_LIMPIO} NOT GLOB '*[^0-9]*'
+         THEN CAST({SQL_DNI_LIMPIO} AS INTEGER) END
+"""
+
+# Máximo de parámetros por consulta en las búsquedas por lote
+LIMITE_PARAMETROS = 500
+
+# Tablas que se pueden volcar completas para análisis
+TABLAS_ANALISIS = ('socios', 'cuotas', 'transacciones', 'sponsors')
+
+# Tablas con contador de versión: las de análisis y las que definen la deuda
+TABLAS_VERSIONADAS = (*TABLAS_ANALISIS, 'cuotas_esperadas', 'aranceles')
+
+# Índices que responden los listados sin leer la tabla: empiezan por el filtro y
+# el orden de cada listado y siguen con las columnas que muestran las vistas (el
+# ID va incluido en todo índice). Reemplazan a idx_cuotas_socio e idx_transacciones_fecha
+INDICES_LISTADOS = {
+    'idx_socios_listado':
+        'socios(activo, apellido, nombre, dni, categoria, telefono, estado_pago, fecha_ultimo_pago)',
+    'idx_cuotas_historial':
+        'cuotas(socio_id, anio, mes, monto, fecha_pago, metodo_pago, recibo_numero)',
+    'idx_cuotas_grilla':
+        'cuotas(anio, socio_id, mes, monto)',
+    'idx_transacciones_listado':
+        'transacciones(fecha, tipo, categoria, monto, metodo_pago, descripcion)',
+    'idx_sponsors_activos':
+        'sponsors(estado, nombre_empresa)'
+}
+
+# Columnas que usa la búsqueda global, por tabla
+CONSULTAS_BUSQUEDA = {
+    'socios': 'SELECT id, apellido, nombre, dni, categoria FROM socios WHERE activo = 1',
+    'sponsors': 'SELECT id, nombre_empresa, nombre_contacto, tipo_patrocinio, estado FROM sponsors WHERE 1 = 1',
+    'transacciones': 'SELECT id, tipo, descripcion, comprobante, fecha, monto FROM transacciones WHERE 1 = 1'
+}
+
+
+def consultar_en_grupos(cursor, consulta: str, valores: Iterable) -> list[dict]:
+    """
+    Ejecuta una consulta con un IN por cada grupo de hasta LIMITE_PARAMETROS valores
+    
+    Args:
+        cursor: Cursor de una conexión abierta
+        consulta: SQL con '{marcadores}' en lugar de la lista del IN
+        valores: Valores a buscar (se ignoran los repetidos)
+    
+    Returns:
+        Filas de todos los grupos, como diccionarios
+    """
+    valores = sorted(set(valores))
+    filas = []
+    for inicio in range(0, len(valores), LIMITE_PARAMETROS):
+        grupo = valores[inicio:inicio + LIMITE_PARAMETROS]
+        cursor.execute(consulta.format(marcadores=', '.join('?' * len(grupo))), grupo)
+        filas.extend(dict(row) for row in cursor.fetchall())
+    return filas
+
+
+def campos_proyectados(campos: dict[str, tuple], columnas: Iterable[str] | None) -> dict[str, tuple]:
+    """
+    Limita los campos a formatear (CAMPOS_*) a las columnas consultadas
+    
+    Args:
+        campos: Campos de fecha y monto de la tabla
+        columnas: Columnas del SELECT (None si son todas)
+    
+    Returns:
+        Argumentos para preparar_para_mostrar
+    """
+    if columnas is None:
+        return campos
+    return {tipo: tuple(campo for campo in nombres if campo in columnas) for tipo, nombres in campos.items()}
+
+
+def tamanio_valor(valor) -> int:
+    """Bytes aproximados de un valor leído de la base"""
+    if valor is None:
+        return 0
+    if isinstance(valor, (str, bytes)):
+        return len(valor)
+    return 8
+
+
+def periodo_vencido(fecha_corte: str) -> int:
+    """Último período (anio * 12 + mes - 1) vencido a una fecha YYYY-MM-DD: el del mes anterior"""
+    return int(fecha_corte[:4]) * 12 + int(fecha_corte[5:7]) - 2
+
 
 class DatabaseManager:
     """Clase para gestionar todas las operaciones de base de datos"""
@@ -24,10 +191,30 @@ class DatabaseManager:
         Args:
             db_path:  Ruta al archivo de base de datos SQLite
         """
-        self. db_path = db_path
-        self.connection = None
+        self.db_path = db_path
+        self._local = threading.local()  # Una conexión por hilo
+        self.version_datos = 0  # Aumenta con cada conexión que modificó datos
+        self.observadores = []  # Funciones avisadas de cada escritura
+        self.columnas_tablas = {}  # tabla -> columnas existentes, para validar proyecciones
+        
+        # Lecturas de los listados: consulta -> filas, bytes y último SQL ejecutado
+        self.lecturas = {}
+        self.medir_bytes = False  # Sumar los bytes leídos tiene un costo por fila
+        self.lock_lecturas = threading.Lock()
+        
+        # Aranceles en memoria: categoría -> (fechas de vigencia, montos), ordenados
+        self.cache_aranceles = None
         self.create_tables()
     
+    @property
+    def connection(self):
+        """Conexión abierta por el hilo actual"""
+        return getattr(self._local, 'connection', None)
+    
+    @connection.setter
+    def connection(self, value):
+        self._local.connection = value
+    
     def connect(self):
         """Establece conexión con la base de datos"""
         try:
@@ -42,9 +229,112 @@ class DatabaseManager:
     def disconnect(self):
         """Cierra la conexión con la base de datos"""
         if self.connection:
+            if self.connection.total_changes:
+                self.version_datos += 1
             self.connection.close()
+            self.connection = None
             logger.info("Conexión cerrada correctamente")
     
+    def observar(self, funcion: Callable[[str, int | None], None]):
+        """
+        Registra una función que se llama después de cada escritura confirmada
+        
+        La función recibe la tabla y el ID de la fila modificada (None si
+        cambiaron muchas filas a la vez). Puede llamarse desde el hilo que
+        escribió, así que no debe consultar la base ni tocar la interfaz.
+        
+        Args:
+            funcion: Función (tabla, fila_id) -> None
+        """
+        self.observadores.append(funcion)
+    
+    def notificar_cambio(self, tabla: str, fila_id: int | None = None):
+        """Avisa a los observadores que cambió una fila (o toda una tabla)"""
+        for funcion in self.observadores:
+            funcion(tabla, fila_id)
+    
+    # ==================== PROYECCIONES Y LECTURAS ====================
+    
+    def proyeccion(self, tabla: str, columnas: Iterable[str] | None) -> str:
+        """
+        Lista de columnas para el SELECT de un listado
+        
+        Args:
+            tabla: Tabla consultada
+            columnas: Columnas que necesita la vista (None para todas); el ID
+                      se agrega siempre
+        
+        Returns:
+            Columnas separadas por coma, o '*'
+        """
+        if columnas is None:
+            return '*'
+        desconocidas = set(columnas) - self.columnas_tablas[tabla]
+        if desconocidas:
+            raise ValueError(f"Columnas desconocidas en {tabla}: {', '.join(sorted(desconocidas))}")
+        return ', '.join(dict.fromkeys(('id', *columnas)))
+    
+    def registrar_lectura(self, consulta: str, sql: str, parametros: tuple, filas: list[dict]):
+        """
+        Suma las filas leídas por un listado (y sus bytes, si medir_bytes está activo)
+        
+        Args:
+            consulta: Nombre del método que leyó
+            sql: Sentencia ejecutada
+            parametros: Parámetros de la sentencia
+            filas: Filas obtenidas
+        """
+        leidos = sum(tamanio_valor(v) for fila in filas for v in fila.values()) if self.medir_bytes else 0
+        with self.lock_lecturas:
+            lectura = self.lecturas.setdefault(consulta, {'consultas': 0, 'filas': 0, 'bytes': 0})
+            lectura['consultas'] += 1
+            lectura['filas'] += len(filas)
+            lectura['bytes'] += leidos
+            lectura['sql'], lectura['parametros'] = sql, parametros
+    
+    def estadisticas_lecturas(self) -> dict[str, dict]:
+        """
+        Filas y bytes leídos por cada listado desde que se creó el gestor
+        
+        Returns:
+            Diccionario consulta -> {'consultas', 'filas', 'bytes'}
+        """
+        with self.lock_lecturas:
+            return {
+                consulta: {clave: lectura[clave] for clave in ('consultas', 'filas', 'bytes')}
+                for consulta, lectura in self.lecturas.items()
+            }
+    
+    def plan_consulta(self, consulta: str) -> list[str]:
+        """
+        Plan de SQLite para la última ejecución de un listado
+        
+        Un listado respondido solo con el índice muestra "USING COVERING INDEX".
+        
+        Args:
+            consulta: Nombre del método (ver estadisticas_lecturas)
+        
+        Returns:
+            Pasos del plan
+        """
+        with self.lock_lecturas:
+            lectura = self.lecturas.get(consulta)
+        if lectura is None:
+            return []
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {lectura['sql']}", lectura['parametros'])
+            return [row['detail'] for row in cursor.fetchall()]
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener el plan de {consulta}: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
     def create_tables(self):
         """Crea todas las tablas necesarias del sistema"""
         conn = self.connect()
@@ -143,11 +433,107 @@ class DatabaseManager:
             
             # Índices para mejorar rendimiento
             cursor. execute('CREATE INDEX IF NOT EXISTS idx_socios_dni ON socios(dni)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_cuotas_socio ON cuotas(socio_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_transacciones_fecha ON transacciones(fecha)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_transacciones_tipo ON transacciones(tipo)')
+            for indice, definicion in INDICES_LISTADOS.items():
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS {indice} ON {definicion}')
+            cursor.execute('DROP INDEX IF EXISTS idx_cuotas_socio')
+            cursor.execute('DROP INDEX IF EXISTS idx_transacciones_fecha')
+            
+            # DNI normalizado, así "30.123.456" y "30123456" son el mismo socio. Lo
+            # completan los triggers en cada alta o cambio de DNI; al agregar la
+            # columna se calcula para los socios existentes.
+            columnas = {row['name'] for row in cursor.execute('PRAGMA table_info(socios)')}
+            if 'dni_normalizado' not in columnas:
+                cursor.execute('ALTER TABLE socios ADD COLUMN dni_normalizado INTEGER')
+                cursor.execute(f'UPDATE socios SET dni_normalizado = {SQL_DNI_NORMALIZADO}')
+            for evento in ('INSERT', 'UPDATE OF dni'):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS trg_socios_dni_{evento.split()[0].lower()}
+                    AFTER {evento} ON socios
+                    BEGIN
+                        UPDATE socios SET dni_normalizado = {SQL_DNI_NORMALIZADO} WHERE id = NEW.id;
+                    END
+                ''')
+            self.crear_indice_dni(cursor)
+            
+            # Cuotas esperadas: una fila por socio y mes que debería pagarse, con la
+            # cuota que la saldó (NULL mientras se adeuda). Los triggers la vinculan
+            # con cada cuota que se registra o elimina.
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS cuotas_esperadas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    socio_id INTEGER NOT NULL,
+                    mes INTEGER NOT NULL,
+                    anio INTEGER NOT NULL,
+                    periodo INTEGER NOT NULL,
+                    monto REAL NOT NULL,
+                    cuota_id INTEGER,
+                    fecha_generacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (socio_id) REFERENCES socios (id) ON DELETE CASCADE,
+                    UNIQUE(socio_id, mes, anio)
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cuotas_impagas
+                ON cuotas_esperadas(periodo, socio_id, monto, cuota_id) WHERE cuota_id IS NULL
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_cuotas_esperadas_pago
+                AFTER INSERT ON cuotas
+                BEGIN
+                    UPDATE cuotas_esperadas SET cuota_id = NEW.id
+                    WHERE socio_id = NEW.socio_id AND mes = NEW.mes AND anio = NEW.anio;
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_cuotas_esperadas_anulacion
+                AFTER DELETE ON cuotas
+                BEGIN
+                    UPDATE cuotas_esperadas SET cuota_id = NULL WHERE cuota_id = OLD.id;
+                END
+            ''')
+            
+            # Aranceles: cuota mensual de cada categoría desde una fecha de vigencia
+            # (siempre el primer día de un mes). Se cargan los de la configuración
+            # la primera vez.
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS aranceles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    categoria TEXT NOT NULL,
+                    vigente_desde DATE NOT NULL,
+                    monto REAL NOT NULL,
+                    fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(categoria, vigente_desde)
+                )
+            ''')
+            if cursor.execute('SELECT COUNT(*) FROM aranceles').fetchone()[0] == 0:
+                cursor.executemany(
+                    'INSERT INTO aranceles (categoria, vigente_desde, monto) VALUES (?, ?, ?)',
+                    [(categoria, VIGENCIA_ARANCELES_INICIALES, monto) for categoria, monto in MONTOS_CUOTA.items()]
+                )
+            
+            # Contador de versión por tabla, mantenido por triggers ante cualquier cambio
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS versiones_tablas (
+                    tabla TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            for tabla in TABLAS_VERSIONADAS:
+                cursor.execute('INSERT OR IGNORE INTO versiones_tablas (tabla) VALUES (?)', (tabla,))
+                for evento in ('INSERT', 'UPDATE', 'DELETE'):
+                    cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS trg_version_{tabla}_{evento.lower()}
+                        AFTER {evento} ON {tabla}
+                        BEGIN
+                            UPDATE versiones_tablas SET version = version + 1 WHERE tabla = '{tabla}';
+                        END
+                    ''')
             
             conn.commit()
+            
+            for tabla in TABLAS_ANALISIS:
+                self.columnas_tablas[tabla] = {row['name'] for row in cursor.execute(f'PRAGMA table_info({tabla})')}
             logger.info("Todas las tablas creadas exitosamente")
             
         except sqlite3.Error as e:
@@ -157,6 +543,35 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
+    def crear_indice_dni(self, cursor):
+        """
+        Crea el índice único sobre el DNI normalizado
+        
+        El índice incluye el ID del socio, así las búsquedas de IDs por DNI se
+        resuelven sin leer la tabla.
+        
+        Si hay socios cargados dos veces con el DNI escrito de distinta forma, el
+        índice único no se puede crear: se informan los DNIs repetidos y se usa
+        uno común para las búsquedas hasta que se corrijan.
+        
+        Args:
+            cursor: Cursor de la conexión abierta en create_tables
+        """
+        try:
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_socios_dni_normalizado ON socios(dni_normalizado)')
+            cursor.execute('DROP INDEX IF EXISTS idx_socios_dni_repetido')
+        except sqlite3.IntegrityError:
+            cursor.execute('''
+                SELECT GROUP_CONCAT(dni, ' / ') AS dnis
+                FROM socios
+                WHERE dni_normalizado IS NOT NULL
+                GROUP BY dni_normalizado
+                HAVING COUNT(*) > 1
+            ''')
+            repetidos = [row['dnis'] for row in cursor.fetchall()]
+            logger.warning(f"Socios con el mismo DNI escrito de distinta forma: {'; '.join(repetidos)}")
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_socios_dni_repetido ON socios(dni_normalizado)')
+    
     # ==================== OPERACIONES SOCIOS ====================
     
     def agregar_socio(self, datos: Dict) -> int:
@@ -192,6 +607,7 @@ class DatabaseManager:
             conn.commit()
             socio_id = cursor.lastrowid
             logger.info(f"Socio creado exitosamente - ID: {socio_id}")
+            self.notificar_cambio('socios', socio_id)
             return socio_id
             
         except sqlite3.IntegrityError:
@@ -204,12 +620,15 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
-    def obtener_todos_socios(self, solo_activos: bool = True) -> List[Dict]:
+    def obtener_todos_socios(self, solo_activos: bool = True,
+                             columnas: tuple[str, ...] | None = None) -> list[dict]:
         """
         Obtiene todos los socios de la base de datos
         
         Args:
             solo_activos: Si True, solo retorna socios activos
+            columnas: Columnas que se van a usar (None para todas); con las del
+                      listado de socios la consulta se responde desde idx_socios_listado
         
         Returns:
             Lista de diccionarios con datos de socios
@@ -218,7 +637,7 @@ class DatabaseManager:
         cursor = conn.cursor()
         
         try:
-            query = 'SELECT * FROM socios'
+            query = f'SELECT {self.proyeccion("socios", columnas)} FROM socios'
             if solo_activos: 
                 query += ' WHERE activo = 1'
             query += ' ORDER BY apellido, nombre'
@@ -227,7 +646,8 @@ class DatabaseManager:
             rows = cursor.fetchall()
             
             socios = [dict(row) for row in rows]
-            return socios
+            self.registrar_lectura('obtener_todos_socios', query, (), socios)
+            return preparar_para_mostrar(socios, **campos_proyectados(CAMPOS_SOCIOS, columnas))
             
         except sqlite3.Error as e:
             logger.error(f"Error al obtener socios: {e}")
@@ -235,9 +655,37 @@ class DatabaseManager:
         finally: 
             self.disconnect()
     
+    def obtener_socios_por_categoria(self) -> list[dict]:
+        """
+        Cuenta los socios activos de cada categoría
+        
+        Returns:
+            Lista de diccionarios con 'categoria' y 'cantidad'
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT categoria, COUNT(*) AS cantidad
+                FROM socios
+                WHERE activo = 1
+                GROUP BY categoria
+                ORDER BY categoria
+            ''')
+            
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al contar socios por categoría: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
     def buscar_socio_por_dni(self, dni:  str) -> Optional[Dict]:
         """
-        Busca un socio por su DNI
+        Busca un socio por su DNI, escrito con o sin puntos
         
         Args:
             dni:  Número de DNI del socio
@@ -249,11 +697,15 @@ class DatabaseManager:
         cursor = conn.cursor()
         
         try:
-            cursor.execute('SELECT * FROM socios WHERE dni = ?', (dni,))
+            dni_normalizado = normalizar_dni(dni)
+            if dni_normalizado is not None:
+                cursor.execute('SELECT * FROM socios WHERE dni_normalizado = ?', (dni_normalizado,))
+            else:
+                cursor.execute('SELECT * FROM socios WHERE dni = ?', (dni.strip(),))
             row = cursor.fetchone()
             
             if row:
-                return dict(row)
+                return preparar_para_mostrar([dict(row)], **CAMPOS_SOCIOS)[0]
             return None
             
         except sqlite3.Error as e:
@@ -262,13 +714,70 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
-    def actualizar_socio(self, socio_id: int, datos: Dict):
+    def buscar_socios_por_dnis(self, dnis: Iterable[str]) -> dict[int, dict]:
+        """
+        Busca varios socios por DNI con una consulta por cada grupo de DNIs
+        
+        Args:
+            dnis: DNIs escritos con o sin puntos (los que no son numéricos se ignoran)
+        
+        Returns:
+            Diccionario DNI normalizado -> datos del socio (solo los encontrados)
+        """
+        normalizados = {n for n in map(normalizar_dni, dnis) if n is not None}
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            socios = consultar_en_grupos(
+                cursor, 'SELECT * FROM socios WHERE dni_normalizado IN ({marcadores})', normalizados
+            )
+            socios = preparar_para_mostrar(socios, **CAMPOS_SOCIOS)
+            return {socio['dni_normalizado']: socio for socio in socios}
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al buscar socios por DNI: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_socio(self, socio_id: int) -> dict | None:
+        """
+        Obtiene un socio por su ID
+        
+        Args:
+            socio_id: ID del socio
+        
+        Returns:
+            Diccionario con datos del socio o None si no existe
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT * FROM socios WHERE id = ?', (socio_id,))
+            row = cursor.fetchone()
+            
+            if row:
+                return preparar_para_mostrar([dict(row)], **CAMPOS_SOCIOS)[0]
+            return None
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener socio: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def actualizar_socio(self, socio_id: int, datos: dict) -> dict | None:
         """
         Actualiza los datos de un socio
         
         Args:
             socio_id: ID del socio a actualizar
             datos: Diccionario con los nuevos datos
+        
+        Returns:
+            Diccionario con los datos actualizados del socio
         """
         conn = self.connect()
         cursor = conn.cursor()
@@ -293,6 +802,7 @@ class DatabaseManager:
             
             conn.commit()
             logger.info(f"Socio {socio_id} actualizado exitosamente")
+            self.notificar_cambio('socios', socio_id)
             
         except sqlite3.Error as e:
             logger.error(f"Error al actualizar socio: {e}")
@@ -300,6 +810,39 @@ class DatabaseManager:
             raise
         finally: 
             self.disconnect()
+        
+        return self.obtener_socio(socio_id)
+    
+    def eliminar_socio(self, socio_id: int) -> dict | None:
+        """
+        Da de baja un socio (lo marca como inactivo)
+        
+        Args:
+            socio_id: ID del socio
+        
+        Returns:
+            Diccionario con los datos del socio dado de baja
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT * FROM socios WHERE id = ?', (socio_id,))
+            row = cursor.fetchone()
+            
+            cursor.execute('UPDATE socios SET activo = 0 WHERE id = ?', (socio_id,))
+            conn.commit()
+            logger.info(f"Socio {socio_id} dado de baja")
+            self.notificar_cambio('socios', socio_id)
+            
+            return dict(row) if row else None
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al eliminar socio: {e}")
+            conn.rollback()
+            raise
+        finally:
+            self.disconnect()
     
     def actualizar_estado_pago_socio(self, socio_id: int, estado: str, fecha_pago: str = None):
         """
@@ -337,6 +880,81 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
+    def obtener_ids_por_dni(self) -> dict[str, int]:
+        """
+        Obtiene el ID de cada socio indexado por DNI (activos e inactivos)
+        
+        Se lee solo el índice del DNI normalizado, que ya incluye el ID.
+        
+        Returns:
+            Diccionario DNI (solo dígitos) -> ID de socio
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT dni_normalizado, id FROM socios WHERE dni_normalizado IS NOT NULL')
+            return {str(row['dni_normalizado']): row['id'] for row in cursor.fetchall()}
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener DNIs de socios: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def importar_socios(self, lotes: Iterable[list[dict]]) -> int:
+        """
+        Inserta socios en bloque, todos en una misma transacción
+        
+        Los lotes se consumen a medida que llegan; si alguno falla (o el
+        generador lanza una excepción) no queda ningún socio importado.
+        
+        Args:
+            lotes: Listas de diccionarios con los datos de cada socio
+        
+        Returns:
+            Cantidad de socios insertados
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cantidad = 0
+            for lote in lotes:
+                cursor.executemany('''
+                    INSERT INTO socios (nombre, apellido, dni, fecha_nacimiento, telefono, email,
+                                        direccion, categoria, fecha_inscripcion, observaciones)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_DATE), ?)
+                ''', [(
+                    socio['nombre'],
+                    socio['apellido'],
+                    socio['dni'],
+                    socio.get('fecha_nacimiento'),
+                    socio.get('telefono'),
+                    socio.get('email'),
+                    socio.get('direccion'),
+                    socio['categoria'],
+                    socio.get('fecha_inscripcion'),
+                    socio.get('observaciones')
+                ) for socio in lote])
+                cantidad += len(lote)
+            
+            conn.commit()
+            logger.info(f"Socios importados: {cantidad}")
+            self.notificar_cambio('socios')
+            return cantidad
+        
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            logger.error(f"DNI duplicado en la importación: {e}")
+            raise ValueError("La importación contiene un DNI ya registrado") from e
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error al importar socios: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
     # ==================== OPERACIONES CUOTAS ====================
     
     def registrar_cuota(self, datos: Dict) -> int:
@@ -368,11 +986,15 @@ class DatabaseManager:
                 datos.get('observaciones')
             ))
             
-            # Actualizar estado del socio
-            self.actualizar_estado_pago_socio(
-                datos['socio_id'],
-                'al_dia',
-                datos.get('fecha_pago', datetime.now().date())
+            # Actualizar estado del socio (en la misma transacción): queda al día
+            # solo si ya no adeuda cuotas esperadas vencidas
+            cursor.execute('''
+                UPDATE socios 
+                SET fecha_ultimo_pago = ? 
+                WHERE id = ? 
+            ''', (datos.get('fecha_pago', datetime.now().date()), datos['socio_id']))
+            self.actualizar_estados_pago(
+                cursor, periodo_vencido(datetime.now().date().isoformat()), 'SELECT ?', (datos['socio_id'],)
             )
             
             conn.commit()
@@ -390,12 +1012,14 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
-    def obtener_cuotas_socio(self, socio_id: int) -> List[Dict]:
+    def obtener_cuotas_socio(self, socio_id: int, columnas: tuple[str, ...] | None = None) -> list[dict]:
         """
         Obtiene todas las cuotas pagadas por un socio
         
         Args:
             socio_id: ID del socio
+            columnas: Columnas que se van a usar (None para todas); con las del
+                      historial la consulta se responde desde idx_cuotas_historial
         
         Returns:
             Lista de cuotas
@@ -404,14 +1028,16 @@ class DatabaseManager:
         cursor = conn. cursor()
         
         try: 
-            cursor.execute('''
-                SELECT * FROM cuotas 
+            query = f'''
+                SELECT {self.proyeccion("cuotas", columnas)} FROM cuotas 
                 WHERE socio_id = ? 
                 ORDER BY anio DESC, mes DESC
-            ''', (socio_id,))
+            '''
+            cursor.execute(query, (socio_id,))
             
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            cuotas = [dict(row) for row in cursor.fetchall()]
+            self.registrar_lectura('obtener_cuotas_socio', query, (socio_id,), cuotas)
+            return preparar_para_mostrar(cuotas, **campos_proyectados(CAMPOS_CUOTAS, columnas))
             
         except sqlite3.Error as e:
             logger.error(f"Error al obtener cuotas: {e}")
@@ -419,22 +1045,858 @@ class DatabaseManager:
         finally: 
             self.disconnect()
     
-    # ==================== OPERACIONES FINANZAS ====================
-    
-    def registrar_transaccion(self, datos: Dict) -> int:
+    def obtener_cuotas_periodo(self, mes: int, anio: int, categoria: str | None = None,
+                               socio_ids: list[int] | None = None) -> list[dict]:
         """
-        Registra una transacción financiera (ingreso o egreso)
+        Obtiene las cuotas pagadas de un período junto con los datos de cada socio
         
         Args:
-            datos:  Diccionario con datos de la transacción
+            mes: Mes de la cuota (1-12)
+            anio: Año de la cuota
+            categoria: Limita a los socios de una categoría
+            socio_ids: Limita a un conjunto de socios
         
         Returns:
-            ID de la transacción
+            Lista de cuotas con nombre, apellido, DNI y categoría del socio
         """
-        conn = self. connect()
-        cursor = conn. cursor()
+        condiciones = ['c.mes = ?', 'c.anio = ?']
+        parametros = [mes, anio]
         
-        try: 
+        if categoria:
+            condiciones.append('s.categoria = ?')
+            parametros.append(categoria)
+        
+        if socio_ids is not None:
+            if not socio_ids:
+                return []
+            condiciones.append(f"c.socio_id IN ({', '.join('?' * len(socio_ids))})")
+            parametros.extend(socio_ids)
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                SELECT c.*, s.nombre, s.apellido, s.dni, s.categoria
+                FROM cuotas c
+                JOIN socios s ON s.id = c.socio_id
+                WHERE {' AND '.join(condiciones)}
+                ORDER BY s.apellido, s.nombre
+            ''', parametros)
+            
+            rows = cursor.fetchall()
+            return preparar_para_mostrar([dict(row) for row in rows], **CAMPOS_CUOTAS)
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener cuotas del período: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_periodos_pagados(self) -> set[tuple[int, int, int]]:
+        """
+        Obtiene todos los períodos con cuota registrada
+        
+        Returns:
+            Conjunto de tuplas (socio_id, mes, anio)
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT socio_id, mes, anio FROM cuotas')
+            return {tuple(row) for row in cursor.fetchall()}
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener períodos pagados: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def importar_cuotas(self, lotes: Iterable[list[dict]]) -> int:
+        """
+        Inserta cuotas en bloque, todas en una misma transacción
+        
+        Al final actualiza la fecha del último pago de los socios afectados.
+        El estado de pago no se modifica, porque las cuotas importadas suelen
+        ser históricas.
+        
+        Args:
+            lotes: Listas de diccionarios con los datos de cada cuota
+        
+        Returns:
+            Cantidad de cuotas insertadas
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM cuotas')
+            ultimo_id = cursor.fetchone()[0]
+            
+            cantidad = 0
+            for lote in lotes:
+                cursor.executemany('''
+                    INSERT INTO cuotas (socio_id, mes, anio, monto, fecha_pago,
+                                        metodo_pago, recibo_numero, observaciones)
+                    VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_DATE), ?, ?, ?)
+                ''', [(
+                    cuota['socio_id'],
+                    cuota['mes'],
+                    cuota['anio'],
+                    cuota['monto'],
+                    cuota.get('fecha_pago'),
+                    cuota.get('metodo_pago'),
+                    cuota.get('recibo_numero'),
+                    cuota.get('observaciones')
+                ) for cuota in lote])
+                cantidad += len(lote)
+            
+            cursor.execute('''
+                UPDATE socios
+                SET fecha_ultimo_pago = (
+                    SELECT MAX(fecha_pago) FROM cuotas WHERE cuotas.socio_id = socios.id
+                )
+                WHERE id IN (SELECT DISTINCT socio_id FROM cuotas WHERE id > ?)
+            ''', (ultimo_id,))
+            
+            conn.commit()
+            logger.info(f"Cuotas importadas: {cantidad}")
+            return cantidad
+        
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            logger.error(f"Cuota duplicada en la importación: {e}")
+            raise ValueError("La importación contiene una cuota ya registrada") from e
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error al importar cuotas: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_socios_sin_cuota(self, mes: int, anio: int, categoria: str | None = None) -> list[dict]:
+        """
+        Obtiene los socios activos (no exentos) que no pagaron la cuota de un período
+        
+        Args:
+            mes: Mes de la cuota (1-12)
+            anio: Año de la cuota
+            categoria: Limita a los socios de una categoría
+        
+        Returns:
+            Lista de socios ordenada por apellido y nombre
+        """
+        filtro = ''
+        parametros = []
+        if categoria:
+            filtro = 'AND s.categoria = ?'
+            parametros.append(categoria)
+        parametros += [mes, anio]
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                SELECT s.id, s.apellido, s.nombre, s.dni, s.categoria, s.estado_pago
+                FROM socios s
+                WHERE s.activo = 1 AND s.estado_pago != 'exento' {filtro}
+                  AND NOT EXISTS (
+                      SELECT 1 FROM cuotas c
+                      WHERE c.socio_id = s.id AND c.mes = ? AND c.anio = ?
+                  )
+                ORDER BY s.apellido, s.nombre
+            ''', parametros)
+            
+            return [dict(row) for row in cursor.fetchall()]
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener socios sin cuota: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def registrar_cobranza(self, pagos: list[dict], datos: dict) -> dict:
+        """
+        Registra las cuotas de un período para varios socios en una sola transacción
+        
+        Por cada socio se inserta la cuota y su ingreso en finanzas, y su estado
+        de pago se recalcula con las cuotas esperadas que sigue adeudando. Si
+        alguna cuota ya estaba registrada no se guarda ninguna.
+        
+        Args:
+            pagos: Un diccionario por socio con 'socio_id', 'monto' y 'descripcion'
+                   (descripción del ingreso)
+            datos: Datos comunes: 'mes', 'anio', 'fecha_pago', 'metodo_pago' y
+                   'recibo_numero' (si falta se numera con la primera cuota)
+        
+        Returns:
+            Diccionario con 'cuota_ids', 'transaccion_ids', 'recibo_numero' y 'total'
+        """
+        if not pagos:
+            raise ValueError("No hay socios seleccionados")
+        
+        fecha_pago = datos.get('fecha_pago') or datetime.now().date().isoformat()
+        recibo_numero = datos.get('recibo_numero')
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM cuotas')
+            ultima_cuota = cursor.fetchone()[0]
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM transacciones')
+            ultima_transaccion = cursor.fetchone()[0]
+            
+            cursor.executemany('''
+                INSERT INTO cuotas (socio_id, mes, anio, monto, fecha_pago, metodo_pago, recibo_numero)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [(pago['socio_id'], datos['mes'], datos['anio'], pago['monto'], fecha_pago,
+                   datos.get('metodo_pago'), recibo_numero) for pago in pagos])
+            
+            cursor.execute('SELECT id FROM cuotas WHERE id > ? ORDER BY id', (ultima_cuota,))
+            cuota_ids = [row[0] for row in cursor.fetchall()]
+            
+            # Un solo número de recibo para toda la cobranza
+            if not recibo_numero:
+                recibo_numero = f"COB-{cuota_ids[0]:06d}"
+                cursor.execute('UPDATE cuotas SET recibo_numero = ? WHERE id > ?', (recibo_numero, ultima_cuota))
+            
+            cursor.executemany('''
+                INSERT INTO transacciones (tipo, categoria, descripcion, monto, fecha, metodo_pago, comprobante)
+                VALUES ('ingreso', 'Cuotas Socios', ?, ?, ?, ?, ?)
+            ''', [(pago['descripcion'], pago['monto'], fecha_pago, datos.get('metodo_pago'), recibo_numero)
+                  for pago in pagos])
+            
+            cursor.execute('SELECT id FROM transacciones WHERE id > ? ORDER BY id', (ultima_transaccion,))
+            transaccion_ids = [row[0] for row in cursor.fetchall()]
+            
+            cursor.execute('''
+                UPDATE socios
+                SET fecha_ultimo_pago = ?
+                WHERE id IN (SELECT socio_id FROM cuotas WHERE id > ?)
+            ''', (fecha_pago, ultima_cuota))
+            self.actualizar_estados_pago(
+                cursor, periodo_vencido(datetime.now().date().isoformat()),
+                'SELECT socio_id FROM cuotas WHERE id > ?', (ultima_cuota,)
+            )
+            
+            conn.commit()
+            logger.info(f"Cobranza {recibo_numero} registrada: {len(cuota_ids)} cuotas")
+            for transaccion_id in transaccion_ids:
+                self.notificar_cambio('transacciones', transaccion_id)
+            
+            return {
+                'cuota_ids': cuota_ids,
+                'transaccion_ids': transaccion_ids,
+                'recibo_numero': recibo_numero,
+                'total': sum(pago['monto'] for pago in pagos)
+            }
+        
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            logger.error(f"Cuota duplicada en la cobranza: {e}")
+            raise ValueError("Alguno de los socios ya tiene registrada la cuota de ese mes") from e
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error al registrar cobranza: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_socios_morosos(self, anio: int, mes: int) -> list[dict]:
+        """
+        Obtiene los socios activos que adeudan cuotas a un mes dado
+        
+        Se cuentan las cuotas esperadas impagas anteriores al mes de referencia
+        (ese mes todavía no venció), igual que al calcular el estado de pago.
+        
+        Args:
+            anio: Año de referencia
+            mes: Mes de referencia (1-12)
+        
+        Returns:
+            Lista de socios con 'meses_adeudados' y 'monto_adeudado'
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                SELECT s.id, s.apellido, s.nombre, s.dni, s.categoria, s.telefono,
+                       s.estado_pago, s.fecha_ultimo_pago, d.meses_adeudados, d.monto_adeudado
+                FROM socios s
+                JOIN ({SQL_DEUDA_VENCIDA}) d ON d.socio_id = s.id
+                WHERE s.activo = 1 AND s.estado_pago != 'exento'
+                ORDER BY d.meses_adeudados DESC, s.apellido, s.nombre
+            ''', (anio * 12 + mes - 2,))
+            
+            rows = cursor.fetchall()
+            return preparar_para_mostrar([dict(row) for row in rows], **CAMPOS_SOCIOS)
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener socios morosos: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_grilla_pagos(self, anio: int, categoria: str | None = None) -> list[dict]:
+        """
+        Obtiene qué meses de un año pagó cada socio activo
+        
+        Las cuotas del año se agrupan por socio en una sola consulta, recorriendo
+        solo el índice (anio, socio_id), y se unen al listado de socios.
+        
+        Args:
+            anio: Año de la grilla
+            categoria: Categoría de los socios (None para todas)
+        
+        Returns:
+            Lista de socios ordenada por apellido, cada uno con 'pagos' (monto
+            pagado de enero a diciembre, None si no pagó), 'pagadas' y
+            'periodo_inscripcion' (anio * 12 + mes - 1 de la inscripción)
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            filtro = ''
+            params = [anio]
+            if categoria:
+                filtro = 'AND s.categoria = ?'
+                params.append(categoria)
+            
+            query = f'''
+                WITH pagos AS (
+                    SELECT socio_id, {SQL_PIVOT_MESES}, COUNT(*) AS pagadas
+                    FROM cuotas
+                    WHERE anio = ?
+                    GROUP BY socio_id
+                )
+                SELECT s.id, s.apellido, s.nombre, s.dni, s.categoria, s.estado_pago,
+                       {SQL_PERIODO_INSCRIPCION} AS periodo_inscripcion,
+                       p.*
+                FROM socios s
+                LEFT JOIN pagos p ON p.socio_id = s.id
+                WHERE s.activo = 1 {filtro}
+                ORDER BY s.apellido, s.nombre
+            '''
+            cursor.execute(query, params)
+            
+            grilla = [dict(row) for row in cursor.fetchall()]
+            self.registrar_lectura('obtener_grilla_pagos', query, tuple(params), grilla)
+            for socio in grilla:
+                del socio['socio_id']
+                socio['pagos'] = tuple(socio.pop(f'mes_{mes}') for mes in range(1, 13))
+                socio['pagadas'] = socio['pagadas'] or 0
+            return grilla
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener grilla de pagos: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def iterar_plantel(self, anio: int, mes: int, orden_categorias: tuple[str, ...] = (),
+                       tamanio_lote: int = 2000) -> Iterator[dict]:
+        """
+        Recorre los socios activos ordenados por categoría, con sus meses adeudados
+        
+        Una sola consulta une a cada socio con sus cuotas esperadas vencidas
+        mientras se recorre, sin cargar el plantel completo en memoria. Usa una
+        conexión propia, igual que iterar_transacciones_periodo.
+        
+        Args:
+            anio: Año de referencia para la deuda
+            mes: Mes de referencia (1-12)
+            orden_categorias: Orden en que deben salir las categorías (las demás van al final)
+            tamanio_lote: Cantidad de filas leídas por vez
+        
+        Yields:
+            Socios de a uno, por categoría, apellido y nombre
+        """
+        parametros = [anio * 12 + mes - 2]
+        orden = ''
+        if orden_categorias:
+            orden = f"CASE s.categoria {' '.join('WHEN ? THEN ?' for _ in orden_categorias)} ELSE ? END, "
+            for posicion, categoria in enumerate(orden_categorias):
+                parametros += [categoria, posicion]
+            parametros.append(len(orden_categorias))
+        
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                SELECT s.id, s.apellido, s.nombre, s.dni, s.categoria, s.fecha_nacimiento,
+                       s.telefono, s.email, s.estado_pago, s.fecha_ultimo_pago,
+                       CASE WHEN s.estado_pago = 'exento' THEN 0
+                            ELSE COALESCE(d.meses_adeudados, 0)
+                       END AS meses_adeudados
+                FROM socios s
+                LEFT JOIN ({SQL_DEUDA_VENCIDA}) d ON d.socio_id = s.id
+                WHERE s.activo = 1
+                ORDER BY {orden}s.categoria, s.apellido, s.nombre
+            ''', parametros)
+            
+            while True:
+                rows = cursor.fetchmany(tamanio_lote)
+                if not rows:
+                    break
+                yield from (dict(row) for row in rows)
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al recorrer el plantel: {e}")
+            raise
+        finally:
+            conn.close()
+    
+    # ==================== CUOTAS ESPERADAS Y DEUDA ====================
+    
+    def actualizar_estados_pago(self, cursor, vencido: int, socios: str | None = None,
+                                parametros: tuple = ()) -> tuple[int, int]:
+        """
+        Marca como morosos a los socios que adeudan cuotas esperadas vencidas y al día al resto
+        
+        Usa el cursor de quien llama, así el estado cambia en la misma transacción
+        que el pago o la generación. Los socios exentos no se tocan.
+        
+        Args:
+            cursor: Cursor de la transacción en curso
+            vencido: Último período (anio * 12 + mes - 1) vencido
+            socios: Consulta con los IDs de los socios a revisar (None para todos)
+            parametros: Parámetros de esa consulta
+        
+        Returns:
+            Cantidad de socios que pasaron a morosos y a al día
+        """
+        filtro = f'AND id IN ({socios})' if socios else ''
+        impagas = 'SELECT socio_id FROM cuotas_esperadas WHERE cuota_id IS NULL AND periodo <= ?'
+        cursor.execute(f'''
+            UPDATE socios SET estado_pago = 'moroso'
+            WHERE activo = 1 AND estado_pago = 'al_dia' {filtro} AND id IN ({impagas})
+        ''', (*parametros, vencido))
+        morosos = cursor.rowcount
+        cursor.execute(f'''
+            UPDATE socios SET estado_pago = 'al_dia'
+            WHERE activo = 1 AND estado_pago = 'moroso' {filtro} AND id NOT IN ({impagas})
+        ''', (*parametros, vencido))
+        return morosos, cursor.rowcount
+    
+    def obtener_ultimo_periodo_esperado(self) -> int | None:
+        """
+        Último período (anio * 12 + mes - 1) con cuotas esperadas generadas
+        
+        Returns:
+            Período o None si todavía no se generó ninguna cuota esperada
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT MAX(periodo) FROM cuotas_esperadas')
+            return cursor.fetchone()[0]
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener el último período generado: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def generar_cuotas_esperadas(self, anio: int, mes: int, mes_desde: int = 1,
+                                 anio_desde: int | None = None) -> dict[str, int]:
+        """
+        Genera las cuotas esperadas hasta un mes y actualiza el estado de pago
+        
+        Inserta en una sola sentencia una fila por socio activo (no exento) y mes
+        desde su inscripción, con el arancel vigente de su categoría en ese mes y
+        la cuota que ya la saldó si existe. Las filas ya generadas no se tocan, así que se puede
+        ejecutar todas las veces que se quiera. Sin anio_desde se retoma desde la
+        temporada del último período generado, así los meses que quedaron sin
+        generar al cambiar de año (diciembre, si no se abrió la aplicación) se
+        completan. Después marca como morosos a los socios que adeudan algún mes
+        anterior al de referencia y al día al resto.
+        
+        Args:
+            anio: Año del último mes a generar
+            mes: Último mes a generar (1-12), normalmente el mes en curso
+            mes_desde: Primer mes a generar de anio_desde (las categorías sin
+                       arancel pagan MONTO_CUOTA_BASE)
+            anio_desde: Año del primer mes a generar (None para el del último
+                        período generado, o anio si todavía no hay ninguno)
+        
+        Returns:
+            Diccionario con 'generadas', 'morosos' y 'al_dia' (socios que cambiaron
+            a cada estado)
+        """
+        if anio_desde is None:
+            ultimo = self.obtener_ultimo_periodo_esperado()
+            anio_desde = anio if ultimo is None else min(ultimo // 12, anio)
+        
+        parametros = {'desde': anio_desde * 12 + mes_desde - 1, 'hasta': anio * 12 + mes - 1,
+                      'base': MONTO_CUOTA_BASE, 'vencido': anio * 12 + mes - 2}
+        precios = []
+        for periodo in range(parametros['desde'], parametros['hasta'] + 1):
+            for categoria, monto in self.obtener_aranceles_vigentes(periodo // 12, periodo % 12 + 1).items():
+                i = len(precios)
+                precios.append(f'(:categoria{i}, {periodo}, :monto{i})')
+                parametros.update({f'categoria{i}': categoria, f'monto{i}': monto})
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            # Inscriptos hasta el mes (la fecha se compara con el primer día del
+            # mes siguiente); las filas ya generadas se descartan antes de buscar su
+            # cuota. El + quita la afinidad de s.categoria, así el arancel se busca
+            # por categoría y período a la vez.
+            cursor.execute(f'''
+                WITH RECURSIVE periodos(periodo) AS (
+                    SELECT :desde UNION ALL SELECT periodo + 1 FROM periodos WHERE periodo < :hasta
+                ),
+                meses(periodo, anio, mes, siguiente) AS (
+                    SELECT periodo, periodo / 12, periodo % 12 + 1,
+                           printf('%04d-%02d-01', (periodo + 1) / 12, (periodo + 1) % 12 + 1)
+                    FROM periodos
+                ),
+                precios(categoria, periodo, monto) AS (VALUES {', '.join(precios) or '(NULL, NULL, NULL)'})
+                INSERT OR IGNORE INTO cuotas_esperadas (socio_id, mes, anio, periodo, monto, cuota_id)
+                SELECT s.id, m.mes, m.anio, m.periodo, COALESCE(p.monto, :base), c.id
+                FROM socios s
+                CROSS JOIN meses m
+                LEFT JOIN precios p ON p.categoria = +s.categoria AND p.periodo = m.periodo
+                LEFT JOIN cuotas c ON c.socio_id = s.id AND c.mes = m.mes AND c.anio = m.anio
+                WHERE s.activo = 1 AND s.estado_pago != 'exento'
+                  AND (s.fecha_inscripcion IS NULL OR s.fecha_inscripcion < m.siguiente)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM cuotas_esperadas e
+                      WHERE e.socio_id = s.id AND e.mes = m.mes AND e.anio = m.anio
+                  )
+            ''', parametros)
+            generadas = cursor.execute('SELECT changes()').fetchone()[0]
+            
+            # El mes de referencia todavía no venció: es moroso quien adeuda uno anterior
+            morosos, al_dia = self.actualizar_estados_pago(cursor, parametros['vencido'])
+            
+            conn.commit()
+            logger.info(f"Cuotas esperadas {mes_desde}/{anio_desde}-{mes}/{anio}: {generadas} nuevas, "
+                        f"{morosos} socios pasaron a morosos y {al_dia} a al día")
+            return {'generadas': generadas, 'morosos': morosos, 'al_dia': al_dia}
+        
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error al generar cuotas esperadas: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_deuda_socios(self, anio: int, mes: int, categoria: str | None = None) -> list[dict]:
+        """
+        Obtiene lo que adeuda cada socio según las cuotas esperadas sin pagar
+        
+        Args:
+            anio: Año de referencia
+            mes: Mes de referencia (1-12), incluido en la deuda
+            categoria: Limita a los socios de una categoría
+        
+        Returns:
+            Socios con 'cuotas_impagas', 'monto_adeudado' y 'primer_periodo'
+            (anio * 12 + mes - 1 de la cuota impaga más antigua), de mayor a menor deuda
+        """
+        filtro = ''
+        parametros = [anio * 12 + mes - 1]
+        if categoria:
+            filtro = 'AND s.categoria = ?'
+            parametros.append(categoria)
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                SELECT s.id, s.apellido, s.nombre, s.dni, s.categoria, s.telefono,
+                       COUNT(*) AS cuotas_impagas, SUM(e.monto) AS monto_adeudado,
+                       MIN(e.periodo) AS primer_periodo
+                FROM cuotas_esperadas e
+                JOIN socios s ON s.id = e.socio_id
+                WHERE e.cuota_id IS NULL AND e.periodo <= ?
+                  AND s.activo = 1 AND s.estado_pago != 'exento' {filtro}
+                GROUP BY s.id
+                ORDER BY monto_adeudado DESC, s.apellido, s.nombre
+            ''', parametros)
+            
+            return [dict(row) for row in cursor.fetchall()]
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener deuda de socios: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_resumen_atrasos(self, fecha_corte: str) -> list[dict]:
+        """
+        Resume la deuda por categoría y tramo de atraso a una fecha
+        
+        Args:
+            fecha_corte: Fecha de referencia (YYYY-MM-DD); se consideran las
+                         cuotas vencidas hasta ese día
+        
+        Returns:
+            Una fila por categoría y tramo con deuda: 'categoria', 'tramo'
+            (índice en TRAMOS_ATRASO), 'socios', 'cuotas' y 'monto'
+        """
+        consulta = f'''
+            {SQL_ATRASOS}
+            SELECT categoria, tramo, COUNT(*) AS socios, SUM(cuotas_impagas) AS cuotas,
+                   SUM(monto_adeudado) AS monto
+            FROM atrasos
+            GROUP BY categoria, tramo
+            ORDER BY categoria, tramo
+        '''
+        parametros = {'fecha_corte': fecha_corte, 'vencido': periodo_vencido(fecha_corte)}
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(consulta, parametros)
+            filas = [dict(row) for row in cursor.fetchall()]
+            self.registrar_lectura('obtener_resumen_atrasos', consulta, parametros, filas)
+            return filas
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener resumen de atrasos: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def iterar_atrasos(self, fecha_corte: str, categoria: str | None = None,
+                       tramo: int | None = None, tamanio_lote: int = 2000) -> Iterator[dict]:
+        """
+        Recorre los socios con cuotas vencidas, del mayor al menor atraso
+        
+        Usa una conexión propia, igual que iterar_plantel, para que los
+        reportes escriban las filas a medida que las lee.
+        
+        Args:
+            fecha_corte: Fecha de referencia (YYYY-MM-DD)
+            categoria: Limita a los socios de una categoría
+            tramo: Limita a un tramo de atraso (índice en TRAMOS_ATRASO)
+            tamanio_lote: Cantidad de filas leídas por vez
+        
+        Yields:
+            Socios con 'primer_periodo' (anio * 12 + mes - 1 de la cuota impaga
+            más antigua), 'cuotas_impagas', 'monto_adeudado', 'dias_atraso' y
+            'tramo', por categoría
+        """
+        parametros = {'fecha_corte': fecha_corte, 'vencido': periodo_vencido(fecha_corte),
+                      'categoria': categoria, 'tramo': tramo}
+        
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                {SQL_ATRASOS}
+                SELECT * FROM atrasos
+                WHERE (:categoria IS NULL OR categoria = :categoria)
+                  AND (:tramo IS NULL OR tramo = :tramo)
+                ORDER BY categoria, dias_atraso DESC, monto_adeudado DESC, apellido, nombre
+            ''', parametros)
+            
+            while True:
+                rows = cursor.fetchmany(tamanio_lote)
+                if not rows:
+                    break
+                yield from (dict(row) for row in rows)
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al recorrer atrasos: {e}")
+            raise
+        finally:
+            conn.close()
+    
+    # ==================== ARANCELES ====================
+    
+    def cargar_aranceles(self) -> dict[str, tuple[list[str], list[float]]]:
+        """
+        Aranceles de todas las categorías, leídos una vez y guardados en memoria
+        
+        Returns:
+            Diccionario categoría -> (fechas de vigencia, montos), de la más antigua
+            a la más reciente
+        """
+        aranceles = self.cache_aranceles
+        if aranceles is not None:
+            return aranceles
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT categoria, vigente_desde, monto FROM aranceles ORDER BY categoria, vigente_desde')
+            aranceles = {}
+            for row in cursor.fetchall():
+                fechas, montos = aranceles.setdefault(row['categoria'], ([], []))
+                fechas.append(row['vigente_desde'])
+                montos.append(row['monto'])
+            self.cache_aranceles = aranceles
+            return aranceles
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al cargar aranceles: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_arancel(self, categoria: str, anio: int, mes: int) -> float | None:
+        """
+        Obtiene la cuota de una categoría en un mes, sin consultar la base
+        
+        Args:
+            categoria: Categoría del socio
+            anio: Año de la cuota
+            mes: Mes de la cuota (1-12)
+        
+        Returns:
+            Monto vigente ese mes o None si la categoría no tenía arancel
+        """
+        vigencias = self.cargar_aranceles().get(categoria)
+        if vigencias is None:
+            return None
+        fechas, montos = vigencias
+        posicion = bisect_right(fechas, f"{anio:04d}-{mes:02d}-01") - 1
+        return montos[posicion] if posicion >= 0 else None
+    
+    def obtener_aranceles_vigentes(self, anio: int, mes: int) -> dict[str, float]:
+        """
+        Obtiene la cuota de cada categoría en un mes (actual o pasado)
+        
+        Returns:
+            Diccionario categoría -> monto, solo de las categorías con arancel ese mes
+        """
+        vigentes = {}
+        for categoria in self.cargar_aranceles():
+            monto = self.obtener_arancel(categoria, anio, mes)
+            if monto is not None:
+                vigentes[categoria] = monto
+        return vigentes
+    
+    def obtener_historial_aranceles(self, categoria: str | None = None) -> list[dict]:
+        """
+        Obtiene todos los aranceles cargados, del más reciente al más antiguo
+        
+        Args:
+            categoria: Limita a una categoría
+        
+        Returns:
+            Lista de aranceles con categoría, vigencia, monto y fecha de carga
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            if categoria:
+                cursor.execute('''
+                    SELECT * FROM aranceles WHERE categoria = ? ORDER BY vigente_desde DESC
+                ''', (categoria,))
+            else:
+                cursor.execute('SELECT * FROM aranceles ORDER BY vigente_desde DESC, categoria')
+            
+            return preparar_para_mostrar([dict(row) for row in cursor.fetchall()],
+                                         fechas=('vigente_desde',), montos=('monto',))
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener historial de aranceles: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def actualizar_aranceles(self, montos: dict[str, float], anio: int, mes: int) -> dict[str, int]:
+        """
+        Fija nuevos aranceles desde un mes en adelante, en una sola transacción
+        
+        Cada categoría queda con un arancel vigente desde el primer día del mes
+        (si ya había uno con esa vigencia se reemplaza su monto). Las cuotas
+        esperadas impagas de esas categorías desde ese mes se vuelven a valuar
+        con el arancel que les corresponde, respetando aumentos posteriores ya
+        cargados. Los aranceles anteriores quedan en el historial.
+        
+        Args:
+            montos: Nuevo monto por categoría
+            anio: Año desde el que rige
+            mes: Mes desde el que rige (1-12)
+        
+        Returns:
+            Diccionario con 'categorias' actualizadas y 'cuotas_revaluadas'
+        """
+        if not montos:
+            raise ValueError("No hay aranceles para actualizar")
+        if any(monto <= 0 for monto in montos.values()):
+            raise ValueError("Los aranceles deben ser mayores a cero")
+        
+        vigente_desde = f"{anio:04d}-{mes:02d}-01"
+        categorias = list(montos)
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany('''
+                INSERT INTO aranceles (categoria, vigente_desde, monto) VALUES (?, ?, ?)
+                ON CONFLICT(categoria, vigente_desde) DO UPDATE SET monto = excluded.monto
+            ''', [(categoria, vigente_desde, monto) for categoria, monto in montos.items()])
+            
+            cursor.execute(f'''
+                UPDATE cuotas_esperadas
+                SET monto = (
+                    SELECT a.monto
+                    FROM aranceles a
+                    JOIN socios s ON s.categoria = a.categoria
+                    WHERE s.id = cuotas_esperadas.socio_id
+                      AND a.vigente_desde <= printf('%04d-%02d-01', cuotas_esperadas.anio, cuotas_esperadas.mes)
+                    ORDER BY a.vigente_desde DESC
+                    LIMIT 1
+                )
+                WHERE cuota_id IS NULL AND periodo >= ?
+                  AND socio_id IN (
+                      SELECT id FROM socios WHERE categoria IN ({', '.join('?' * len(categorias))})
+                  )
+            ''', [anio * 12 + mes - 1, *categorias])
+            revaluadas = cursor.rowcount
+            
+            conn.commit()
+            self.cache_aranceles = None
+            logger.info(f"Aranceles desde {vigente_desde}: {len(categorias)} categorías, "
+                        f"{revaluadas} cuotas esperadas revaluadas")
+            return {'categorias': len(categorias), 'cuotas_revaluadas': revaluadas}
+        
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error al actualizar aranceles: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    # ==================== OPERACIONES FINANZAS ====================
+    
+    def registrar_transaccion(self, datos: Dict) -> int:
+        """
+        Registra una transacción financiera (ingreso o egreso)
+        
+        Args:
+            datos:  Diccionario con datos de la transacción
+        
+        Returns:
+            ID de la transacción
+        """
+        conn = self. connect()
+        cursor = conn. cursor()
+        
+        try: 
             cursor.execute('''
                 INSERT INTO transacciones (tipo, categoria, descripcion, monto,
                                           fecha, metodo_pago, comprobante, 
@@ -455,6 +1917,7 @@ class DatabaseManager:
             conn.commit()
             transaccion_id = cursor.lastrowid
             logger.info(f"Transacción registrada - ID: {transaccion_id}")
+            self.notificar_cambio('transacciones', transaccion_id)
             return transaccion_id
             
         except sqlite3.Error as e:
@@ -464,6 +1927,64 @@ class DatabaseManager:
         finally:
             self. disconnect()
     
+    def obtener_transaccion(self, transaccion_id: int) -> dict | None:
+        """
+        Obtiene una transacción por su ID
+        
+        Args:
+            transaccion_id: ID de la transacción
+        
+        Returns:
+            Diccionario con datos de la transacción o None si no existe
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT * FROM transacciones WHERE id = ?', (transaccion_id,))
+            row = cursor.fetchone()
+            
+            if row:
+                return preparar_para_mostrar([dict(row)], **CAMPOS_TRANSACCIONES)[0]
+            return None
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener transacción: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def eliminar_transaccion(self, transaccion_id: int) -> dict | None:
+        """
+        Elimina una transacción
+        
+        Args:
+            transaccion_id: ID de la transacción
+        
+        Returns:
+            Diccionario con los datos de la transacción eliminada
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT * FROM transacciones WHERE id = ?', (transaccion_id,))
+            row = cursor.fetchone()
+            
+            cursor.execute('DELETE FROM transacciones WHERE id = ?', (transaccion_id,))
+            conn.commit()
+            logger.info(f"Transacción eliminada - ID: {transaccion_id}")
+            self.notificar_cambio('transacciones', transaccion_id)
+            
+            return dict(row) if row else None
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al eliminar transacción: {e}")
+            conn.rollback()
+            raise
+        finally:
+            self.disconnect()
+    
     def obtener_balance_general(self) -> Dict:
         """
         Calcula el balance general (ingresos totales - egresos totales)
@@ -505,13 +2026,16 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
-    def obtener_transacciones_periodo(self, fecha_inicio: str, fecha_fin: str) -> List[Dict]:
+    def obtener_transacciones_periodo(self, fecha_inicio: str, fecha_fin: str,
+                                      columnas: tuple[str, ...] | None = None) -> list[dict]:
         """
         Obtiene todas las transacciones en un período de tiempo
         
         Args: 
             fecha_inicio: Fecha de inicio (YYYY-MM-DD)
             fecha_fin: Fecha de fin (YYYY-MM-DD)
+            columnas: Columnas que se van a usar (None para todas); con las de la
+                      vista de finanzas la consulta se responde desde idx_transacciones_listado
         
         Returns: 
             Lista de transacciones
@@ -520,17 +2044,345 @@ class DatabaseManager:
         cursor = conn.cursor()
         
         try: 
+            query = f'''
+                SELECT {self.proyeccion("transacciones", columnas)} FROM transacciones
+                WHERE fecha BETWEEN ? AND ?
+                ORDER BY fecha DESC
+            '''
+            cursor.execute(query, (fecha_inicio, fecha_fin))
+            
+            transacciones = [dict(row) for row in cursor.fetchall()]
+            self.registrar_lectura('obtener_transacciones_periodo', query, (fecha_inicio, fecha_fin), transacciones)
+            return preparar_para_mostrar(transacciones, **campos_proyectados(CAMPOS_TRANSACCIONES, columnas))
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener transacciones: {e}")
+            raise
+        finally:
+            self.disconnect()
+
+    def iterar_transacciones_periodo(self, fecha_inicio: str, fecha_fin: str,
+                                     tamanio_lote: int = 5000) -> Iterator[dict]:
+        """
+        Recorre las transacciones de un período por lotes, sin cargarlas todas en memoria
+
+        Usa una conexión propia para que el resto de las operaciones pueda seguir
+        usando la conexión del hilo mientras se consume el generador.
+
+        Args:
+            fecha_inicio: Fecha de inicio (YYYY-MM-DD)
+            fecha_fin: Fecha de fin (YYYY-MM-DD)
+            tamanio_lote: Cantidad de filas leídas por vez
+
+        Yields:
+            Transacciones de a una, ordenadas por fecha descendente
+        """
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
             cursor.execute('''
                 SELECT * FROM transacciones
                 WHERE fecha BETWEEN ? AND ?
                 ORDER BY fecha DESC
             ''', (fecha_inicio, fecha_fin))
+
+            while True:
+                rows = cursor.fetchmany(tamanio_lote)
+                if not rows:
+                    break
+                yield from (dict(row) for row in rows)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error al recorrer transacciones: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def leer_tabla_por_lotes(self, tabla: str, tamanio_lote: int = 20000) -> Iterator[pd.DataFrame]:
+        """
+        Lee una tabla completa en DataFrames de tamaño acotado
+        
+        Usa una conexión propia, igual que iterar_transacciones_periodo.
+        
+        Args:
+            tabla: Una de TABLAS_ANALISIS
+            tamanio_lote: Cantidad de filas por DataFrame
+        
+        Yields:
+            DataFrames con las columnas de la tabla, ordenados por ID
+        """
+        if tabla not in TABLAS_ANALISIS:
+            raise ValueError(f"Tabla no exportable: {tabla}")
+        
+        conn = sqlite3.connect(str(self.db_path))
+        
+        try:
+            yield from pd.read_sql_query(
+                f"SELECT * FROM {tabla} ORDER BY id", conn, chunksize=tamanio_lote
+            )
+        
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            logger.error(f"Error al leer la tabla {tabla}: {e}")
+            raise
+        finally:
+            conn.close()
+    
+    def obtener_versiones(self, tablas: tuple[str, ...] = TABLAS_ANALISIS) -> dict[str, int]:
+        """
+        Obtiene el contador de versión de cada tabla
+        
+        El contador aumenta con cada fila insertada, modificada o eliminada,
+        así que dos lecturas con los mismos valores ven los mismos datos.
+        
+        Args:
+            tablas: Tablas a consultar (de TABLAS_VERSIONADAS)
+        
+        Returns:
+            Diccionario tabla -> versión
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+                SELECT tabla, version FROM versiones_tablas
+                WHERE tabla IN ({','.join('?' * len(tablas))})
+            ''', tuple(tablas))
+            versiones = {row['tabla']: row['version'] for row in cursor.fetchall()}
+            return {tabla: versiones.get(tabla, 0) for tabla in tablas}
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener versiones de tablas: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def contar_filas(self, tablas: tuple[str, ...] = TABLAS_ANALISIS) -> dict[str, int]:
+        """
+        Cuenta las filas de cada tabla
+        
+        Args:
+            tablas: Tablas a contar (de TABLAS_ANALISIS)
+        
+        Returns:
+            Diccionario tabla -> cantidad de filas
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            conteos = {}
+            for tabla in tablas:
+                if tabla not in TABLAS_ANALISIS:
+                    raise ValueError(f"Tabla no exportable: {tabla}")
+                cursor.execute(f"SELECT COUNT(*) FROM {tabla}")
+                conteos[tabla] = cursor.fetchone()[0]
+            return conteos
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al contar filas: {e}")
+            raise
+        finally:
+            self.disconnect()
+
+    def obtener_textos_busqueda(self, tabla: str, ids: Iterable[int] | None = None) -> list[dict]:
+        """
+        Obtiene las columnas que indexa la búsqueda global
+
+        Args:
+            tabla: 'socios', 'sponsors' o 'transacciones'
+            ids: IDs a consultar (None para toda la tabla); los que ya no
+                 existen o son socios dados de baja no se devuelven
+
+        Returns:
+            Lista de diccionarios con las columnas de CONSULTAS_BUSQUEDA
+        """
+        if tabla not in CONSULTAS_BUSQUEDA:
+            raise ValueError(f"Tabla sin búsqueda: {tabla}")
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        try:
+            if ids is None:
+                cursor.execute(CONSULTAS_BUSQUEDA[tabla])
+                return [dict(row) for row in cursor.fetchall()]
+
+            return consultar_en_grupos(cursor, f"{CONSULTAS_BUSQUEDA[tabla]} AND id IN ({{marcadores}})", ids)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener textos de búsqueda: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_estado_transacciones(self) -> dict:
+        """
+        Obtiene la cantidad de transacciones y el último ID registrado
+        
+        Returns:
+            Diccionario con 'cantidad' y 'ultimo_id'
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT COUNT(*) AS cantidad, COALESCE(MAX(id), 0) AS ultimo_id
+                FROM transacciones
+            ''')
+            return dict(cursor.fetchone())
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener estado de transacciones: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_series_financieras(self, granularidad: str = 'mes', desde_id: int = 0) -> list[dict]:
+        """
+        Obtiene ingresos y egresos agregados por período
+        
+        Args:
+            granularidad: 'mes' o 'semana'
+            desde_id: Solo considera transacciones con ID mayor a este valor
+        
+        Returns:
+            Lista de períodos con ingresos, egresos, cantidad y último ID
+        """
+        formatos = {'mes': '%Y-%m', 'semana': '%Y-S%W'}
+        if granularidad not in formatos:
+            raise ValueError(f"Granularidad no soportada: {granularidad}")
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT strftime(?, fecha) AS periodo,
+                       COALESCE(SUM(CASE WHEN tipo = 'ingreso' THEN monto END), 0) AS ingresos,
+                       COALESCE(SUM(CASE WHEN tipo = 'egreso' THEN monto END), 0) AS egresos,
+                       COUNT(*) AS cantidad,
+                       MAX(id) AS ultimo_id
+                FROM transacciones
+                WHERE id > ?
+                GROUP BY periodo
+                ORDER BY periodo
+            ''', (formatos[granularidad], desde_id))
+            
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener series financieras: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_totales_por_categoria(self, fecha_inicio: str, fecha_fin: str) -> list[dict]:
+        """
+        Obtiene el total y la cantidad de transacciones por tipo y categoría en un período
+        
+        Args:
+            fecha_inicio: Fecha de inicio (YYYY-MM-DD)
+            fecha_fin: Fecha de fin (YYYY-MM-DD)
+        
+        Returns:
+            Lista con 'tipo', 'categoria', 'total' y 'cantidad', de mayor a menor total
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT tipo, categoria, SUM(monto) AS total, COUNT(*) AS cantidad
+                FROM transacciones
+                WHERE fecha BETWEEN ? AND ?
+                GROUP BY tipo, categoria
+                ORDER BY tipo DESC, total DESC
+            ''', (fecha_inicio, fecha_fin))
             
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener totales por categoría: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_evolucion_mensual(self, fecha_inicio: str, fecha_fin: str) -> list[dict]:
+        """
+        Obtiene ingresos, egresos y saldo acumulado mes a mes en un período
+        
+        El saldo parte del acumulado de todas las transacciones anteriores al período.
+        
+        Args:
+            fecha_inicio: Fecha de inicio (YYYY-MM-DD)
+            fecha_fin: Fecha de fin (YYYY-MM-DD)
+        
+        Returns:
+            Lista de meses ('YYYY-MM') con 'ingresos', 'egresos' y 'saldo'
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                WITH anterior AS (
+                    SELECT COALESCE(SUM(CASE WHEN tipo = 'ingreso' THEN monto ELSE -monto END), 0) AS saldo
+                    FROM transacciones
+                    WHERE fecha < ?
+                ),
+                meses AS (
+                    SELECT strftime('%Y-%m', fecha) AS periodo,
+                           COALESCE(SUM(CASE WHEN tipo = 'ingreso' THEN monto END), 0) AS ingresos,
+                           COALESCE(SUM(CASE WHEN tipo = 'egreso' THEN monto END), 0) AS egresos
+                    FROM transacciones
+                    WHERE fecha BETWEEN ? AND ?
+                    GROUP BY periodo
+                )
+                SELECT periodo, ingresos, egresos,
+                       (SELECT saldo FROM anterior)
+                           + SUM(ingresos - egresos) OVER (ORDER BY periodo) AS saldo
+                FROM meses
+                ORDER BY periodo
+            ''', (fecha_inicio, fecha_inicio, fecha_fin))
             
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+        
         except sqlite3.Error as e:
-            logger.error(f"Error al obtener transacciones: {e}")
+            logger.error(f"Error al obtener evolución mensual: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
+    def obtener_saldo_al(self, fecha: str) -> float:
+        """
+        Calcula el saldo acumulado de todas las transacciones anteriores a una fecha
+        
+        Args:
+            fecha: Fecha límite, no incluida (YYYY-MM-DD)
+        
+        Returns:
+            Ingresos menos egresos anteriores a la fecha
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT COALESCE(SUM(CASE WHEN tipo = 'ingreso' THEN monto ELSE -monto END), 0) AS saldo
+                FROM transacciones
+                WHERE fecha < ?
+            ''', (fecha,))
+            return float(cursor.fetchone()['saldo'])
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al calcular saldo: {e}")
             raise
         finally:
             self.disconnect()
@@ -572,6 +2424,7 @@ class DatabaseManager:
             conn.commit()
             sponsor_id = cursor.lastrowid
             logger.info(f"Sponsor creado - ID: {sponsor_id}")
+            self.notificar_cambio('sponsors', sponsor_id)
             return sponsor_id
             
         except sqlite3.Error as e:
@@ -581,10 +2434,14 @@ class DatabaseManager:
         finally: 
             self.disconnect()
     
-    def obtener_sponsors_activos(self) -> List[Dict]:
+    def obtener_sponsors_activos(self, columnas: tuple[str, ...] | None = None) -> list[dict]:
         """
         Obtiene todos los sponsors activos
         
+        Args:
+            columnas: Columnas que se van a usar (None para todas); con el ID y el
+                      nombre de la empresa la consulta se responde desde idx_sponsors_activos
+        
         Returns:
             Lista de sponsors activos
         """
@@ -592,14 +2449,16 @@ class DatabaseManager:
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                SELECT * FROM sponsors
+            query = f'''
+                SELECT {self.proyeccion("sponsors", columnas)} FROM sponsors
                 WHERE estado = 'activo'
                 ORDER BY nombre_empresa
-            ''')
+            '''
+            cursor.execute(query)
             
-            rows = cursor. fetchall()
-            return [dict(row) for row in rows]
+            sponsors = [dict(row) for row in cursor.fetchall()]
+            self.registrar_lectura('obtener_sponsors_activos', query, (), sponsors)
+            return sponsors
             
         except sqlite3.Error as e:
             logger. error(f"Error al obtener sponsors:  {e}")
@@ -607,6 +2466,36 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
+    def obtener_todos_sponsors(self, columnas: tuple[str, ...] | None = None) -> list[dict]:
+        """
+        Obtiene todos los sponsors, activos o no
+        
+        Args:
+            columnas: Columnas que se van a usar (None para todas)
+        
+        Returns:
+            Lista de sponsors ordenada por empresa
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            query = f'''
+                SELECT {self.proyeccion("sponsors", columnas)} FROM sponsors
+                ORDER BY nombre_empresa, id
+            '''
+            cursor.execute(query)
+            
+            sponsors = [dict(row) for row in cursor.fetchall()]
+            self.registrar_lectura('obtener_todos_sponsors', query, (), sponsors)
+            return sponsors
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error al obtener sponsors: {e}")
+            raise
+        finally:
+            self.disconnect()
+    
     def obtener_sponsors_proximos_vencer(self, dias:  int = 30) -> List[Dict]:
         """
         Obtiene sponsors cuyos contratos vencen próximamente
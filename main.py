@@ -3,6 +3,7 @@ Punto de entrada de la aplicación
 Sistema de Gestión Integral - Club Don Bosco
 """
 
+import multiprocessing
 import sys
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
@@ -38,4 +39,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Necesario para el pool de procesos de los recibos en el ejecutable empaquetado
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
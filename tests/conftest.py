@@ -0,0 +1,46 @@
+"""
+Fixtures compartidas por las pruebas
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+
+from database.database import DatabaseManager
+
+
+@pytest.fixture(scope='session')
+def app():
+    """Aplicación Qt sin ventanas, para las pruebas de vistas"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Gestor sobre una base nueva en un archivo temporal"""
+    return DatabaseManager(tmp_path / 'club.db')
+
+
+@pytest.fixture
+def inscribir(db):
+    """Función que da de alta un socio con fecha de inscripción y devuelve su ID"""
+    def inscribir_socio(dni: str, categoria: str = 'U15', fecha_inscripcion: str = '2025-01-01',
+                        estado_pago: str = 'al_dia') -> int:
+        conn = db.connect()
+        try:
+            cursor = conn.execute('''
+                INSERT INTO socios (nombre, apellido, dni, categoria, fecha_inscripcion, estado_pago)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', ('Nombre', f'Apellido {dni}', dni, categoria, fecha_inscripcion, estado_pago))
+            conn.commit()
+            return cursor.lastrowid
+        finally:
+            db.disconnect()
+    return inscribir_socio
@@ -0,0 +1,96 @@
+"""
+Pruebas de la exportación para análisis
+"""
+
+import pandas as pd
+import pytest
+
+from utils.analytics_exporter import (
+    PARQUET_DISPONIBLE,
+    AnalyticsExporter,
+    convertir_tipos,
+)
+
+HOY = pd.Timestamp('2025-06-30')
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    exporter = AnalyticsExporter()
+    exporter.exports_path = tmp_path
+    return exporter
+
+
+def test_tipos_y_columnas_de_socios():
+    df = pd.DataFrame({
+        'id': [1, 2], 'dni_normalizado': ['30123456', None], 'activo': [1, 0],
+        'fecha_nacimiento': ['2010-07-01', None], 'fecha_inscripcion': ['2025-01-10', 'x'],
+        'fecha_ultimo_pago': [None, None], 'fecha_creacion': ['2025-01-10 10:00:00', None],
+        'fecha_modificacion': [None, None], 'apellido': ['Pérez', 'Gómez']
+    })
+
+    df = convertir_tipos(df, 'socios', HOY)
+
+    assert list(df['edad']) == [14, pd.NA]
+    assert str(df['dni_normalizado'].dtype) == 'Int64'
+    assert list(df['activo']) == [True, False]
+    assert pd.isna(df['fecha_inscripcion'][1])
+    assert str(df['apellido'].dtype) == 'string'
+
+
+def test_monto_neto_y_periodo_de_transacciones():
+    df = pd.DataFrame({
+        'tipo': ['ingreso', 'egreso'], 'monto': [100, 40],
+        'fecha': ['2025-03-15', '2025-04-01'], 'fecha_creacion': [None, None]
+    })
+
+    df = convertir_tipos(df, 'transacciones', HOY)
+
+    assert list(df['monto_neto']) == [100, -40]
+    assert list(df['periodo']) == [pd.Timestamp('2025-03-01'), pd.Timestamp('2025-04-01')]
+
+
+def test_csv_comprimido_en_lotes(db, inscribir, exporter, tmp_path):
+    for i in range(5):
+        inscribir(str(30000000 + i))
+    exporter.tamanio_lote = 2
+    avances = []
+
+    carpeta = exporter.exportar(db, tablas=('socios',), formato='csv', progreso=avances.append)
+
+    socios = pd.read_csv(tmp_path / carpeta / 'socios.csv.gz')
+    assert list(socios['dni_normalizado']) == [30000000 + i for i in range(5)]
+    assert 'edad' in socios.columns
+    assert avances == [2, 4, 5]
+
+
+def test_progreso_acumula_entre_tablas(db, inscribir, exporter):
+    socio_id = inscribir('30123456')
+    db.registrar_cuota({'socio_id': socio_id, 'mes': 3, 'anio': 2025, 'monto': 100, 'fecha_pago': '2025-03-02'})
+    avances = []
+
+    exporter.exportar(db, tablas=('socios', 'cuotas'), formato='csv', progreso=avances.append)
+
+    assert avances == [1, 2]
+
+
+def test_formato_no_soportado(db, exporter):
+    with pytest.raises(ValueError):
+        exporter.exportar(db, formato='xlsx')
+
+
+@pytest.mark.skipif(not PARQUET_DISPONIBLE, reason="pyarrow no está instalado")
+def test_parquet(db, inscribir, exporter, tmp_path):
+    inscribir('30123456')
+
+    carpeta = exporter.exportar(db, tablas=('socios',), formato='parquet')
+
+    socios = pd.read_parquet(tmp_path / carpeta / 'socios.parquet')
+    assert list(socios['dni_normalizado']) == [30123456]
+
+
+@pytest.mark.skipif(PARQUET_DISPONIBLE, reason="pyarrow está instalado")
+def test_sin_pyarrow(db, exporter):
+    assert exporter.formato_por_defecto() == 'csv'
+    with pytest.raises(ValueError, match='pyarrow'):
+        exporter.exportar(db, formato='parquet')
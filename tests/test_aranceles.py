@@ -0,0 +1,67 @@
+"""
+Pruebas de los aranceles por categoría y del reajuste de cuotas impagas
+"""
+
+import pytest
+
+from config.settings import MONTO_CUOTA_BASE
+
+
+def montos(db, socio_id: int) -> dict:
+    conn = db.connect()
+    try:
+        return {row['mes']: row['monto'] for row in conn.execute(
+            'SELECT mes, monto FROM cuotas_esperadas WHERE socio_id = ? AND anio = 2025', (socio_id,)
+        )}
+    finally:
+        db.disconnect()
+
+
+def test_arancel_vigente_por_mes(db):
+    db.actualizar_aranceles({'U15': 6000}, 2025, 7)
+
+    assert db.obtener_arancel('U15', 2025, 6) == MONTO_CUOTA_BASE
+    assert db.obtener_arancel('U15', 2025, 7) == 6000
+    assert db.obtener_arancel('U15', 2026, 1) == 6000
+    assert db.obtener_arancel('U13', 2025, 7) == MONTO_CUOTA_BASE
+    assert db.obtener_arancel('Inexistente', 2025, 7) is None
+
+
+def test_reajusta_solo_las_cuotas_impagas_desde_la_vigencia(db, inscribir):
+    socio_id = inscribir('1', categoria='U15')
+    otra_categoria = inscribir('2', categoria='U13')
+    db.registrar_cuota({'socio_id': socio_id, 'mes': 8, 'anio': 2025, 'monto': MONTO_CUOTA_BASE})
+    db.generar_cuotas_esperadas(2025, 12)
+
+    resultado = db.actualizar_aranceles({'U15': 6000}, 2025, 7)
+
+    assert resultado == {'categorias': 1, 'cuotas_revaluadas': 5}
+    esperados = {mes: MONTO_CUOTA_BASE for mes in range(1, 13)}
+    esperados.update({mes: 6000 for mes in (7, 9, 10, 11, 12)})
+    assert montos(db, socio_id) == esperados
+    assert set(montos(db, otra_categoria).values()) == {MONTO_CUOTA_BASE}
+
+
+def test_respeta_aumentos_posteriores(db, inscribir):
+    socio_id = inscribir('1', categoria='U15')
+    db.generar_cuotas_esperadas(2025, 12)
+    db.actualizar_aranceles({'U15': 7000}, 2025, 10)
+
+    db.actualizar_aranceles({'U15': 6000}, 2025, 7)
+
+    assert [montos(db, socio_id)[mes] for mes in (6, 7, 9, 10, 12)] == [MONTO_CUOTA_BASE, 6000, 6000, 7000, 7000]
+
+
+def test_cuotas_nuevas_con_el_arancel_vigente(db, inscribir):
+    socio_id = inscribir('1', categoria='U15')
+    db.actualizar_aranceles({'U15': 6000}, 2025, 3)
+
+    db.generar_cuotas_esperadas(2025, 4)
+
+    assert montos(db, socio_id) == {1: MONTO_CUOTA_BASE, 2: MONTO_CUOTA_BASE, 3: 6000, 4: 6000}
+
+
+@pytest.mark.parametrize('nuevos', [{}, {'U15': 0}, {'U15': -100}])
+def test_aranceles_invalidos(db, nuevos):
+    with pytest.raises(ValueError):
+        db.actualizar_aranceles(nuevos, 2025, 1)
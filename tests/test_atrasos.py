@@ -0,0 +1,66 @@
+"""
+Pruebas de la antigüedad de la deuda por tramos de 30, 60 y 90 días
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from config.settings import MONTO_CUOTA_BASE, TRAMOS_ATRASO
+from utils.reportes import resumen_atrasos
+
+# La cuota de enero de 2025 vence el 1 de febrero
+VENCIMIENTO_ENERO = date(2025, 2, 1)
+
+
+@pytest.fixture
+def deudor(db, inscribir):
+    """Socio que adeuda desde enero de 2025, con las cuotas generadas hasta junio"""
+    socio_id = inscribir('1', fecha_inscripcion='2025-01-10')
+    db.generar_cuotas_esperadas(2025, 6)
+    return socio_id
+
+
+@pytest.mark.parametrize('dias, tramo', [
+    (1, 0), (30, 0), (31, 1), (60, 1), (61, 2), (90, 2), (91, 3)
+])
+def test_limites_de_los_tramos(db, deudor, dias, tramo):
+    fecha_corte = (VENCIMIENTO_ENERO + timedelta(days=dias)).isoformat()
+
+    atrasos = list(db.iterar_atrasos(fecha_corte))
+
+    assert [(fila['id'], fila['dias_atraso'], fila['tramo']) for fila in atrasos] == [(deudor, dias, tramo)]
+    assert TRAMOS_ATRASO[tramo][0] is None or dias <= TRAMOS_ATRASO[tramo][0]
+
+
+def test_solo_cuentan_las_cuotas_vencidas(db, deudor):
+    assert list(db.iterar_atrasos('2025-01-31')) == []
+
+    # Al 15 de marzo vencieron enero y febrero; marzo todavía no
+    fila, = db.iterar_atrasos('2025-03-15')
+    assert (fila['cuotas_impagas'], fila['monto_adeudado']) == (2, 2 * MONTO_CUOTA_BASE)
+
+
+def test_el_atraso_se_cuenta_desde_la_cuota_impaga_mas_antigua(db, deudor):
+    db.registrar_cuota({'socio_id': deudor, 'mes': 1, 'anio': 2025, 'monto': MONTO_CUOTA_BASE})
+
+    fila, = db.iterar_atrasos('2025-04-10')
+
+    assert fila['primer_periodo'] == 2025 * 12 + 1
+    assert (fila['dias_atraso'], fila['cuotas_impagas']) == (40, 2)
+
+
+def test_resumen_por_categoria_y_tramo(db, inscribir):
+    inscribir('1', categoria='U15', fecha_inscripcion='2025-01-01')
+    inscribir('2', categoria='U15', fecha_inscripcion='2025-04-01')
+    inscribir('3', categoria='U13', fecha_inscripcion='2025-04-01')
+    db.generar_cuotas_esperadas(2025, 6)
+
+    filas = db.obtener_resumen_atrasos('2025-06-15')
+    resumen = resumen_atrasos(filas)
+
+    assert [(f['categoria'], f['tramo'], f['socios'], f['cuotas']) for f in filas] == [
+        ('U13', 1, 1, 2), ('U15', 1, 1, 2), ('U15', 3, 1, 5)
+    ]
+    assert [tramo['socios'] for tramo in resumen['totales']] == [0, 2, 0, 1]
+    assert resumen['total'] == {'socios': 3, 'monto': 9 * MONTO_CUOTA_BASE}
@@ -0,0 +1,188 @@
+"""
+Pruebas de los buscadores en memoria
+"""
+
+import pytest
+
+from database.database import LIMITE_PARAMETROS
+from utils.buscador import IndiceGlobal, IndiceSocios, plegar
+
+SOCIOS = [
+    {'id': 1, 'apellido': 'Gómez', 'nombre': 'María José', 'dni': '30.123.456'},
+    {'id': 2, 'apellido': 'Ibáñez', 'nombre': 'Juan', 'dni': '31000000'},
+    {'id': 3, 'apellido': 'Gomeza', 'nombre': 'Pedro', 'dni': '28123456'},
+    {'id': 4, 'apellido': 'Fernández', 'nombre': 'Lucía', 'dni': '40111222'},
+]
+
+
+@pytest.fixture
+def indice():
+    return IndiceSocios(SOCIOS)
+
+
+def ids(resultados) -> list[int]:
+    return [socio['id'] for socio, _ in resultados]
+
+
+def test_plegar():
+    assert plegar("Ibáñez, José  ") == 'ibanez jose'
+
+
+@pytest.mark.parametrize('consulta, esperados', [
+    ('GOMEZ', [1, 3]),
+    ('ibanez', [2]),
+    ('ibañez juan', [2]),
+    ('maria gomez', [1]),
+    ('gom', [1, 3]),
+])
+def test_sin_acentos_ni_mayusculas(indice, consulta, esperados):
+    assert ids(indice.buscar(consulta)) == esperados
+
+
+@pytest.mark.parametrize('consulta, esperado', [
+    ('gomes', 1),
+    ('fernandes lucia', 4),
+    ('ibanes', 2),
+])
+def test_tolera_errores_de_tipeo(indice, consulta, esperado):
+    assert esperado in ids(indice.buscar(consulta))
+
+
+def test_coincidencia_exacta_primero(indice):
+    resultados = indice.buscar('gomez')
+
+    assert ids(resultados) == [1, 3]
+    assert resultados[0][1] == 1.0 > resultados[1][1]
+
+
+@pytest.mark.parametrize('consulta, esperados', [
+    ('30.123', [1]),
+    ('30123456', [1]),
+    ('123456', [1, 3]),
+])
+def test_por_dni(indice, consulta, esperados):
+    assert sorted(ids(indice.buscar(consulta))) == esperados
+
+
+def test_sin_coincidencias(indice):
+    assert indice.buscar('xyz') == []
+    assert indice.buscar('   ') == []
+
+
+def test_agregar_y_quitar_despues_de_buscar(indice):
+    indice.buscar('gomez')
+
+    indice.agregar({'id': 5, 'apellido': 'Gómez', 'nombre': 'Ana', 'dni': '35000000'})
+    indice.quitar(1)
+
+    assert ids(indice.buscar('gomez')) == [5, 3]
+    assert indice.buscar('30123456') == []
+    assert len(indice) == 4
+
+
+def test_actualizar_un_socio(indice):
+    indice.buscar('gomez')
+
+    indice.agregar({**SOCIOS[1], 'apellido': 'Paz'})
+
+    assert indice.buscar('ibanez') == []
+    assert ids(indice.buscar('paz')) == [2]
+
+
+def test_limite(indice):
+    assert len(indice.buscar('gomez', limite=1)) == 1
+
+
+# ==================== BÚSQUEDA GLOBAL ====================
+
+@pytest.fixture
+def indice_global(db):
+    """Índice global ya cargado (vacío) sobre la base de prueba"""
+    indice = IndiceGlobal(db)
+    indice.instalar(indice.leer())
+    return indice
+
+
+def agregar_socio(db, apellido: str, dni: str) -> int:
+    return db.agregar_socio({'nombre': 'Ana', 'apellido': apellido, 'dni': dni, 'categoria': 'U15'})
+
+
+def encontrados(indice, consulta: str) -> list[tuple[str, int]]:
+    return [(tipo, fila['id']) for tipo, fila in indice.buscar(consulta)]
+
+
+def test_carga_inicial(db, inscribir):
+    socio_id = inscribir('30123456')
+    indice = IndiceGlobal(db)
+
+    indice.instalar(indice.leer())
+
+    assert encontrados(indice, '30123') == [('socios', socio_id)]
+    assert len(indice) == 1
+
+
+def test_alta_y_baja_se_aplican_en_la_siguiente_busqueda(db, indice_global):
+    socio_id = agregar_socio(db, 'Paz', '30123456')
+    assert encontrados(indice_global, 'paz') == [('socios', socio_id)]
+
+    db.eliminar_socio(socio_id)
+
+    assert encontrados(indice_global, 'paz') == []
+    assert len(indice_global) == 0
+
+
+def test_edicion_reemplaza_las_palabras(db, indice_global):
+    socio_id = agregar_socio(db, 'Paz', '30123456')
+    indice_global.buscar('paz')
+
+    db.actualizar_socio(socio_id, {'nombre': 'Ana', 'apellido': 'Ríos', 'categoria': 'U15'})
+
+    assert encontrados(indice_global, 'paz') == []
+    assert encontrados(indice_global, 'rios') == [('socios', socio_id)]
+
+
+def test_importacion_relee_la_tabla(db, indice_global):
+    db.importar_socios([[
+        {'dni': '30123456', 'apellido': 'Paz', 'nombre': 'Ana', 'categoria': 'U15'},
+        {'dni': '31000000', 'apellido': 'Paz', 'nombre': 'Luis', 'categoria': 'U13'},
+    ]])
+
+    assert len(encontrados(indice_global, 'paz')) == 2
+
+
+def test_todas_las_tablas_en_orden(db, indice_global):
+    socio_id = agregar_socio(db, 'Aguirre', '30123456')
+    sponsor_id = db.agregar_sponsor({
+        'nombre_empresa': 'Aguas del Norte', 'monto_contrato': 1000,
+        'fecha_inicio': '2025-01-01', 'fecha_vencimiento': '2026-01-01'
+    })
+    transaccion_id = db.registrar_transaccion({
+        'tipo': 'ingreso', 'categoria': 'Otros', 'descripcion': 'Agua para el torneo',
+        'monto': 100, 'fecha': '2025-01-01', 'comprobante': 'A-0001'
+    })
+
+    assert encontrados(indice_global, 'agu') == [
+        ('socios', socio_id), ('sponsors', sponsor_id), ('transacciones', transaccion_id)
+    ]
+    assert encontrados(indice_global, 'a0001') == [('transacciones', transaccion_id)]
+    assert encontrados(indice_global, 'aguas norte') == [('sponsors', sponsor_id)]
+
+
+def test_limite_por_tabla(db, indice_global):
+    for dni in ('30000001', '30000002', '30000003'):
+        agregar_socio(db, 'Paz', dni)
+
+    assert len(indice_global.buscar('paz', limite=2)) == 2
+
+
+def test_textos_de_busqueda_en_grupos(db):
+    dnis = [str(30000000 + i) for i in range(LIMITE_PARAMETROS + 10)]
+    db.importar_socios([[{'dni': dni, 'apellido': 'Paz', 'nombre': 'Ana', 'categoria': 'U15'} for dni in dnis]])
+    socio_id = db.buscar_socio_por_dni(dnis[0])['id']
+    db.eliminar_socio(socio_id)
+    ids = range(1, len(dnis) + 50)
+
+    filas = db.obtener_textos_busqueda('socios', ids)
+
+    assert len(filas) == len(dnis) - 1
+    assert socio_id not in {fila['id'] for fila in filas}
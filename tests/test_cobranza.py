@@ -0,0 +1,81 @@
+"""
+Pruebas de la cobranza por categoría
+"""
+
+import pytest
+
+DATOS = {'mes': 3, 'anio': 2025, 'fecha_pago': '2025-03-10', 'metodo_pago': 'Efectivo'}
+
+
+def pagos_de(*socio_ids: int, monto: float = 100) -> list[dict]:
+    return [{'socio_id': socio_id, 'monto': monto, 'descripcion': f"Cuota socio {socio_id}"}
+            for socio_id in socio_ids]
+
+
+def contar(db, tabla: str) -> int:
+    conn = db.connect()
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM {tabla}').fetchone()[0]
+    finally:
+        db.disconnect()
+
+
+def test_registra_cuotas_e_ingresos_con_un_recibo(db, inscribir):
+    primero, segundo = inscribir('30000001'), inscribir('30000002')
+
+    cobranza = db.registrar_cobranza(pagos_de(primero, segundo), DATOS)
+
+    assert len(cobranza['cuota_ids']) == len(cobranza['transaccion_ids']) == 2
+    assert cobranza['recibo_numero'] == f"COB-{cobranza['cuota_ids'][0]:06d}"
+    assert cobranza['total'] == 200
+    for socio_id in (primero, segundo):
+        cuota, = db.obtener_cuotas_socio(socio_id)
+        assert (cuota['mes'], cuota['anio'], cuota['recibo_numero']) == (3, 2025, cobranza['recibo_numero'])
+        assert db.obtener_socio(socio_id)['fecha_ultimo_pago'] == '2025-03-10'
+
+
+def test_respeta_el_numero_de_recibo(db, inscribir):
+    socio_id = inscribir('30000001')
+
+    cobranza = db.registrar_cobranza(pagos_de(socio_id), {**DATOS, 'recibo_numero': 'R-100'})
+
+    assert cobranza['recibo_numero'] == 'R-100'
+
+
+def test_cuota_ya_pagada_no_guarda_ninguna(db, inscribir):
+    primero, segundo = inscribir('30000001'), inscribir('30000002')
+    db.registrar_cobranza(pagos_de(segundo), DATOS)
+
+    with pytest.raises(ValueError, match='ya tiene registrada'):
+        db.registrar_cobranza(pagos_de(primero, segundo), DATOS)
+
+    assert db.obtener_cuotas_socio(primero) == []
+    assert (contar(db, 'cuotas'), contar(db, 'transacciones')) == (1, 1)
+
+
+def test_error_a_mitad_de_camino_no_guarda_nada(db, inscribir):
+    primero, segundo = inscribir('30000001'), inscribir('30000002')
+    pagos = pagos_de(primero, segundo)
+    del pagos[1]['descripcion']
+
+    with pytest.raises(KeyError):
+        db.registrar_cobranza(pagos, DATOS)
+
+    assert (contar(db, 'cuotas'), contar(db, 'transacciones')) == (0, 0)
+
+
+def test_sin_socios(db):
+    with pytest.raises(ValueError):
+        db.registrar_cobranza([], DATOS)
+
+
+def test_socios_sin_cuota_del_mes(db, inscribir):
+    primero = inscribir('30000001')
+    segundo = inscribir('30000002')
+    inscribir('30000003', categoria='U13')
+    inscribir('30000004', estado_pago='exento')
+    db.registrar_cobranza(pagos_de(primero), DATOS)
+
+    pendientes = db.obtener_socios_sin_cuota(3, 2025, 'U15')
+
+    assert [socio['id'] for socio in pendientes] == [segundo]
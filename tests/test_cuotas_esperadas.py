@@ -0,0 +1,126 @@
+"""
+Pruebas de las cuotas esperadas y del estado de pago que se calcula con ellas
+"""
+
+from datetime import date
+
+from config.settings import MONTO_CUOTA_BASE
+
+
+def estados(db) -> dict:
+    conn = db.connect()
+    try:
+        return {row['id']: row['estado_pago'] for row in conn.execute('SELECT id, estado_pago FROM socios')}
+    finally:
+        db.disconnect()
+
+
+def periodos_generados(db, socio_id: int) -> list:
+    conn = db.connect()
+    try:
+        return [(row['anio'], row['mes']) for row in conn.execute(
+            'SELECT anio, mes FROM cuotas_esperadas WHERE socio_id = ? ORDER BY periodo', (socio_id,)
+        )]
+    finally:
+        db.disconnect()
+
+
+def anio_mes(periodo: int) -> tuple:
+    return periodo // 12, periodo % 12 + 1
+
+
+def cuota(socio_id: int, periodo: int) -> dict:
+    anio, mes = anio_mes(periodo)
+    return {'socio_id': socio_id, 'mes': mes, 'anio': anio, 'monto': MONTO_CUOTA_BASE}
+
+
+def test_generacion_idempotente(db, inscribir):
+    inscribir('1', fecha_inscripcion='2025-03-15')
+    inscribir('2', fecha_inscripcion='2025-06-01')
+
+    primera = db.generar_cuotas_esperadas(2025, 8)
+    segunda = db.generar_cuotas_esperadas(2025, 8)
+
+    assert primera['generadas'] == 6 + 3
+    assert segunda == {'generadas': 0, 'morosos': 0, 'al_dia': 0}
+
+
+def test_desde_la_inscripcion_y_sin_exentos(db, inscribir):
+    socio_id = inscribir('1', fecha_inscripcion='2025-10-31')
+    exento = inscribir('2', estado_pago='exento')
+
+    db.generar_cuotas_esperadas(2025, 12)
+
+    assert periodos_generados(db, socio_id) == [(2025, 10), (2025, 11), (2025, 12)]
+    assert periodos_generados(db, exento) == []
+
+
+def test_completa_el_anio_anterior(db, inscribir):
+    socio_id = inscribir('1', fecha_inscripcion='2025-10-01')
+    db.generar_cuotas_esperadas(2025, 11)
+
+    resultado = db.generar_cuotas_esperadas(2026, 2)
+
+    assert resultado['generadas'] == 3
+    assert periodos_generados(db, socio_id) == [(2025, 10), (2025, 11), (2025, 12), (2026, 1), (2026, 2)]
+
+
+def test_cuotas_pagadas_quedan_vinculadas(db, inscribir):
+    socio_id = inscribir('1')
+    db.registrar_cuota({'socio_id': socio_id, 'mes': 1, 'anio': 2025, 'monto': MONTO_CUOTA_BASE})
+
+    db.generar_cuotas_esperadas(2025, 3)
+
+    assert [d['cuotas_impagas'] for d in db.obtener_deuda_socios(2025, 3)] == [2]
+
+
+def test_barrido_moroso_y_al_dia(db, inscribir):
+    al_dia = inscribir('1')
+    moroso = inscribir('2')
+    for mes in (1, 2):
+        db.registrar_cuota({'socio_id': al_dia, 'mes': mes, 'anio': 2025, 'monto': MONTO_CUOTA_BASE})
+    db.registrar_cuota({'socio_id': moroso, 'mes': 1, 'anio': 2025, 'monto': MONTO_CUOTA_BASE})
+
+    # Marzo todavía no venció: solo cuenta lo adeudado hasta febrero
+    resultado = db.generar_cuotas_esperadas(2025, 3)
+
+    assert resultado['morosos'] == 1
+    assert estados(db) == {al_dia: 'al_dia', moroso: 'moroso'}
+    assert [(s['id'], s['meses_adeudados']) for s in db.obtener_socios_morosos(2025, 3)] == [(moroso, 1)]
+
+    # Anular la cuota de enero vuelve a dejar la deuda
+    conn = db.connect()
+    conn.execute('DELETE FROM cuotas WHERE socio_id = ? AND mes = 1', (al_dia,))
+    conn.commit()
+    db.disconnect()
+    assert db.generar_cuotas_esperadas(2025, 3)['morosos'] == 1
+    assert estados(db)[al_dia] == 'moroso'
+
+
+def test_pago_recalcula_el_estado(db, inscribir):
+    hoy = date.today()
+    actual = hoy.year * 12 + hoy.month - 1
+    anio, mes = anio_mes(actual - 2)
+    socio_id = inscribir('1', fecha_inscripcion=f'{anio:04d}-{mes:02d}-01')
+    db.generar_cuotas_esperadas(hoy.year, hoy.month, mes_desde=mes, anio_desde=anio)
+    assert estados(db)[socio_id] == 'moroso'
+
+    # Pagar una de las dos cuotas vencidas no alcanza
+    db.registrar_cuota(cuota(socio_id, actual - 2))
+    assert estados(db)[socio_id] == 'moroso'
+
+    anio, mes = anio_mes(actual - 1)
+    db.registrar_cobranza([{'socio_id': socio_id, 'monto': MONTO_CUOTA_BASE, 'descripcion': 'Cuota'}],
+                          {'anio': anio, 'mes': mes})
+    assert estados(db)[socio_id] == 'al_dia'
+
+
+def test_plantel_usa_las_cuotas_esperadas(db, inscribir):
+    socio_id = inscribir('1')
+    exento = inscribir('2', estado_pago='exento')
+    db.registrar_cuota({'socio_id': socio_id, 'mes': 2, 'anio': 2025, 'monto': MONTO_CUOTA_BASE})
+    db.generar_cuotas_esperadas(2025, 4)
+
+    plantel = {s['id']: s['meses_adeudados'] for s in db.iterar_plantel(2025, 4)}
+
+    assert plantel == {socio_id: 2, exento: 0}
@@ -0,0 +1,62 @@
+"""
+Pruebas de la clave de DNI normalizada
+"""
+
+import pytest
+
+from database.database import LIMITE_PARAMETROS
+from utils.validators import normalizar_dni
+
+
+@pytest.mark.parametrize('dni, esperado', [
+    ('30123456', 30123456),
+    ('30.123.456', 30123456),
+    (' 30 123 456 ', 30123456),
+    ('30-123-456', 30123456),
+    ('30,123,456', 30123456),
+    (30123456, 30123456),
+    ('0030123456', 30123456),
+    ('30A123456', None),
+    ('\uff13\uff10\uff11\uff12\uff13\uff14\uff15\uff16', None),  # dígitos de ancho completo
+    ('', None),
+    (None, None),
+])
+def test_normalizar_dni(dni, esperado):
+    assert normalizar_dni(dni) == esperado
+
+
+def socio(dni: str) -> dict:
+    return {'nombre': 'Juan', 'apellido': 'Pérez', 'dni': dni, 'categoria': 'U15'}
+
+
+def test_buscar_socio_con_o_sin_puntos(db):
+    socio_id = db.agregar_socio(socio('30123456'))
+
+    assert db.buscar_socio_por_dni('30.123.456')['id'] == socio_id
+    assert db.buscar_socio_por_dni(' 30123456 ')['id'] == socio_id
+    assert db.buscar_socio_por_dni('30123457') is None
+
+
+def test_dni_duplicado_escrito_distinto(db):
+    db.agregar_socio(socio('30123456'))
+
+    with pytest.raises(ValueError):
+        db.agregar_socio(socio('30.123.456'))
+
+
+def test_buscar_varios_dnis(db):
+    primero = db.agregar_socio(socio('30.123.456'))
+    segundo = db.agregar_socio(socio('31000000'))
+
+    encontrados = db.buscar_socios_por_dnis(['30123456', '31.000.000', '99999999', 'sin número'])
+
+    assert {dni: fila['id'] for dni, fila in encontrados.items()} == {30123456: primero, 31000000: segundo}
+
+
+def test_buscar_mas_dnis_que_parametros_por_consulta(db):
+    dnis = [str(30000000 + i) for i in range(LIMITE_PARAMETROS * 2 + 1)]
+    db.importar_socios([[{**socio(dni), 'apellido': f'Apellido {dni}'} for dni in dnis]])
+
+    encontrados = db.buscar_socios_por_dnis([*dnis, '99999999'])
+
+    assert sorted(encontrados) == [int(dni) for dni in dnis]
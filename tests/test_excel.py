@@ -0,0 +1,68 @@
+"""
+Pruebas de las exportaciones a Excel en modo streaming
+"""
+
+import openpyxl
+import pytest
+
+from utils.excel_exporter import FORMATO_MONTO, ExcelExporter
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    exporter = ExcelExporter()
+    exporter.exports_path = tmp_path
+    return exporter
+
+
+def leer(exporter, archivo: str) -> list[tuple]:
+    """Valores de todas las filas de la primera hoja"""
+    wb = openpyxl.load_workbook(exporter.exports_path / archivo)
+    return list(wb.worksheets[0].iter_rows(values_only=True))
+
+
+def transacciones(cantidad: int):
+    """Generador de transacciones alternando ingresos de 100 y egresos de 40"""
+    for i in range(cantidad):
+        yield {
+            'fecha': '2025-03-02', 'tipo': 'ingreso' if i % 2 == 0 else 'egreso',
+            'categoria': 'Otros', 'descripcion': f"Movimiento {i}", 'monto': 100 if i % 2 == 0 else 40
+        }
+
+
+def test_transacciones_desde_un_generador(exporter):
+    avances = []
+
+    archivo = exporter.exportar_transacciones(transacciones(2500), '2025-03-01', '2025-03-31', avances.append)
+
+    filas = leer(exporter, archivo)
+    assert filas[3][:5] == ("Fecha", "Tipo", "Categoría", "Descripción", "Monto")
+    assert filas[4][:5] == ('02/03/2025', 'Ingreso', 'Otros', 'Movimiento 0', 100)
+    assert filas[4 + 2499][3] == 'Movimiento 2499'
+    assert [fila[3:5] for fila in filas[-3:]] == [
+        ("TOTAL INGRESOS:", 1250 * 100), ("TOTAL EGRESOS:", 1250 * 40), ("BALANCE:", 1250 * 60)
+    ]
+    assert avances == [1000, 2000]
+
+
+def test_formato_de_los_montos(exporter):
+    archivo = exporter.exportar_transacciones(transacciones(1), '2025-03-01', '2025-03-31')
+
+    hoja = openpyxl.load_workbook(exporter.exports_path / archivo).worksheets[0]
+
+    assert hoja['E5'].number_format == FORMATO_MONTO
+    assert hoja['A1'].font.bold
+
+
+def test_socios(exporter):
+    socios = [{
+        'dni': '30123456', 'apellido': 'Pérez', 'nombre': 'Juan', 'categoria': 'U15',
+        'telefono': None, 'email': None, 'estado_pago': 'moroso',
+        'fecha_ultimo_pago': '2025-03-02', 'fecha_inscripcion': '2025-01-10'
+    }]
+
+    archivo = exporter.exportar_socios(iter(socios))
+
+    assert leer(exporter, archivo)[4] == (
+        '30123456', 'Pérez', 'Juan', 'U15', '-', '-', 'MOROSO', '02/03/2025', '10/01/2025'
+    )
@@ -0,0 +1,154 @@
+"""
+Pruebas del caché de exportaciones
+"""
+
+import os
+import time
+
+import pytest
+
+from utils.excel_exporter import ExcelExporter
+from utils.export_cache import CacheExportaciones
+
+TABLAS_DEUDA = ('socios', 'cuotas', 'cuotas_esperadas', 'aranceles')
+
+
+@pytest.fixture
+def carpeta(tmp_path):
+    """Carpeta de exportaciones, separada de la base para que la poda no la toque"""
+    carpeta = tmp_path / 'exports'
+    carpeta.mkdir()
+    return carpeta
+
+
+@pytest.fixture
+def cache(carpeta):
+    return CacheExportaciones(carpeta)
+
+
+@pytest.fixture
+def generar(carpeta):
+    """Función de generación que crea un archivo nuevo por llamada y las cuenta"""
+    def generar_archivo():
+        generar_archivo.llamadas += 1
+        nombre = f"reporte_{generar_archivo.llamadas}.txt"
+        (carpeta / nombre).write_text('contenido', encoding='utf-8')
+        return nombre
+    generar_archivo.llamadas = 0
+    return generar_archivo
+
+
+def crear_exportacion(cache, nombre: str, dias: float = 0, kb: int = 1):
+    """Crea un archivo registrado en el índice con la antigüedad indicada"""
+    ruta = cache.carpeta / nombre
+    ruta.write_bytes(b'x' * kb * 1024)
+    modificado = time.time() - dias * 86400
+    os.utime(ruta, (modificado, modificado))
+    cache.guardar(f"clave_{nombre}", 'prueba', nombre)
+    return ruta
+
+
+def test_misma_exportacion_se_reutiliza(db, inscribir, cache, generar):
+    inscribir('1')
+    parametros = {'anio': 2025, 'mes': 12}
+    primero, _ = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    segundo, reutilizado = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    assert reutilizado
+    assert segundo == primero
+    assert generar.llamadas == 1
+
+
+def test_otros_parametros_no_reutilizan(db, cache, generar):
+    cache.obtener_o_generar(db, 'plantel_excel', {'anio': 2025, 'mes': 11}, TABLAS_DEUDA, generar)
+
+    _, reutilizado = cache.obtener_o_generar(db, 'plantel_excel', {'anio': 2025, 'mes': 12}, TABLAS_DEUDA, generar)
+
+    assert not reutilizado
+    assert generar.llamadas == 2
+
+
+def test_alta_de_socio_invalida_la_exportacion(db, inscribir, cache, generar):
+    parametros = {'anio': 2025, 'mes': 12}
+    cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    inscribir('1')
+    _, reutilizado = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    assert not reutilizado
+
+
+def test_archivo_borrado_se_regenera(db, cache, generar, carpeta):
+    parametros = {'anio': 2025, 'mes': 12}
+    primero, _ = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    (carpeta / primero).unlink()
+    segundo, reutilizado = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    assert not reutilizado
+    assert (carpeta / segundo).exists()
+
+
+def test_reajuste_de_aranceles_invalida_la_deuda(db, inscribir, cache, generar):
+    inscribir('1', categoria='U15')
+    db.generar_cuotas_esperadas(2025, 12)
+    parametros = {'anio': 2025, 'mes': 12}
+    primero, _ = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    db.actualizar_aranceles({'U15': 99999}, 2025, 1)
+    segundo, reutilizado = cache.obtener_o_generar(db, 'plantel_excel', parametros, TABLAS_DEUDA, generar)
+
+    assert not reutilizado
+    assert segundo != primero
+
+
+def test_exportaciones_del_mismo_segundo_no_se_pisan(tmp_path):
+    exporter = ExcelExporter()
+    exporter.exports_path = tmp_path
+
+    primero = exporter.exportar_socios([])
+    segundo = exporter.exportar_socios([])
+
+    assert primero != segundo
+    assert (tmp_path / primero).exists() and (tmp_path / segundo).exists()
+
+
+def test_podar_por_antiguedad(cache):
+    viejo = crear_exportacion(cache, 'viejo.xlsx', dias=40)
+    nuevo = crear_exportacion(cache, 'nuevo.xlsx', dias=1)
+
+    eliminadas = cache.podar(max_dias=30, max_mb=100)
+
+    assert eliminadas == 1
+    assert not viejo.exists() and nuevo.exists()
+    assert cache.obtener('clave_viejo.xlsx') is None
+    assert cache.obtener('clave_nuevo.xlsx') == 'nuevo.xlsx'
+
+
+def test_podar_por_tamanio_borra_lo_mas_antiguo(cache):
+    primero = crear_exportacion(cache, 'primero.pdf', dias=3, kb=400)
+    segundo = crear_exportacion(cache, 'segundo.pdf', dias=2, kb=400)
+    tercero = crear_exportacion(cache, 'tercero.pdf', dias=1, kb=400)
+
+    eliminadas = cache.podar(max_dias=30, max_mb=1)
+
+    assert eliminadas == 1
+    assert not primero.exists()
+    assert segundo.exists() and tercero.exists()
+
+
+def test_podar_borra_carpetas_y_respeta_el_indice(cache, carpeta):
+    lote = carpeta / 'recibos_lote'
+    lote.mkdir()
+    (lote / 'recibo_1.pdf').write_bytes(b'x')
+    viejo = time.time() - 40 * 86400
+    os.utime(lote, (viejo, viejo))
+    cache.guardar('clave_lote', 'recibos_lote', 'recibos_lote/')
+
+    eliminadas = cache.podar(max_dias=30, max_mb=100)
+
+    assert eliminadas == 1
+    assert not lote.exists()
+    assert (carpeta / '.cache_exportaciones.json').exists()
+    assert cache.leer_indice() == {}
@@ -0,0 +1,51 @@
+"""
+Pruebas del formateo de fechas y montos para mostrar
+"""
+
+import pytest
+
+from utils.formatters import fecha_a_texto, monto_a_texto, preparar_para_mostrar
+
+
+@pytest.mark.parametrize('valor, texto', [
+    ('2025-03-02', '02/03/2025'),
+    (None, '-'),
+    ('', '-'),
+    ('02/03/2025', '02/03/2025'),
+])
+def test_fecha_a_texto(valor, texto):
+    assert fecha_a_texto(valor) == texto
+
+
+def test_monto_a_texto():
+    assert monto_a_texto(1234.5) == '$1,234.50'
+
+
+def test_preparar_para_mostrar():
+    registros = [{'fecha': '2025-03-02', 'monto': 1500}, {'fecha': None, 'monto': None}]
+
+    preparados = preparar_para_mostrar(registros, fechas=('fecha',), montos=('monto',))
+
+    assert preparados is registros
+    assert [(r['fecha_texto'], r['monto_texto']) for r in registros] == [
+        ('02/03/2025', '$1,500.00'), ('-', '$0.00')
+    ]
+
+
+def test_no_se_vuelve_a_formatear():
+    registro = {'fecha': '2025-03-02', 'fecha_texto': 'ya preparado'}
+
+    preparar_para_mostrar((r for r in [registro]), fechas=('fecha',))
+
+    assert registro['fecha_texto'] == 'ya preparado'
+
+
+def test_lecturas_de_la_base_vienen_preparadas(db, inscribir):
+    socio_id = inscribir('30123456', fecha_inscripcion='2025-01-10')
+    db.registrar_cuota({'socio_id': socio_id, 'mes': 3, 'anio': 2025, 'monto': 5000, 'fecha_pago': '2025-03-02'})
+
+    socio = db.obtener_socio(socio_id)
+    cuota, = db.obtener_cuotas_socio(socio_id)
+
+    assert socio['fecha_inscripcion_texto'] == '10/01/2025'
+    assert (cuota['fecha_pago_texto'], cuota['monto_texto']) == ('02/03/2025', '$5,000.00')
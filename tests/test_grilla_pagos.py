@@ -0,0 +1,60 @@
+"""
+Pruebas de la grilla de pagos por socio y mes
+"""
+
+import pytest
+
+
+@pytest.fixture
+def pagar(db):
+    """Función que registra la cuota de un mes"""
+    def pagar_cuota(socio_id: int, mes: int, anio: int = 2025, monto: float = 100):
+        return db.registrar_cuota({
+            'socio_id': socio_id, 'mes': mes, 'anio': anio, 'monto': monto,
+            'fecha_pago': f"{anio}-{mes:02d}-05"
+        })
+    return pagar_cuota
+
+
+def test_meses_pagados_del_anio(db, inscribir, pagar):
+    socio_id = inscribir('30000001')
+    pagar(socio_id, 1, monto=100)
+    pagar(socio_id, 3, monto=120)
+    pagar(socio_id, 3, anio=2024, monto=90)
+
+    fila, = db.obtener_grilla_pagos(2025)
+
+    assert fila['id'] == socio_id
+    assert fila['pagos'] == (100.0, None, 120.0) + (None,) * 9
+    assert fila['pagadas'] == 2
+    assert 'socio_id' not in fila
+
+
+def test_socio_sin_pagos(db, inscribir):
+    inscribir('30000001', fecha_inscripcion='2025-03-15')
+
+    fila, = db.obtener_grilla_pagos(2025)
+
+    assert fila['pagos'] == (None,) * 12
+    assert fila['pagadas'] == 0
+    assert fila['periodo_inscripcion'] == 2025 * 12 + 3 - 1
+
+
+def test_filtro_por_categoria_y_activos(db, inscribir):
+    u15 = inscribir('30000001', categoria='U15')
+    inscribir('30000002', categoria='U13')
+    baja = inscribir('30000003', categoria='U15')
+    db.eliminar_socio(baja)
+
+    grilla = db.obtener_grilla_pagos(2025, 'U15')
+
+    assert [fila['id'] for fila in grilla] == [u15]
+
+
+def test_orden_por_apellido(db, inscribir):
+    segundo = inscribir('30000002')
+    primero = inscribir('30000001')
+
+    grilla = db.obtener_grilla_pagos(2025)
+
+    assert [fila['id'] for fila in grilla] == [primero, segundo]
@@ -0,0 +1,162 @@
+"""
+Pruebas de la importación de planillas
+"""
+
+import csv
+import threading
+
+import openpyxl
+import pytest
+
+from utils.importer import DataImporter, ImportacionCancelada
+
+
+@pytest.fixture
+def importador(tmp_path):
+    """Importador que deja los archivos de rechazos en la carpeta temporal"""
+    importador = DataImporter()
+    importador.exports_path = tmp_path
+    return importador
+
+
+def escribir_csv(carpeta, nombre: str, lineas: list[str], codificacion: str = 'utf-8'):
+    ruta = carpeta / nombre
+    ruta.write_text('\n'.join(lineas) + '\n', encoding=codificacion)
+    return ruta
+
+
+def leer_rechazos(carpeta, resultado: dict) -> list[list[str]]:
+    """Filas del CSV de rechazos de una importación, con el encabezado"""
+    with open(carpeta / resultado['archivo_rechazos'], newline='', encoding='utf-8-sig') as archivo:
+        return list(csv.reader(archivo, delimiter=';'))
+
+
+@pytest.mark.parametrize('titulo', ['Listado viejo', 'Listado, temporada 2019'])
+def test_csv_con_punto_y_coma_y_titulo(db, importador, tmp_path, titulo):
+    ruta = escribir_csv(tmp_path, 'socios.csv', [
+        titulo,
+        '',
+        'DNI;Apellido;Nombre;Categoría',
+        '30.123.456;Pérez;Juan;U15',
+        '31000000;Gómez;Ana;U13',
+    ])
+
+    resultado = importador.importar(db, ruta, 'socios')
+
+    assert (resultado['importadas'], resultado['rechazadas']) == (2, 0)
+    assert db.buscar_socio_por_dni('30123456')['apellido'] == 'Pérez'
+
+
+def test_dni_repetido_en_el_archivo_y_en_la_base(db, importador, inscribir, tmp_path):
+    inscribir('31000000')
+    ruta = escribir_csv(tmp_path, 'socios.csv', [
+        'DNI,Apellido,Nombre,Categoría',
+        '30.123.456,Pérez,Juan,U15',
+        '30123456,Pérez,Juan Carlos,U15',
+        '31.000.000,Gómez,Ana,U13',
+    ])
+
+    resultado = importador.importar(db, ruta, 'socios')
+
+    assert (resultado['importadas'], resultado['rechazadas']) == (1, 2)
+    assert [fila[:2] for fila in leer_rechazos(tmp_path, resultado)[1:]] == [
+        ['3', 'DNI: repetido o ya registrado'],
+        ['4', 'DNI: repetido o ya registrado'],
+    ]
+
+
+def test_archivo_de_rechazos(db, importador, tmp_path):
+    ruta = escribir_csv(tmp_path, 'socios.csv', [
+        'DNI,Apellido,Nombre,Categoría',
+        '30123456,Pérez,Juan,U15',
+        '12,Mal,Dato,U15',
+        '31000000,Gómez,Ana,Primera',
+    ])
+
+    resultado = importador.importar(db, ruta, 'socios')
+
+    assert leer_rechazos(tmp_path, resultado) == [
+        ['Fila', 'Motivo', 'DNI', 'Apellido', 'Nombre', 'Categoría'],
+        ['3', 'DNI: cantidad de dígitos incorrecta', '12', 'Mal', 'Dato', 'U15'],
+        ['4', 'Categoría: valor no reconocido', '31000000', 'Gómez', 'Ana', 'Primera'],
+    ]
+
+
+def test_sin_rechazos_no_crea_archivo(db, importador, tmp_path):
+    ruta = escribir_csv(tmp_path, 'socios.csv', ['DNI,Apellido,Nombre,Categoría', '30123456,Pérez,Juan,U15'])
+
+    resultado = importador.importar(db, ruta, 'socios')
+
+    assert resultado['archivo_rechazos'] is None
+    assert not list(tmp_path.glob('rechazos_*'))
+
+
+def test_csv_en_codificacion_de_windows(db, importador, tmp_path):
+    ruta = escribir_csv(tmp_path, 'socios.csv', [
+        'DNI;Apellido;Nombre;Categoría',
+        '30123456;Núñez;José;U15',
+    ], codificacion='cp1252')
+
+    resultado = importador.importar(db, ruta, 'socios')
+
+    assert resultado['importadas'] == 1
+    assert db.buscar_socio_por_dni('30123456')['apellido'] == 'Núñez'
+
+
+def test_importar_cuotas(db, importador, inscribir, tmp_path):
+    socio_id = inscribir('30123456')
+    ruta = escribir_csv(tmp_path, 'cuotas.csv', [
+        'DNI;Mes;Año;Monto;Fecha de pago',
+        '30.123.456;Marzo;2025;$ 5.000,50;2025-03-02',
+        '30123456;3;2025;5000;2025-03-02',
+        '99999999;3;2025;5000;2025-03-02',
+        '30123456;13;2025;5000;2025-03-02',
+    ])
+
+    resultado = importador.importar(db, ruta, 'cuotas')
+
+    assert (resultado['importadas'], resultado['rechazadas']) == (1, 3)
+    assert [fila[1] for fila in leer_rechazos(tmp_path, resultado)[1:]] == [
+        'Período: repetido o ya registrado',
+        'DNI: no corresponde a ningún socio',
+        'Mes: fuera del rango permitido',
+    ]
+    cuota, = db.obtener_cuotas_socio(socio_id)
+    assert (cuota['mes'], cuota['anio'], cuota['monto']) == (3, 2025, 5000.5)
+
+
+def test_importar_xlsx_con_titulo(db, importador, tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.append(['Padrón de socios 2019'])
+    wb.active.append([])
+    wb.active.append(['Documento', 'Apellidos', 'Nombres', 'División'])
+    wb.active.append([30123456, 'Pérez', 'Juan', 'U15'])
+    ruta = tmp_path / 'socios.xlsx'
+    wb.save(ruta)
+
+    resultado = importador.importar(db, ruta, 'socios')
+
+    assert resultado['importadas'] == 1
+    assert db.buscar_socio_por_dni('30.123.456')['nombre'] == 'Juan'
+
+
+def test_cancelar_no_importa_nada(db, importador, tmp_path):
+    importador.tamanio_lote = 1
+    ruta = escribir_csv(tmp_path, 'socios.csv', [
+        'DNI,Apellido,Nombre,Categoría',
+        '30123456,Pérez,Juan,U15',
+        '31000000,Gómez,Ana,U13',
+    ])
+    cancelacion = threading.Event()
+
+    with pytest.raises(ImportacionCancelada):
+        importador.importar(db, ruta, 'socios', progreso=lambda _: cancelacion.set(), cancelacion=cancelacion)
+
+    assert db.buscar_socio_por_dni('30123456') is None
+
+
+def test_faltan_columnas_obligatorias(db, importador, tmp_path):
+    ruta = escribir_csv(tmp_path, 'socios.csv', ['DNI,Apellido', '30123456,Pérez'])
+
+    with pytest.raises(ValueError, match='nombre, categoria'):
+        importador.importar(db, ruta, 'socios')
@@ -0,0 +1,78 @@
+"""
+Pruebas de la precarga de datos en tiempo ocioso
+"""
+
+import pytest
+
+from ui.prefetch import Prefetcher, cargar_clave, estimar_bytes, obtener_datos
+
+
+@pytest.fixture
+def prefetcher(app, db):
+    prefetcher = Prefetcher(db, {})
+    yield prefetcher
+    app.removeEventFilter(prefetcher)
+
+
+def test_acierto_sin_consultar(db, inscribir, prefetcher):
+    inscribir('30123456')
+    clave = ('socios', None)
+    precargados = [{'id': 0, 'apellido': 'Precargado'}]
+    prefetcher.store(clave, precargados, db.version_datos)
+
+    assert obtener_datos(prefetcher, db, clave) is precargados
+    assert prefetcher.estadisticas()['aciertos'] == 1
+    # Cada precarga se usa una sola vez
+    assert obtener_datos(prefetcher, db, clave)[0]['dni'] == '30123456'
+    assert prefetcher.stats['fallos'] == 1
+
+
+def test_escritura_invalida_lo_precargado(db, inscribir, prefetcher):
+    clave = ('socios', None)
+    prefetcher.store(clave, [], db.version_datos)
+
+    inscribir('30123456')
+
+    assert len(prefetcher.obtener(clave)) == 1
+    assert prefetcher.stats['descartadas'] == 1
+    assert prefetcher.bytes_en_uso == 0
+
+
+def test_presupuesto_desaloja_lo_mas_antiguo(db, prefetcher):
+    filas = [{'id': i, 'texto': 'x' * 100} for i in range(50)]
+    prefetcher.presupuesto = estimar_bytes(filas) * 2
+
+    for socio_id in (1, 2, 3):
+        prefetcher.store(('cuotas', socio_id, None), filas, db.version_datos)
+
+    assert list(prefetcher.cache) == [('cuotas', 2, None), ('cuotas', 3, None)]
+    assert prefetcher.bytes_en_uso <= prefetcher.presupuesto
+
+
+def test_resultado_de_una_precarga_cancelada(db, prefetcher):
+    prefetcher.pendientes = [('socios', None)]
+    generacion = prefetcher.generacion
+    prefetcher.cancel()
+
+    prefetcher.on_loaded(('socios', None), [], db.version_datos, generacion)
+
+    assert not prefetcher.cache
+    assert prefetcher.stats['descartadas'] == 1
+
+
+def test_socios_recientes(prefetcher):
+    for socio_id in (1, 2, 1):
+        prefetcher.socio_visto(socio_id)
+
+    assert list(prefetcher.socios_recientes) == [1, 2]
+
+
+def test_cargar_clave(db, inscribir):
+    socio_id = inscribir('30123456')
+
+    socios = cargar_clave(db, ('socios', ('id', 'apellido')))
+
+    assert [socio['id'] for socio in socios] == [socio_id]
+    assert cargar_clave(db, ('cuotas', socio_id, None)) == []
+    with pytest.raises(ValueError):
+        cargar_clave(db, ('sponsors',))
@@ -0,0 +1,84 @@
+"""
+Pruebas de la generación de recibos del mes en lote
+"""
+
+import re
+
+import pytest
+
+from utils.pdf_generator import MIN_RECIBOS_PROCESOS, PDFGenerator, datos_recibo
+
+PAGINA_PDF = re.compile(rb'/Type /Page\b(?!s)')
+
+
+@pytest.fixture
+def generador(tmp_path):
+    generador = PDFGenerator()
+    generador.exports_path = tmp_path
+    return generador
+
+
+@pytest.fixture
+def cuotas_marzo(db, inscribir):
+    """Función que da de alta socios con la cuota de marzo de 2025 pagada y devuelve sus cuotas"""
+    def crear(cantidad: int, categoria: str = 'U15') -> list[dict]:
+        for _ in range(cantidad):
+            crear.socios += 1
+            socio_id = inscribir(str(30000000 + crear.socios), categoria=categoria)
+            db.registrar_cuota({'socio_id': socio_id, 'mes': 3, 'anio': 2025, 'monto': 5000,
+                                'fecha_pago': '2025-03-02'})
+        return db.obtener_cuotas_periodo(3, 2025, categoria=categoria)
+    crear.socios = 0
+    return crear
+
+
+def test_datos_del_recibo(db, cuotas_marzo):
+    cuota, = cuotas_marzo(1)
+
+    datos = datos_recibo(cuota)
+
+    assert datos['periodo'] == 'Marzo 2025'
+    assert datos['fecha'] == '02/03/2025'
+    assert datos['recibo_numero'] == f"REC-{cuota['id']:06d}"
+
+
+def test_cuotas_del_periodo_por_categoria_y_socios(db, cuotas_marzo):
+    u15 = cuotas_marzo(2)
+    cuotas_marzo(1, categoria='U13')
+
+    elegidas = db.obtener_cuotas_periodo(3, 2025, socio_ids=[u15[0]['socio_id']])
+
+    assert len(db.obtener_cuotas_periodo(3, 2025)) == 3
+    assert [c['id'] for c in elegidas] == [u15[0]['id']]
+    assert db.obtener_cuotas_periodo(4, 2025) == []
+
+
+def test_un_pdf_por_recibo(generador, cuotas_marzo):
+    cuotas = cuotas_marzo(3)
+    avances = []
+
+    resultado = generador.generar_recibos_lote(cuotas, procesos=1, progreso=avances.append)
+
+    assert resultado['cantidad'] == 3
+    assert sorted(p.name for p in resultado['carpeta'].iterdir()) == sorted(resultado['archivos'])
+    assert avances == [3]
+
+
+def test_un_solo_pdf_combinado(generador, cuotas_marzo, tmp_path):
+    cuotas = cuotas_marzo(3)
+
+    resultado = generador.generar_recibos_lote(cuotas, combinar=True)
+
+    archivo, = resultado['archivos']
+    assert len(PAGINA_PDF.findall((tmp_path / archivo).read_bytes())) == 3
+
+
+def test_pool_de_procesos(generador, cuotas_marzo):
+    cuotas = cuotas_marzo(MIN_RECIBOS_PROCESOS + 5)
+    avances = []
+
+    resultado = generador.generar_recibos_lote(cuotas, procesos=2, progreso=avances.append)
+
+    assert len(set(resultado['archivos'])) == len(cuotas)
+    assert len(list(resultado['carpeta'].iterdir())) == len(cuotas)
+    assert avances[-1] == len(cuotas)
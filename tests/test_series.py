@@ -0,0 +1,89 @@
+"""
+Pruebas de las series financieras del dashboard
+"""
+
+import pytest
+
+from utils.series import SerieFinanciera
+
+
+@pytest.fixture
+def movimiento(db):
+    """Función que registra una transacción y devuelve su ID"""
+    def registrar(tipo: str, monto: float, fecha: str) -> int:
+        return db.registrar_transaccion({
+            'tipo': tipo, 'categoria': 'Otros', 'descripcion': 'Movimiento', 'monto': monto, 'fecha': fecha
+        })
+    return registrar
+
+
+def totales(serie) -> dict:
+    return {periodo: tuple(montos) for periodo, montos in serie.periodos.items()}
+
+
+def test_totales_por_mes(db, movimiento):
+    movimiento('ingreso', 100, '2025-01-05')
+    movimiento('egreso', 30, '2025-01-20')
+    movimiento('ingreso', 50, '2025-02-01')
+    serie = SerieFinanciera()
+
+    assert serie.actualizar(db)
+
+    assert totales(serie) == {'2025-01': (100, 30), '2025-02': (50, 0)}
+
+
+def test_solo_suma_las_transacciones_nuevas(db, movimiento):
+    movimiento('ingreso', 100, '2025-01-05')
+    serie = SerieFinanciera()
+    serie.actualizar(db)
+
+    movimiento('ingreso', 20, '2025-01-06')
+
+    assert serie.actualizar(db)
+    assert not serie.actualizar(db)
+    assert totales(serie) == {'2025-01': (120, 0)}
+
+
+def test_baja_reconstruye_la_serie(db, movimiento):
+    movimiento('ingreso', 100, '2025-01-05')
+    transaccion_id = movimiento('ingreso', 20, '2025-02-06')
+    serie = SerieFinanciera()
+    serie.actualizar(db)
+
+    db.eliminar_transaccion(transaccion_id)
+
+    assert serie.actualizar(db)
+    assert totales(serie) == {'2025-01': (100, 0)}
+
+
+def test_granularidad_semanal(db, movimiento):
+    movimiento('ingreso', 100, '2025-01-06')
+    movimiento('ingreso', 50, '2025-01-12')
+    movimiento('ingreso', 10, '2025-01-13')
+    serie = SerieFinanciera('semana')
+
+    serie.actualizar(db)
+
+    assert totales(serie) == {'2025-S01': (150, 0), '2025-S02': (10, 0)}
+
+
+def test_puntos_agrupa_periodos_consecutivos():
+    serie = SerieFinanciera()
+    serie.agregar([
+        {'periodo': f"2025-{mes:02d}", 'ingresos': 100, 'egresos': 40, 'cantidad': 2, 'ultimo_id': mes}
+        for mes in range(1, 6)
+    ])
+
+    puntos = serie.puntos(max_puntos=2)
+
+    assert [(p['periodo'], p['ingresos'], p['egresos'], p['balance']) for p in puntos] == [
+        ('2025-01', 300, 120, 180), ('2025-04', 200, 80, 300)
+    ]
+
+
+def test_sin_reducir_hay_un_punto_por_periodo():
+    serie = SerieFinanciera()
+    serie.agregar([{'periodo': '2025-01', 'ingresos': 10, 'egresos': 0, 'cantidad': 1, 'ultimo_id': 1}])
+
+    assert len(serie.puntos()) == 1
+    assert SerieFinanciera().puntos() == []
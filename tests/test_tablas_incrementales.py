@@ -0,0 +1,91 @@
+"""
+Pruebas de la actualización de las tablas fila por fila después de un alta,
+una edición o una baja
+"""
+
+import pytest
+
+from ui.views.socios_view import SociosView
+
+
+@pytest.fixture
+def alta(db):
+    """Función que da de alta un socio por la base y devuelve su ID"""
+    def alta_socio(apellido: str, dni: str, estado_pago: str = 'al_dia') -> int:
+        socio_id = db.agregar_socio({'nombre': 'Ana', 'apellido': apellido, 'dni': dni, 'categoria': 'U15'})
+        db.actualizar_estado_pago_socio(socio_id, estado_pago)
+        return socio_id
+    return alta_socio
+
+
+def apellidos(vista) -> list[str]:
+    """Apellidos en el orden en que los muestra la tabla"""
+    return [vista.table.item(fila, 2).text() for fila in range(vista.table.rowCount())]
+
+
+def recargada(db, vista) -> bool:
+    """Indica si la vista quedó igual que si se hubiera recargado completa"""
+    nueva = SociosView(db)
+    return (apellidos(vista) == apellidos(nueva)
+            and [s['id'] for s in vista.socios] == [s['id'] for s in nueva.socios]
+            and vista.estadisticas == nueva.estadisticas)
+
+
+def test_escrituras_devuelven_el_registro(db, alta):
+    socio_id = alta('Paz', '30000001')
+
+    actualizado = db.actualizar_socio(socio_id, {'nombre': 'Ana', 'apellido': 'Ríos', 'categoria': 'U13'})
+    baja = db.eliminar_socio(socio_id)
+
+    assert (actualizado['apellido'], actualizado['categoria']) == ('Ríos', 'U13')
+    assert 'fecha_inscripcion_texto' in actualizado
+    assert baja['id'] == socio_id
+    assert db.eliminar_socio(999) is None
+
+
+def test_alta_en_su_posicion(app, db, alta):
+    alta('Bravo', '30000001')
+    alta('Delta', '30000002')
+    vista = SociosView(db)
+
+    socio_id = alta('Charlie', '30000003', estado_pago='moroso')
+    vista.insert_socio_row(db.obtener_socio(socio_id))
+
+    assert apellidos(vista) == ['Bravo', 'Charlie', 'Delta']
+    assert vista.estadisticas == {'total': 3, 'al_dia': 2, 'moroso': 1}
+    assert recargada(db, vista)
+
+
+def test_edicion_que_cambia_el_orden(app, db, alta):
+    alta('Bravo', '30000001')
+    socio_id = alta('Delta', '30000002')
+    vista = SociosView(db)
+
+    anterior = db.obtener_socio(socio_id)
+    socio = db.actualizar_socio(socio_id, {'nombre': 'Ana', 'apellido': 'Alfa', 'categoria': 'U15'})
+    vista.update_socio_row(anterior, socio)
+
+    assert apellidos(vista) == ['Alfa', 'Bravo']
+    assert recargada(db, vista)
+
+
+def test_baja(app, db, alta):
+    socio_id = alta('Bravo', '30000001')
+    alta('Delta', '30000002')
+    vista = SociosView(db)
+
+    vista.remove_socio_row(db.eliminar_socio(socio_id))
+
+    assert apellidos(vista) == ['Delta']
+    assert vista.lbl_total.text() == "Total: 1"
+    assert recargada(db, vista)
+
+
+def test_socios_con_el_mismo_apellido(app, db, alta):
+    primero = alta('Paz', '30000001')
+    segundo = alta('Paz', '30000002')
+    vista = SociosView(db)
+
+    vista.remove_socio_row(db.eliminar_socio(segundo))
+
+    assert [s['id'] for s in vista.socios] == [primero]
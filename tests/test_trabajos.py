@@ -0,0 +1,90 @@
+"""
+Pruebas de la cola de exportaciones en segundo plano
+"""
+
+import threading
+import time
+
+import pytest
+
+from ui.jobs import GestorTrabajos
+
+
+@pytest.fixture
+def gestor(app):
+    gestor = GestorTrabajos()
+    yield gestor
+    gestor.cancelar_todos()
+
+
+def esperar(app, gestor, trabajo_id: int, segundos: float = 5) -> str:
+    """Procesa eventos hasta que el trabajo termina y devuelve su estado final"""
+    limite = time.monotonic() + segundos
+    while gestor.activos() and time.monotonic() < limite:
+        app.processEvents()
+        time.sleep(0.01)
+    app.processEvents()
+    return gestor.trabajos[trabajo_id].estado
+
+
+def test_trabajo_terminado_con_progreso(app, gestor):
+    finalizados = []
+    gestor.trabajo_finalizado.connect(finalizados.append)
+
+    def exportar(progreso=None):
+        progreso(500)
+        return 'reporte.xlsx'
+
+    trabajo_id = gestor.enviar("Reporte", exportar, total=500)
+
+    assert esperar(app, gestor, trabajo_id) == 'terminado'
+    trabajo = gestor.trabajos[trabajo_id]
+    assert (trabajo.resultado, trabajo.cantidad) == ('reporte.xlsx', 500)
+    assert finalizados == [trabajo]
+
+
+def test_funcion_sin_progreso(app, gestor):
+    trabajo_id = gestor.enviar("Reporte", lambda: 'reporte.pdf')
+
+    assert esperar(app, gestor, trabajo_id) == 'terminado'
+
+
+def test_error(app, gestor):
+    def exportar():
+        raise OSError("Disco lleno")
+
+    trabajo_id = gestor.enviar("Reporte", exportar)
+
+    assert esperar(app, gestor, trabajo_id) == 'error'
+    assert gestor.trabajos[trabajo_id].mensaje_error == "Disco lleno"
+
+
+def test_cancelar_en_curso(app, gestor):
+    iniciado = threading.Event()
+
+    def exportar(progreso=None):
+        iniciado.set()
+        while True:
+            progreso(1)
+            time.sleep(0.01)
+
+    trabajo_id = gestor.enviar("Reporte largo", exportar)
+    assert iniciado.wait(5)
+
+    gestor.cancelar(trabajo_id)
+
+    assert esperar(app, gestor, trabajo_id) == 'cancelado'
+
+
+def test_cancelar_en_cola(app, gestor):
+    liberar = threading.Event()
+    gestor.pool.setMaxThreadCount(1)
+    primero = gestor.enviar("Primero", lambda: liberar.wait(5))
+    segundo = gestor.enviar("Segundo", lambda: 'no debería correr')
+
+    gestor.cancelar(segundo)
+    liberar.set()
+
+    assert gestor.trabajos[segundo].estado == 'cancelado'
+    assert esperar(app, gestor, primero) == 'terminado'
+    assert gestor.trabajos[segundo].resultado is None
@@ -0,0 +1,124 @@
+"""
+Pruebas de los validadores por columna
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from utils.validators import (
+    primer_error,
+    validar_dnis,
+    validar_emails,
+    validar_fechas,
+    validar_montos,
+)
+
+
+@pytest.mark.parametrize('dni, esperado', [
+    ('30123456', '30123456'),
+    ('30.123.456', '30123456'),
+    ('1.234.567', '1234567'),
+    ('30 123 456', '30123456'),
+    ('30-123-456', '30123456'),
+    (30123456, '30123456'),
+    (30123456.0, '30123456'),
+    ('030123456', '30123456'),
+])
+def test_dni_valido(dni, esperado):
+    dnis, errores = validar_dnis([dni])
+
+    assert dnis[0] == esperado
+    assert pd.isna(errores[0])
+
+
+@pytest.mark.parametrize('dni, error', [
+    ('1234567.5', 'formato'),
+    (1234567.5, 'formato'),
+    ('30.123456', 'formato'),
+    ('30123.456', 'formato'),
+    ('30.123-456', 'formato'),
+    ('30A123456', 'no_numerico'),
+    ('123456', 'longitud'),
+    ('123.456.789', 'longitud'),
+    ('', 'vacio'),
+    (None, 'vacio'),
+])
+def test_dni_invalido(dni, error):
+    _, errores = validar_dnis([dni])
+
+    assert errores[0] == error
+
+
+def test_dni_vacio_opcional():
+    _, errores = validar_dnis([None], obligatorio=False)
+
+    assert pd.isna(errores[0])
+
+
+@pytest.mark.parametrize('monto, esperado', [
+    ('$ 5.000,50', 5000.5),
+    ('5000.50', 5000.5),
+    ('1.234.567,8', 1234567.8),
+    (5000, 5000.0),
+    (' 750 ', 750.0),
+])
+def test_monto_valido(monto, esperado):
+    montos, errores = validar_montos([monto])
+
+    assert montos[0] == esperado
+    assert pd.isna(errores[0])
+
+
+@pytest.mark.parametrize('monto, error', [
+    (0, 'no_positivo'),
+    ('-100', 'no_positivo'),
+    ('abc', 'formato'),
+    ('$', 'formato'),
+    ('', 'vacio'),
+    (None, 'vacio'),
+])
+def test_monto_invalido(monto, error):
+    _, errores = validar_montos([monto])
+
+    assert errores[0] == error
+
+
+@pytest.mark.parametrize('fecha, esperada', [
+    ('2025-03-02', '2025-03-02'),
+    ('02/03/2025', '2025-03-02'),
+    ('02-03-2025', '2025-03-02'),
+    ('02/03/25', '2025-03-02'),
+    ('2025-03-02 00:00:00', '2025-03-02'),
+    (datetime(2025, 3, 2), '2025-03-02'),
+])
+def test_fecha_valida(fecha, esperada):
+    fechas, errores = validar_fechas([fecha])
+
+    assert fechas[0] == esperada
+    assert pd.isna(errores[0])
+
+
+def test_fecha_invalida_y_vacia():
+    _, errores = validar_fechas(['31/02/2025', None], obligatorio=True)
+
+    assert list(errores) == ['fecha_invalida', 'vacio']
+
+
+def test_emails():
+    emails, errores = validar_emails(['Ana@Club.com.ar', 'sin-arroba', None])
+
+    assert emails[0] == 'ana@club.com.ar'
+    assert list(errores.fillna('')) == ['', 'formato', '']
+
+
+def test_primer_error_respeta_la_prioridad():
+    dni = pd.Series(['longitud', pd.NA, pd.NA], dtype='string')
+    monto = pd.Series(['no_positivo', 'formato', pd.NA], dtype='string')
+
+    motivos = primer_error(('DNI', dni), ('Monto', monto))
+
+    assert list(motivos.fillna('')) == [
+        'DNI: cantidad de dígitos incorrecta', 'Monto: formato inválido', ''
+    ]
@@ -0,0 +1,231 @@
+"""
+Cola de exportaciones en segundo plano
+Ejecuta exportaciones (Excel, PDF) en un pool de hilos propio, informando
+progreso y permitiendo cancelarlas sin bloquear la carga de datos
+"""
+
+import inspect
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from config.settings import EXPORT_CONFIG, EXPORTS_PATH
+
+logger = logging.getLogger(__name__)
+
+# Estados de un trabajo y su texto para mostrar
+ESTADOS_TRABAJO = {
+    'en_cola': 'En cola',
+    'en_curso': 'En curso',
+    'cancelando': 'Cancelando...',
+    'terminado': 'Terminado',
+    'error': 'Error',
+    'cancelado': 'Cancelado'
+}
+
+ESTADOS_FINALES = ('terminado', 'error', 'cancelado')
+
+
+class ExportacionCancelada(Exception):
+    """Se lanza desde el callback de progreso cuando el trabajo fue cancelado"""
+
+
+class TrabajoSignals(QObject):
+    """Señales emitidas por un trabajo de exportación"""
+    
+    iniciado = pyqtSignal(int)
+    progreso = pyqtSignal(int, int)
+    terminado = pyqtSignal(int, object)
+    error = pyqtSignal(int, str)
+    cancelado = pyqtSignal(int)
+
+
+class TrabajoExportacion(QRunnable):
+    """Exportación encolada en el pool de trabajos"""
+    
+    def __init__(self, trabajo_id: int, descripcion: str, funcion: Callable,
+                 total: int | None = None, carpeta: Path = EXPORTS_PATH):
+        """
+        Args:
+            trabajo_id: Identificador del trabajo
+            descripcion: Texto que se muestra en el panel
+            funcion: Función que genera el archivo y devuelve su nombre; si acepta
+                     el argumento 'progreso' recibe el callback de progreso
+            total: Cantidad de filas esperadas, si se conoce
+            carpeta: Carpeta donde queda el archivo generado
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # El gestor conserva el trabajo para mostrarlo
+        self.id = trabajo_id
+        self.descripcion = descripcion
+        self.funcion = funcion
+        self.total = total
+        self.carpeta = carpeta
+        self.estado = 'en_cola'
+        self.cantidad = 0
+        self.resultado = None
+        self.mensaje_error = None
+        self.cancelacion = threading.Event()
+        self.signals = TrabajoSignals()
+    
+    def reportar(self, cantidad: int):
+        """
+        Callback de progreso que se pasa a la función de exportación
+        
+        Args:
+            cantidad: Filas procesadas hasta el momento
+        
+        Raises:
+            ExportacionCancelada: Si se pidió cancelar el trabajo
+        """
+        if self.cancelacion.is_set():
+            raise ExportacionCancelada()
+        self.signals.progreso.emit(self.id, cantidad)
+    
+    def run(self):
+        """Ejecuta la exportación y emite el resultado, el error o la cancelación"""
+        if self.cancelacion.is_set():
+            self.signals.cancelado.emit(self.id)
+            return
+        
+        self.signals.iniciado.emit(self.id)
+        try:
+            if 'progreso' in inspect.signature(self.funcion).parameters:
+                resultado = self.funcion(progreso=self.reportar)
+            else:
+                resultado = self.funcion()
+        except ExportacionCancelada:
+            self.signals.cancelado.emit(self.id)
+        except Exception as e:
+            logger.exception(f"Error en la exportación '{self.descripcion}'")
+            self.signals.error.emit(self.id, str(e))
+        else:
+            self.signals.terminado.emit(self.id, resultado)
+
+
+class GestorTrabajos(QObject):
+    """Encola exportaciones y lleva el estado de cada una"""
+    
+    trabajo_agregado = pyqtSignal(object)
+    trabajo_actualizado = pyqtSignal(object)
+    trabajo_finalizado = pyqtSignal(object)
+    trabajo_eliminado = pyqtSignal(int)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(EXPORT_CONFIG['max_trabajos'])
+        self.trabajos: dict[int, TrabajoExportacion] = {}
+        self.siguiente_id = 1
+    
+    def enviar(self, descripcion: str, funcion: Callable, total: int | None = None,
+               carpeta: Path = EXPORTS_PATH) -> int:
+        """
+        Encola una exportación
+        
+        Args:
+            descripcion: Texto que se muestra en el panel
+            funcion: Función que genera el archivo y devuelve su nombre
+            total: Cantidad de filas esperadas, si se conoce
+            carpeta: Carpeta donde queda el archivo generado
+        
+        Returns:
+            ID del trabajo
+        """
+        trabajo = TrabajoExportacion(self.siguiente_id, descripcion, funcion, total, carpeta)
+        self.siguiente_id += 1
+        
+        trabajo.signals.iniciado.connect(self.on_iniciado)
+        trabajo.signals.progreso.connect(self.on_progreso)
+        trabajo.signals.terminado.connect(self.on_terminado)
+        trabajo.signals.error.connect(self.on_error)
+        trabajo.signals.cancelado.connect(self.on_cancelado)
+        
+        self.trabajos[trabajo.id] = trabajo
+        self.trabajo_agregado.emit(trabajo)
+        self.pool.start(trabajo)
+        self.limpiar_historial()
+        return trabajo.id
+    
+    def cancelar(self, trabajo_id: int):
+        """
+        Cancela un trabajo: si está en cola se quita del pool, si está en curso
+        se detiene en el próximo reporte de progreso
+        
+        Args:
+            trabajo_id: ID del trabajo
+        """
+        trabajo = self.trabajos.get(trabajo_id)
+        if trabajo is None or trabajo.estado in ESTADOS_FINALES:
+            return
+        
+        trabajo.cancelacion.set()
+        if trabajo.estado == 'en_cola' and self.pool.tryTake(trabajo):
+            self.finalizar(trabajo, 'cancelado')
+        else:
+            trabajo.estado = 'cancelando'
+            self.trabajo_actualizado.emit(trabajo)
+    
+    def cancelar_todos(self, espera_ms: int = 5000):
+        """
+        Cancela todos los trabajos pendientes y espera a que terminen los que están en curso
+        
+        Args:
+            espera_ms: Tiempo máximo de espera
+        """
+        for trabajo_id in list(self.trabajos):
+            self.cancelar(trabajo_id)
+        self.pool.waitForDone(espera_ms)
+    
+    def activos(self) -> int:
+        """Cantidad de trabajos en cola o en curso"""
+        return sum(1 for t in self.trabajos.values() if t.estado not in ESTADOS_FINALES)
+    
+    def limpiar_historial(self):
+        """Descarta los trabajos finalizados más antiguos que exceden el historial"""
+        finalizados = [t.id for t in self.trabajos.values() if t.estado in ESTADOS_FINALES]
+        for trabajo_id in finalizados[:max(0, len(finalizados) - EXPORT_CONFIG['historial'])]:
+            del self.trabajos[trabajo_id]
+            self.trabajo_eliminado.emit(trabajo_id)
+    
+    def finalizar(self, trabajo: TrabajoExportacion, estado: str):
+        """Marca un trabajo como finalizado y lo notifica"""
+        trabajo.estado = estado
+        self.trabajo_actualizado.emit(trabajo)
+        self.trabajo_finalizado.emit(trabajo)
+    
+    # ==================== SEÑALES DE LOS TRABAJOS ====================
+    
+    def on_iniciado(self, trabajo_id: int):
+        trabajo = self.trabajos.get(trabajo_id)
+        if trabajo is not None and trabajo.estado == 'en_cola':
+            trabajo.estado = 'en_curso'
+            self.trabajo_actualizado.emit(trabajo)
+    
+    def on_progreso(self, trabajo_id: int, cantidad: int):
+        trabajo = self.trabajos.get(trabajo_id)
+        if trabajo is not None:
+            trabajo.cantidad = cantidad
+            self.trabajo_actualizado.emit(trabajo)
+    
+    def on_terminado(self, trabajo_id: int, resultado):
+        trabajo = self.trabajos.get(trabajo_id)
+        if trabajo is not None:
+            trabajo.resultado = resultado
+            logger.info(f"Exportación terminada: {trabajo.descripcion} -> {resultado}")
+            self.finalizar(trabajo, 'terminado')
+    
+    def on_error(self, trabajo_id: int, mensaje: str):
+        trabajo = self.trabajos.get(trabajo_id)
+        if trabajo is not None:
+            trabajo.mensaje_error = mensaje
+            logger.error(f"Error en exportación {trabajo.descripcion}: {mensaje}")
+            self.finalizar(trabajo, 'error')
+    
+    def on_cancelado(self, trabajo_id: int):
+        trabajo = self.trabajos.get(trabajo_id)
+        if trabajo is not None:
+            self.finalizar(trabajo, 'cancelado')
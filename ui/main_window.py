@@ -5,18 +5,29 @@ Contiene el menú lateral y el área de contenido
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QStackedWidget, QLabel, QFrame
+    QPushButton, QStackedWidget, QLabel, QFrame, QDockWidget,
+    QSystemTrayIcon, QMessageBox
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtGui import QIcon, QPixmap, QKeySequence, QShortcut
+from datetime import date
+import logging
 
 from config.settings import WINDOW_CONFIG, COLORS, CLUB_INFO, ASSETS_PATH
 from ui.styles import get_style
+from ui.jobs import GestorTrabajos
+from ui.prefetch import Prefetcher
+from ui.widgets import PaletaBusqueda, PanelTrabajos, abrir_carpeta
+from ui.workers import Worker
+from utils.buscador import IndiceGlobal
+from utils.export_cache import CacheExportaciones
 from ui.views. dashboard_view import DashboardView
 from ui.views.socios_view import SociosView
 from ui.views. finanzas_view import FinanzasView
 from ui.views. sponsors_view import SponsorsView
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """Ventana principal del sistema"""
@@ -53,9 +64,21 @@ class MainWindow(QMainWindow):
         self.content_area = QStackedWidget()
         main_layout.addWidget(self. content_area)
         
+        # Cola de exportaciones en segundo plano
+        self.create_jobs_dock()
+        
         # Cargar vistas
         self.load_views()
         
+        # Búsqueda global (Ctrl+K)
+        self.create_search_palette()
+        
+        # Cuotas esperadas del mes en curso y estado de pago de los socios
+        self.start_expected_fees_job()
+        
+        # Retención de la carpeta de exportaciones
+        self.start_export_retention_job()
+        
         # Mostrar dashboard por defecto
         self.show_dashboard()
     
@@ -202,24 +225,144 @@ class MainWindow(QMainWindow):
         
         return footer
     
+    def create_jobs_dock(self):
+        """Crea la cola de exportaciones y el panel acoplable que la muestra"""
+        self.jobs = GestorTrabajos(self)
+        self.jobs.trabajo_agregado.connect(lambda trabajo: self.jobs_dock.show())
+        self.jobs.trabajo_finalizado.connect(self.notify_job_finished)
+        
+        self.jobs_dock = QDockWidget("Exportaciones", self)
+        self.jobs_dock.setObjectName("jobs_dock")
+        self.jobs_dock.setWidget(PanelTrabajos(self.jobs))
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.jobs_dock)
+        self.jobs_dock.hide()
+        
+        # Notificaciones del sistema, si el escritorio las soporta
+        self.tray_icon = None
+        self.ultima_carpeta = None
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(QIcon(str(ASSETS_PATH / "logo.png")), self)
+            self.tray_icon.messageClicked.connect(lambda: abrir_carpeta(self.ultima_carpeta))
+            self.tray_icon.show()
+    
+    def notify_job_finished(self, trabajo):
+        """
+        Avisa que terminó una exportación sin interrumpir la carga de datos
+        
+        Args:
+            trabajo: Trabajo finalizado
+        """
+        if trabajo.estado == 'terminado':
+            mensaje = f"{trabajo.descripcion}: {trabajo.resultado}"
+        elif trabajo.estado == 'error':
+            mensaje = f"{trabajo.descripcion}: error - {trabajo.mensaje_error}"
+        else:
+            mensaje = f"{trabajo.descripcion}: cancelada"
+        
+        self.statusBar().showMessage(mensaje, 10000)
+        
+        if self.tray_icon is not None and trabajo.estado == 'terminado':
+            self.ultima_carpeta = trabajo.carpeta
+            self.tray_icon.showMessage(
+                "Exportación terminada",
+                f"{mensaje}\nHaga clic para abrir la carpeta",
+                QSystemTrayIcon.MessageIcon.Information
+            )
+    
     def load_views(self):
         """Carga todas las vistas de la aplicación"""
+        # Precarga en tiempo ocioso: datos probables según la vista activa
+        self.prefetcher = Prefetcher(self.db_manager, {
+            'dashboard': lambda: [self.socios_view.data_key(), self.finanzas_view.period_key()],
+            'socios': lambda: [*self.recent_cuotas_keys(), self.finanzas_view.period_key()],
+            'finanzas': lambda: [self.socios_view.data_key()],
+            'sponsors': lambda: [self.socios_view.data_key()]
+        }, self)
+        
         # Dashboard
         self.dashboard_view = DashboardView(self.db_manager)
         self.content_area.addWidget(self.dashboard_view)
         
         # Socios
-        self.socios_view = SociosView(self.db_manager)
+        self.socios_view = SociosView(self.db_manager, self.prefetcher, self.jobs)
         self.content_area.addWidget(self. socios_view)
         
         # Finanzas
-        self.finanzas_view = FinanzasView(self. db_manager)
+        self.finanzas_view = FinanzasView(self.db_manager, self.prefetcher, self.jobs)
         self.content_area.addWidget(self.finanzas_view)
         
         # Sponsors
         self.sponsors_view = SponsorsView(self.db_manager)
         self.content_area.addWidget(self.sponsors_view)
     
+    def create_search_palette(self):
+        """Arma el índice de la búsqueda global en segundo plano y registra Ctrl+K"""
+        self.indice_global = IndiceGlobal(self.db_manager)
+        self.palette = PaletaBusqueda(self.indice_global, self)
+        self.palette.seleccionado.connect(self.open_search_result)
+        
+        self.indice_worker = Worker(self.indice_global.leer)
+        self.indice_worker.signals.finished.connect(self.on_search_index_loaded)
+        self.indice_worker.signals.error.connect(
+            lambda mensaje: logger.error(f"No se pudo armar el índice de búsqueda: {mensaje}")
+        )
+        QThreadPool.globalInstance().start(self.indice_worker)
+        
+        self.palette_shortcut = QShortcut(QKeySequence("Ctrl+K"), self)
+        self.palette_shortcut.activated.connect(self.palette.abrir)
+    
+    def start_expected_fees_job(self):
+        """Genera en segundo plano las cuotas esperadas que falten desde la temporada del último período generado"""
+        hoy = date.today()
+        self.fees_worker = Worker(self.db_manager.generar_cuotas_esperadas, hoy.year, hoy.month)
+        self.fees_worker.signals.finished.connect(self.on_expected_fees_generated)
+        self.fees_worker.signals.error.connect(
+            lambda mensaje: logger.error(f"No se pudieron generar las cuotas esperadas: {mensaje}")
+        )
+        QThreadPool.globalInstance().start(self.fees_worker)
+    
+    def start_export_retention_job(self):
+        """Elimina en segundo plano las exportaciones que superan la retención configurada"""
+        self.retention_worker = Worker(CacheExportaciones().podar)
+        self.retention_worker.signals.error.connect(
+            lambda mensaje: logger.warning(f"No se pudo aplicar la retención de exportaciones: {mensaje}")
+        )
+        QThreadPool.globalInstance().start(self.retention_worker)
+    
+    def on_expected_fees_generated(self, resultado: dict):
+        """Recarga las vistas que muestran el estado de pago si algún socio cambió"""
+        if resultado['morosos'] or resultado['al_dia']:
+            self.socios_view.refresh_data()
+            self.dashboard_view.refresh_data()
+    
+    def on_search_index_loaded(self, leido):
+        """Instala el índice leído y refresca la búsqueda si ya estaba abierta"""
+        self.indice_global.instalar(leido)
+        if self.palette.isVisible():
+            self.palette.actualizar_resultados()
+    
+    def open_search_result(self, tipo: str, fila: dict):
+        """
+        Navega a la vista de un resultado de la búsqueda global y lo selecciona
+        
+        Args:
+            tipo: 'socios', 'sponsors' o 'transacciones'
+            fila: Datos del resultado
+        """
+        if tipo == 'socios':
+            self.show_socios()
+            self.socios_view.select_socio(fila)
+        elif tipo == 'transacciones':
+            self.show_finanzas()
+            self.finanzas_view.select_transaccion(fila)
+        else:
+            self.show_sponsors()
+            self.sponsors_view.select_sponsor(fila)
+    
+    def recent_cuotas_keys(self) -> list:
+        """Claves de precarga de los historiales de los últimos socios consultados"""
+        return [self.socios_view.cuotas_key(socio_id) for socio_id in self.prefetcher.socios_recientes]
+    
     def update_menu_buttons(self, active_button: QPushButton):
         """
         Actualiza el estado visual de los botones del menú
@@ -237,26 +380,50 @@ class MainWindow(QMainWindow):
         for btn in buttons:
             btn.setChecked(btn == active_button)
     
+    def closeEvent(self, event):
+        """Guarda el estado del dashboard y detiene las exportaciones antes de cerrar"""
+        activos = self.jobs.activos()
+        if activos:
+            reply = QMessageBox.question(
+                self,
+                "Exportaciones en curso",
+                f"Hay {activos} exportación(es) sin terminar.\n¿Desea cancelarlas y salir?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        self.jobs.cancelar_todos()
+        
+        self.dashboard_view.save_snapshot()
+        logger.info(f"Estadísticas de precarga: {self.prefetcher.estadisticas()}")
+        logger.info(f"Lecturas de listados: {self.db_manager.estadisticas_lecturas()}")
+        super().closeEvent(event)
+    
     def show_dashboard(self):
         """Muestra la vista del Dashboard"""
         self.content_area.setCurrentWidget(self.dashboard_view)
         self.update_menu_buttons(self.btn_dashboard)
         self.dashboard_view.refresh_data()
+        self.prefetcher.vista_activa('dashboard')
     
     def show_socios(self):
         """Muestra la vista de Socios"""
         self.content_area.setCurrentWidget(self. socios_view)
         self.update_menu_buttons(self.btn_socios)
         self.socios_view.refresh_data()
+        self.prefetcher.vista_activa('socios')
     
     def show_finanzas(self):
         """Muestra la vista de Finanzas"""
         self.content_area.setCurrentWidget(self.finanzas_view)
         self.update_menu_buttons(self.btn_finanzas)
         self.finanzas_view.refresh_data()
+        self.prefetcher.vista_activa('finanzas')
     
     def show_sponsors(self):
         """Muestra la vista de Sponsors"""
         self.content_area.setCurrentWidget(self.sponsors_view)
         self.update_menu_buttons(self.btn_sponsors)
-        self.sponsors_view.refresh_data()
\ No newline at end of file
+        self.sponsors_view.refresh_data()
+        self.prefetcher.vista_activa('sponsors')
\ No newline at end of file
@@ -0,0 +1,289 @@
+"""
+Precarga de datos en tiempo ocioso
+Mientras el usuario no interactúa, consulta en segundo plano los datos
+de las vistas a las que probablemente navegue a continuación
+"""
+
+import logging
+import sys
+from collections import OrderedDict, deque
+from collections.abc import Callable
+
+from PyQt6.QtCore import QEvent, QObject, QThreadPool, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from config.settings import PREFETCH_CONFIG
+from ui.workers import Worker
+
+logger = logging.getLogger(__name__)
+
+# Eventos que indican que el usuario está actuando
+EVENTOS_USUARIO = (
+    QEvent.Type.KeyPress,
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.Wheel
+)
+
+
+def estimar_bytes(filas) -> int:
+    """
+    Estima la memoria ocupada por una lista de diccionarios a partir de una muestra
+
+    Args:
+        filas: Lista de diccionarios (o cualquier otro resultado)
+
+    Returns:
+        Tamaño aproximado en bytes
+    """
+    if not isinstance(filas, list) or not filas:
+        return sys.getsizeof(filas)
+
+    muestra = filas[:20]
+    por_fila = sum(
+        sys.getsizeof(fila) + sum(sys.getsizeof(v) for v in fila.values())
+        for fila in muestra
+    ) / len(muestra)
+    return int(por_fila * len(filas)) + sys.getsizeof(filas)
+
+
+def cargar_clave(db_manager, clave: tuple):
+    """
+    Ejecuta la consulta correspondiente a una clave de precarga
+
+    Args:
+        db_manager: Gestor de base de datos
+        clave: ('socios', columnas), ('transacciones', desde, hasta, columnas) o
+               ('cuotas', socio_id, columnas); columnas None para todas
+
+    Returns:
+        Resultado de la consulta
+    """
+    tipo = clave[0]
+    if tipo == 'socios':
+        return db_manager.obtener_todos_socios(columnas=clave[1])
+    if tipo == 'transacciones':
+        return db_manager.obtener_transacciones_periodo(clave[1], clave[2], columnas=clave[3])
+    if tipo == 'cuotas':
+        return db_manager.obtener_cuotas_socio(clave[1], columnas=clave[2])
+    raise ValueError(f"Clave de precarga desconocida: {clave}")
+
+
+def obtener_datos(prefetcher: 'Prefetcher | None', db_manager, clave: tuple):
+    """
+    Obtiene los datos de una clave usando la precarga si está disponible
+
+    Args:
+        prefetcher: Prefetcher de la aplicación o None
+        db_manager: Gestor de base de datos
+        clave: Clave de los datos
+
+    Returns:
+        Resultado de la consulta
+    """
+    if prefetcher is not None:
+        return prefetcher.obtener(clave)
+    return cargar_clave(db_manager, clave)
+
+
+class Prefetcher(QObject):
+    """Precarga en segundo plano los datos de las vistas adyacentes"""
+
+    def __init__(self, db_manager, proveedores: dict[str, Callable[[], list[tuple]]], parent=None):
+        """
+        Args:
+            db_manager: Gestor de base de datos
+            proveedores: Por cada vista, función que devuelve las claves a precargar
+                         cuando esa vista está activa
+            parent: QObject padre
+        """
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.proveedores = proveedores
+        self.presupuesto = PREFETCH_CONFIG['presupuesto_mb'] * 1024 * 1024
+
+        self.cache = OrderedDict()  # clave -> (version_datos, datos, bytes)
+        self.bytes_en_uso = 0
+        self.socios_recientes = deque(maxlen=PREFETCH_CONFIG['socios_recientes'])
+        self.vista = None
+
+        self.pendientes = []
+        self.generacion = 0  # Cambia al cancelar para descartar resultados en vuelo
+        self.worker = None
+        self.stats = {'aciertos': 0, 'fallos': 0, 'precargas': 0, 'canceladas': 0, 'descartadas': 0}
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(PREFETCH_CONFIG['espera_ms'])
+        self.timer.timeout.connect(self.start)
+
+        QApplication.instance().installEventFilter(self)
+
+    # ==================== CONSULTA ====================
+
+    def obtener(self, clave: tuple):
+        """
+        Devuelve los datos de una clave, precargados si están disponibles
+
+        Args:
+            clave: Clave de los datos
+
+        Returns:
+            Resultado de la consulta
+        """
+        datos = self.precargado(clave)
+        if datos is not None:
+            return datos
+
+        self.stats['fallos'] += 1
+        return cargar_clave(self.db_manager, clave)
+
+    def precargado(self, clave: tuple):
+        """
+        Retira de la caché los datos precargados de una clave, sin consultar la base
+
+        Args:
+            clave: Clave de los datos
+
+        Returns:
+            Datos precargados y vigentes, o None si no los hay
+        """
+        entrada = self.cache.pop(clave, None)
+        if entrada is None:
+            return None
+
+        version, datos, tamanio = entrada
+        self.bytes_en_uso -= tamanio
+        if version == self.db_manager.version_datos:
+            self.stats['aciertos'] += 1
+            return datos
+        self.stats['descartadas'] += 1
+        return None
+
+    # ==================== EVENTOS DE NAVEGACIÓN ====================
+
+    def vista_activa(self, nombre: str):
+        """
+        Registra la vista actual y programa la precarga de sus vecinas
+
+        Args:
+            nombre: Nombre de la vista ('dashboard', 'socios', etc.)
+        """
+        self.vista = nombre
+        self.cancel()
+
+    def socio_visto(self, socio_id: int):
+        """
+        Registra un socio consultado para precargar su historial de cuotas
+
+        Args:
+            socio_id: ID del socio
+        """
+        if socio_id in self.socios_recientes:
+            self.socios_recientes.remove(socio_id)
+        self.socios_recientes.appendleft(socio_id)
+
+    def eventFilter(self, obj, event) -> bool:
+        """Cancela la precarga y reinicia la espera cuando el usuario actúa"""
+        if event.type() in EVENTOS_USUARIO:
+            self.cancel()
+        return False
+
+    def cancel(self):
+        """Cancela la precarga en curso y vuelve a esperar inactividad"""
+        if self.pendientes or self.worker is not None:
+            self.stats['canceladas'] += 1
+            self.generacion += 1
+            self.pendientes = []
+        self.timer.start()
+
+    # ==================== PRECARGA ====================
+
+    def start(self):
+        """Arma la lista de claves a precargar y comienza con la primera"""
+        proveedor = self.proveedores.get(self.vista)
+        if proveedor is None:
+            return
+
+        self.pendientes = [clave for clave in proveedor() if not self.is_cached(clave)]
+        self.next()
+
+    def is_cached(self, clave: tuple) -> bool:
+        """Indica si una clave ya está precargada y vigente"""
+        entrada = self.cache.get(clave)
+        return entrada is not None and entrada[0] == self.db_manager.version_datos
+
+    def next(self):
+        """Lanza la siguiente precarga pendiente (una a la vez)"""
+        if self.worker is not None or not self.pendientes:
+            return
+
+        clave = self.pendientes.pop(0)
+        generacion = self.generacion
+        version = self.db_manager.version_datos
+
+        self.worker = Worker(cargar_clave, self.db_manager, clave)
+        self.worker.signals.finished.connect(
+            lambda datos: self.on_loaded(clave, datos, version, generacion)
+        )
+        self.worker.signals.error.connect(self.on_error)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def on_loaded(self, clave: tuple, datos, version: int, generacion: int):
+        """Guarda el resultado de una precarga si sigue siendo válido"""
+        self.worker = None
+
+        if generacion != self.generacion or version != self.db_manager.version_datos:
+            self.stats['descartadas'] += 1
+        else:
+            self.store(clave, datos, version)
+
+        self.next()
+
+    def on_error(self, error: str):
+        """Registra un error de precarga y continúa con la siguiente"""
+        self.worker = None
+        logger.warning(f"Error en precarga: {error}")
+        self.next()
+
+    def store(self, clave: tuple, datos, version: int):
+        """
+        Guarda datos precargados respetando el presupuesto de memoria
+
+        Args:
+            clave: Clave de los datos
+            datos: Resultado de la consulta
+            version: Versión de datos al momento de consultar
+        """
+        tamanio = estimar_bytes(datos)
+        if tamanio > self.presupuesto:
+            self.stats['descartadas'] += 1
+            return
+
+        anterior = self.cache.pop(clave, None)
+        if anterior is not None:
+            self.bytes_en_uso -= anterior[2]
+
+        # Desalojar las entradas más antiguas hasta que entre la nueva
+        while self.cache and self.bytes_en_uso + tamanio > self.presupuesto:
+            _, (_, _, liberado) = self.cache.popitem(last=False)
+            self.bytes_en_uso -= liberado
+
+        self.cache[clave] = (version, datos, tamanio)
+        self.bytes_en_uso += tamanio
+        self.stats['precargas'] += 1
+
+    def estadisticas(self) -> dict:
+        """
+        Devuelve las estadísticas de uso de la precarga
+
+        Returns:
+            Diccionario con aciertos, fallos, tasa de aciertos y memoria usada
+        """
+        consultas = self.stats['aciertos'] + self.stats['fallos']
+        return {
+            **self.stats,
+            'tasa_aciertos': self.stats['aciertos'] / consultas if consultas else 0.0,
+            'bytes_en_uso': self.bytes_en_uso,
+            'entradas': len(self.cache)
+        }
+
@@ -7,10 +7,18 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFrame, QGridLayout, QScrollArea
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtGui import QFont
+from datetime import datetime
+import logging
 
-from config.settings import COLORS
+from config.settings import COLORS, DASHBOARD_SNAPSHOT_PATH, TRAMOS_ATRASO
+from ui.workers import Worker
+from utils.snapshot import guardar_snapshot, cargar_snapshot
+from ui.widgets.charts import GraficoFinanciero, GraficoCategorias
+from utils.series import SerieFinanciera
+
+logger = logging.getLogger(__name__)
 
 
 class DashboardView(QWidget):
@@ -19,7 +27,14 @@ class DashboardView(QWidget):
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self.serie_financiera = SerieFinanciera('mes')
+        self.metricas = None
+        self.worker = None
+        self.actualizacion_pendiente = False
         self.init_ui()
+        
+        # Mostrar de inmediato las últimas métricas guardadas
+        self.load_snapshot()
     
     def init_ui(self):
         """Inicializa la interfaz del dashboard"""
@@ -38,11 +53,10 @@ class DashboardView(QWidget):
         title.setObjectName("title")
         layout.addWidget(title)
         
-        # Subtítulo con fecha actual
-        from datetime import datetime
-        subtitle = QLabel(f"Última actualización: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
-        subtitle.setStyleSheet(f"color: {COLORS['text']}; font-size: 11pt;")
-        layout.addWidget(subtitle)
+        # Subtítulo con la fecha de los datos mostrados
+        self.lbl_actualizacion = QLabel("Actualizando datos...")
+        self.lbl_actualizacion.setStyleSheet(f"color: {COLORS['text']}; font-size: 11pt;")
+        layout.addWidget(self.lbl_actualizacion)
         
         # Tarjetas de resumen financiero
         financial_cards = self.create_financial_cards()
@@ -52,6 +66,10 @@ class DashboardView(QWidget):
         stats_cards = self.create_stats_cards()
         layout.addLayout(stats_cards)
         
+        # Gráficos
+        charts_section = self.create_charts_section()
+        layout.addLayout(charts_section)
+        
         # Alertas y notificaciones
         alerts_section = self.create_alerts_section()
         layout.addWidget(alerts_section)
@@ -148,6 +166,24 @@ class DashboardView(QWidget):
         
         return layout
     
+    def create_charts_section(self) -> QHBoxLayout:
+        """
+        Crea los gráficos de evolución financiera y de socios por categoría
+        
+        Returns:
+            Layout con los gráficos
+        """
+        layout = QHBoxLayout()
+        layout.setSpacing(20)
+        
+        self.grafico_financiero = GraficoFinanciero()
+        layout.addWidget(self.grafico_financiero, 2)
+        
+        self.grafico_categorias = GraficoCategorias()
+        layout.addWidget(self.grafico_categorias, 1)
+        
+        return layout
+    
     def create_metric_card(self, title: str, value: str, color: str, style: str) -> QFrame:
         """
         Crea una tarjeta de métrica financiera
@@ -277,42 +313,132 @@ class DashboardView(QWidget):
         return section
     
     def refresh_data(self):
-        """Actualiza todos los datos del dashboard"""
+        """Actualiza todos los datos del dashboard en segundo plano"""
+        if self.worker is not None:
+            # Se repite al terminar la actual, que puede tener datos viejos
+            self.actualizacion_pendiente = True
+            return
+        
+        self.worker = Worker(self.collect_metrics)
+        self.worker.signals.finished.connect(self.on_metrics_ready)
+        self.worker.signals.error.connect(self.on_metrics_error)
+        QThreadPool.globalInstance().start(self.worker)
+    
+    def collect_metrics(self) -> dict:
+        """
+        Consulta todas las métricas del dashboard (sin tocar la interfaz)
+        
+        Returns:
+            Diccionario serializable con las métricas
+        """
+        balance = self.db_manager.obtener_balance_general()
+        
+        # La serie solo consulta las transacciones nuevas
+        self.serie_financiera.actualizar(self.db_manager)
+        
+        socios = self.db_manager.obtener_todos_socios(columnas=('estado_pago',))
+        sponsors = self.db_manager.obtener_sponsors_activos(columnas=())
+        sponsors_vencer = self.db_manager.obtener_sponsors_proximos_vencer(30)
+        
+        # Socios con cuotas vencidas por tramo de atraso
+        atrasos = [0] * len(TRAMOS_ATRASO)
+        for fila in self.db_manager.obtener_resumen_atrasos(datetime.now().strftime('%Y-%m-%d')):
+            atrasos[fila['tramo']] += fila['socios']
+        
+        return {
+            'fecha': datetime.now().strftime('%d/%m/%Y %H:%M'),
+            'ingresos': balance['ingresos'],
+            'egresos': balance['egresos'],
+            'balance': balance['balance'],
+            'socios_total': len(socios),
+            'socios_al_dia': len([s for s in socios if s['estado_pago'] == 'al_dia']),
+            'socios_morosos': len([s for s in socios if s['estado_pago'] == 'moroso']),
+            'sponsors_activos': len(sponsors),
+            'sponsors_por_vencer': len(sponsors_vencer),
+            'atrasos_por_tramo': atrasos,
+            'serie_financiera': self.serie_financiera.puntos(),
+            'socios_por_categoria': self.db_manager.obtener_socios_por_categoria()
+        }
+    
+    def on_metrics_ready(self, metricas: dict):
+        """Muestra las métricas recién calculadas y las guarda en disco"""
+        self.worker = None
+        self.apply_metrics(metricas)
+        self.save_snapshot()
+        self.run_pending_refresh()
+    
+    def on_metrics_error(self, error: str):
+        """Informa un error de la actualización en segundo plano"""
+        self.worker = None
+        logger.warning(f"Error al actualizar dashboard: {error}")
+        self.run_pending_refresh()
+    
+    def run_pending_refresh(self):
+        """Lanza la actualización pedida mientras corría la anterior"""
+        if self.actualizacion_pendiente:
+            self.actualizacion_pendiente = False
+            self.refresh_data()
+    
+    def apply_metrics(self, metricas: dict, desde_snapshot: bool = False):
+        """
+        Actualiza tarjetas, gráficos y alertas con las métricas dadas
+        
+        Args:
+            metricas: Diccionario generado por collect_metrics
+            desde_snapshot: True si los datos provienen del último guardado
+        """
+        self.metricas = metricas
+        
+        if desde_snapshot:
+            self.lbl_actualizacion.setText(f"Datos del {metricas['fecha']} - actualizando...")
+        else:
+            self.lbl_actualizacion.setText(f"Última actualización: {metricas['fecha']}")
+        
+        # Tarjetas financieras
+        self.card_ingresos.value_label.setText(f"${metricas['ingresos']:,.2f}")
+        self.card_egresos.value_label.setText(f"${metricas['egresos']:,.2f}")
+        self.card_balance.value_label.setText(f"${metricas['balance']:,.2f}")
+        
+        # Gráficos
+        self.grafico_financiero.actualizar(metricas['serie_financiera'])
+        self.grafico_categorias.actualizar(metricas['socios_por_categoria'])
+        
+        # Estadísticas de socios y sponsors
+        self.card_socios_total.value_label.setText(str(metricas['socios_total']))
+        self.card_socios_al_dia.value_label.setText(str(metricas['socios_al_dia']))
+        self.card_socios_morosos.value_label.setText(str(metricas['socios_morosos']))
+        self.card_sponsors.value_label.setText(str(metricas['sponsors_activos']))
+        
+        # Alertas
+        self.update_alerts(metricas['socios_morosos'], metricas['sponsors_por_vencer'],
+                           metricas.get('atrasos_por_tramo'))
+    
+    def load_snapshot(self):
+        """Muestra las métricas guardadas en la última sesión, si existen"""
+        metricas = cargar_snapshot(DASHBOARD_SNAPSHOT_PATH)
+        if not metricas:
+            return
+        
         try:
-            # Obtener balance general
-            balance = self.db_manager.obtener_balance_general()
-            
-            # Actualizar tarjetas financieras
-            self.card_ingresos.value_label.setText(f"${balance['ingresos']: ,.2f}")
-            self.card_egresos.value_label.setText(f"${balance['egresos']:,.2f}")
-            self.card_balance.value_label.setText(f"${balance['balance']:,.2f}")
-            
-            # Obtener estadísticas de socios
-            socios = self.db_manager.obtener_todos_socios()
-            socios_al_dia = [s for s in socios if s['estado_pago'] == 'al_dia']
-            socios_morosos = [s for s in socios if s['estado_pago'] == 'moroso']
-            
-            self.card_socios_total.value_label.setText(str(len(socios)))
-            self.card_socios_al_dia.value_label.setText(str(len(socios_al_dia)))
-            self.card_socios_morosos. value_label.setText(str(len(socios_morosos)))
-            
-            # Obtener sponsors activos
-            sponsors = self. db_manager.obtener_sponsors_activos()
-            self.card_sponsors.value_label. setText(str(len(sponsors)))
-            
-            # Actualizar alertas
-            self.update_alerts(socios_morosos, sponsors)
-            
-        except Exception as e:
-            print(f"Error al actualizar dashboard: {e}")
+            self.apply_metrics(metricas, desde_snapshot=True)
+        except (KeyError, TypeError, ValueError) as e:
+            # Snapshot de una versión anterior (u otros tramos de atraso): se ignora
+            logger.warning(f"Snapshot del dashboard descartado: {e}")
     
-    def update_alerts(self, socios_morosos: list, sponsors: list):
+    def save_snapshot(self):
+        """Guarda en disco las últimas métricas mostradas"""
+        if self.metricas:
+            guardar_snapshot(DASHBOARD_SNAPSHOT_PATH, self.metricas)
+    
+    def update_alerts(self, socios_morosos: int, sponsors_por_vencer: int, atrasos_por_tramo: list | None = None):
         """
         Actualiza la sección de alertas
         
         Args:
-            socios_morosos: Lista de socios con deudas
-            sponsors: Lista de sponsors activos
+            socios_morosos: Cantidad de socios con deudas
+            sponsors_por_vencer: Cantidad de contratos que vencen en 30 días
+            atrasos_por_tramo: Socios con cuotas vencidas en cada tramo de TRAMOS_ATRASO
+                               (no está en los snapshots anteriores)
         """
         # Limpiar alertas anteriores
         while self.alerts_container.count():
@@ -323,17 +449,23 @@ class DashboardView(QWidget):
         has_alerts = False
         
         # Alerta de socios morosos
-        if len(socios_morosos) > 0:
+        if socios_morosos > 0:
             has_alerts = True
-            alert = QLabel(f"⚠️ Hay {len(socios_morosos)} socios con cuotas pendientes")
+            texto = f"⚠️ Hay {socios_morosos} socios con cuotas pendientes"
+            if atrasos_por_tramo and any(atrasos_por_tramo):
+                texto += " (" + " · ".join(
+                    f"{nombre.lower()}: {cantidad}"
+                    for (_, nombre), cantidad in zip(TRAMOS_ATRASO, atrasos_por_tramo, strict=True) if cantidad
+                ) + ")"
+            alert = QLabel(texto)
+            alert.setToolTip("Detalle por categoría en Finanzas > Antigüedad de Deuda")
             alert.setStyleSheet(f"color: {COLORS['warning']}; font-size: 11pt; padding: 10px;")
             self.alerts_container.addWidget(alert)
         
         # Alerta de sponsors próximos a vencer
-        sponsors_vencer = self.db_manager.obtener_sponsors_proximos_vencer(30)
-        if len(sponsors_vencer) > 0:
+        if sponsors_por_vencer > 0:
             has_alerts = True
-            alert = QLabel(f"📅 Hay {len(sponsors_vencer)} contratos de sponsors por vencer en 30 días")
+            alert = QLabel(f"📅 Hay {sponsors_por_vencer} contratos de sponsors por vencer en 30 días")
             alert.setStyleSheet(f"color:  {COLORS['warning']}; font-size: 11pt; padding: 10px;")
             self.alerts_container.addWidget(alert)
         
@@ -8,21 +8,40 @@ from PyQt6.QtWidgets import (
     QPushButton, QTableWidget, QTableWidgetItem, QFrame,
     QDialog, QFormLayout, QComboBox, QDateEdit, QTextEdit,
     QMessageBox, QHeaderView, QAbstractItemView, QDialogButtonBox,
-    QDoubleSpinBox, QTabWidget, QGridLayout
+    QDoubleSpinBox, QTabWidget, QSpinBox
 )
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from itertools import islice
+import logging
 
-from config.settings import COLORS, CATEGORIAS_INGRESOS, CATEGORIAS_EGRESOS
+from config.settings import (
+    COLORS, CATEGORIAS_BASQUET, CATEGORIAS_INGRESOS, CATEGORIAS_EGRESOS, MESES, TRAMOS_ATRASO
+)
+from database.database import TABLAS_ANALISIS
+from ui.prefetch import obtener_datos
+from utils.export_cache import exportar_con_cache
+from utils.formatters import monto_a_texto
+
+logger = logging.getLogger(__name__)
+
+# Columnas de las transacciones que muestran las tablas
+COLUMNAS_LISTADO = ('fecha', 'tipo', 'categoria', 'descripcion', 'monto', 'metodo_pago')
+
+# Socios que muestra el detalle de atrasos (el reporte los incluye a todos)
+LIMITE_DETALLE_ATRASOS = 500
 
 
 class FinanzasView(QWidget):
     """Vista principal de finanzas"""
     
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, prefetcher=None, jobs=None):
         super().__init__()
         self.db_manager = db_manager
+        self.prefetcher = prefetcher
+        self.jobs = jobs
+        self.totales = {'ingreso': 0.0, 'egreso': 0.0}
         self.init_ui()
     
     def init_ui(self):
@@ -143,6 +162,23 @@ class FinanzasView(QWidget):
         btn_exportar. setCursor(Qt.CursorShape.PointingHandCursor)
         layout.addWidget(btn_exportar)
         
+        btn_analisis = QPushButton("📦 Exportar para Análisis")
+        btn_analisis.setToolTip("Socios, cuotas, transacciones y sponsors en archivos para planillas o BI")
+        btn_analisis.clicked.connect(self.exportar_analisis)
+        btn_analisis.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_analisis)
+        
+        btn_reporte = QPushButton("📑 Reporte Financiero")
+        btn_reporte.clicked.connect(self.show_reporte_dialog)
+        btn_reporte.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_reporte)
+        
+        btn_atrasos = QPushButton("⏳ Antigüedad de Deuda")
+        btn_atrasos.setToolTip("Socios con cuotas vencidas por categoría y días de atraso")
+        btn_atrasos.clicked.connect(self.show_atrasos_dialog)
+        btn_atrasos.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_atrasos)
+        
         layout.addStretch()
         
         return layout
@@ -213,6 +249,9 @@ class FinanzasView(QWidget):
         
         table.setColumnHidden(0, True)
         
+        # Filas mostradas, en el mismo orden que la tabla
+        table.transacciones = []
+        
         return table
     
     def filtrar_hoy(self):
@@ -234,13 +273,16 @@ class FinanzasView(QWidget):
         self.filter_desde.setDate(inicio_mes)
         self.filter_hasta.setDate(hoy)
     
+    def period_key(self) -> tuple:
+        """Clave de precarga de las transacciones del período filtrado"""
+        fecha_desde = self.filter_desde.date().toString('yyyy-MM-dd')
+        fecha_hasta = self.filter_hasta.date().toString('yyyy-MM-dd')
+        return ('transacciones', fecha_desde, fecha_hasta, COLUMNAS_LISTADO)
+    
     def load_transacciones(self):
         """Carga las transacciones según los filtros"""
         try: 
-            fecha_desde = self.filter_desde.date().toString('yyyy-MM-dd')
-            fecha_hasta = self.filter_hasta.date().toString('yyyy-MM-dd')
-            
-            transacciones = self.db_manager.obtener_transacciones_periodo(fecha_desde, fecha_hasta)
+            transacciones = obtener_datos(self.prefetcher, self.db_manager, self.period_key())
             
             # Filtrar por tipo
             ingresos = [t for t in transacciones if t['tipo'] == 'ingreso']
@@ -259,37 +301,112 @@ class FinanzasView(QWidget):
     
     def populate_table(self, table: QTableWidget, transacciones: list):
         """Puebla una tabla con transacciones"""
-        table.setRowCount(0)
+        table.transacciones = list(transacciones)
+        table.setRowCount(len(table.transacciones))
         
-        for trans in transacciones:
-            row = table.rowCount()
-            table.insertRow(row)
-            
-            table.setItem(row, 0, QTableWidgetItem(str(trans['id'])))
-            
-            fecha = datetime.strptime(trans['fecha'], '%Y-%m-%d').strftime('%d/%m/%Y')
-            table.setItem(row, 1, QTableWidgetItem(fecha))
-            
-            tipo_item = QTableWidgetItem(trans['tipo']. capitalize())
-            if trans['tipo'] == 'ingreso':
-                tipo_item. setForeground(Qt.GlobalColor.darkGreen)
-            else:
-                tipo_item.setForeground(Qt.GlobalColor.red)
-            tipo_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            table.setItem(row, 2, tipo_item)
-            
-            table.setItem(row, 3, QTableWidgetItem(trans['categoria']))
-            table.setItem(row, 4, QTableWidgetItem(trans['descripcion']))
-            
-            monto_item = QTableWidgetItem(f"${trans['monto']: ,.2f}")
-            monto_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            table.setItem(row, 5, monto_item)
-            
-            metodo = trans. get('metodo_pago', '-') or '-'
-            table.setItem(row, 6, QTableWidgetItem(metodo))
+        for row, trans in enumerate(table.transacciones):
+            self.set_row(table, row, trans)
+    
+    def set_row(self, table: QTableWidget, row: int, trans: dict):
+        """Escribe los datos de una transacción en una fila de la tabla"""
+        table.setItem(row, 0, QTableWidgetItem(str(trans['id'])))
+        
+        table.setItem(row, 1, QTableWidgetItem(trans['fecha_texto']))
+        
+        tipo_item = QTableWidgetItem(trans['tipo'].capitalize())
+        if trans['tipo'] == 'ingreso':
+            tipo_item.setForeground(Qt.GlobalColor.darkGreen)
+        else:
+            tipo_item.setForeground(Qt.GlobalColor.red)
+        tipo_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        table.setItem(row, 2, tipo_item)
+        
+        table.setItem(row, 3, QTableWidgetItem(trans['categoria']))
+        table.setItem(row, 4, QTableWidgetItem(trans['descripcion']))
+        
+        monto_item = QTableWidgetItem(trans['monto_texto'])
+        monto_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        table.setItem(row, 5, monto_item)
+        
+        metodo = trans.get('metodo_pago', '-') or '-'
+        table.setItem(row, 6, QTableWidgetItem(metodo))
+        
+        actions_widget = self.create_action_buttons(trans['id'])
+        table.setCellWidget(row, 7, actions_widget)
+    
+    def tables_for(self, trans: dict) -> list:
+        """Devuelve las tablas en las que se muestra una transacción"""
+        if trans['tipo'] == 'ingreso':
+            return [self.table_ingresos, self.table_todas]
+        return [self.table_egresos, self.table_todas]
+    
+    def in_filter_range(self, trans: dict) -> bool:
+        """Indica si la fecha de una transacción está dentro de los filtros"""
+        fecha_desde = self.filter_desde.date().toString('yyyy-MM-dd')
+        fecha_hasta = self.filter_hasta.date().toString('yyyy-MM-dd')
+        return fecha_desde <= trans['fecha'] <= fecha_hasta
+    
+    def insert_transaccion_row(self, trans: dict):
+        """Inserta una transacción en las tablas sin recargarlas (orden por fecha descendente)"""
+        if not self.in_filter_range(trans):
+            return
+        
+        for table in self.tables_for(trans):
+            # Búsqueda binaria de la primera fila con fecha anterior
+            lo, hi = 0, len(table.transacciones)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if table.transacciones[mid]['fecha'] >= trans['fecha']:
+                    lo = mid + 1
+                else:
+                    hi = mid
             
-            actions_widget = self.create_action_buttons(trans['id'])
-            table.setCellWidget(row, 7, actions_widget)
+            table.transacciones.insert(lo, trans)
+            table.insertRow(lo)
+            self.set_row(table, lo, trans)
+        
+        self.totales[trans['tipo']] += trans['monto']
+        self.show_totals()
+    
+    def remove_transaccion_row(self, trans: dict):
+        """Quita una transacción de las tablas sin recargarlas"""
+        removed = False
+        
+        for table in self.tables_for(trans):
+            for row, actual in enumerate(table.transacciones):
+                if actual['id'] == trans['id']:
+                    del table.transacciones[row]
+                    table.removeRow(row)
+                    removed = True
+                    break
+        
+        if removed:
+            self.totales[trans['tipo']] -= trans['monto']
+            self.show_totals()
+    
+    def select_transaccion(self, trans: dict):
+        """
+        Muestra una transacción en la pestaña "Todas", ampliando el período si hace falta
+        
+        Args:
+            trans: Diccionario con al menos id y fecha (YYYY-MM-DD)
+        """
+        if not self.in_filter_range(trans):
+            fecha = QDate.fromString(str(trans['fecha'])[:10], 'yyyy-MM-dd')
+            for filtro, fecha_filtro in ((self.filter_desde, min(self.filter_desde.date(), fecha)),
+                                         (self.filter_hasta, max(self.filter_hasta.date(), fecha))):
+                filtro.blockSignals(True)
+                filtro.setDate(fecha_filtro)
+                filtro.blockSignals(False)
+            self.load_transacciones()
+        
+        for row, actual in enumerate(self.table_todas.transacciones):
+            if actual['id'] == trans['id']:
+                self.tabs.setCurrentWidget(self.table_todas)
+                self.table_todas.selectRow(row)
+                self.table_todas.scrollToItem(self.table_todas.item(row, 1),
+                                              QAbstractItemView.ScrollHint.PositionAtCenter)
+                break
     
     def create_action_buttons(self, transaccion_id: int) -> QWidget:
         """Crea botones de acción para cada transacción"""
@@ -310,12 +427,20 @@ class FinanzasView(QWidget):
     
     def update_totals(self, ingresos: list, egresos:  list):
         """Actualiza los totales en las cards"""
-        total_ingresos = sum(t['monto'] for t in ingresos)
-        total_egresos = sum(t['monto'] for t in egresos)
+        self.totales = {
+            'ingreso': sum(t['monto'] for t in ingresos),
+            'egreso': sum(t['monto'] for t in egresos)
+        }
+        self.show_totals()
+    
+    def show_totals(self):
+        """Muestra los totales acumulados en las cards"""
+        total_ingresos = self.totales['ingreso']
+        total_egresos = self.totales['egreso']
         balance = total_ingresos - total_egresos
         
-        self.card_ingresos. value_label.setText(f"${total_ingresos:,.2f}")
-        self.card_egresos.value_label. setText(f"${total_egresos:,.2f}")
+        self.card_ingresos.value_label.setText(f"${total_ingresos:,.2f}")
+        self.card_egresos.value_label.setText(f"${total_egresos:,.2f}")
         self.card_balance.value_label.setText(f"${balance:,.2f}")
         
         # Cambiar color del balance según sea positivo o negativo
@@ -334,9 +459,9 @@ class FinanzasView(QWidget):
     
     def show_add_transaccion_dialog(self, tipo: str):
         """Muestra el diálogo para agregar transacción"""
-        dialog = AddTransaccionDialog(self. db_manager, tipo, self)
-        if dialog.exec() == QDialog.DialogCode. Accepted:
-            self.refresh_data()
+        dialog = AddTransaccionDialog(self.db_manager, tipo, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.insert_transaccion_row(dialog.transaccion)
     
     def delete_transaccion(self, transaccion_id: int):
         """Elimina una transacción"""
@@ -349,39 +474,417 @@ class FinanzasView(QWidget):
         
         if reply == QMessageBox. StandardButton.Yes:
             try:
-                conn = self.db_manager.connect()
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM transacciones WHERE id = ? ", (transaccion_id,))
-                conn.commit()
-                self.db_manager.disconnect()
+                transaccion = self.db_manager.eliminar_transaccion(transaccion_id)
                 
                 QMessageBox.information(self, "Éxito", "Transacción eliminada correctamente")
-                self.refresh_data()
+                if transaccion:
+                    self.remove_transaccion_row(transaccion)
             except Exception as e:
                 QMessageBox. critical(self, "Error", f"Error al eliminar:  {str(e)}")
     
     def exportar_excel(self):
-        """Exporta las transacciones a Excel"""
-        try:
-            from utils.excel_exporter import ExcelExporter
-            exporter = ExcelExporter()
-            
-            fecha_desde = self.filter_desde.date().toString('yyyy-MM-dd')
-            fecha_hasta = self.filter_hasta.date().toString('yyyy-MM-dd')
+        """Exporta las transacciones a Excel (en segundo plano si hay cola de exportaciones)"""
+        from utils.excel_exporter import ExcelExporter
+        exporter = ExcelExporter()
+        
+        fecha_desde = self.filter_desde.date().toString('yyyy-MM-dd')
+        fecha_hasta = self.filter_hasta.date().toString('yyyy-MM-dd')
+        
+        def exportar(progreso=None):
+            def generar():
+                # Las filas se leen por lotes y se escriben a medida que llegan
+                transacciones = self.db_manager.iterar_transacciones_periodo(fecha_desde, fecha_hasta)
+                return exporter.exportar_transacciones(transacciones, fecha_desde, fecha_hasta, progreso)
             
-            transacciones = self.db_manager.obtener_transacciones_periodo(fecha_desde, fecha_hasta)
-            
-            filename = exporter.exportar_transacciones(transacciones, fecha_desde, fecha_hasta)
+            # Si el período y los datos no cambiaron, se devuelve el archivo anterior
+            return exportar_con_cache(
+                self.db_manager, exporter.exports_path, 'transacciones_excel',
+                {'desde': fecha_desde, 'hasta': fecha_hasta}, ('transacciones',), generar
+            )
+        
+        if self.jobs is not None:
+            self.jobs.enviar(
+                f"Transacciones {self.filter_desde.date().toString('dd/MM/yyyy')} - "
+                f"{self.filter_hasta.date().toString('dd/MM/yyyy')} (Excel)",
+                exportar,
+                total=len(self.table_todas.transacciones),
+                carpeta=exporter.exports_path
+            )
+            return
+        
+        try:
+            filename = exportar()
             QMessageBox.information(self, "Éxito", f"Archivo exportado: {filename}")
             
         except Exception as e: 
             QMessageBox.critical(self, "Error", f"Error al exportar:  {str(e)}")
     
+    def exportar_analisis(self):
+        """Exporta todas las tablas para análisis (en segundo plano si hay cola de exportaciones)"""
+        from utils.analytics_exporter import AnalyticsExporter
+        exporter = AnalyticsExporter()
+        formato = exporter.formato_por_defecto()
+        
+        def exportar(progreso=None):
+            # Edades y días de vencimiento dependen de la fecha de exportación
+            return exportar_con_cache(
+                self.db_manager, exporter.exports_path, 'analisis',
+                {'formato': formato, 'fecha': date.today()}, TABLAS_ANALISIS,
+                lambda: exporter.exportar(self.db_manager, formato=formato, progreso=progreso)
+            )
+        
+        if self.jobs is not None:
+            try:
+                total = sum(self.db_manager.contar_filas().values())
+            except Exception:
+                logger.exception("No se pudo contar las filas a exportar")
+                total = None
+            self.jobs.enviar(
+                f"Datos para análisis ({'Parquet' if formato == 'parquet' else 'CSV'})",
+                exportar,
+                total=total,
+                carpeta=exporter.exports_path
+            )
+            return
+        
+        try:
+            carpeta = exportar()
+            QMessageBox.information(self, "Éxito", f"Datos exportados en la carpeta: {carpeta}")
+            
+        except Exception as e:
+            logger.exception("Error al exportar")
+            QMessageBox.critical(self, "Error", f"Error al exportar:  {e}")
+    
+    def show_reporte_dialog(self):
+        """Muestra el diálogo del reporte financiero mensual o anual"""
+        dialog = ReporteFinancieroDialog(self.db_manager, self, jobs=self.jobs)
+        dialog.exec()
+    
+    def show_atrasos_dialog(self):
+        """Muestra la antigüedad de la deuda de los socios"""
+        dialog = AtrasosDialog(self.db_manager, self, jobs=self.jobs)
+        dialog.exec()
+    
     def refresh_data(self):
         """Recarga los datos"""
         self.load_transacciones()
 
 
+class ReporteFinancieroDialog(QDialog):
+    """Diálogo para generar el estado financiero de un mes o un año"""
+    
+    def __init__(self, db_manager, parent=None, jobs=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.jobs = jobs
+        self.setWindowTitle("Reporte Financiero")
+        self.setMinimumWidth(400)
+        self.init_ui()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("📑 Reporte Financiero")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Formulario
+        form = QFormLayout()
+        
+        periodo_layout = QHBoxLayout()
+        
+        self.input_mes = QComboBox()
+        self.input_mes.addItem("Año completo")
+        self.input_mes.addItems(MESES)
+        self.input_mes.setCurrentIndex(datetime.now().month)
+        periodo_layout.addWidget(self.input_mes)
+        
+        self.input_anio = QSpinBox()
+        self.input_anio.setRange(2020, 2030)
+        self.input_anio.setValue(datetime.now().year)
+        periodo_layout.addWidget(self.input_anio)
+        
+        form.addRow("Período *:", periodo_layout)
+        
+        layout.addLayout(form)
+        
+        # Botones
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.button(QDialogButtonBox.StandardButton.Ok).setText("Generar")
+        buttons.accepted.connect(self.generar)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def generar(self):
+        """Arma los totales del período y genera el PDF"""
+        from utils.pdf_generator import PDFGenerator
+        from utils.reportes import datos_reporte_financiero
+        
+        pdf_gen = PDFGenerator()
+        anio = self.input_anio.value()
+        mes = self.input_mes.currentIndex() or None
+        
+        def generar():
+            # Los deudores dependen del día en que se genera el reporte
+            return exportar_con_cache(
+                self.db_manager, pdf_gen.exports_path, 'reporte_financiero',
+                {'anio': anio, 'mes': mes, 'fecha': date.today()},
+                ('socios', 'cuotas', 'transacciones', 'cuotas_esperadas', 'aranceles'),
+                lambda: pdf_gen.generar_reporte_financiero(datos_reporte_financiero(self.db_manager, anio, mes))
+            )
+        
+        if self.jobs is not None:
+            self.jobs.enviar(
+                f"Reporte financiero {self.input_mes.currentText()} {anio} (PDF)",
+                generar,
+                carpeta=pdf_gen.exports_path
+            )
+            self.accept()
+            return
+        
+        try:
+            QMessageBox.information(self, "Éxito", f"Reporte generado: {generar()}")
+            self.accept()
+        except Exception as e:
+            logger.exception("Error al generar el reporte")
+            QMessageBox.critical(self, "Error", f"Error al generar el reporte: {e}")
+
+
+class AtrasosDialog(QDialog):
+    """Diálogo con la deuda de los socios por categoría y tramo de atraso"""
+    
+    def __init__(self, db_manager, parent=None, jobs=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.jobs = jobs
+        self.resumen = None
+        self.filtro_tramo = None
+        self.setWindowTitle("Antigüedad de Deuda")
+        self.setMinimumSize(900, 650)
+        self.init_ui()
+        self.load_resumen()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("⏳ Antigüedad de Deuda")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Filtros
+        filtros = QHBoxLayout()
+        filtros.addWidget(QLabel("Vencidas al:"))
+        self.input_fecha = QDateEdit()
+        self.input_fecha.setCalendarPopup(True)
+        self.input_fecha.setDate(QDate.currentDate())
+        self.input_fecha.dateChanged.connect(self.load_resumen)
+        filtros.addWidget(self.input_fecha)
+        
+        filtros.addWidget(QLabel("Categoría:"))
+        self.input_categoria = QComboBox()
+        self.input_categoria.addItem("Todas")
+        self.input_categoria.addItems(CATEGORIAS_BASQUET)
+        self.input_categoria.currentIndexChanged.connect(self.clear_tramo)
+        filtros.addWidget(self.input_categoria)
+        filtros.addStretch()
+        layout.addLayout(filtros)
+        
+        # Resumen: categorías por tramos; un clic filtra el detalle
+        self.table_resumen = QTableWidget()
+        self.table_resumen.setColumnCount(len(TRAMOS_ATRASO) + 2)
+        self.table_resumen.setHorizontalHeaderLabels(
+            ["Categoría"] + [nombre for _, nombre in TRAMOS_ATRASO] + ["Total"]
+        )
+        self.table_resumen.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_resumen.verticalHeader().setVisible(False)
+        self.table_resumen.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_resumen.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table_resumen.cellClicked.connect(self.select_cell)
+        layout.addWidget(self.table_resumen)
+        
+        # Detalle por socio
+        self.lbl_detalle = QLabel()
+        self.lbl_detalle.setStyleSheet(f"color: {COLORS['primary']}; font-weight: bold;")
+        layout.addWidget(self.lbl_detalle)
+        
+        self.table_detalle = QTableWidget()
+        self.table_detalle.setColumnCount(8)
+        self.table_detalle.setHorizontalHeaderLabels(
+            ["Socio", "DNI", "Categoría", "Teléfono", "Adeuda Desde", "Cuotas", "Días", "Adeudado"]
+        )
+        self.table_detalle.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table_detalle.verticalHeader().setVisible(False)
+        self.table_detalle.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_detalle.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_detalle.setAlternatingRowColors(True)
+        layout.addWidget(self.table_detalle, stretch=2)
+        
+        # Botones
+        botones = QHBoxLayout()
+        btn_pdf = QPushButton("📑 Reporte PDF")
+        btn_pdf.clicked.connect(lambda: self.exportar('pdf'))
+        botones.addWidget(btn_pdf)
+        btn_excel = QPushButton("📄 Exportar a Excel")
+        btn_excel.clicked.connect(lambda: self.exportar('excel'))
+        botones.addWidget(btn_excel)
+        botones.addStretch()
+        btn_cerrar = QPushButton("Cerrar")
+        btn_cerrar.setObjectName("secondary")
+        btn_cerrar.clicked.connect(self.reject)
+        botones.addWidget(btn_cerrar)
+        layout.addLayout(botones)
+    
+    def fecha_corte(self) -> str:
+        """Fecha de corte elegida (YYYY-MM-DD)"""
+        return self.input_fecha.date().toString("yyyy-MM-dd")
+    
+    def categoria(self):
+        """Categoría elegida o None para todas"""
+        categoria = self.input_categoria.currentText()
+        return None if categoria == "Todas" else categoria
+    
+    def load_resumen(self, *args):
+        """Calcula el resumen por categoría y tramo a la fecha elegida"""
+        from utils.reportes import resumen_atrasos
+        
+        try:
+            self.resumen = resumen_atrasos(self.db_manager.obtener_resumen_atrasos(self.fecha_corte()))
+        except Exception as e:
+            logger.exception("Error al calcular atrasos")
+            QMessageBox.critical(self, "Error", f"Error al calcular atrasos: {e}")
+            return
+        
+        def item(acumulado) -> QTableWidgetItem:
+            texto = f"{acumulado['socios']} · {monto_a_texto(acumulado['monto'])}" if acumulado['socios'] else "-"
+            celda = QTableWidgetItem(texto)
+            celda.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            return celda
+        
+        filas = [(categoria, valores['tramos'], valores['total'])
+                 for categoria, valores in self.resumen['categorias'].items()]
+        filas.append(("Total", self.resumen['totales'], self.resumen['total']))
+        
+        self.table_resumen.setRowCount(len(filas))
+        for row, (categoria, tramos, total) in enumerate(filas):
+            self.table_resumen.setItem(row, 0, QTableWidgetItem(categoria))
+            for col, acumulado in enumerate([*tramos, total], start=1):
+                self.table_resumen.setItem(row, col, item(acumulado))
+        
+        fuente = QFont()
+        fuente.setBold(True)
+        for col in range(self.table_resumen.columnCount()):
+            self.table_resumen.item(len(filas) - 1, col).setFont(fuente)
+        ultimo = self.table_resumen.item(len(filas) - 1, len(TRAMOS_ATRASO))
+        ultimo.setForeground(Qt.GlobalColor.red)
+        
+        self.load_detalle()
+    
+    def select_cell(self, row: int, col: int):
+        """Filtra el detalle por la categoría y el tramo de la celda elegida"""
+        categoria = self.table_resumen.item(row, 0).text()
+        self.filtro_tramo = col - 1 if 1 <= col <= len(TRAMOS_ATRASO) else None
+        
+        self.input_categoria.blockSignals(True)
+        self.input_categoria.setCurrentText(categoria if categoria in CATEGORIAS_BASQUET else "Todas")
+        self.input_categoria.blockSignals(False)
+        self.load_detalle()
+    
+    def clear_tramo(self, *args):
+        """Al cambiar de categoría se muestran todos los tramos"""
+        self.filtro_tramo = None
+        self.load_detalle()
+    
+    def load_detalle(self):
+        """Lista los socios con cuotas vencidas, del mayor al menor atraso"""
+        categoria = self.categoria()
+        try:
+            socios = list(islice(
+                self.db_manager.iterar_atrasos(self.fecha_corte(), categoria, self.filtro_tramo),
+                LIMITE_DETALLE_ATRASOS + 1
+            ))
+        except Exception as e:
+            logger.exception("Error al cargar socios")
+            QMessageBox.critical(self, "Error", f"Error al cargar socios: {e}")
+            return
+        
+        texto = f"Socios de {categoria}" if categoria else "Socios"
+        if self.filtro_tramo is not None:
+            texto += f" con {TRAMOS_ATRASO[self.filtro_tramo][1].lower()} de atraso"
+        if len(socios) > LIMITE_DETALLE_ATRASOS:
+            socios = socios[:LIMITE_DETALLE_ATRASOS]
+            texto += f" (primeros {LIMITE_DETALLE_ATRASOS}; el reporte los incluye a todos)"
+        self.lbl_detalle.setText(texto)
+        
+        ultimo_tramo = len(TRAMOS_ATRASO) - 1
+        self.table_detalle.setRowCount(len(socios))
+        for row, socio in enumerate(socios):
+            periodo = socio['primer_periodo']
+            valores = [
+                f"{socio['apellido']}, {socio['nombre']}",
+                socio['dni'],
+                socio['categoria'],
+                socio['telefono'] or '-',
+                f"{MESES[periodo % 12]} {periodo // 12}",
+                str(socio['cuotas_impagas']),
+                str(socio['dias_atraso']),
+                monto_a_texto(socio['monto_adeudado'])
+            ]
+            for col, valor in enumerate(valores):
+                item = QTableWidgetItem(valor)
+                if col >= 5:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                if socio['tramo'] == ultimo_tramo and col == 6:
+                    item.setForeground(Qt.GlobalColor.red)
+                self.table_detalle.setItem(row, col, item)
+    
+    def exportar(self, formato: str):
+        """
+        Genera el reporte con todos los socios de la categoría elegida
+        
+        Args:
+            formato: 'pdf' o 'excel'
+        """
+        from utils.reportes import datos_reporte_atrasos
+        
+        if formato == 'pdf':
+            from utils.pdf_generator import PDFGenerator
+            generador = PDFGenerator()
+            escribir = generador.generar_reporte_atrasos
+        else:
+            from utils.excel_exporter import ExcelExporter
+            generador = ExcelExporter()
+            escribir = generador.exportar_atrasos
+        
+        fecha = self.input_fecha.date().toPyDate()
+        categoria = self.categoria()
+        
+        def generar(progreso=None):
+            return escribir(datos_reporte_atrasos(self.db_manager, fecha, categoria), progreso)
+        
+        if self.jobs is not None:
+            resumen = self.resumen and (self.resumen['categorias'].get(categoria) if categoria else self.resumen)
+            total = resumen['total']['socios'] if resumen else 0
+            self.jobs.enviar(
+                f"Antigüedad de deuda al {fecha.strftime('%d/%m/%Y')} ({'PDF' if formato == 'pdf' else 'Excel'})",
+                generar,
+                total=total,
+                carpeta=generador.exports_path
+            )
+            return
+        
+        try:
+            QMessageBox.information(self, "Éxito", f"Reporte generado: {generar()}")
+        except Exception as e:
+            logger.exception("Error al generar el reporte")
+            QMessageBox.critical(self, "Error", f"Error al generar el reporte: {e}")
+
+
 class AddTransaccionDialog(QDialog):
     """Diálogo para agregar una transacción"""
     
@@ -389,7 +892,8 @@ class AddTransaccionDialog(QDialog):
         super().__init__(parent)
         self.db_manager = db_manager
         self.tipo = tipo
-        self. setWindowTitle(f"Registrar {tipo.capitalize()}")
+        self.transaccion = None
+        self.setWindowTitle(f"Registrar {tipo.capitalize()}")
         self.setMinimumWidth(500)
         self.init_ui()
     
@@ -493,6 +997,7 @@ class AddTransaccionDialog(QDialog):
         
         try:
             transaccion_id = self.db_manager.registrar_transaccion(datos)
+            self.transaccion = self.db_manager.obtener_transaccion(transaccion_id)
             QMessageBox.information(self, "Éxito", f"Transacción registrada correctamente\nID: {transaccion_id}")
             self.accept()
         except Exception as e: 
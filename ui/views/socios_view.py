@@ -8,23 +8,51 @@ from PyQt6.QtWidgets import (
     QPushButton, QTableWidget, QTableWidgetItem, QFrame,
     QDialog, QFormLayout, QComboBox, QDateEdit, QTextEdit,
     QMessageBox, QHeaderView, QAbstractItemView, QDialogButtonBox,
-    QDoubleSpinBox, QSpinBox, QScrollArea
+    QDoubleSpinBox, QSpinBox, QScrollArea, QCheckBox, QFileDialog, QProgressBar, QListWidget,
+    QListWidgetItem, QTableView
 )
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QThreadPool
 from PyQt6.QtGui import QFont
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from pathlib import Path
+import logging
+import threading
 
-from config.settings import COLORS, CATEGORIAS_BASQUET, ESTADOS_PAGO
+from config.settings import COLORS, CATEGORIAS_BASQUET, ESTADOS_PAGO, MESES, MONTO_CUOTA_BASE
+from ui.prefetch import obtener_datos
+from ui.widgets import ModeloGrillaPagos, abrir_carpeta
+from ui.workers import Worker
+from utils.buscador import IndiceSocios
+from utils.export_cache import exportar_con_cache
+from utils.formatters import monto_a_texto
+from utils.importer import (
+    CAMPOS_IMPORTACION, CAMPOS_OBLIGATORIOS, DataImporter, contar_filas, detectar_mapeo, leer_encabezados
+)
 from utils.pdf_generator import PDFGenerator
+from utils.validators import normalizar_dni
+
+logger = logging.getLogger(__name__)
+
+# Columnas que usan la tabla de socios, la búsqueda y el registro de cuotas
+COLUMNAS_LISTADO = ('dni', 'apellido', 'nombre', 'categoria', 'telefono', 'estado_pago', 'fecha_ultimo_pago')
+
+# Columnas que muestra el historial de cuotas
+COLUMNAS_HISTORIAL = ('mes', 'anio', 'monto', 'fecha_pago', 'metodo_pago', 'recibo_numero')
 
 
 class SociosView(QWidget):
     """Vista principal de gestión de socios"""
     
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, prefetcher=None, jobs=None):
         super().__init__()
         self.db_manager = db_manager
+        self.prefetcher = prefetcher
+        self.jobs = jobs
         self.pdf_generator = PDFGenerator()
+        self.socios = []
+        self.buscador = IndiceSocios()
+        self.estadisticas = {'total': 0, 'al_dia': 0, 'moroso': 0}
         self.init_ui()
     
     def init_ui(self):
@@ -70,12 +98,54 @@ class SociosView(QWidget):
         btn_cuota.setCursor(Qt.CursorShape. PointingHandCursor)
         layout.addWidget(btn_cuota)
         
+        # Botón cobranza en lote
+        btn_cobranza = QPushButton("💰 Cobranza por Categoría")
+        btn_cobranza.setObjectName("secondary")
+        btn_cobranza.setToolTip("Registrar de una vez las cuotas de un mes de varios socios")
+        btn_cobranza.clicked.connect(self.show_cobranza_dialog)
+        btn_cobranza.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_cobranza)
+        
         # Botón ver historial
         btn_historial = QPushButton("📋 Ver Historial")
         btn_historial.clicked.connect(self.show_historial_cuotas)
         btn_historial.setCursor(Qt.CursorShape.PointingHandCursor)
         layout.addWidget(btn_historial)
         
+        # Botón grilla de pagos
+        btn_grilla = QPushButton("🗓️ Grilla de Pagos")
+        btn_grilla.setToolTip("Qué meses pagó cada socio en un año, por categoría")
+        btn_grilla.clicked.connect(self.show_grilla_pagos)
+        btn_grilla.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_grilla)
+        
+        # Botón recibos del mes
+        btn_recibos = QPushButton("🧾 Recibos del Mes")
+        btn_recibos.clicked.connect(self.show_recibos_lote_dialog)
+        btn_recibos.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_recibos)
+        
+        # Botón planteles por categoría
+        btn_plantel = QPushButton("📊 Planteles")
+        btn_plantel.setToolTip("Excel con una hoja por categoría y los meses adeudados de cada socio")
+        btn_plantel.clicked.connect(self.exportar_plantel)
+        btn_plantel.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_plantel)
+        
+        # Botón aranceles por categoría
+        btn_aranceles = QPushButton("🏷️ Aranceles")
+        btn_aranceles.setToolTip("Cuota mensual de cada categoría, aumentos e historial")
+        btn_aranceles.clicked.connect(self.show_aranceles_dialog)
+        btn_aranceles.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_aranceles)
+        
+        # Botón importar planillas
+        btn_importar = QPushButton("📥 Importar")
+        btn_importar.setToolTip("Cargar socios o cuotas desde planillas Excel o CSV")
+        btn_importar.clicked.connect(self.show_importar_dialog)
+        btn_importar.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(btn_importar)
+        
         layout.addStretch()
         
         # Estadísticas rápidas
@@ -102,7 +172,7 @@ class SociosView(QWidget):
         layout.addWidget(lbl_search)
         
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Buscar por nombre, apellido o DNI...")
+        self.search_input.setPlaceholderText("Buscar por nombre, apellido o DNI (con o sin acentos)...")
         self.search_input. textChanged.connect(self.filter_socios)
         layout.addWidget(self.search_input)
         
@@ -120,7 +190,7 @@ class SociosView(QWidget):
         # Configurar tabla
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         table.setAlternatingRowColors(True)
         
         # Ajustar columnas
@@ -139,71 +209,171 @@ class SociosView(QWidget):
         # Ocultar columna ID
         table.setColumnHidden(0, True)
         
+        # Registrar el socio seleccionado para precargar su historial
+        table.currentCellChanged.connect(self.on_current_row_changed)
+        
         return table
     
     def load_socios(self):
         """Carga todos los socios en la tabla"""
         try:
-            socios = self.db_manager. obtener_todos_socios()
+            socios = obtener_datos(self.prefetcher, self.db_manager, self.data_key())
             self.populate_table(socios)
             self.update_statistics(socios)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error al cargar socios: {str(e)}")
     
+    @staticmethod
+    def data_key() -> tuple:
+        """Clave de precarga del listado de socios"""
+        return ('socios', COLUMNAS_LISTADO)
+    
+    @staticmethod
+    def cuotas_key(socio_id: int) -> tuple:
+        """Clave de precarga del historial de cuotas de un socio"""
+        return ('cuotas', socio_id, COLUMNAS_HISTORIAL)
+    
     def populate_table(self, socios: list):
         """
         Puebla la tabla con los datos de socios
         
         Args: 
-            socios: Lista de diccionarios con datos de socios
+            socios: Lista de diccionarios con datos de socios (ordenada por apellido y nombre)
         """
-        self. table.setRowCount(0)
+        self.socios = list(socios)
+        self.buscador.construir(self.socios)
+        self.table.setRowCount(len(self.socios))
         
-        for socio in socios:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # ID (oculto)
-            self.table.setItem(row, 0, QTableWidgetItem(str(socio['id'])))
-            
-            # DNI
-            self.table.setItem(row, 1, QTableWidgetItem(socio['dni']))
-            
-            # Apellido
-            self.table.setItem(row, 2, QTableWidgetItem(socio['apellido']))
-            
-            # Nombre
-            self.table. setItem(row, 3, QTableWidgetItem(socio['nombre']))
-            
-            # Categoría
-            self.table.setItem(row, 4, QTableWidgetItem(socio['categoria']))
-            
-            # Teléfono
-            telefono = socio. get('telefono', '') or '-'
-            self.table.setItem(row, 5, QTableWidgetItem(telefono))
-            
-            # Estado de pago
-            estado_item = QTableWidgetItem(ESTADOS_PAGO.get(socio['estado_pago'], 'Desconocido'))
-            if socio['estado_pago'] == 'al_dia': 
-                estado_item.setForeground(Qt.GlobalColor. darkGreen)
-            elif socio['estado_pago'] == 'moroso':
-                estado_item.setForeground(Qt.GlobalColor.red)
-            estado_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            self.table.setItem(row, 6, estado_item)
-            
-            # Último pago
-            ultimo_pago = socio.get('fecha_ultimo_pago', '') or '-'
-            if ultimo_pago != '-':
-                try:
-                    fecha = datetime.strptime(ultimo_pago, '%Y-%m-%d')
-                    ultimo_pago = fecha.strftime('%d/%m/%Y')
-                except: 
-                    pass
-            self.table.setItem(row, 7, QTableWidgetItem(ultimo_pago))
-            
-            # Botones de acción
-            actions_widget = self.create_action_buttons(socio['id'])
-            self.table. setCellWidget(row, 8, actions_widget)
+        for row, socio in enumerate(self.socios):
+            self.set_row(row, socio)
+        
+        if self.search_input.text().strip():
+            self.filter_socios()
+    
+    def set_row(self, row: int, socio: dict):
+        """
+        Escribe los datos de un socio en una fila de la tabla
+        
+        Args:
+            row: Índice de la fila
+            socio: Diccionario con datos del socio
+        """
+        # ID (oculto)
+        self.table.setItem(row, 0, QTableWidgetItem(str(socio['id'])))
+        
+        # DNI
+        self.table.setItem(row, 1, QTableWidgetItem(socio['dni']))
+        
+        # Apellido
+        self.table.setItem(row, 2, QTableWidgetItem(socio['apellido']))
+        
+        # Nombre
+        self.table.setItem(row, 3, QTableWidgetItem(socio['nombre']))
+        
+        # Categoría
+        self.table.setItem(row, 4, QTableWidgetItem(socio['categoria']))
+        
+        # Teléfono
+        telefono = socio.get('telefono', '') or '-'
+        self.table.setItem(row, 5, QTableWidgetItem(telefono))
+        
+        # Estado de pago
+        estado_item = QTableWidgetItem(ESTADOS_PAGO.get(socio['estado_pago'], 'Desconocido'))
+        if socio['estado_pago'] == 'al_dia': 
+            estado_item.setForeground(Qt.GlobalColor.darkGreen)
+        elif socio['estado_pago'] == 'moroso':
+            estado_item.setForeground(Qt.GlobalColor.red)
+        estado_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        self.table.setItem(row, 6, estado_item)
+        
+        # Último pago (formateado en la capa de datos)
+        self.table.setItem(row, 7, QTableWidgetItem(socio['fecha_ultimo_pago_texto']))
+        
+        # Botones de acción
+        actions_widget = self.create_action_buttons(socio['id'])
+        self.table.setCellWidget(row, 8, actions_widget)
+    
+    @staticmethod
+    def sort_key(socio: dict) -> tuple:
+        """Clave de orden de la tabla (igual al ORDER BY de la consulta)"""
+        return (socio['apellido'], socio['nombre'])
+    
+    def find_row(self, socio: dict) -> int:
+        """
+        Busca la fila de un socio usando su clave de orden
+        
+        Args:
+            socio: Diccionario con datos del socio (al menos id, apellido y nombre)
+        
+        Returns:
+            Índice de la fila o -1 si no está en la tabla
+        """
+        key = self.sort_key(socio)
+        row = bisect_left(self.socios, key, key=self.sort_key)
+        
+        while row < len(self.socios) and self.sort_key(self.socios[row]) == key:
+            if self.socios[row]['id'] == socio['id']:
+                return row
+            row += 1
+        
+        return -1
+    
+    def insert_socio_row(self, socio: dict):
+        """
+        Inserta un socio en su posición ordenada sin recargar la tabla
+        
+        Args:
+            socio: Diccionario con datos del socio
+        """
+        if not socio.get('activo', 1):
+            return
+        
+        row = bisect_right(self.socios, self.sort_key(socio), key=self.sort_key)
+        self.socios.insert(row, socio)
+        self.buscador.agregar(socio)
+        self.table.insertRow(row)
+        self.set_row(row, socio)
+        self.table.setRowHidden(row, not self.matches_search(socio))
+        self.apply_statistics_delta(socio, 1)
+    
+    def update_socio_row(self, socio_anterior: dict, socio: dict):
+        """
+        Actualiza la fila de un socio, moviéndola si cambió su posición
+        
+        Args:
+            socio_anterior: Datos del socio antes de la modificación
+            socio: Datos actualizados del socio
+        """
+        row = self.find_row(socio_anterior)
+        if row < 0:
+            self.insert_socio_row(socio)
+            return
+        
+        if self.sort_key(socio_anterior) == self.sort_key(socio):
+            self.apply_statistics_delta(self.socios[row], -1)
+            self.socios[row] = socio
+            self.buscador.agregar(socio)
+            self.set_row(row, socio)
+            self.table.setRowHidden(row, not self.matches_search(socio))
+            self.apply_statistics_delta(socio, 1)
+        else:
+            self.remove_socio_row(socio_anterior)
+            self.insert_socio_row(socio)
+    
+    def remove_socio_row(self, socio: dict):
+        """
+        Quita la fila de un socio de la tabla
+        
+        Args:
+            socio: Diccionario con datos del socio
+        """
+        row = self.find_row(socio)
+        if row < 0:
+            return
+        
+        self.apply_statistics_delta(self.socios.pop(row), -1)
+        self.buscador.quitar(socio['id'])
+        self.table.removeRow(row)
     
     def create_action_buttons(self, socio_id: int) -> QWidget:
         """
@@ -254,42 +424,122 @@ class SociosView(QWidget):
         Args: 
             socios: Lista de socios
         """
-        total = len(socios)
-        al_dia = len([s for s in socios if s['estado_pago'] == 'al_dia'])
-        morosos = len([s for s in socios if s['estado_pago'] == 'moroso'])
+        self.estadisticas = {
+            'total': len(socios),
+            'al_dia': len([s for s in socios if s['estado_pago'] == 'al_dia']),
+            'moroso': len([s for s in socios if s['estado_pago'] == 'moroso'])
+        }
+        self.show_statistics()
+    
+    def apply_statistics_delta(self, socio: dict, signo: int):
+        """
+        Suma o resta un socio de las estadísticas
+        
+        Args:
+            socio: Diccionario con datos del socio
+            signo: 1 para sumar, -1 para restar
+        """
+        self.estadisticas['total'] += signo
+        if socio['estado_pago'] in self.estadisticas:
+            self.estadisticas[socio['estado_pago']] += signo
+        self.show_statistics()
+    
+    def show_statistics(self):
+        """Muestra las estadísticas en la barra de herramientas"""
+        self.lbl_total.setText(f"Total: {self.estadisticas['total']}")
+        self.lbl_al_dia.setText(f"Al día: {self.estadisticas['al_dia']}")
+        self.lbl_morosos.setText(f"Morosos: {self.estadisticas['moroso']}")
+    
+    def matches_search(self, socio: dict) -> bool:
+        """
+        Indica si un socio coincide con el texto de búsqueda actual
         
-        self.lbl_total.setText(f"Total: {total}")
-        self.lbl_al_dia. setText(f"Al día: {al_dia}")
-        self.lbl_morosos.setText(f"Morosos: {morosos}")
+        Args:
+            socio: Diccionario con datos del socio
+        
+        Returns:
+            True si debe mostrarse
+        """
+        return self.buscador.coincide(socio['id'], self.search_input.text())
     
     def filter_socios(self):
-        """Filtra los socios según el texto de búsqueda"""
-        search_text = self.search_input.text().lower()
+        """
+        Filtra los socios según el texto de búsqueda (sin distinguir acentos y
+        tolerando errores de tipeo) y muestra la mejor coincidencia
+        """
+        texto = self.search_input.text()
+        resultados = self.buscador.buscar(texto, limite=None) if texto.strip() else None
+        visibles = None if resultados is None else {socio['id'] for socio, _ in resultados}
         
-        for row in range(self.table. rowCount()):
-            show_row = False
-            
-            # Buscar en DNI, Apellido y Nombre
-            for col in [1, 2, 3]: 
-                item = self.table. item(row, col)
-                if item and search_text in item.text().lower():
-                    show_row = True
-                    break
-            
-            self.table.setRowHidden(row, not show_row)
+        # Solo se tocan las filas que cambian de estado, sin repintar en cada una
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row, socio in enumerate(self.socios):
+                oculta = visibles is not None and socio['id'] not in visibles
+                if self.table.isRowHidden(row) != oculta:
+                    self.table.setRowHidden(row, oculta)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        
+        if resultados:
+            row = self.find_row(resultados[0][0])
+            if row >= 0:
+                self.table.scrollToItem(self.table.item(row, 2), QAbstractItemView.ScrollHint.PositionAtTop)
+    
+    def select_socio(self, socio: dict):
+        """
+        Selecciona un socio en la tabla, limpiando la búsqueda si lo ocultaba
+        
+        Args:
+            socio: Diccionario con al menos id, apellido y nombre
+        """
+        row = self.find_row(socio)
+        if row < 0:
+            return
+        if self.table.isRowHidden(row):
+            self.search_input.clear()
+        self.table.selectRow(row)
+        self.table.scrollToItem(self.table.item(row, 2), QAbstractItemView.ScrollHint.PositionAtCenter)
+    
+    def on_current_row_changed(self, row: int, *args):
+        """Registra el socio seleccionado como consultado recientemente"""
+        if 0 <= row < len(self.socios):
+            self.mark_socio_seen(self.socios[row]['id'])
+    
+    def mark_socio_seen(self, socio_id: int):
+        """
+        Informa a la precarga que se consultó un socio
+        
+        Args:
+            socio_id: ID del socio
+        """
+        if self.prefetcher is not None:
+            self.prefetcher.socio_visto(socio_id)
     
     def show_add_socio_dialog(self):
         """Muestra el diálogo para agregar un nuevo socio"""
         dialog = AddSocioDialog(self.db_manager, self)
-        if dialog.exec() == QDialog.DialogCode. Accepted:
-            self.refresh_data()
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.insert_socio_row(dialog.socio)
     
     def show_registrar_cuota_dialog(self):
         """Muestra el diálogo para registrar una cuota"""
-        dialog = RegistrarCuotaDialog(self.db_manager, self)
+        dialog = RegistrarCuotaDialog(self.db_manager, self, self.jobs, self.buscador)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            socio = self.db_manager.obtener_socio(dialog.socio_actual['id'])
+            self.update_socio_row(dialog.socio_actual, socio)
+    
+    def show_cobranza_dialog(self):
+        """Muestra el diálogo para cobrar las cuotas de un mes a varios socios"""
+        dialog = CobranzaDialog(self.db_manager, self, self.jobs)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.refresh_data()
     
+    def show_aranceles_dialog(self):
+        """Muestra el diálogo de aranceles por categoría"""
+        dialog = ArancelesDialog(self.db_manager, self)
+        dialog.exec()
+    
     def show_historial_cuotas(self):
         """Muestra el historial de cuotas de un socio"""
         # Obtener socio seleccionado
@@ -299,8 +549,64 @@ class SociosView(QWidget):
             return
         
         socio_id = int(self.table.item(current_row, 0).text())
-        dialog = HistorialCuotasDialog(self.db_manager, socio_id, self)
+        self.mark_socio_seen(socio_id)
+        dialog = HistorialCuotasDialog(self.db_manager, socio_id, self, self.prefetcher)
+        dialog.exec()
+    
+    def show_grilla_pagos(self):
+        """Muestra la grilla de pagos por mes de todos los socios"""
+        dialog = GrillaPagosDialog(self.db_manager, self, self.prefetcher)
+        dialog.exec()
+    
+    def selected_socio_ids(self) -> list:
+        """IDs de los socios seleccionados en la tabla"""
+        rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+        return sorted(int(self.table.item(row, 0).text()) for row in rows)
+    
+    def show_recibos_lote_dialog(self):
+        """Muestra el diálogo para reimprimir los recibos de un período"""
+        dialog = RecibosLoteDialog(self.db_manager, self.selected_socio_ids(), self, self.jobs)
+        dialog.exec()
+    
+    def exportar_plantel(self):
+        """Exporta los planteles por categoría (en segundo plano si hay cola de exportaciones)"""
+        from utils.excel_exporter import ExcelExporter
+        exporter = ExcelExporter()
+        hoy = datetime.now()
+        periodo = f"{MESES[hoy.month - 1]} {hoy.year}"
+        
+        def exportar(progreso=None):
+            def generar():
+                socios = self.db_manager.iterar_plantel(hoy.year, hoy.month, tuple(CATEGORIAS_BASQUET))
+                return exporter.exportar_plantel(socios, periodo, progreso)
+            
+            return exportar_con_cache(
+                self.db_manager, exporter.exports_path, 'plantel_excel',
+                {'anio': hoy.year, 'mes': hoy.month},
+                ('socios', 'cuotas', 'cuotas_esperadas', 'aranceles'), generar
+            )
+        
+        if self.jobs is not None:
+            self.jobs.enviar(
+                f"Planteles por categoría - {periodo} (Excel)",
+                exportar,
+                total=len(self.socios),
+                carpeta=exporter.exports_path
+            )
+            return
+        
+        try:
+            QMessageBox.information(self, "Éxito", f"Archivo exportado: {exportar()}")
+        except Exception as e:
+            logger.exception("Error al exportar")
+            QMessageBox.critical(self, "Error", f"Error al exportar: {e}")
+    
+    def show_importar_dialog(self):
+        """Muestra el diálogo de importación de planillas"""
+        dialog = ImportarDialog(self.db_manager, self)
         dialog.exec()
+        if dialog.resultado and dialog.resultado['importadas']:
+            self.refresh_data()
     
     def edit_socio(self, socio_id: int):
         """
@@ -309,9 +615,10 @@ class SociosView(QWidget):
         Args:
             socio_id: ID del socio a editar
         """
+        self.mark_socio_seen(socio_id)
         dialog = EditSocioDialog(self.db_manager, socio_id, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.refresh_data()
+            self.update_socio_row(dialog.socio_anterior, dialog.socio)
     
     def view_socio_details(self, socio_id:  int):
         """
@@ -320,6 +627,7 @@ class SociosView(QWidget):
         Args:
             socio_id:  ID del socio
         """
+        self.mark_socio_seen(socio_id)
         dialog = SocioDetailsDialog(self.db_manager, socio_id, self)
         dialog.exec()
     
@@ -339,14 +647,11 @@ class SociosView(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                conn = self.db_manager.connect()
-                cursor = conn.cursor()
-                cursor.execute("UPDATE socios SET activo = 0 WHERE id = ?", (socio_id,))
-                conn.commit()
-                self.db_manager.disconnect()
+                socio = self.db_manager.eliminar_socio(socio_id)
                 
                 QMessageBox.information(self, "Éxito", "Socio eliminado correctamente")
-                self.refresh_data()
+                if socio:
+                    self.remove_socio_row(socio)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error al eliminar socio: {str(e)}")
     
@@ -361,6 +666,7 @@ class AddSocioDialog(QDialog):
     def __init__(self, db_manager, parent=None):
         super().__init__(parent)
         self.db_manager = db_manager
+        self.socio = None
         self.setWindowTitle("Agregar Nuevo Socio")
         self.setMinimumWidth(500)
         self.init_ui()
@@ -462,7 +768,8 @@ class AddSocioDialog(QDialog):
         
         try:
             socio_id = self.db_manager.agregar_socio(datos)
-            QMessageBox. information(self, "Éxito", f"Socio agregado correctamente\nID: {socio_id}")
+            self.socio = self.db_manager.obtener_socio(socio_id)
+            QMessageBox.information(self, "Éxito", f"Socio agregado correctamente\nID: {socio_id}")
             self.accept()
         except ValueError as e:
             QMessageBox.warning(self, "Advertencia", str(e))
@@ -477,6 +784,8 @@ class EditSocioDialog(QDialog):
         super().__init__(parent)
         self.db_manager = db_manager
         self.socio_id = socio_id
+        self.socio_anterior = None
+        self.socio = None
         self.setWindowTitle("Editar Socio")
         self.setMinimumWidth(500)
         self.init_ui()
@@ -531,11 +840,8 @@ class EditSocioDialog(QDialog):
     def load_socio_data(self):
         """Carga los datos del socio"""
         try:
-            conn = self.db_manager.connect()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM socios WHERE id = ?", (self. socio_id,))
-            socio = dict(cursor.fetchone())
-            self.db_manager.disconnect()
+            socio = self.db_manager.obtener_socio(self.socio_id)
+            self.socio_anterior = socio
             
             self.input_nombre.setText(socio['nombre'])
             self.input_apellido.setText(socio['apellido'])
@@ -565,7 +871,7 @@ class EditSocioDialog(QDialog):
         }
         
         try:
-            self.db_manager.actualizar_socio(self.socio_id, datos)
+            self.socio = self.db_manager.actualizar_socio(self.socio_id, datos)
             QMessageBox.information(self, "Éxito", "Socio actualizado correctamente")
             self.accept()
         except Exception as e:
@@ -575,9 +881,11 @@ class EditSocioDialog(QDialog):
 class RegistrarCuotaDialog(QDialog):
     """Diálogo para registrar el pago de una cuota"""
     
-    def __init__(self, db_manager, parent=None):
+    def __init__(self, db_manager, parent=None, jobs=None, buscador=None):
         super().__init__(parent)
         self.db_manager = db_manager
+        self.jobs = jobs
+        self.buscador = buscador  # Índice de la vista de socios; si no hay, se arma al buscar
         self.setWindowTitle("Registrar Pago de Cuota")
         self.setMinimumWidth(500)
         self.init_ui()
@@ -595,17 +903,24 @@ class RegistrarCuotaDialog(QDialog):
         form = QFormLayout()
         form.setSpacing(15)
         
-        # DNI del socio
+        # DNI o nombre del socio
         dni_layout = QHBoxLayout()
         self.input_dni = QLineEdit()
-        self.input_dni.setPlaceholderText("Ingrese DNI del socio")
+        self.input_dni.setPlaceholderText("DNI, apellido o nombre del socio")
         dni_layout.addWidget(self. input_dni)
         
         btn_buscar = QPushButton("🔍 Buscar")
         btn_buscar.clicked. connect(self.buscar_socio)
         dni_layout. addWidget(btn_buscar)
         
-        form.addRow("DNI Socio *:", dni_layout)
+        form.addRow("Socio *:", dni_layout)
+        
+        # Coincidencias cuando la búsqueda por nombre encuentra varios socios
+        self.lista_resultados = QListWidget()
+        self.lista_resultados.setMaximumHeight(130)
+        self.lista_resultados.currentItemChanged.connect(self.on_resultado_changed)
+        self.lista_resultados.hide()
+        form.addRow("", self.lista_resultados)
         
         # Información del socio
         self.lbl_socio_info = QLabel("Seleccione un socio")
@@ -617,10 +932,7 @@ class RegistrarCuotaDialog(QDialog):
         mes_anio_layout = QHBoxLayout()
         
         self.input_mes = QComboBox()
-        self.input_mes. addItems([
-            "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
-            "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"
-        ])
+        self.input_mes.addItems(MESES)
         self.input_mes.setCurrentIndex(datetime.now().month - 1)
         mes_anio_layout.addWidget(self.input_mes)
         
@@ -631,14 +943,17 @@ class RegistrarCuotaDialog(QDialog):
         
         form.addRow("Mes/Año *:", mes_anio_layout)
         
-        # Monto
+        # Monto (se completa con el arancel de la categoría del socio)
         self.input_monto = QDoubleSpinBox()
         self.input_monto.setPrefix("$ ")
         self.input_monto.setRange(0, 999999)
-        self.input_monto.setValue(5000)  # Valor por defecto
+        self.input_monto.setValue(MONTO_CUOTA_BASE)
         self.input_monto.setDecimals(2)
         form.addRow("Monto *:", self.input_monto)
         
+        self.input_mes.currentIndexChanged.connect(self.update_monto)
+        self.input_anio.valueChanged.connect(self.update_monto)
+        
         # Fecha de pago
         self.input_fecha = QDateEdit()
         self.input_fecha.setCalendarPopup(True)
@@ -668,32 +983,79 @@ class RegistrarCuotaDialog(QDialog):
         self.socio_actual = None
     
     def buscar_socio(self):
-        """Busca un socio por DNI"""
-        dni = self.input_dni.text().strip()
+        """Busca un socio por DNI exacto o, si no, por apellido y nombre aproximados"""
+        texto = self.input_dni.text().strip()
         
-        if not dni:
-            QMessageBox.warning(self, "Advertencia", "Ingrese un DNI")
+        if not texto:
+            QMessageBox.warning(self, "Advertencia", "Ingrese un DNI, apellido o nombre")
             return
         
         try:
-            socio = self.db_manager. buscar_socio_por_dni(dni)
-            
+            socio = self.db_manager.buscar_socio_por_dni(texto) if normalizar_dni(texto) is not None else None
             if socio:
-                self.socio_actual = socio
-                info = f"✓ {socio['apellido']}, {socio['nombre']}\n"
-                info += f"Categoría: {socio['categoria']}\n"
-                info += f"Estado: {ESTADOS_PAGO. get(socio['estado_pago'], 'Desconocido')}"
-                
-                self.lbl_socio_info.setText(info)
-                self.lbl_socio_info.setStyleSheet(f"color: {COLORS['success']}; font-weight: bold; padding: 10px; background-color: #E8F5E9; border-radius: 5px;")
+                resultados = [socio]
+            else:
+                if self.buscador is None:
+                    self.buscador = IndiceSocios(self.db_manager.obtener_todos_socios())
+                resultados = [socio for socio, _ in self.buscador.buscar(texto, limite=20)]
+            
+            self.lista_resultados.clear()
+            self.lista_resultados.setVisible(len(resultados) > 1)
+            if len(resultados) > 1:
+                for socio in resultados:
+                    item = QListWidgetItem(
+                        f"{socio['apellido']}, {socio['nombre']} - DNI {socio['dni']} ({socio['categoria']})"
+                    )
+                    item.setData(Qt.ItemDataRole.UserRole, socio)
+                    self.lista_resultados.addItem(item)
+                self.lista_resultados.setCurrentRow(0)
+            elif resultados:
+                self.seleccionar_socio(resultados[0])
             else:
-                self.socio_actual = None
-                self.lbl_socio_info.setText("❌ No se encontró ningún socio con ese DNI")
-                self. lbl_socio_info. setStyleSheet(f"color:  {COLORS['danger']}; font-weight: bold; padding:  10px; background-color:  #FFEBEE; border-radius:  5px;")
+                self.seleccionar_socio(None)
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error al buscar socio: {str(e)}")
     
+    def on_resultado_changed(self, item, *args):
+        """Selecciona el socio elegido en la lista de coincidencias"""
+        if item is not None:
+            self.seleccionar_socio(item.data(Qt.ItemDataRole.UserRole))
+    
+    def seleccionar_socio(self, socio):
+        """
+        Muestra los datos del socio elegido (o que no se encontró ninguno)
+        
+        Args:
+            socio: Diccionario con datos del socio o None
+        """
+        self.socio_actual = socio
+        if socio:
+            info = f"✓ {socio['apellido']}, {socio['nombre']}\n"
+            info += f"Categoría: {socio['categoria']}\n"
+            info += f"Estado: {ESTADOS_PAGO. get(socio['estado_pago'], 'Desconocido')}"
+            
+            self.lbl_socio_info.setText(info)
+            self.lbl_socio_info.setStyleSheet(f"color: {COLORS['success']}; font-weight: bold; padding: 10px; background-color: #E8F5E9; border-radius: 5px;")
+            self.update_monto()
+        else:
+            self.lbl_socio_info.setText("❌ No se encontró ningún socio con ese DNI o nombre")
+            self. lbl_socio_info. setStyleSheet(f"color:  {COLORS['danger']}; font-weight: bold; padding:  10px; background-color:  #FFEBEE; border-radius:  5px;")
+    
+    def update_monto(self, *args):
+        """Completa el monto con el arancel de la categoría del socio en el mes elegido"""
+        if not self.socio_actual:
+            return
+        try:
+            monto = self.db_manager.obtener_arancel(
+                self.socio_actual['categoria'], self.input_anio.value(), self.input_mes.currentIndex() + 1
+            )
+        except Exception:
+            logger.exception("No se pudo obtener el arancel del socio")
+            return  # Queda el monto escrito a mano
+        if monto is not None:
+            self.input_monto.setValue(monto)
+    
     def save_cuota(self):
         """Guarda el pago de la cuota"""
         if not self.socio_actual:
@@ -742,7 +1104,7 @@ class RegistrarCuotaDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Error al registrar cuota: {str(e)}")
     
     def generar_recibo(self, datos:  dict, cuota_id: int):
-        """Genera el recibo en PDF"""
+        """Genera el recibo en PDF (en segundo plano si hay cola de exportaciones)"""
         try:
             from utils.pdf_generator import PDFGenerator
             pdf_gen = PDFGenerator()
@@ -755,9 +1117,17 @@ class RegistrarCuotaDialog(QDialog):
                 'monto': datos['monto'],
                 'metodo_pago': datos['metodo_pago'],
                 'fecha':  datetime.strptime(datos['fecha_pago'], '%Y-%m-%d').strftime('%d/%m/%Y'),
-                'recibo_numero': datos. get('recibo_numero', f"REC-{cuota_id: 06d}")
+                'recibo_numero': datos.get('recibo_numero') or f"REC-{cuota_id:06d}"
             }
             
+            if self.jobs is not None:
+                self.jobs.enviar(
+                    f"Recibo {datos_recibo['recibo_numero']} - {datos_recibo['socio']} (PDF)",
+                    lambda: pdf_gen.generar_recibo_cuota(datos_recibo),
+                    carpeta=pdf_gen.exports_path
+                )
+                return
+            
             filename = pdf_gen.generar_recibo_cuota(datos_recibo)
             QMessageBox.information(self, "Éxito", f"Recibo generado:  {filename}")
             
@@ -765,13 +1135,757 @@ class RegistrarCuotaDialog(QDialog):
             QMessageBox.warning(self, "Advertencia", f"Error al generar PDF: {str(e)}")
 
 
+class CobranzaDialog(QDialog):
+    """Diálogo para registrar juntas las cuotas de un mes de varios socios"""
+    
+    def __init__(self, db_manager, parent=None, jobs=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.jobs = jobs
+        self.aranceles = {}
+        self.setWindowTitle("Cobranza por Categoría")
+        self.setMinimumSize(600, 650)
+        self.init_ui()
+        self.load_socios()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("💰 Cobranza por Categoría")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Formulario
+        form = QFormLayout()
+        
+        self.input_categoria = QComboBox()
+        self.input_categoria.addItem("Todas")
+        self.input_categoria.addItems(CATEGORIAS_BASQUET)
+        self.input_categoria.currentIndexChanged.connect(self.load_socios)
+        form.addRow("Categoría:", self.input_categoria)
+        
+        mes_anio_layout = QHBoxLayout()
+        
+        self.input_mes = QComboBox()
+        self.input_mes.addItems(MESES)
+        self.input_mes.setCurrentIndex(datetime.now().month - 1)
+        self.input_mes.currentIndexChanged.connect(self.load_socios)
+        mes_anio_layout.addWidget(self.input_mes)
+        
+        self.input_anio = QSpinBox()
+        self.input_anio.setRange(2020, 2030)
+        self.input_anio.setValue(datetime.now().year)
+        self.input_anio.valueChanged.connect(self.load_socios)
+        mes_anio_layout.addWidget(self.input_anio)
+        
+        form.addRow("Mes/Año *:", mes_anio_layout)
+        
+        # Con una categoría se propone su arancel; con todas, cada socio paga el de la suya
+        self.input_monto = QDoubleSpinBox()
+        self.input_monto.setPrefix("$ ")
+        self.input_monto.setRange(0, 999999)
+        self.input_monto.setValue(MONTO_CUOTA_BASE)
+        self.input_monto.setDecimals(2)
+        self.input_monto.valueChanged.connect(self.update_total)
+        form.addRow("Monto por socio *:", self.input_monto)
+        
+        self.input_fecha = QDateEdit()
+        self.input_fecha.setCalendarPopup(True)
+        self.input_fecha.setDate(QDate.currentDate())
+        form.addRow("Fecha de Pago:", self.input_fecha)
+        
+        self.input_metodo = QComboBox()
+        self.input_metodo.addItems(["Efectivo", "Transferencia", "Débito", "Crédito"])
+        form.addRow("Método de Pago:", self.input_metodo)
+        
+        self.input_recibo = QLineEdit()
+        self.input_recibo.setPlaceholderText("Número de recibo (opcional, uno para toda la cobranza)")
+        form.addRow("N° Recibo:", self.input_recibo)
+        
+        layout.addLayout(form)
+        
+        # Socios que no pagaron el mes
+        seleccion_layout = QHBoxLayout()
+        self.check_todos = QCheckBox("Seleccionar todos")
+        self.check_todos.toggled.connect(self.select_all)
+        seleccion_layout.addWidget(self.check_todos)
+        seleccion_layout.addStretch()
+        self.lbl_total = QLabel()
+        self.lbl_total.setStyleSheet(f"color: {COLORS['primary']}; font-weight: bold;")
+        seleccion_layout.addWidget(self.lbl_total)
+        layout.addLayout(seleccion_layout)
+        
+        self.lista_socios = QListWidget()
+        self.lista_socios.itemChanged.connect(self.update_total)
+        layout.addWidget(self.lista_socios)
+        
+        self.check_recibo = QCheckBox("Generar un recibo con todas las cuotas")
+        self.check_recibo.setChecked(True)
+        layout.addWidget(self.check_recibo)
+        
+        # Botones
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.button(QDialogButtonBox.StandardButton.Save).setText("Registrar Cobranza")
+        buttons.accepted.connect(self.save_cobranza)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def load_socios(self, *args):
+        """Lista los socios de la categoría que no pagaron el mes elegido"""
+        categoria = self.input_categoria.currentText()
+        mes, anio = self.input_mes.currentIndex() + 1, self.input_anio.value()
+        try:
+            socios = self.db_manager.obtener_socios_sin_cuota(
+                mes, anio, None if categoria == "Todas" else categoria
+            )
+            # Un solo acceso a los aranceles del mes; los montos se buscan acá
+            self.aranceles = self.db_manager.obtener_aranceles_vigentes(anio, mes)
+        except Exception as e:
+            logger.exception("Error al cargar socios")
+            QMessageBox.critical(self, "Error", f"Error al cargar socios: {e}")
+            return
+        
+        self.lista_socios.blockSignals(True)
+        self.lista_socios.clear()
+        for socio in socios:
+            item = QListWidgetItem(
+                f"{socio['apellido']}, {socio['nombre']} - DNI {socio['dni']} ({socio['categoria']})"
+            )
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            item.setData(Qt.ItemDataRole.UserRole, socio)
+            self.lista_socios.addItem(item)
+        self.lista_socios.blockSignals(False)
+        
+        self.check_todos.blockSignals(True)
+        self.check_todos.setChecked(False)
+        self.check_todos.blockSignals(False)
+        self.update_monto()
+    
+    def update_monto(self):
+        """Propone el arancel de la categoría elegida, o usa el de cada socio si son todas"""
+        todas = self.input_categoria.currentText() == "Todas"
+        self.input_monto.setEnabled(not todas)
+        self.input_monto.setToolTip("Cada socio paga el arancel de su categoría" if todas else "")
+        if not todas:
+            monto = self.monto_arancel(self.input_categoria.currentText())
+            if monto is not None:
+                self.input_monto.blockSignals(True)
+                self.input_monto.setValue(monto)
+                self.input_monto.blockSignals(False)
+        self.update_total()
+    
+    def monto_arancel(self, categoria: str):
+        """Arancel de una categoría en el mes elegido (None si no tiene)"""
+        return self.aranceles.get(categoria)
+    
+    def monto_socio(self, socio: dict) -> float:
+        """Monto que paga un socio en esta cobranza"""
+        if self.input_monto.isEnabled():
+            return self.input_monto.value()
+        return self.aranceles.get(socio['categoria'], self.input_monto.value())
+    
+    def select_all(self, checked: bool):
+        """Marca o desmarca todos los socios de la lista"""
+        estado = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        self.lista_socios.blockSignals(True)
+        for row in range(self.lista_socios.count()):
+            self.lista_socios.item(row).setCheckState(estado)
+        self.lista_socios.blockSignals(False)
+        self.update_total()
+    
+    def selected_socios(self) -> list:
+        """Socios marcados en la lista"""
+        return [
+            self.lista_socios.item(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(self.lista_socios.count())
+            if self.lista_socios.item(row).checkState() == Qt.CheckState.Checked
+        ]
+    
+    def update_total(self, *args):
+        """Muestra cuántos socios hay marcados y el total a cobrar"""
+        socios = self.selected_socios()
+        self.lbl_total.setText(
+            f"Sin pagar: {self.lista_socios.count()}   Seleccionados: {len(socios)}   "
+            f"Total: {monto_a_texto(sum(self.monto_socio(socio) for socio in socios))}"
+        )
+    
+    def save_cobranza(self):
+        """Registra las cuotas de los socios marcados y genera el recibo combinado"""
+        socios = self.selected_socios()
+        if not socios:
+            QMessageBox.warning(self, "Advertencia", "Seleccione al menos un socio")
+            return
+        
+        periodo = f"{self.input_mes.currentText()} {self.input_anio.value()}"
+        datos = {
+            'mes': self.input_mes.currentIndex() + 1,
+            'anio': self.input_anio.value(),
+            'fecha_pago': self.input_fecha.date().toString('yyyy-MM-dd'),
+            'metodo_pago': self.input_metodo.currentText(),
+            'recibo_numero': self.input_recibo.text().strip()
+        }
+        pagos = [{
+            'socio_id': socio['id'],
+            'monto': self.monto_socio(socio),
+            'descripcion': f"Cuota {periodo} - {socio['apellido']}, {socio['nombre']}"
+        } for socio in socios]
+        
+        try:
+            cobranza = self.db_manager.registrar_cobranza(pagos, datos)
+        except ValueError as e:
+            QMessageBox.warning(self, "Advertencia", str(e))
+            self.load_socios()
+            return
+        except Exception as e:
+            logger.exception("Error al registrar la cobranza")
+            QMessageBox.critical(self, "Error", f"Error al registrar la cobranza: {e}")
+            return
+        
+        mensaje = (f"Cobranza {cobranza['recibo_numero']} registrada: {len(socios)} cuotas "
+                   f"por {monto_a_texto(cobranza['total'])}")
+        if self.check_recibo.isChecked():
+            mensaje += self.generar_recibo(socios, cobranza, datos, periodo)
+        
+        QMessageBox.information(self, "Éxito", mensaje)
+        self.accept()
+    
+    def generar_recibo(self, socios: list, cobranza: dict, datos: dict, periodo: str) -> str:
+        """
+        Genera el recibo combinado (en segundo plano si hay cola de exportaciones)
+        
+        Returns:
+            Línea para agregar al mensaje final
+        """
+        pdf_gen = PDFGenerator()
+        datos_recibo = {
+            'recibo_numero': cobranza['recibo_numero'],
+            'fecha': self.input_fecha.date().toString('dd/MM/yyyy'),
+            'periodo': periodo,
+            'categoria': self.input_categoria.currentText(),
+            'metodo_pago': datos['metodo_pago'],
+            'total': cobranza['total'],
+            'pagos': [
+                {'socio': f"{socio['apellido']}, {socio['nombre']}", 'dni': socio['dni'],
+                 'monto': self.monto_socio(socio)}
+                for socio in socios
+            ]
+        }
+        
+        if self.jobs is not None:
+            self.jobs.enviar(
+                f"Recibo {cobranza['recibo_numero']} - {periodo} ({len(socios)} cuotas, PDF)",
+                lambda: pdf_gen.generar_recibo_cobranza(datos_recibo),
+                carpeta=pdf_gen.exports_path
+            )
+            return "\nEl recibo se está generando en Exportaciones."
+        
+        try:
+            return f"\nRecibo generado: {pdf_gen.generar_recibo_cobranza(datos_recibo)}"
+        except Exception as e:
+            logger.exception("No se pudo generar el recibo")
+            return f"\nNo se pudo generar el recibo: {e}"
+
+
+class ArancelesDialog(QDialog):
+    """Diálogo para consultar y actualizar la cuota de cada categoría"""
+    
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.vigentes = {}
+        self.setWindowTitle("Aranceles por Categoría")
+        self.setMinimumSize(600, 650)
+        self.init_ui()
+        self.load_data()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("🏷️ Aranceles por Categoría")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Mes desde el que rigen los nuevos montos (o que se consulta)
+        form = QFormLayout()
+        
+        mes_anio_layout = QHBoxLayout()
+        
+        self.input_mes = QComboBox()
+        self.input_mes.addItems(MESES)
+        self.input_mes.setCurrentIndex(datetime.now().month - 1)
+        self.input_mes.currentIndexChanged.connect(self.load_vigentes)
+        mes_anio_layout.addWidget(self.input_mes)
+        
+        self.input_anio = QSpinBox()
+        self.input_anio.setRange(2020, 2030)
+        self.input_anio.setValue(datetime.now().year)
+        self.input_anio.valueChanged.connect(self.load_vigentes)
+        mes_anio_layout.addWidget(self.input_anio)
+        
+        form.addRow("Vigente desde:", mes_anio_layout)
+        
+        aumento_layout = QHBoxLayout()
+        self.input_aumento = QDoubleSpinBox()
+        self.input_aumento.setSuffix(" %")
+        self.input_aumento.setRange(-50, 500)
+        self.input_aumento.setDecimals(1)
+        aumento_layout.addWidget(self.input_aumento)
+        
+        btn_aumento = QPushButton("Aplicar a todas")
+        btn_aumento.setObjectName("secondary")
+        btn_aumento.clicked.connect(self.apply_aumento)
+        aumento_layout.addWidget(btn_aumento)
+        aumento_layout.addStretch()
+        
+        form.addRow("Aumento:", aumento_layout)
+        layout.addLayout(form)
+        
+        # Arancel vigente en el mes elegido y nuevo monto de cada categoría
+        self.table = QTableWidget()
+        self.table.setColumnCount(3)
+        self.table.setHorizontalHeaderLabels(["Categoría", "Vigente en el mes", "Nuevo monto"])
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+        
+        # Historial de aranceles
+        lbl_historial = QLabel("Historial")
+        lbl_historial.setStyleSheet(f"color: {COLORS['primary']}; font-weight: bold;")
+        layout.addWidget(lbl_historial)
+        
+        self.table_historial = QTableWidget()
+        self.table_historial.setColumnCount(3)
+        self.table_historial.setHorizontalHeaderLabels(["Vigente desde", "Categoría", "Monto"])
+        self.table_historial.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_historial.setAlternatingRowColors(True)
+        self.table_historial.verticalHeader().setVisible(False)
+        self.table_historial.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table_historial)
+        
+        # Botones
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Close
+        )
+        buttons.button(QDialogButtonBox.StandardButton.Save).setText("Guardar Aranceles")
+        buttons.accepted.connect(self.save_aranceles)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def load_data(self):
+        """Carga los aranceles del mes elegido y el historial"""
+        self.load_vigentes()
+        
+        try:
+            historial = self.db_manager.obtener_historial_aranceles()
+        except Exception as e:
+            logger.exception("Error al cargar historial de aranceles")
+            QMessageBox.critical(self, "Error", f"Error al cargar historial de aranceles: {e}")
+            return
+        
+        self.table_historial.setRowCount(len(historial))
+        for row, arancel in enumerate(historial):
+            self.table_historial.setItem(row, 0, QTableWidgetItem(arancel['vigente_desde_texto']))
+            self.table_historial.setItem(row, 1, QTableWidgetItem(arancel['categoria']))
+            self.table_historial.setItem(row, 2, QTableWidgetItem(arancel['monto_texto']))
+    
+    def load_vigentes(self, *args):
+        """Muestra el arancel de cada categoría en el mes elegido y lo propone como nuevo monto"""
+        try:
+            self.vigentes = self.db_manager.obtener_aranceles_vigentes(
+                self.input_anio.value(), self.input_mes.currentIndex() + 1
+            )
+        except Exception as e:
+            logger.exception("Error al cargar aranceles")
+            QMessageBox.critical(self, "Error", f"Error al cargar aranceles: {e}")
+            return
+        
+        categorias = CATEGORIAS_BASQUET + sorted(set(self.vigentes) - set(CATEGORIAS_BASQUET))
+        self.table.setRowCount(len(categorias))
+        for row, categoria in enumerate(categorias):
+            vigente = self.vigentes.get(categoria)
+            self.table.setItem(row, 0, QTableWidgetItem(categoria))
+            self.table.setItem(row, 1, QTableWidgetItem(monto_a_texto(vigente) if vigente is not None else "-"))
+            
+            input_nuevo = QDoubleSpinBox()
+            input_nuevo.setPrefix("$ ")
+            input_nuevo.setRange(0, 999999)
+            input_nuevo.setDecimals(2)
+            input_nuevo.setValue(vigente or 0)
+            self.table.setCellWidget(row, 2, input_nuevo)
+    
+    def apply_aumento(self):
+        """Propone para todas las categorías el arancel vigente más el porcentaje indicado"""
+        factor = 1 + self.input_aumento.value() / 100
+        for row in range(self.table.rowCount()):
+            vigente = self.vigentes.get(self.table.item(row, 0).text())
+            if vigente is not None:
+                self.table.cellWidget(row, 2).setValue(round(vigente * factor))
+    
+    def save_aranceles(self):
+        """Guarda los montos que cambiaron, vigentes desde el mes elegido"""
+        montos = {}
+        for row in range(self.table.rowCount()):
+            categoria = self.table.item(row, 0).text()
+            nuevo = self.table.cellWidget(row, 2).value()
+            if nuevo > 0 and nuevo != self.vigentes.get(categoria):
+                montos[categoria] = nuevo
+        
+        if not montos:
+            QMessageBox.warning(self, "Advertencia", "No hay montos nuevos para guardar")
+            return
+        
+        periodo = f"{self.input_mes.currentText()} {self.input_anio.value()}"
+        reply = QMessageBox.question(
+            self,
+            "Confirmar aranceles",
+            f"Se actualizarán {len(montos)} categoría(s) desde {periodo}.\n"
+            "Las cuotas pendientes de pago desde ese mes tomarán el nuevo monto.\n¿Continuar?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        try:
+            resultado = self.db_manager.actualizar_aranceles(
+                montos, self.input_anio.value(), self.input_mes.currentIndex() + 1
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "Advertencia", str(e))
+            return
+        except Exception as e:
+            logger.exception("Error al actualizar aranceles")
+            QMessageBox.critical(self, "Error", f"Error al actualizar aranceles: {e}")
+            return
+        
+        QMessageBox.information(
+            self, "Éxito",
+            f"Aranceles actualizados desde {periodo}: {resultado['categorias']} categoría(s), "
+            f"{resultado['cuotas_revaluadas']} cuota(s) pendiente(s) revaluada(s)"
+        )
+        self.load_data()
+
+
+class RecibosLoteDialog(QDialog):
+    """Diálogo para generar en lote los recibos de un período"""
+    
+    def __init__(self, db_manager, socio_ids: list, parent=None, jobs=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.socio_ids = socio_ids
+        self.jobs = jobs
+        self.setWindowTitle("Recibos del Mes")
+        self.setMinimumWidth(450)
+        self.init_ui()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("🧾 Recibos del Mes")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Formulario
+        form = QFormLayout()
+        
+        mes_anio_layout = QHBoxLayout()
+        
+        self.input_mes = QComboBox()
+        self.input_mes.addItems(MESES)
+        self.input_mes.setCurrentIndex(datetime.now().month - 1)
+        mes_anio_layout.addWidget(self.input_mes)
+        
+        self.input_anio = QSpinBox()
+        self.input_anio.setRange(2020, 2030)
+        self.input_anio.setValue(datetime.now().year)
+        mes_anio_layout.addWidget(self.input_anio)
+        
+        form.addRow("Mes/Año *:", mes_anio_layout)
+        
+        self.input_categoria = QComboBox()
+        self.input_categoria.addItem("Todas")
+        self.input_categoria.addItems(CATEGORIAS_BASQUET)
+        form.addRow("Categoría:", self.input_categoria)
+        
+        self.check_seleccionados = QCheckBox(f"Solo socios seleccionados ({len(self.socio_ids)})")
+        self.check_seleccionados.setEnabled(bool(self.socio_ids))
+        form.addRow("", self.check_seleccionados)
+        
+        self.check_combinar = QCheckBox("Un solo PDF con todos los recibos")
+        form.addRow("", self.check_combinar)
+        
+        layout.addLayout(form)
+        
+        # Botones
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.button(QDialogButtonBox.StandardButton.Ok).setText("Generar")
+        buttons.accepted.connect(self.generar)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def generar(self):
+        """Selecciona las cuotas del período y genera sus recibos"""
+        categoria = self.input_categoria.currentText()
+        periodo = f"{self.input_mes.currentText()} {self.input_anio.value()}"
+        
+        try:
+            cuotas = self.db_manager.obtener_cuotas_periodo(
+                self.input_mes.currentIndex() + 1,
+                self.input_anio.value(),
+                categoria=None if categoria == "Todas" else categoria,
+                socio_ids=self.socio_ids if self.check_seleccionados.isChecked() else None
+            )
+        except Exception as e:
+            logger.exception("Error al obtener cuotas")
+            QMessageBox.critical(self, "Error", f"Error al obtener cuotas: {e}")
+            return
+        
+        if not cuotas:
+            QMessageBox.warning(self, "Advertencia", f"No hay cuotas pagadas para {periodo}")
+            return
+        
+        pdf_gen = PDFGenerator()
+        combinar = self.check_combinar.isChecked()
+        
+        def generar(progreso=None):
+            resultado = pdf_gen.generar_recibos_lote(cuotas, combinar=combinar, progreso=progreso)
+            destino = resultado['archivos'][0] if combinar else f"{resultado['carpeta'].name}/"
+            return (f"{resultado['cantidad']} recibos en {resultado['segundos']:.1f} s "
+                    f"({resultado['recibos_por_segundo']:.1f}/s) - {destino}")
+        
+        if self.jobs is not None:
+            self.jobs.enviar(f"Recibos {periodo} - {categoria} (PDF)", generar, total=len(cuotas))
+            self.accept()
+            return
+        
+        try:
+            QMessageBox.information(self, "Éxito", f"Recibos generados: {generar()}")
+            self.accept()
+        except Exception as e:
+            logger.exception("Error al generar recibos")
+            QMessageBox.critical(self, "Error", f"Error al generar recibos: {e}")
+
+
+class ImportarDialog(QDialog):
+    """Diálogo para importar socios o cuotas desde una planilla"""
+    
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.importer = DataImporter()
+        self.encabezados = []
+        self.combos_mapeo = {}
+        self.worker = None
+        self.cancelacion = threading.Event()
+        self.resultado = None
+        self.setWindowTitle("Importar Planilla")
+        self.setMinimumWidth(550)
+        self.init_ui()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("📥 Importar Planilla")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Archivo y tipo de datos
+        form = QFormLayout()
+        
+        self.input_tipo = QComboBox()
+        self.input_tipo.addItem("Socios", 'socios')
+        self.input_tipo.addItem("Cuotas", 'cuotas')
+        self.input_tipo.currentIndexChanged.connect(self.update_mapeo)
+        form.addRow("Datos:", self.input_tipo)
+        
+        archivo_layout = QHBoxLayout()
+        self.input_archivo = QLineEdit()
+        self.input_archivo.setReadOnly(True)
+        self.input_archivo.setPlaceholderText("Archivo .xlsx o .csv")
+        archivo_layout.addWidget(self.input_archivo)
+        btn_archivo = QPushButton("Examinar...")
+        btn_archivo.clicked.connect(self.select_file)
+        archivo_layout.addWidget(btn_archivo)
+        form.addRow("Archivo *:", archivo_layout)
+        
+        layout.addLayout(form)
+        
+        # Columnas del archivo para cada campo
+        lbl_mapeo = QLabel("Columnas")
+        lbl_mapeo.setStyleSheet("font-weight: bold;")
+        layout.addWidget(lbl_mapeo)
+        self.form_mapeo = QFormLayout()
+        layout.addLayout(self.form_mapeo)
+        
+        # Progreso y resultado
+        self.progress = QProgressBar()
+        self.progress.setVisible(False)
+        layout.addWidget(self.progress)
+        
+        self.lbl_resultado = QLabel()
+        self.lbl_resultado.setWordWrap(True)
+        layout.addWidget(self.lbl_resultado)
+        
+        # Botones
+        buttons_layout = QHBoxLayout()
+        self.btn_rechazos = QPushButton("📂 Ver rechazos")
+        self.btn_rechazos.setVisible(False)
+        self.btn_rechazos.clicked.connect(self.open_rechazos)
+        buttons_layout.addWidget(self.btn_rechazos)
+        buttons_layout.addStretch()
+        
+        self.btn_importar = QPushButton("Importar")
+        self.btn_importar.setEnabled(False)
+        self.btn_importar.clicked.connect(self.importar)
+        buttons_layout.addWidget(self.btn_importar)
+        
+        self.btn_cerrar = QPushButton("Cerrar")
+        self.btn_cerrar.setObjectName("secondary")
+        self.btn_cerrar.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.btn_cerrar)
+        layout.addLayout(buttons_layout)
+        
+        self.update_mapeo()
+    
+    def select_file(self):
+        """Elige el archivo y lee sus encabezados"""
+        ruta, _ = QFileDialog.getOpenFileName(
+            self, "Seleccionar planilla", "", "Planillas (*.xlsx *.xlsm *.csv *.txt)"
+        )
+        if not ruta:
+            return
+        
+        try:
+            self.encabezados = leer_encabezados(Path(ruta))
+        except Exception as e:
+            logger.exception("No se pudo leer el archivo")
+            QMessageBox.critical(self, "Error", f"No se pudo leer el archivo: {e}")
+            return
+        
+        self.input_archivo.setText(ruta)
+        self.update_mapeo()
+    
+    def update_mapeo(self):
+        """Arma un selector de columna por campo, con la columna detectada elegida"""
+        while self.form_mapeo.rowCount():
+            self.form_mapeo.removeRow(0)
+        self.combos_mapeo = {}
+        
+        tipo = self.input_tipo.currentData()
+        detectado = detectar_mapeo(self.encabezados, tipo)
+        for campo in CAMPOS_IMPORTACION[tipo]:
+            combo = QComboBox()
+            combo.addItem("(no importar)", None)
+            for indice, encabezado in enumerate(self.encabezados):
+                combo.addItem(encabezado or f"Columna {indice + 1}", indice)
+            if campo in detectado:
+                combo.setCurrentIndex(detectado[campo] + 1)
+            
+            obligatorio = " *" if campo in CAMPOS_OBLIGATORIOS[tipo] else ""
+            self.form_mapeo.addRow(f"{campo.replace('_', ' ').capitalize()}{obligatorio}:", combo)
+            self.combos_mapeo[campo] = combo
+        
+        self.btn_importar.setEnabled(bool(self.encabezados))
+    
+    def importar(self):
+        """Valida el mapeo e inicia la importación en segundo plano"""
+        tipo = self.input_tipo.currentData()
+        mapeo = {
+            campo: combo.currentData()
+            for campo, combo in self.combos_mapeo.items()
+            if combo.currentData() is not None
+        }
+        faltantes = [c for c in CAMPOS_OBLIGATORIOS[tipo] if c not in mapeo]
+        if faltantes:
+            QMessageBox.warning(self, "Advertencia", f"Elija la columna de: {', '.join(faltantes)}")
+            return
+        
+        ruta = Path(self.input_archivo.text())
+        self.progress.setRange(0, contar_filas(ruta) or 0)
+        self.progress.setValue(0)
+        self.progress.setVisible(True)
+        self.lbl_resultado.clear()
+        self.btn_rechazos.setVisible(False)
+        self.btn_importar.setEnabled(False)
+        self.btn_cerrar.setText("Cancelar")
+        self.btn_cerrar.clicked.disconnect()
+        self.btn_cerrar.clicked.connect(self.cancelacion.set)
+        self.cancelacion.clear()
+        
+        def importar(progreso=None):
+            return self.importer.importar(
+                self.db_manager, ruta, tipo, mapeo, progreso=progreso, cancelacion=self.cancelacion
+            )
+        
+        self.worker = Worker(importar)
+        self.worker.signals.progreso.connect(self.progress.setValue)
+        self.worker.signals.finished.connect(self.on_finished)
+        self.worker.signals.error.connect(self.on_error)
+        QThreadPool.globalInstance().start(self.worker)
+    
+    def restore_buttons(self):
+        """Vuelve los botones al estado de espera"""
+        self.worker = None
+        self.btn_importar.setEnabled(True)
+        self.btn_cerrar.setText("Cerrar")
+        self.btn_cerrar.clicked.disconnect()
+        self.btn_cerrar.clicked.connect(self.reject)
+    
+    def on_finished(self, resultado: dict):
+        """Muestra el resumen de la importación"""
+        self.restore_buttons()
+        self.resultado = resultado
+        self.progress.setValue(self.progress.maximum())
+        
+        texto = (f"✅ {resultado['importadas']:,} filas importadas y {resultado['rechazadas']:,} "
+                 f"rechazadas de {resultado['leidas']:,} en {resultado['segundos']:.1f} s.")
+        if resultado['archivo_rechazos']:
+            texto += f"\nLos rechazos y sus motivos están en {resultado['archivo_rechazos']}."
+            self.btn_rechazos.setVisible(True)
+        self.lbl_resultado.setText(texto)
+    
+    def open_rechazos(self):
+        """Abre el informe de filas rechazadas"""
+        abrir_carpeta(self.importer.exports_path / self.resultado['archivo_rechazos'])
+    
+    def on_error(self, mensaje: str):
+        """Informa que la importación no se hizo (no queda nada importado)"""
+        self.restore_buttons()
+        self.progress.setVisible(False)
+        if self.cancelacion.is_set():
+            self.lbl_resultado.setText("Importación cancelada: no se importó ninguna fila.")
+        else:
+            self.lbl_resultado.setText(f"❌ Error al importar: {mensaje}\nNo se importó ninguna fila.")
+    
+    def reject(self):
+        """No cierra mientras la importación está en curso"""
+        if self.worker is not None:
+            self.cancelacion.set()
+            return
+        super().reject()
+
+
 class HistorialCuotasDialog(QDialog):
     """Diálogo para ver el historial de cuotas de un socio"""
     
-    def __init__(self, db_manager, socio_id: int, parent=None):
+    def __init__(self, db_manager, socio_id: int, parent=None, prefetcher=None):
         super().__init__(parent)
         self.db_manager = db_manager
         self.socio_id = socio_id
+        self.prefetcher = prefetcher
         self.setWindowTitle("Historial de Cuotas")
         self.setMinimumSize(700, 500)
         self.init_ui()
@@ -808,18 +1922,12 @@ class HistorialCuotasDialog(QDialog):
     def load_data(self):
         """Carga los datos del socio y sus cuotas"""
         try: 
-            # Obtener datos del socio
-            conn = self.db_manager.connect()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM socios WHERE id = ?", (self.socio_id,))
-            socio = dict(cursor.fetchone())
-            self.db_manager.disconnect()
+            socio = self.db_manager.obtener_socio(self.socio_id)
+            # Las cuotas pueden estar precargadas
+            cuotas = obtener_datos(self.prefetcher, self.db_manager, SociosView.cuotas_key(self.socio_id))
             
             self.lbl_socio.setText(f"📋 Historial de:  {socio['apellido']}, {socio['nombre']} (DNI: {socio['dni']})")
             
-            # Obtener cuotas
-            cuotas = self.db_manager.obtener_cuotas_socio(self.socio_id)
-            
             self.table.setRowCount(0)
             for cuota in cuotas: 
                 row = self.table.rowCount()
@@ -830,10 +1938,8 @@ class HistorialCuotasDialog(QDialog):
                 
                 self.table.setItem(row, 0, QTableWidgetItem(mes_nombre))
                 self.table.setItem(row, 1, QTableWidgetItem(str(cuota['anio'])))
-                self.table. setItem(row, 2, QTableWidgetItem(f"${cuota['monto']:,.2f}"))
-                
-                fecha = datetime.strptime(cuota['fecha_pago'], '%Y-%m-%d').strftime('%d/%m/%Y')
-                self.table.setItem(row, 3, QTableWidgetItem(fecha))
+                self.table.setItem(row, 2, QTableWidgetItem(cuota['monto_texto']))
+                self.table.setItem(row, 3, QTableWidgetItem(cuota['fecha_pago_texto']))
                 
                 self.table.setItem(row, 4, QTableWidgetItem(cuota. get('metodo_pago', '-')))
                 self.table. setItem(row, 5, QTableWidgetItem(cuota.get('recibo_numero', '-') or '-'))
@@ -849,6 +1955,128 @@ class HistorialCuotasDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Error al cargar historial: {str(e)}")
 
 
+class GrillaPagosDialog(QDialog):
+    """Diálogo con los meses pagados por cada socio en un año"""
+    
+    def __init__(self, db_manager, parent=None, prefetcher=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.prefetcher = prefetcher
+        self.setWindowTitle("Grilla de Pagos")
+        self.setMinimumSize(1000, 600)
+        self.init_ui()
+        self.load_data()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        layout = QVBoxLayout(self)
+        
+        # Título
+        title = QLabel("🗓️ Grilla de Pagos")
+        title.setStyleSheet(f"color: {COLORS['primary']}; font-size: 16pt; font-weight: bold;")
+        layout.addWidget(title)
+        
+        # Filtros
+        filtros = QHBoxLayout()
+        
+        filtros.addWidget(QLabel("Año:"))
+        self.input_anio = QSpinBox()
+        self.input_anio.setRange(2020, 2030)
+        self.input_anio.setValue(datetime.now().year)
+        self.input_anio.valueChanged.connect(self.load_data)
+        filtros.addWidget(self.input_anio)
+        
+        filtros.addWidget(QLabel("Categoría:"))
+        self.input_categoria = QComboBox()
+        self.input_categoria.addItem("Todas")
+        self.input_categoria.addItems(CATEGORIAS_BASQUET)
+        self.input_categoria.currentIndexChanged.connect(self.load_data)
+        filtros.addWidget(self.input_categoria)
+        
+        filtros.addStretch()
+        
+        self.lbl_resumen = QLabel()
+        self.lbl_resumen.setStyleSheet(f"color: {COLORS['primary']}; font-weight: bold;")
+        filtros.addWidget(self.lbl_resumen)
+        
+        layout.addLayout(filtros)
+        
+        # Grilla: el modelo entrega solo las celdas visibles y las filas
+        # tienen alto fijo, así la vista no mide todos los socios
+        self.modelo = ModeloGrillaPagos(self)
+        self.table = QTableView()
+        self.table.setModel(self.modelo)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setWordWrap(False)
+        self.table.doubleClicked.connect(self.show_historial)
+        
+        vertical = self.table.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(26)
+        
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setColumnWidth(1, 95)
+        self.table.setColumnWidth(2, 80)
+        for columna in range(3, self.modelo.columnCount()):
+            self.table.setColumnWidth(columna, 44)
+        self.table.setColumnWidth(self.modelo.columnCount() - 1, 65)
+        
+        layout.addWidget(self.table)
+        
+        # Pagos por mes de los socios mostrados
+        self.lbl_meses = QLabel()
+        self.lbl_meses.setStyleSheet(f"color: {COLORS['text']}; font-size: 9pt;")
+        layout.addWidget(self.lbl_meses)
+        
+        # Botones
+        botones = QHBoxLayout()
+        lbl_ayuda = QLabel("✓ pagado · ✗ adeudado · doble clic para ver el historial del socio")
+        lbl_ayuda.setStyleSheet(f"color: {COLORS['text']}; font-size: 8pt;")
+        botones.addWidget(lbl_ayuda)
+        botones.addStretch()
+        btn_close = QPushButton("Cerrar")
+        btn_close.clicked.connect(self.accept)
+        botones.addWidget(btn_close)
+        layout.addLayout(botones)
+    
+    def load_data(self, *args):
+        """Consulta la grilla del año y la categoría elegidos"""
+        anio = self.input_anio.value()
+        categoria = self.input_categoria.currentText()
+        
+        try:
+            filas = self.db_manager.obtener_grilla_pagos(anio, None if categoria == "Todas" else categoria)
+        except Exception as e:
+            logger.exception("Error al cargar la grilla de pagos")
+            QMessageBox.critical(self, "Error", f"Error al cargar la grilla de pagos: {e}")
+            return
+        
+        hoy = datetime.now()
+        self.modelo.set_grilla(filas, anio, hoy.year * 12 + hoy.month - 1)
+        
+        al_dia = sum(
+            1 for socio in filas
+            if not any(self.modelo.estado_mes(socio, mes) == 'adeudado' for mes in range(1, 13))
+        )
+        self.lbl_resumen.setText(f"Socios: {len(filas)}   Sin meses adeudados en {anio}: {al_dia}")
+        self.lbl_meses.setText("Pagaron:  " + "  ·  ".join(
+            f"{MESES[mes][:3]} {cantidad}" for mes, cantidad in enumerate(self.modelo.pagados_por_mes())
+        ))
+    
+    def show_historial(self, index):
+        """Abre el historial de cuotas del socio de la fila"""
+        socio = self.modelo.socio(index.row())
+        if socio is None:
+            return
+        dialog = HistorialCuotasDialog(self.db_manager, socio['id'], self, self.prefetcher)
+        dialog.exec()
+
+
 class SocioDetailsDialog(QDialog):
     """Diálogo para mostrar todos los detalles de un socio"""
     
@@ -928,11 +2156,7 @@ class SocioDetailsDialog(QDialog):
     def load_data(self):
         """Carga los datos del socio"""
         try:
-            conn = self.db_manager.connect()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM socios WHERE id = ?", (self.socio_id,))
-            socio = dict(cursor.fetchone())
-            self.db_manager.disconnect()
+            socio = self.db_manager.obtener_socio(self.socio_id)
             
             self.lbl_title.setText(f"👤 {socio['apellido']}, {socio['nombre']}")
             self.lbl_dni.setText(socio['dni'])
@@ -2,8 +2,29 @@
 Vista de Gestión de Sponsors
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+import logging
+
 from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from utils.formatters import fecha_a_texto, monto_a_texto
+
+logger = logging.getLogger(__name__)
+
+# Columnas que muestra la tabla de sponsors
+COLUMNAS_LISTADO = (
+    'nombre_empresa', 'nombre_contacto', 'telefono', 'tipo_patrocinio',
+    'monto_contrato', 'fecha_vencimiento', 'estado'
+)
 
 
 class SponsorsView(QWidget):
@@ -12,18 +33,99 @@ class SponsorsView(QWidget):
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self.sponsors = []
         self.init_ui()
     
     def init_ui(self):
         """Inicializa la interfaz"""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(20)
+        
+        # Título
+        title = QLabel("🤝 Gestión de Sponsors")
+        title.setObjectName("title")
+        layout.addWidget(title)
+        
+        # Tabla de sponsors
+        self.table = self.create_sponsors_table()
+        layout.addWidget(self.table)
+    
+    def create_sponsors_table(self) -> QTableWidget:
+        """Crea la tabla de sponsors"""
+        table = QTableWidget()
+        table.setColumnCount(8)
+        table.setHorizontalHeaderLabels([
+            "ID", "Empresa", "Contacto", "Teléfono", "Tipo",
+            "Monto", "Vencimiento", "Estado"
+        ])
+        
+        # Configurar tabla
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setAlternatingRowColors(True)
+        
+        # Ajustar columnas
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        
+        # Ocultar columna ID
+        table.setColumnHidden(0, True)
+        
+        return table
+    
+    def load_sponsors(self):
+        """Carga todos los sponsors en la tabla"""
+        try:
+            self.populate_table(self.db_manager.obtener_todos_sponsors(COLUMNAS_LISTADO))
+        except Exception as e:
+            logger.exception("Error al cargar sponsors")
+            QMessageBox.critical(self, "Error", f"Error al cargar sponsors: {e}")
+    
+    def populate_table(self, sponsors: list):
+        """
+        Puebla la tabla con los datos de sponsors
+        
+        Args:
+            sponsors: Lista de diccionarios con datos de sponsors
+        """
+        self.sponsors = list(sponsors)
+        self.table.setRowCount(len(self.sponsors))
+        
+        for row, sponsor in enumerate(self.sponsors):
+            monto = sponsor.get('monto_contrato')
+            valores = (
+                str(sponsor['id']),
+                sponsor['nombre_empresa'],
+                sponsor.get('nombre_contacto') or '-',
+                sponsor.get('telefono') or '-',
+                sponsor.get('tipo_patrocinio') or '-',
+                monto_a_texto(monto) if monto is not None else '-',
+                fecha_a_texto(sponsor.get('fecha_vencimiento')),
+                (sponsor.get('estado') or '').capitalize()
+            )
+            for col, valor in enumerate(valores):
+                self.table.setItem(row, col, QTableWidgetItem(valor))
+            
+            if sponsor.get('estado') != 'activo':
+                self.table.item(row, 7).setForeground(Qt.GlobalColor.gray)
+    
+    def select_sponsor(self, sponsor: dict):
+        """
+        Selecciona un sponsor en la tabla
         
-        label = QLabel("🤝 Gestión de Sponsors\n\nEn construcción")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("font-size: 24pt; color: #1D71B8; font-weight: bold;")
-        layout.addWidget(label)
+        Args:
+            sponsor: Diccionario con al menos el id del sponsor
+        """
+        row = next((i for i, fila in enumerate(self.sponsors) if fila['id'] == sponsor['id']), -1)
+        if row < 0:
+            return
+        self.table.selectRow(row)
+        self.table.scrollToItem(self.table.item(row, 1), QAbstractItemView.ScrollHint.PositionAtCenter)
     
     def refresh_data(self):
         """Recarga los datos"""
-        pass
\ No newline at end of file
+        self.load_sponsors()
@@ -0,0 +1,11 @@
+"""
+Widgets reutilizables de la interfaz
+"""
+
+from .charts import GraficoCategorias, GraficoFinanciero
+from .jobs_panel import PanelTrabajos, abrir_carpeta
+from .payment_grid import ModeloGrillaPagos
+from .search_palette import PaletaBusqueda
+
+__all__ = ['GraficoCategorias', 'GraficoFinanciero', 'ModeloGrillaPagos', 'PaletaBusqueda', 'PanelTrabajos',
+           'abrir_carpeta']
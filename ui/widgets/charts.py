@@ -0,0 +1,136 @@
+"""
+Gráficos del dashboard
+Basados en PyQt6-Charts, se alimentan con series ya agregadas
+"""
+
+from PyQt6.QtCharts import (
+    QBarCategoryAxis,
+    QBarSeries,
+    QBarSet,
+    QChart,
+    QChartView,
+    QLineSeries,
+    QValueAxis,
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPainter, QPen
+
+from config.settings import COLORS
+
+
+class BaseChartView(QChartView):
+    """Vista de gráfico con la configuración común del sistema"""
+    
+    def __init__(self, titulo: str, parent=None):
+        super().__init__(parent)
+        chart = QChart()
+        chart.setTitle(titulo)
+        chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+        chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+        self.setChart(chart)
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setMinimumHeight(320)
+    
+    def limpiar(self):
+        """Quita series y ejes del gráfico"""
+        chart = self.chart()
+        chart.removeAllSeries()
+        for axis in chart.axes():
+            chart.removeAxis(axis)
+
+
+class GraficoFinanciero(BaseChartView):
+    """Gráfico de ingresos y egresos por período con el balance acumulado"""
+    
+    def __init__(self, parent=None):
+        super().__init__("Ingresos, Egresos y Balance", parent)
+    
+    def actualizar(self, puntos: list):
+        """
+        Redibuja el gráfico
+        
+        Args:
+            puntos: Lista de SerieFinanciera.puntos()
+        """
+        self.limpiar()
+        chart = self.chart()
+        
+        set_ingresos = QBarSet("Ingresos")
+        set_ingresos.setColor(QColor(COLORS['success']))
+        set_egresos = QBarSet("Egresos")
+        set_egresos.setColor(QColor(COLORS['danger']))
+        
+        linea_balance = QLineSeries()
+        linea_balance.setName("Balance acumulado")
+        linea_balance.setPen(QPen(QColor(COLORS['primary']), 3))
+        
+        for i, punto in enumerate(puntos):
+            set_ingresos.append(punto['ingresos'])
+            set_egresos.append(punto['egresos'])
+            linea_balance.append(i, punto['balance'])
+        
+        barras = QBarSeries()
+        barras.append(set_ingresos)
+        barras.append(set_egresos)
+        chart.addSeries(barras)
+        chart.addSeries(linea_balance)
+        
+        eje_x = QBarCategoryAxis()
+        eje_x.append([p['periodo'] for p in puntos])
+        eje_x.setLabelsAngle(-60)
+        chart.addAxis(eje_x, Qt.AlignmentFlag.AlignBottom)
+        
+        valores = [0.0]
+        for punto in puntos:
+            valores.extend((punto['ingresos'], punto['egresos'], punto['balance']))
+        
+        eje_y = QValueAxis()
+        eje_y.setRange(min(valores), max(valores) or 1.0)
+        eje_y.setLabelFormat("$%.0f")
+        eje_y.applyNiceNumbers()
+        chart.addAxis(eje_y, Qt.AlignmentFlag.AlignLeft)
+        
+        for serie in (barras, linea_balance):
+            serie.attachAxis(eje_x)
+            serie.attachAxis(eje_y)
+
+
+class GraficoCategorias(BaseChartView):
+    """Gráfico de barras con la cantidad de socios por categoría"""
+    
+    def __init__(self, parent=None):
+        super().__init__("Socios por Categoría", parent)
+        self.chart().legend().setVisible(False)
+    
+    def actualizar(self, categorias: list):
+        """
+        Redibuja el gráfico
+        
+        Args:
+            categorias: Lista de diccionarios con 'categoria' y 'cantidad'
+        """
+        self.limpiar()
+        chart = self.chart()
+        
+        set_socios = QBarSet("Socios")
+        set_socios.setColor(QColor(COLORS['secondary']))
+        for fila in categorias:
+            set_socios.append(fila['cantidad'])
+        
+        barras = QBarSeries()
+        barras.append(set_socios)
+        chart.addSeries(barras)
+        
+        eje_x = QBarCategoryAxis()
+        eje_x.append([fila['categoria'] for fila in categorias])
+        chart.addAxis(eje_x, Qt.AlignmentFlag.AlignBottom)
+        
+        eje_y = QValueAxis()
+        maximo = max([fila['cantidad'] for fila in categorias] + [1])
+        eje_y.setRange(0, maximo)
+        eje_y.setTickCount(min(maximo, 5) + 1)
+        eje_y.setLabelFormat("%d")
+        chart.addAxis(eje_y, Qt.AlignmentFlag.AlignLeft)
+        
+        barras.attachAxis(eje_x)
+        barras.attachAxis(eje_y)
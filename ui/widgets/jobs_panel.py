@@ -0,0 +1,131 @@
+"""
+Panel de exportaciones
+Lista los trabajos de exportación con su estado, progreso y acciones
+"""
+
+from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QProgressBar,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+)
+
+from ui.jobs import ESTADOS_TRABAJO, GestorTrabajos, TrabajoExportacion
+
+
+def abrir_carpeta(carpeta):
+    """Abre la carpeta indicada en el explorador de archivos del sistema"""
+    QDesktopServices.openUrl(QUrl.fromLocalFile(str(carpeta)))
+
+
+class PanelTrabajos(QTableWidget):
+    """Tabla con una fila por trabajo de exportación"""
+    
+    def __init__(self, gestor: GestorTrabajos, parent=None):
+        super().__init__(parent)
+        self.gestor = gestor
+        
+        self.setColumnCount(4)
+        self.setHorizontalHeaderLabels(["Exportación", "Estado", "Progreso", ""])
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.verticalHeader().setVisible(False)
+        
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        self.setColumnWidth(2, 220)
+        
+        gestor.trabajo_agregado.connect(self.add_trabajo)
+        gestor.trabajo_actualizado.connect(self.update_trabajo)
+        gestor.trabajo_eliminado.connect(self.remove_trabajo)
+    
+    def find_row(self, trabajo_id: int) -> int:
+        """Fila del trabajo o -1 si no está en la tabla"""
+        for row in range(self.rowCount()):
+            if self.item(row, 0).data(Qt.ItemDataRole.UserRole) == trabajo_id:
+                return row
+        return -1
+    
+    def add_trabajo(self, trabajo: TrabajoExportacion):
+        """Agrega un trabajo nuevo al principio de la tabla"""
+        self.insertRow(0)
+        
+        item = QTableWidgetItem(trabajo.descripcion)
+        item.setData(Qt.ItemDataRole.UserRole, trabajo.id)
+        self.setItem(0, 0, item)
+        self.setItem(0, 1, QTableWidgetItem())
+        
+        barra = QProgressBar()
+        barra.setTextVisible(True)
+        self.setCellWidget(0, 2, barra)
+        
+        boton = QPushButton()
+        boton.setCursor(Qt.CursorShape.PointingHandCursor)
+        boton.clicked.connect(lambda: self.on_action(trabajo.id))
+        self.setCellWidget(0, 3, boton)
+        
+        self.update_trabajo(trabajo)
+    
+    def update_trabajo(self, trabajo: TrabajoExportacion):
+        """Refleja en la fila el estado y progreso actual del trabajo"""
+        row = self.find_row(trabajo.id)
+        if row < 0:
+            return
+        
+        estado = ESTADOS_TRABAJO[trabajo.estado]
+        if trabajo.estado == 'error':
+            estado = f"{estado}: {trabajo.mensaje_error}"
+        self.item(row, 1).setText(estado)
+        
+        barra = self.cellWidget(row, 2)
+        if trabajo.estado == 'terminado':
+            barra.setRange(0, 1)
+            barra.setValue(1)
+            barra.setFormat(str(trabajo.resultado))
+        elif trabajo.estado in ('error', 'cancelado'):
+            barra.setRange(0, 1)
+            barra.setValue(0)
+            barra.setFormat("-")
+        elif trabajo.total:
+            barra.setRange(0, trabajo.total)
+            barra.setValue(min(trabajo.cantidad, trabajo.total))
+            barra.setFormat(f"{trabajo.cantidad:,} / {trabajo.total:,} filas")
+        else:
+            # Sin total conocido: barra indeterminada con la cantidad escrita
+            barra.setRange(0, 0)
+            barra.setFormat(f"{trabajo.cantidad:,} filas" if trabajo.cantidad else "")
+        
+        boton = self.cellWidget(row, 3)
+        if trabajo.estado == 'terminado':
+            boton.setText("📂 Abrir carpeta")
+            boton.setEnabled(True)
+        elif trabajo.estado in ('error', 'cancelado'):
+            boton.setText("—")
+            boton.setEnabled(False)
+        else:
+            boton.setText("✖ Cancelar")
+            boton.setEnabled(trabajo.estado != 'cancelando')
+    
+    def remove_trabajo(self, trabajo_id: int):
+        """Quita de la tabla un trabajo descartado del historial"""
+        row = self.find_row(trabajo_id)
+        if row >= 0:
+            self.removeRow(row)
+    
+    def on_action(self, trabajo_id: int):
+        """Cancela el trabajo o abre su carpeta si ya terminó"""
+        trabajo = self.gestor.trabajos.get(trabajo_id)
+        if trabajo is None:
+            return
+        
+        if trabajo.estado == 'terminado':
+            abrir_carpeta(trabajo.carpeta)
+        else:
+            self.gestor.cancelar(trabajo_id)
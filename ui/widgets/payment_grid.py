@@ -0,0 +1,124 @@
+"""
+Grilla de pagos
+Modelo de tabla con un socio por fila y los doce meses de un año como
+columnas; la vista solo pide las celdas visibles, así que se desplaza igual
+con cientos que con miles de socios
+"""
+
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from config.settings import COLORS, ESTADOS_PAGO, MESES
+from utils.formatters import monto_a_texto
+
+# Columnas fijas antes de los meses
+COLUMNAS_SOCIO = ("Socio", "DNI", "Categoría")
+PRIMER_MES = len(COLUMNAS_SOCIO)
+COLUMNA_PAGADAS = PRIMER_MES + 12
+
+# Estado de cada celda de mes: texto y color de fondo
+ESTADOS_CELDA = {
+    'pagado': ("✓", QColor(COLORS['success']).lighter(190)),
+    'adeudado': ("✗", QColor(COLORS['danger']).lighter(170)),
+    'sin_cargo': ("", QColor(COLORS['background']))
+}
+
+
+class ModeloGrillaPagos(QAbstractTableModel):
+    """Socios por meses de un año, con la cuota pagada en cada mes"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filas: list[dict] = []
+        self.anio = 0
+        self.periodo_actual = 0
+    
+    def set_grilla(self, filas: list[dict], anio: int, periodo_actual: int):
+        """
+        Reemplaza los socios de la grilla
+        
+        Args:
+            filas: Resultado de DatabaseManager.obtener_grilla_pagos
+            anio: Año de la grilla
+            periodo_actual: anio * 12 + mes - 1 del mes en curso; los meses
+                            posteriores no se marcan como adeudados
+        """
+        self.beginResetModel()
+        self.filas = filas
+        self.anio = anio
+        self.periodo_actual = periodo_actual
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self.filas)
+    
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else COLUMNA_PAGADAS + 1
+    
+    def estado_mes(self, socio: dict, mes: int) -> str:
+        """
+        Estado de un mes (1-12) para un socio
+        
+        Returns:
+            'pagado', 'adeudado' o 'sin_cargo' (mes futuro, anterior a la
+            inscripción o socio exento)
+        """
+        if socio['pagos'][mes - 1] is not None:
+            return 'pagado'
+        periodo = self.anio * 12 + mes - 1
+        if (socio['estado_pago'] == 'exento' or periodo > self.periodo_actual
+                or (socio['periodo_inscripcion'] is not None and periodo < socio['periodo_inscripcion'])):
+            return 'sin_cargo'
+        return 'adeudado'
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        socio = self.filas[index.row()]
+        columna = index.column()
+        
+        if PRIMER_MES <= columna < COLUMNA_PAGADAS:
+            mes = columna - PRIMER_MES + 1
+            if role == Qt.ItemDataRole.DisplayRole:
+                return ESTADOS_CELDA[self.estado_mes(socio, mes)][0]
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return ESTADOS_CELDA[self.estado_mes(socio, mes)][1]
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.ToolTipRole:
+                monto = socio['pagos'][mes - 1]
+                detalle = f"pagó {monto_a_texto(monto)}" if monto is not None else "sin pago"
+                return f"{MESES[mes - 1]} {self.anio}: {detalle}"
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if columna == 0:
+                return f"{socio['apellido']}, {socio['nombre']}"
+            if columna == 1:
+                return socio['dni']
+            if columna == 2:
+                return socio['categoria']
+            return str(socio['pagadas'])
+        if role == Qt.ItemDataRole.TextAlignmentRole and columna == COLUMNA_PAGADAS:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ToolTipRole and columna == 0:
+            return ESTADOS_PAGO.get(socio['estado_pago'], socio['estado_pago'])
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal:
+            return None
+        if section < PRIMER_MES:
+            return COLUMNAS_SOCIO[section]
+        if section < COLUMNA_PAGADAS:
+            return MESES[section - PRIMER_MES][:3]
+        return "Pagadas"
+    
+    def socio(self, row: int) -> dict | None:
+        """Socio de una fila o None si está fuera de rango"""
+        return self.filas[row] if 0 <= row < len(self.filas) else None
+    
+    def pagados_por_mes(self) -> list[int]:
+        """Cantidad de socios que pagaron cada mes, de enero a diciembre"""
+        return [sum(1 for socio in self.filas if socio['pagos'][mes] is not None) for mes in range(12)]
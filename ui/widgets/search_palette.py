@@ -0,0 +1,163 @@
+"""
+Búsqueda global
+Ventana emergente (Ctrl+K) que busca socios, sponsors y transacciones
+mientras se escribe, sin cambiar de vista
+"""
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+)
+
+from config.settings import COLORS
+from utils.buscador import IndiceGlobal
+from utils.formatters import fecha_a_texto, monto_a_texto
+
+# Encabezado de cada grupo de resultados
+TITULOS_TIPOS = {
+    'socios': "👥  Socios",
+    'sponsors': "🤝  Sponsors",
+    'transacciones': "💰  Transacciones"
+}
+
+
+def describir(tipo: str, fila: dict) -> str:
+    """
+    Texto de un resultado: título y, debajo, el detalle que lo distingue
+    
+    Args:
+        tipo: Tabla del resultado
+        fila: Columnas de la búsqueda global
+    
+    Returns:
+        Texto en dos líneas
+    """
+    if tipo == 'socios':
+        return f"{fila['apellido']}, {fila['nombre']}\nDNI {fila['dni']} · {fila['categoria']}"
+    if tipo == 'sponsors':
+        detalle = ' · '.join(
+            texto for texto in (fila['nombre_contacto'], fila['tipo_patrocinio'], fila['estado']) if texto
+        )
+        return f"{fila['nombre_empresa']}\n{detalle or '-'}"
+    detalle = f"{fecha_a_texto(fila['fecha'])} · {fila['tipo'].capitalize()} · {monto_a_texto(fila['monto'])}"
+    if fila['comprobante']:
+        detalle += f" · Comprobante {fila['comprobante']}"
+    return f"{fila['descripcion']}\n{detalle}"
+
+
+class PaletaBusqueda(QDialog):
+    """Ventana de búsqueda global con los resultados agrupados por tabla"""
+    
+    # Resultado elegido: (tipo, fila)
+    seleccionado = pyqtSignal(str, dict)
+    
+    def __init__(self, indice: IndiceGlobal, parent=None):
+        super().__init__(parent)
+        self.indice = indice
+        self.setWindowFlags(Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint)
+        self.setFixedWidth(640)
+        self.init_ui()
+    
+    def init_ui(self):
+        """Inicializa la interfaz"""
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['white']};
+                border: 2px solid {COLORS['primary']};
+            }}
+        """)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        
+        self.input_busqueda = QLineEdit()
+        self.input_busqueda.setPlaceholderText("Buscar socios (nombre o DNI), sponsors o transacciones...")
+        self.input_busqueda.textChanged.connect(self.actualizar_resultados)
+        layout.addWidget(self.input_busqueda)
+        
+        self.lista_resultados = QListWidget()
+        self.lista_resultados.setMinimumHeight(380)
+        self.lista_resultados.itemActivated.connect(self.elegir)
+        self.lista_resultados.itemClicked.connect(self.elegir)
+        layout.addWidget(self.lista_resultados)
+        
+        self.lbl_estado = QLabel()
+        self.lbl_estado.setStyleSheet(f"color: {COLORS['text']}; font-size: 8pt;")
+        layout.addWidget(self.lbl_estado)
+    
+    def abrir(self):
+        """Muestra la ventana centrada arriba de la ventana principal"""
+        if self.parent() is not None:
+            ventana = self.parent().geometry()
+            self.move(ventana.x() + (ventana.width() - self.width()) // 2, ventana.y() + 80)
+        self.input_busqueda.selectAll()
+        self.actualizar_resultados()
+        self.show()
+        self.input_busqueda.setFocus()
+    
+    def actualizar_resultados(self, *args):
+        """Vuelve a buscar con el texto actual"""
+        self.lista_resultados.clear()
+        if not self.indice.cargado:
+            self.lbl_estado.setText("Preparando la búsqueda...")
+            return
+        
+        texto = self.input_busqueda.text()
+        resultados = self.indice.buscar(texto)
+        tipo_anterior = None
+        for tipo, fila in resultados:
+            if tipo != tipo_anterior:
+                encabezado = QListWidgetItem(TITULOS_TIPOS[tipo])
+                encabezado.setFlags(Qt.ItemFlag.NoItemFlags)
+                encabezado.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+                self.lista_resultados.addItem(encabezado)
+                tipo_anterior = tipo
+            
+            item = QListWidgetItem(describir(tipo, fila))
+            item.setData(Qt.ItemDataRole.UserRole, (tipo, fila))
+            self.lista_resultados.addItem(item)
+        
+        if resultados:
+            self.mover_seleccion(1)
+        if not texto.strip():
+            self.lbl_estado.setText("↑↓ para moverse · Enter para abrir · Esc para cerrar")
+        else:
+            self.lbl_estado.setText(f"{len(resultados)} resultado(s)" if resultados else "Sin resultados")
+    
+    def mover_seleccion(self, paso: int):
+        """
+        Mueve la selección al siguiente resultado, salteando los encabezados
+        
+        Args:
+            paso: 1 para bajar, -1 para subir
+        """
+        row = self.lista_resultados.currentRow() + paso
+        while 0 <= row < self.lista_resultados.count():
+            if self.lista_resultados.item(row).data(Qt.ItemDataRole.UserRole) is not None:
+                self.lista_resultados.setCurrentRow(row)
+                return
+            row += paso
+    
+    def keyPressEvent(self, event):
+        """Flechas y Enter actúan sobre la lista aunque el foco esté en el texto"""
+        if event.key() == Qt.Key.Key_Down:
+            self.mover_seleccion(1)
+        elif event.key() == Qt.Key.Key_Up:
+            self.mover_seleccion(-1)
+        elif event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.elegir(self.lista_resultados.currentItem())
+        else:
+            super().keyPressEvent(event)
+    
+    def elegir(self, item):
+        """Cierra la ventana y avisa el resultado elegido"""
+        datos = item.data(Qt.ItemDataRole.UserRole) if item is not None else None
+        if datos is None or not self.isVisible():
+            return
+        self.hide()
+        self.seleccionado.emit(*datos)
@@ -0,0 +1,50 @@
+"""
+Ejecución de tareas en segundo plano
+Permite correr consultas y exportaciones sin bloquear la interfaz
+"""
+
+import inspect
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSignals(QObject):
+    """Señales emitidas por un Worker"""
+    
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progreso = pyqtSignal(int)
+
+
+class Worker(QRunnable):
+    """Ejecuta una función en el pool de hilos de Qt y devuelve su resultado por señal"""
+    
+    def __init__(self, funcion, *args, **kwargs):
+        """
+        Args:
+            funcion: Función a ejecutar en segundo plano
+            *args, **kwargs: Argumentos para la función
+        """
+        super().__init__()
+        self.funcion = funcion
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Ejecuta la función y emite el resultado o el error"""
+        # Las funciones que aceptan 'progreso' informan su avance por señal
+        kwargs = dict(self.kwargs)
+        if 'progreso' in inspect.signature(self.funcion).parameters:
+            kwargs.setdefault('progreso', self.signals.progreso.emit)
+        
+        try:
+            resultado = self.funcion(*self.args, **kwargs)
+        except Exception as e:
+            logger.exception("Error en tarea de segundo plano")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(resultado)
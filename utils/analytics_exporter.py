@@ -0,0 +1,199 @@
+"""
+Exportador para análisis
+Vuelca las tablas principales a archivos columnares (Parquet) o CSV comprimido
+para trabajar en planillas de cálculo o herramientas de BI
+"""
+
+import gzip
+from pathlib import Path
+
+import pandas as pd
+
+from config.settings import EXPORT_CONFIG, EXPORTS_PATH
+from database.database import TABLAS_ANALISIS
+from utils.export_cache import nombre_unico
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_DISPONIBLE = True
+except ImportError:
+    PARQUET_DISPONIBLE = False
+
+# Conversión de tipos por tabla (el resto de las columnas de texto queda como string)
+TIPOS_ANALISIS = {
+    'socios': {
+        'fechas': ('fecha_nacimiento', 'fecha_inscripcion', 'fecha_ultimo_pago',
+                   'fecha_creacion', 'fecha_modificacion'),
+        'enteros': ('dni_normalizado',),
+        'booleanos': ('activo',)
+    },
+    'cuotas': {
+        'fechas': ('fecha_pago', 'fecha_creacion'),
+        'enteros': ('socio_id', 'mes', 'anio'),
+        'montos': ('monto',)
+    },
+    'transacciones': {
+        'fechas': ('fecha', 'fecha_creacion'),
+        'montos': ('monto',)
+    },
+    'sponsors': {
+        'fechas': ('fecha_inicio', 'fecha_vencimiento', 'fecha_creacion', 'fecha_modificacion'),
+        'montos': ('monto_contrato',)
+    }
+}
+
+
+def convertir_tipos(df: pd.DataFrame, tabla: str, hoy: pd.Timestamp | None = None) -> pd.DataFrame:
+    """
+    Convierte las columnas de un lote a tipos de análisis y agrega columnas derivadas
+    
+    Todas las operaciones son vectorizadas sobre columnas completas.
+    
+    Args:
+        df: Lote leído de la tabla
+        tabla: Nombre de la tabla
+        hoy: Fecha de referencia para edades y vencimientos (por defecto, hoy)
+    
+    Returns:
+        El mismo DataFrame con los tipos convertidos
+    """
+    tipos = TIPOS_ANALISIS.get(tabla, {})
+    hoy = hoy if hoy is not None else pd.Timestamp.today().normalize()
+    
+    for columna in tipos.get('fechas', ()):
+        df[columna] = pd.to_datetime(df[columna], format='ISO8601', errors='coerce')
+    for columna in tipos.get('enteros', ()):
+        df[columna] = pd.to_numeric(df[columna], errors='coerce').astype('Int64')
+    for columna in tipos.get('montos', ()):
+        df[columna] = pd.to_numeric(df[columna], errors='coerce').astype('float64')
+    for columna in tipos.get('booleanos', ()):
+        df[columna] = pd.to_numeric(df[columna], errors='coerce').astype('boolean')
+    
+    # Texto con tipo explícito para que todos los lotes tengan el mismo esquema
+    # (object en pandas 2, str en pandas 3)
+    texto = [columna for columna, tipo in df.dtypes.items() if pd.api.types.is_string_dtype(tipo)]
+    df[texto] = df[texto].astype('string')
+    
+    if tabla == 'socios':
+        df['edad'] = ((hoy - df['fecha_nacimiento']).dt.days // 365.25).astype('Int64')
+    elif tabla == 'cuotas':
+        df['periodo'] = pd.to_datetime(
+            pd.DataFrame({'year': df['anio'], 'month': df['mes'], 'day': 1}), errors='coerce'
+        )
+    elif tabla == 'transacciones':
+        df['periodo'] = df['fecha'].dt.to_period('M').dt.to_timestamp()
+        df['monto_neto'] = df['monto'].where(df['tipo'] == 'ingreso', -df['monto'])
+    elif tabla == 'sponsors':
+        df['dias_restantes'] = (df['fecha_vencimiento'] - hoy).dt.days.astype('Int64')
+    
+    return df
+
+
+class AnalyticsExporter:
+    """Clase para exportar instantáneas de datos para análisis"""
+    
+    def __init__(self):
+        self.exports_path = EXPORTS_PATH
+        self.tamanio_lote = EXPORT_CONFIG['lote_analisis']
+    
+    def formato_por_defecto(self) -> str:
+        """Parquet si pyarrow está instalado, CSV comprimido si no"""
+        return 'parquet' if PARQUET_DISPONIBLE else 'csv'
+    
+    def exportar(self, db_manager, tablas: tuple[str, ...] = TABLAS_ANALISIS,
+                 formato: str | None = None, progreso=None) -> str:
+        """
+        Exporta las tablas a una carpeta nueva, un archivo por tabla
+        
+        Args:
+            db_manager: Gestor de base de datos
+            tablas: Tablas a exportar
+            formato: 'parquet' o 'csv' (por defecto, según formato_por_defecto)
+            progreso: Función opcional que recibe la cantidad de filas escritas
+        
+        Returns:
+            Nombre de la carpeta generada
+        """
+        formato = formato or self.formato_por_defecto()
+        if formato == 'parquet' and not PARQUET_DISPONIBLE:
+            raise ValueError("La exportación a Parquet requiere el paquete pyarrow")
+        if formato not in ('parquet', 'csv'):
+            raise ValueError(f"Formato no soportado: {formato}")
+        
+        carpeta = self.exports_path / nombre_unico('analisis')
+        carpeta.mkdir(parents=True, exist_ok=True)
+        
+        cantidad = 0
+        for tabla in tablas:
+            lotes = db_manager.leer_tabla_por_lotes(tabla, self.tamanio_lote)
+            if formato == 'parquet':
+                escritos = self.escribir_parquet(lotes, tabla, carpeta / f"{tabla}.parquet", cantidad, progreso)
+            else:
+                escritos = self.escribir_csv(lotes, tabla, carpeta / f"{tabla}.csv.gz", cantidad, progreso)
+            cantidad += escritos
+        
+        return carpeta.name
+    
+    def escribir_csv(self, lotes, tabla: str, ruta: Path, previas: int = 0, progreso=None) -> int:
+        """
+        Escribe los lotes de una tabla en un único CSV comprimido con gzip
+        
+        Args:
+            lotes: DataFrames leídos de la tabla
+            tabla: Nombre de la tabla
+            ruta: Archivo de destino
+            previas: Filas ya escritas de tablas anteriores (para el progreso)
+            progreso: Función opcional que recibe la cantidad de filas escritas
+        
+        Returns:
+            Cantidad de filas escritas
+        """
+        hoy = pd.Timestamp.today().normalize()
+        cantidad = 0
+        
+        with gzip.open(ruta, 'wt', encoding='utf-8', newline='', compresslevel=6) as archivo:
+            for numero, lote in enumerate(lotes):
+                convertir_tipos(lote, tabla, hoy).to_csv(archivo, index=False, header=numero == 0)
+                cantidad += len(lote)
+                if progreso:
+                    progreso(previas + cantidad)
+        
+        return cantidad
+    
+    def escribir_parquet(self, lotes, tabla: str, ruta: Path, previas: int = 0, progreso=None) -> int:
+        """
+        Escribe los lotes de una tabla en un archivo Parquet (un grupo de filas por lote)
+        
+        Args:
+            lotes: DataFrames leídos de la tabla
+            tabla: Nombre de la tabla
+            ruta: Archivo de destino
+            previas: Filas ya escritas de tablas anteriores (para el progreso)
+            progreso: Función opcional que recibe la cantidad de filas escritas
+        
+        Returns:
+            Cantidad de filas escritas
+        """
+        hoy = pd.Timestamp.today().normalize()
+        cantidad = 0
+        escritor = None
+        
+        try:
+            for lote in lotes:
+                datos = pa.Table.from_pandas(
+                    convertir_tipos(lote, tabla, hoy),
+                    schema=escritor.schema if escritor else None,
+                    preserve_index=False
+                )
+                if escritor is None:
+                    escritor = pq.ParquetWriter(ruta, datos.schema, compression='zstd')
+                escritor.write_table(datos)
+                cantidad += len(lote)
+                if progreso:
+                    progreso(previas + cantidad)
+        finally:
+            if escritor is not None:
+                escritor.close()
+        
+        return cantidad
@@ -0,0 +1,426 @@
+"""
+Buscadores en memoria
+Índice por trigramas de socios, sin distinguir acentos ni mayúsculas y
+tolerante a errores de tipeo ("Gomes" encuentra a "Gómez"), e índice por
+prefijos de socios, sponsors y transacciones para la búsqueda global
+"""
+
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from functools import cache
+
+from utils.validators import PATRON_SEPARADORES_DNI, normalizar_dni
+
+# Puntaje mínimo de cada palabra buscada para considerar que coincide
+UMBRAL = 0.5
+
+# Peso de una coincidencia aproximada frente a una por prefijo
+PESO_APROXIMADO = 0.85
+
+PATRON_NO_ALFANUMERICO = re.compile(r'[^a-z0-9]+')
+
+# Tablas de la búsqueda global, en el orden en que se muestran los resultados
+TIPOS_BUSQUEDA = ('socios', 'sponsors', 'transacciones')
+
+# Mayor que cualquier carácter de una palabra plegada: cierra el rango de un prefijo
+FIN_PREFIJO = '\x7f'
+
+
+def plegar(texto) -> str:
+    """
+    Pasa un texto a minúsculas, sin acentos ni signos
+    
+    Args:
+        texto: Texto a normalizar ("Ibáñez, José" -> "ibanez jose")
+    
+    Returns:
+        Palabras separadas por un espacio
+    """
+    texto = unicodedata.normalize('NFKD', str(texto or '')).encode('ascii', 'ignore').decode('ascii')
+    return PATRON_NO_ALFANUMERICO.sub(' ', texto.lower()).strip()
+
+
+@cache
+def trigramas(palabra: str) -> frozenset[str]:
+    """
+    Trigramas de una palabra, con dos espacios al inicio y uno al final
+    
+    Los espacios hacen que las primeras letras pesen más, así lo que se
+    tipea primero (el comienzo del apellido) decide la coincidencia. Los
+    nombres y apellidos se repiten mucho, por eso se guardan ya calculados.
+    """
+    relleno = f"  {palabra} "
+    return frozenset(relleno[i:i + 3] for i in range(len(relleno) - 2))
+
+
+class IndiceSocios:
+    """Índice de búsqueda aproximada de socios por apellido, nombre y DNI"""
+    
+    def __init__(self, socios: Iterable[dict] = ()):
+        """
+        Inicializa el índice
+        
+        Args:
+            socios: Socios a indexar (se indexan recién en la primera búsqueda)
+        """
+        self.socios = {}     # id -> socio
+        self.palabras = {}   # id -> [(palabra, trigramas)]
+        self.dnis = {}       # id -> DNI solo con dígitos
+        self.indice = None   # trigrama -> ids; None hasta la primera búsqueda
+        self.construir(socios)
+    
+    def __len__(self) -> int:
+        return len(self.socios)
+    
+    def construir(self, socios: Iterable[dict]):
+        """Reemplaza el contenido del índice"""
+        self.socios = {socio['id']: socio for socio in socios}
+        self.palabras = {}
+        self.dnis = {}
+        self.indice = None
+    
+    def preparar(self):
+        """Arma el índice de trigramas si todavía no se armó"""
+        if self.indice is not None:
+            return
+        self.indice = defaultdict(set)
+        for socio in self.socios.values():
+            self.indexar(socio)
+    
+    def indexar(self, socio: dict):
+        """Agrega las palabras y el DNI de un socio al índice de trigramas"""
+        palabras = [
+            (palabra, trigramas(palabra))
+            for palabra in plegar(f"{socio['apellido']} {socio['nombre']}").split()
+        ]
+        self.palabras[socio['id']] = palabras
+        self.dnis[socio['id']] = PATRON_SEPARADORES_DNI.sub('', str(socio.get('dni') or ''))
+        for trigrama in frozenset().union(*(t for _, t in palabras)):
+            self.indice[trigrama].add(socio['id'])
+    
+    def agregar(self, socio: dict):
+        """Agrega un socio o actualiza sus datos"""
+        self.quitar(socio['id'])
+        self.socios[socio['id']] = socio
+        if self.indice is not None:
+            self.indexar(socio)
+    
+    def quitar(self, socio_id: int):
+        """Quita un socio del índice (si está)"""
+        if self.socios.pop(socio_id, None) is None or self.indice is None:
+            return
+        for trigrama in frozenset().union(*(t for _, t in self.palabras.pop(socio_id, []))):
+            ids = self.indice.get(trigrama)
+            if ids is not None:
+                ids.discard(socio_id)
+                if not ids:
+                    del self.indice[trigrama]
+        self.dnis.pop(socio_id, None)
+    
+    # ==================== BÚSQUEDA ====================
+    
+    @staticmethod
+    def separar_consulta(consulta: str) -> tuple[list[tuple[str, frozenset[str]]], list[str]]:
+        """
+        Divide la consulta en palabras a buscar en el nombre y números de DNI
+        
+        Returns:
+            Tupla ([(palabra, trigramas)], [dígitos de DNI])
+        """
+        dni = normalizar_dni(consulta)
+        if dni is not None:
+            return [], [PATRON_SEPARADORES_DNI.sub('', consulta)]
+        palabras, numeros = [], []
+        for palabra in plegar(consulta).split():
+            if palabra.isdigit():
+                numeros.append(palabra)
+            else:
+                palabras.append((palabra, trigramas(palabra)))
+        return palabras, numeros
+    
+    @staticmethod
+    def puntaje_palabra(buscada: str, trigramas_buscada: frozenset[str],
+                        palabras: list[tuple[str, frozenset[str]]]) -> float:
+        """
+        Mejor coincidencia de una palabra buscada con las palabras del socio
+        
+        Una palabra que empieza con lo buscado puntúa entre 0.9 y 1 (1 si es
+        igual); si no, cuenta la proporción de trigramas compartidos.
+        """
+        mejor = 0.0
+        for palabra, trigramas_palabra in palabras:
+            if palabra.startswith(buscada):
+                return max(mejor, 0.9 + 0.1 * len(buscada) / len(palabra))
+            compartidos = len(trigramas_buscada & trigramas_palabra)
+            mejor = max(mejor, PESO_APROXIMADO * compartidos / len(trigramas_buscada))
+        return mejor
+    
+    def puntuar(self, socio_id: int, palabras: list[tuple[str, frozenset[str]]], numeros: list[str]) -> float:
+        """
+        Puntaje de un socio para una consulta ya separada
+        
+        Returns:
+            Promedio de los puntajes de cada palabra, o 0 si alguna no coincide
+        """
+        dni = self.dnis.get(socio_id, '')
+        if any(numero not in dni for numero in numeros):
+            return 0.0
+        if not palabras:
+            # Búsqueda solo por DNI: primero los que empiezan con los dígitos
+            return 1.0 if all(dni.startswith(numero) for numero in numeros) else 0.9
+        
+        total = 0.0
+        for buscada, trigramas_buscada in palabras:
+            puntaje = self.puntaje_palabra(buscada, trigramas_buscada, self.palabras.get(socio_id, []))
+            if puntaje < UMBRAL:
+                return 0.0
+            total += puntaje
+        return total / len(palabras)
+    
+    def candidatos(self, palabras: list[tuple[str, frozenset[str]]], numeros: list[str]) -> Iterable[int]:
+        """
+        Socios cuyo DNI contiene cada número buscado y que comparten
+        suficientes trigramas con cada palabra buscada
+        
+        Es una cota: solo estos pueden llegar al umbral, el puntaje final
+        se calcula después sobre ellos.
+        """
+        resultado = None
+        for numero in numeros:
+            ids = {socio_id for socio_id, dni in self.dnis.items() if numero in dni}
+            resultado = ids if resultado is None else resultado & ids
+        
+        for _, trigramas_buscada in palabras:
+            if resultado is not None and not resultado:
+                break
+            minimo = math.ceil(len(trigramas_buscada) * UMBRAL / PESO_APROXIMADO) - 1
+            apariciones = Counter()
+            for trigrama in trigramas_buscada:
+                apariciones.update(self.indice.get(trigrama, ()))
+            ids = {socio_id for socio_id, cantidad in apariciones.items() if cantidad >= minimo}
+            resultado = ids if resultado is None else resultado & ids
+        return resultado or ()
+    
+    def buscar(self, consulta: str, limite: int | None = 50) -> list[tuple[dict, float]]:
+        """
+        Busca socios por apellido, nombre o DNI
+        
+        Args:
+            consulta: Texto tipeado ("gomez", "ibanez maria", "30.123", ...)
+            limite: Cantidad máxima de resultados (None para todos)
+        
+        Returns:
+            Lista de (socio, puntaje) ordenada de mejor a peor coincidencia
+        """
+        palabras, numeros = self.separar_consulta(consulta)
+        if not palabras and not numeros:
+            return []
+        
+        self.preparar()
+        resultados = []
+        for socio_id in self.candidatos(palabras, numeros):
+            puntaje = self.puntuar(socio_id, palabras, numeros)
+            if puntaje > 0:
+                resultados.append((self.socios[socio_id], puntaje))
+        
+        resultados.sort(key=lambda r: (-r[1], r[0]['apellido'], r[0]['nombre']))
+        return resultados if limite is None else resultados[:limite]
+    
+    def coincide(self, socio_id: int, consulta: str) -> bool:
+        """Indica si un socio aparece en los resultados de la consulta"""
+        palabras, numeros = self.separar_consulta(consulta)
+        if not palabras and not numeros:
+            return True
+        self.preparar()
+        return self.puntuar(socio_id, palabras, numeros) > 0
+
+
+def palabras_busqueda(tipo: str, fila: dict) -> tuple[str, ...]:
+    """
+    Palabras por las que se encuentra una fila en la búsqueda global
+    
+    Args:
+        tipo: Tabla de la fila (ver TIPOS_BUSQUEDA)
+        fila: Columnas de database.CONSULTAS_BUSQUEDA
+    
+    Returns:
+        Palabras plegadas, sin repetir
+    """
+    if tipo == 'socios':
+        texto = f"{fila['apellido']} {fila['nombre']}"
+        extras = [PATRON_SEPARADORES_DNI.sub('', str(fila['dni'] or ''))]
+    elif tipo == 'sponsors':
+        texto = f"{fila['nombre_empresa']} {fila['nombre_contacto'] or ''}"
+        extras = []
+    else:
+        # El comprobante también se encuentra escrito de corrido ("A-0001" o "a0001")
+        comprobante = plegar(fila['comprobante'])
+        texto = f"{fila['descripcion']} {comprobante}"
+        extras = [comprobante.replace(' ', '')]
+    return tuple({palabra for palabra in plegar(texto).split() + extras if palabra})
+
+
+class IndiceGlobal:
+    """
+    Índice por prefijos de socios, sponsors y transacciones
+    
+    Las palabras se guardan en una lista ordenada por tabla y palabra: las de
+    una tabla que empiezan con lo tipeado quedan contiguas y se encuentran por
+    bisección. Las escrituras en la base solo se anotan (pueden llegar desde
+    otro hilo) y se aplican antes de la siguiente búsqueda, consultando
+    únicamente las filas que cambiaron.
+    """
+    
+    def __init__(self, db_manager):
+        """
+        Inicializa el índice vacío y se registra como observador de la base
+        
+        Args:
+            db_manager: Gestor de base de datos
+        """
+        self.db_manager = db_manager
+        self.claves = []        # [(tipo, palabra, id)] ordenada
+        self.entradas = {}      # (tipo, id) -> (fila, palabras)
+        self.cargado = False
+        self.pendientes = set()  # (tipo, id) modificados; (tipo, None) para releer la tabla
+        self.lock = threading.Lock()
+        db_manager.observar(self.notificar)
+    
+    def __len__(self) -> int:
+        return len(self.entradas)
+    
+    def notificar(self, tabla: str, fila_id: int | None = None):
+        """Anota una escritura en la base (ver DatabaseManager.observar)"""
+        if tabla in TIPOS_BUSQUEDA:
+            with self.lock:
+                self.pendientes.add((tabla, fila_id))
+    
+    # ==================== CARGA ====================
+    
+    def leer(self) -> tuple[list[tuple[str, str, int]], dict]:
+        """
+        Lee las tres tablas y arma el índice sin instalarlo
+        
+        Se puede llamar desde un hilo de fondo; el resultado se pasa a instalar()
+        
+        Returns:
+            Tupla (claves, entradas)
+        """
+        claves, entradas = [], {}
+        for tipo in TIPOS_BUSQUEDA:
+            for fila in self.db_manager.obtener_textos_busqueda(tipo):
+                palabras = palabras_busqueda(tipo, fila)
+                entradas[(tipo, fila['id'])] = (fila, palabras)
+                claves.extend((tipo, palabra, fila['id']) for palabra in palabras)
+        claves.sort()
+        return claves, entradas
+    
+    def instalar(self, leido: tuple[list[tuple[str, str, int]], dict]):
+        """Reemplaza el contenido del índice por el resultado de leer()"""
+        self.claves, self.entradas = leido
+        self.cargado = True
+    
+    def actualizar(self):
+        """Aplica las escrituras anotadas desde la última búsqueda"""
+        if not self.cargado:
+            return
+        with self.lock:
+            pendientes, self.pendientes = self.pendientes, set()
+        if not pendientes:
+            return
+        
+        tablas = {tipo for tipo, fila_id in pendientes if fila_id is None}
+        for tipo in tablas:
+            self.releer_tabla(tipo)
+        
+        ids_por_tipo = defaultdict(set)
+        for tipo, fila_id in pendientes:
+            if tipo not in tablas:
+                ids_por_tipo[tipo].add(fila_id)
+        for tipo, ids in ids_por_tipo.items():
+            for fila_id in ids:
+                self.quitar(tipo, fila_id)
+            for fila in self.db_manager.obtener_textos_busqueda(tipo, ids):
+                self.agregar(tipo, fila)
+    
+    def releer_tabla(self, tipo: str):
+        """Vuelve a indexar una tabla completa (después de una importación)"""
+        filas = self.db_manager.obtener_textos_busqueda(tipo)
+        self.claves = [clave for clave in self.claves if clave[0] != tipo]
+        self.entradas = {clave: entrada for clave, entrada in self.entradas.items() if clave[0] != tipo}
+        for fila in filas:
+            palabras = palabras_busqueda(tipo, fila)
+            self.entradas[(tipo, fila['id'])] = (fila, palabras)
+            self.claves.extend((tipo, palabra, fila['id']) for palabra in palabras)
+        self.claves.sort()
+    
+    def agregar(self, tipo: str, fila: dict):
+        """Indexa una fila nueva"""
+        palabras = palabras_busqueda(tipo, fila)
+        self.entradas[(tipo, fila['id'])] = (fila, palabras)
+        for palabra in palabras:
+            insort(self.claves, (tipo, palabra, fila['id']))
+    
+    def quitar(self, tipo: str, fila_id: int):
+        """Quita una fila del índice (si está)"""
+        entrada = self.entradas.pop((tipo, fila_id), None)
+        if entrada is None:
+            return
+        for palabra in entrada[1]:
+            clave = (tipo, palabra, fila_id)
+            posicion = bisect_left(self.claves, clave)
+            if posicion < len(self.claves) and self.claves[posicion] == clave:
+                del self.claves[posicion]
+    
+    # ==================== BÚSQUEDA ====================
+    
+    def rango(self, tipo: str, prefijo: str) -> tuple[int, int]:
+        """Posiciones [desde, hasta) de las palabras de una tabla que empiezan con el prefijo"""
+        return (bisect_left(self.claves, (tipo, prefijo)),
+                bisect_left(self.claves, (tipo, prefijo + FIN_PREFIJO)))
+    
+    def buscar(self, consulta: str, limite: int = 8) -> list[tuple[str, dict]]:
+        """
+        Busca filas que tengan, por cada palabra consultada, una palabra que
+        empiece con ella
+        
+        Args:
+            consulta: Texto tipeado ("gomez", "30123", "sponsor agua", "a-0001", ...)
+            limite: Cantidad máxima de resultados por tabla
+        
+        Returns:
+            Lista de (tipo, fila) agrupada por tabla en el orden de TIPOS_BUSQUEDA;
+            dentro de cada tabla primero las palabras completas y más cortas
+        """
+        self.actualizar()
+        prefijos = list(dict.fromkeys(plegar(consulta).split()))
+        if not prefijos:
+            return []
+        
+        resultados = []
+        for tipo in TIPOS_BUSQUEDA:
+            # Se recorre el rango de la palabra más selectiva; las demás se verifican por fila
+            rangos = [(self.rango(tipo, prefijo), prefijo) for prefijo in prefijos]
+            (desde, hasta), elegido = min(rangos, key=lambda r: r[0][1] - r[0][0])
+            resto = [prefijo for prefijo in prefijos if prefijo != elegido]
+            
+            encontrados = 0
+            vistos = set()
+            for posicion in range(desde, hasta):
+                fila_id = self.claves[posicion][2]
+                if fila_id in vistos:
+                    continue
+                vistos.add(fila_id)
+                
+                fila, palabras = self.entradas[(tipo, fila_id)]
+                if all(any(palabra.startswith(prefijo) for palabra in palabras) for prefijo in resto):
+                    resultados.append((tipo, fila))
+                    encontrados += 1
+                    if encontrados == limite:
+                        break
+        return resultados
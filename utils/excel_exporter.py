@@ -4,11 +4,51 @@ Exporta transacciones y reportes financieros
 """
 
 import openpyxl
-from openpyxl. styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from datetime import datetime
-from pathlib import Path
+from collections.abc import Iterable
 
-from config.settings import CLUB_INFO, EXPORTS_PATH
+from config.settings import CLUB_INFO, EXPORTS_PATH, MESES
+from utils.export_cache import nombre_unico
+from utils.formatters import fecha_a_texto
+
+FORMATO_MONTO = '"$"#,##0.00'
+
+# Caracteres que Excel no admite en el nombre de una hoja
+CARACTERES_INVALIDOS_HOJA = str.maketrans({c: '-' for c in '[]:*?/\\'})
+
+
+def crear_estilos() -> list:
+    """
+    Crea los estilos con nombre usados en todas las exportaciones
+    
+    Returns:
+        Lista de NamedStyle
+    """
+    borde = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    return [
+        NamedStyle(name='titulo', font=Font(bold=True, size=14), alignment=Alignment(horizontal='center')),
+        NamedStyle(name='subtitulo', alignment=Alignment(horizontal='center')),
+        NamedStyle(
+            name='encabezado',
+            font=Font(bold=True, color="FFFFFF", size=12),
+            fill=PatternFill(start_color="1D71B8", end_color="1D71B8", fill_type="solid"),
+            alignment=Alignment(horizontal='center'),
+            border=borde
+        ),
+        NamedStyle(name='dato', border=borde),
+        NamedStyle(name='dato_alerta', font=Font(bold=True, color="DC3545"), border=borde),
+        NamedStyle(name='dato_monto', border=borde, number_format=FORMATO_MONTO),
+        NamedStyle(name='total', font=Font(bold=True)),
+        NamedStyle(name='total_monto', font=Font(bold=True), number_format=FORMATO_MONTO)
+    ]
 
 
 class ExcelExporter:
@@ -17,216 +57,333 @@ class ExcelExporter:
     def __init__(self):
         self.exports_path = EXPORTS_PATH
     
-    def exportar_transacciones(self, transacciones: list, fecha_desde: str, fecha_hasta: str) -> str:
+    def crear_libro(self) -> openpyxl.Workbook:
+        """
+        Crea un libro en modo de solo escritura (las filas se vuelcan a disco al agregarlas)
+        
+        Returns:
+            Workbook con los estilos registrados
+        """
+        wb = openpyxl.Workbook(write_only=True)
+        for estilo in crear_estilos():
+            wb.add_named_style(estilo)
+        return wb
+    
+    def fila(self, ws, valores: list, estilos) -> list:
         """
-        Exporta transacciones a Excel
+        Arma una fila de celdas con estilo
         
         Args:
-            transacciones: Lista de transacciones
+            ws: Hoja de solo escritura
+            valores: Valores de la fila
+            estilos: Nombre de estilo para todas las celdas o lista con uno por celda
+        
+        Returns:
+            Lista de WriteOnlyCell
+        """
+        if isinstance(estilos, str):
+            estilos = [estilos] * len(valores)
+        
+        celdas = []
+        for valor, estilo in zip(valores, estilos, strict=True):
+            celda = WriteOnlyCell(ws, value=valor)
+            if estilo:
+                celda.style = estilo
+            celdas.append(celda)
+        return celdas
+    
+    def encabezado(self, ws, titulo: str, subtitulo: str, headers: list, anchos: list):
+        """
+        Escribe título, subtítulo y encabezados de columna de una hoja
+        
+        Args:
+            ws: Hoja de solo escritura
+            titulo: Texto de la primera fila
+            subtitulo: Texto de la segunda fila
+            headers: Nombres de las columnas
+            anchos: Ancho de cada columna
+        """
+        ultima_columna = openpyxl.utils.get_column_letter(len(headers))
+        
+        for i, ancho in enumerate(anchos, start=1):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = ancho
+        
+        ws.merged_cells.add(f'A1:{ultima_columna}1')
+        ws.merged_cells.add(f'A2:{ultima_columna}2')
+        
+        ws.append(self.fila(ws, [titulo], 'titulo'))
+        ws.append(self.fila(ws, [subtitulo], 'subtitulo'))
+        ws.append([])  # Fila vacía
+        ws.append(self.fila(ws, headers, 'encabezado'))
+    
+    def exportar_transacciones(self, transacciones: Iterable[dict], fecha_desde: str, fecha_hasta: str,
+                               progreso=None) -> str:
+        """
+        Exporta transacciones a Excel en modo streaming
+        
+        Args:
+            transacciones: Lista o generador de transacciones
             fecha_desde: Fecha inicio del período
             fecha_hasta:  Fecha fin del período
+            progreso: Función opcional que recibe la cantidad de filas escritas
         
         Returns:
             Nombre del archivo generado
         """
-        # Crear workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Transacciones"
-        
-        # Estilos
-        header_fill = PatternFill(start_color="1D71B8", end_color="1D71B8", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        wb = self.crear_libro()
+        ws = wb.create_sheet("Transacciones")
+        
+        self.encabezado(
+            ws,
+            f"{CLUB_INFO['nombre']} - Reporte de Transacciones",
+            f"Período:  {fecha_a_texto(fecha_desde)} - {fecha_a_texto(fecha_hasta)}",
+            ["Fecha", "Tipo", "Categoría", "Descripción", "Monto", "Método", "Comprobante", "Responsable"],
+            [12, 10, 20, 40, 15, 15, 15, 20]
         )
         
-        # Título
-        ws. merge_cells('A1:H1')
-        ws['A1'] = f"{CLUB_INFO['nombre']} - Reporte de Transacciones"
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A1'].alignment = Alignment(horizontal='center')
-        
-        # Período
-        ws.merge_cells('A2:H2')
-        fecha_desde_fmt = datetime.strptime(fecha_desde, '%Y-%m-%d').strftime('%d/%m/%Y')
-        fecha_hasta_fmt = datetime.strptime(fecha_hasta, '%Y-%m-%d').strftime('%d/%m/%Y')
-        ws['A2'] = f"Período:  {fecha_desde_fmt} - {fecha_hasta_fmt}"
-        ws['A2'].alignment = Alignment(horizontal='center')
-        
-        # Encabezados
-        headers = ["Fecha", "Tipo", "Categoría", "Descripción", "Monto", "Método", "Comprobante", "Responsable"]
-        ws.append([])  # Fila vacía
-        ws.append(headers)
-        
-        header_row = ws[4]
-        for cell in header_row:
-            cell.fill = header_fill
-            cell. font = header_font
-            cell.alignment = Alignment(horizontal='center')
-            cell.border = border
-        
-        # Datos
-        total_ingresos = 0
-        total_egresos = 0
-        
-        for trans in transacciones:
-            fecha = datetime.strptime(trans['fecha'], '%Y-%m-%d').strftime('%d/%m/%Y')
-            ws.append([
-                fecha,
-                trans['tipo']. capitalize(),
+        # Datos: cada fila se escribe una sola vez, ya con su formato
+        estilos_dato = ['dato', 'dato', 'dato', 'dato', 'dato_monto', 'dato', 'dato', 'dato']
+        totales = {'ingreso': 0, 'egreso': 0}
+        
+        for cantidad, trans in enumerate(transacciones, start=1):
+            ws.append(self.fila(ws, [
+                trans.get('fecha_texto') or fecha_a_texto(trans['fecha']),
+                trans['tipo'].capitalize(),
                 trans['categoria'],
                 trans['descripcion'],
                 trans['monto'],
-                trans. get('metodo_pago', '-') or '-',
+                trans.get('metodo_pago', '-') or '-',
                 trans.get('comprobante', '-') or '-',
                 trans.get('responsable', '-') or '-'
-            ])
+            ], estilos_dato))
             
-            if trans['tipo'] == 'ingreso':
-                total_ingresos += trans['monto']
-            else:
-                total_egresos += trans['monto']
+            totales[trans['tipo']] += trans['monto']
             
-            # Aplicar bordes
-            for cell in ws[ws.max_row]:
-                cell.border = border
+            if progreso and cantidad % 1000 == 0:
+                progreso(cantidad)
         
         # Totales
+        estilos_total = [None, None, None, 'total', 'total_monto']
         ws.append([])
-        ws.append(["", "", "", "TOTAL INGRESOS:", total_ingresos, "", "", ""])
-        ws.append(["", "", "", "TOTAL EGRESOS:", total_egresos, "", "", ""])
-        ws.append(["", "", "", "BALANCE:", total_ingresos - total_egresos, "", "", ""])
-        
-        # Formatear totales
-        for row in range(ws.max_row - 2, ws.max_row + 1):
-            ws[f'D{row}']. font = Font(bold=True)
-            ws[f'E{row}'].font = Font(bold=True)
-            ws[f'E{row}'].number_format = '"$"#,##0.00'
-        
-        # Formato de montos
-        for row in range(5, ws.max_row - 3):
-            ws[f'E{row}'].number_format = '"$"#,##0.00'
-        
-        # Ajustar anchos de columna
-        ws. column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 10
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 40
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F']. width = 15
-        ws. column_dimensions['G'].width = 15
-        ws.column_dimensions['H'].width = 20
+        ws.append(self.fila(ws, ["", "", "", "TOTAL INGRESOS:", totales['ingreso']], estilos_total))
+        ws.append(self.fila(ws, ["", "", "", "TOTAL EGRESOS:", totales['egreso']], estilos_total))
+        ws.append(self.fila(ws, ["", "", "", "BALANCE:", totales['ingreso'] - totales['egreso']], estilos_total))
         
         # Guardar archivo
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"transacciones_{timestamp}.xlsx"
+        filename = nombre_unico('transacciones', '.xlsx')
         filepath = self.exports_path / filename
         
         wb.save(str(filepath))
         return filename
     
-    def exportar_socios(self, socios: list) -> str:
+    def exportar_socios(self, socios: Iterable[dict], progreso=None) -> str:
         """
-        Exporta lista de socios a Excel
+        Exporta lista de socios a Excel en modo streaming
         
         Args:
-            socios:  Lista de socios
+            socios:  Lista o generador de socios
+            progreso: Función opcional que recibe la cantidad de filas escritas
         
         Returns:
             Nombre del archivo generado
         """
-        wb = openpyxl. Workbook()
-        ws = wb.active
-        ws.title = "Socios"
-        
-        # Estilos
-        header_fill = PatternFill(start_color="1D71B8", end_color="1D71B8", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        wb = self.crear_libro()
+        ws = wb.create_sheet("Socios")
+        
+        self.encabezado(
+            ws,
+            f"{CLUB_INFO['nombre']} - Lista de Socios",
+            f"Generado el: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+            ["DNI", "Apellido", "Nombre", "Categoría", "Teléfono", "Email", "Estado Pago", "Último Pago",
+             "Fecha Inscripción"],
+            [12, 20, 20, 15, 15, 25, 15, 15, 18]
         )
         
-        # Título
-        ws.merge_cells('A1:I1')
-        ws['A1'] = f"{CLUB_INFO['nombre']} - Lista de Socios"
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A1'].alignment = Alignment(horizontal='center')
+        for cantidad, socio in enumerate(socios, start=1):
+            ws.append(self.fila(ws, [
+                socio['dni'],
+                socio['apellido'],
+                socio['nombre'],
+                socio['categoria'],
+                socio.get('telefono', '-') or '-',
+                socio.get('email', '-') or '-',
+                socio['estado_pago'].upper(),
+                socio.get('fecha_ultimo_pago_texto') or fecha_a_texto(socio.get('fecha_ultimo_pago')),
+                socio.get('fecha_inscripcion_texto') or fecha_a_texto(socio.get('fecha_inscripcion'))
+            ], 'dato'))
+            
+            if progreso and cantidad % 1000 == 0:
+                progreso(cantidad)
         
-        # Fecha de generación
-        ws.merge_cells('A2:I2')
-        ws['A2'] = f"Generado el: {datetime.now().strftime('%d/%m/%Y %H:%M')}"
-        ws['A2']. alignment = Alignment(horizontal='center')
+        # Guardar
+        filename = nombre_unico('socios', '.xlsx')
+        filepath = self.exports_path / filename
         
-        # Encabezados
-        headers = ["DNI", "Apellido", "Nombre", "Categoría", "Teléfono", "Email", "Estado Pago", "Último Pago", "Fecha Inscripción"]
-        ws.append([])
-        ws.append(headers)
-        
-        header_row = ws[4]
-        for cell in header_row: 
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
-            cell.border = border
-        
-        # Datos
-        for socio in socios:
-            ultimo_pago = socio. get('fecha_ultimo_pago', '')
-            if ultimo_pago:
-                try:
-                    ultimo_pago = datetime.strptime(ultimo_pago, '%Y-%m-%d').strftime('%d/%m/%Y')
-                except: 
-                    ultimo_pago = '-'
-            else:
-                ultimo_pago = '-'
-            
-            fecha_insc = socio.get('fecha_inscripcion', '')
-            if fecha_insc:
-                try:
-                    fecha_insc = datetime.strptime(fecha_insc, '%Y-%m-%d').strftime('%d/%m/%Y')
-                except:
-                    fecha_insc = '-'
-            else: 
-                fecha_insc = '-'
+        wb.save(str(filepath))
+        return filename
+    
+    def exportar_plantel(self, socios: Iterable[dict], periodo: str, progreso=None) -> str:
+        """
+        Exporta el plantel con una hoja por categoría, en modo streaming
+        
+        Los socios deben venir ordenados por categoría: cada vez que cambia la
+        categoría se cierra la hoja actual con su resumen y se abre otra.
+        
+        Args:
+            socios: Lista o generador de socios con 'meses_adeudados'
+            periodo: Mes de referencia de la deuda (texto para el subtítulo)
+            progreso: Función opcional que recibe la cantidad de filas escritas
+        
+        Returns:
+            Nombre del archivo generado
+        """
+        wb = self.crear_libro()
+        headers = ["Apellido", "Nombre", "DNI", "Fecha Nac.", "Teléfono", "Email",
+                   "Estado Pago", "Último Pago", "Meses Adeudados"]
+        anchos = [20, 20, 12, 12, 15, 25, 14, 14, 16]
+        estilos_al_dia = ['dato'] * len(headers)
+        estilos_deuda = ['dato'] * (len(headers) - 1) + ['dato_alerta']
+        
+        ws = None
+        categoria_actual = None
+        resumen = None
+        
+        def cerrar_hoja():
+            ws.append([])
+            ws.append(self.fila(ws, ["Socios:", resumen['socios']], 'total'))
+            ws.append(self.fila(ws, ["Al día:", resumen['socios'] - resumen['con_deuda']], 'total'))
+            ws.append(self.fila(ws, ["Con deuda:", resumen['con_deuda']], 'total'))
+        
+        cantidad = 0
+        for cantidad, socio in enumerate(socios, start=1):
+            if ws is None or socio['categoria'] != categoria_actual:
+                if ws is not None:
+                    cerrar_hoja()
+                categoria_actual = socio['categoria']
+                resumen = {'socios': 0, 'con_deuda': 0}
+                ws = wb.create_sheet(str(categoria_actual).translate(CARACTERES_INVALIDOS_HOJA)[:31] or "Sin categoría")
+                self.encabezado(
+                    ws,
+                    f"{CLUB_INFO['nombre']} - Plantel {categoria_actual}",
+                    f"Deuda calculada a {periodo}",
+                    headers,
+                    anchos
+                )
             
-            ws.append([
+            meses = socio['meses_adeudados'] or 0
+            ws.append(self.fila(ws, [
+                socio['apellido'],
+                socio['nombre'],
                 socio['dni'],
+                fecha_a_texto(socio.get('fecha_nacimiento')),
+                socio.get('telefono', '-') or '-',
+                socio.get('email', '-') or '-',
+                socio['estado_pago'].upper(),
+                fecha_a_texto(socio.get('fecha_ultimo_pago')),
+                meses
+            ], estilos_deuda if meses > 0 else estilos_al_dia))
+            
+            resumen['socios'] += 1
+            resumen['con_deuda'] += meses > 0
+            
+            if progreso and cantidad % 1000 == 0:
+                progreso(cantidad)
+        
+        if ws is None:
+            # Sin socios activos: una hoja con los encabezados
+            ws = wb.create_sheet("Plantel")
+            self.encabezado(ws, f"{CLUB_INFO['nombre']} - Plantel", f"Deuda calculada a {periodo}", headers, anchos)
+        else:
+            cerrar_hoja()
+        
+        # Guardar
+        filename = nombre_unico('plantel', '.xlsx')
+        filepath = self.exports_path / filename
+        
+        wb.save(str(filepath))
+        return filename
+    
+    def exportar_atrasos(self, datos: dict, progreso=None) -> str:
+        """
+        Exporta el reporte de antigüedad de la deuda, con el detalle en modo streaming
+        
+        La hoja "Resumen" tiene socios y monto por categoría y tramo; la hoja
+        "Detalle" se escribe a medida que se leen los socios.
+        
+        Args:
+            datos: Resultado de utils.reportes.datos_reporte_atrasos
+            progreso: Función opcional que recibe la cantidad de filas escritas
+        
+        Returns:
+            Nombre del archivo generado
+        """
+        wb = self.crear_libro()
+        titulo = f"{CLUB_INFO['nombre']} - {datos['titulo']}"
+        subtitulo = f"Cuotas vencidas al {fecha_a_texto(datos['fecha_corte'])}"
+        
+        # Resumen: dos columnas (socios y monto) por tramo y por el total
+        ws = wb.create_sheet("Resumen")
+        headers = ["Categoría"]
+        for nombre in datos['tramos'] + ["Total"]:
+            headers += [f"{nombre} - Socios", f"{nombre} - Monto"]
+        self.encabezado(ws, titulo, subtitulo, headers, [15] + [14, 18] * (len(datos['tramos']) + 1))
+        
+        def valores(tramos: list, total: dict) -> list:
+            fila = []
+            for acumulado in [*tramos, total]:
+                fila += [acumulado['socios'], acumulado['monto']]
+            return fila
+        
+        estilos_dato = ['dato'] + ['dato', 'dato_monto'] * (len(datos['tramos']) + 1)
+        estilos_total = ['total'] + ['total', 'total_monto'] * (len(datos['tramos']) + 1)
+        resumen = datos['resumen']
+        for categoria, acumulado in resumen['categorias'].items():
+            ws.append(self.fila(ws, [categoria, *valores(acumulado['tramos'], acumulado['total'])], estilos_dato))
+        ws.append(self.fila(ws, ["TOTAL", *valores(resumen['totales'], resumen['total'])], estilos_total))
+        
+        # Detalle por socio
+        ws = wb.create_sheet("Detalle")
+        if datos['categoria']:
+            subtitulo += f" - {datos['categoria']}"
+        self.encabezado(
+            ws, titulo, subtitulo,
+            ["Apellido", "Nombre", "DNI", "Categoría", "Teléfono", "Adeuda Desde",
+             "Cuotas Impagas", "Días de Atraso", "Tramo", "Monto Adeudado"],
+            [20, 20, 12, 12, 15, 14, 15, 15, 16, 16]
+        )
+        estilos = ['dato'] * 9 + ['dato_monto']
+        estilos_alerta = ['dato'] * 7 + ['dato_alerta', 'dato_alerta', 'dato_monto']
+        ultimo_tramo = len(datos['tramos']) - 1
+        
+        total = 0
+        cantidad = 0
+        for cantidad, socio in enumerate(datos['socios'], start=1):
+            periodo = socio['primer_periodo']
+            ws.append(self.fila(ws, [
                 socio['apellido'],
                 socio['nombre'],
+                socio['dni'],
                 socio['categoria'],
-                socio. get('telefono', '-') or '-',
-                socio. get('email', '-') or '-',
-                socio['estado_pago']. upper(),
-                ultimo_pago,
-                fecha_insc
-            ])
+                socio.get('telefono', '-') or '-',
+                f"{MESES[periodo % 12]} {periodo // 12}",
+                socio['cuotas_impagas'],
+                socio['dias_atraso'],
+                datos['tramos'][socio['tramo']],
+                socio['monto_adeudado']
+            ], estilos_alerta if socio['tramo'] == ultimo_tramo else estilos))
+            
+            total += socio['monto_adeudado']
             
-            # Aplicar bordes
-            for cell in ws[ws.max_row]:
-                cell.border = border
-        
-        # Ajustar anchos
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D']. width = 15
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F']. width = 25
-        ws.column_dimensions['G'].width = 15
-        ws.column_dimensions['H']. width = 15
-        ws.column_dimensions['I'].width = 18
+            if progreso and cantidad % 1000 == 0:
+                progreso(cantidad)
+        
+        ws.append([])
+        ws.append(self.fila(ws, ["Socios:", cantidad], 'total'))
+        ws.append(self.fila(ws, ["Total adeudado:", total], ['total', 'total_monto']))
         
         # Guardar
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"socios_{timestamp}.xlsx"
+        filename = nombre_unico(f"atrasos_{datos['fecha_corte']}", '.xlsx')
         filepath = self.exports_path / filename
         
         wb.save(str(filepath))
-        return filename
\ No newline at end of file
+        return filename
@@ -0,0 +1,218 @@
+"""
+Caché de exportaciones
+Reutiliza los archivos ya generados cuando se pide la misma exportación sobre
+los mismos datos, y aplica la política de retención de la carpeta de exportaciones
+"""
+
+import hashlib
+import json
+import logging
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from config.settings import EXPORT_CONFIG, EXPORTS_PATH
+
+logger = logging.getLogger(__name__)
+
+ARCHIVO_INDICE = '.cache_exportaciones.json'
+
+# Las exportaciones corren en varios hilos y comparten el índice
+_lock = threading.Lock()
+
+
+def clave_exportacion(tipo: str, parametros: dict, versiones: dict[str, int]) -> str:
+    """
+    Calcula la clave de una exportación
+    
+    Args:
+        tipo: Tipo de exportación ('transacciones_excel', 'reporte_financiero', ...)
+        parametros: Parámetros que afectan el contenido del archivo
+        versiones: Versión de cada tabla leída por la exportación
+    
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    contenido = json.dumps(
+        {'tipo': tipo, 'parametros': parametros, 'versiones': versiones},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+
+def nombre_unico(prefijo: str, extension: str = '') -> str:
+    """
+    Nombre de archivo (o carpeta) con fecha y hora para una exportación
+    
+    La cola corre varias exportaciones a la vez: el sufijo al azar evita que
+    dos del mismo tipo que empiezan en el mismo segundo escriban el mismo
+    archivo y el caché asocie las dos claves a uno solo.
+    
+    Args:
+        prefijo: Comienzo del nombre ('transacciones', 'recibos', ...)
+        extension: Extensión con el punto ('.xlsx'), vacía para una carpeta
+    
+    Returns:
+        Nombre como 'transacciones_20250131_101500_3fa9c2.xlsx'
+    """
+    return f"{prefijo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}{extension}"
+
+
+def tamanio_en_disco(ruta: Path) -> int:
+    """Tamaño en bytes de un archivo o de todo el contenido de una carpeta"""
+    if ruta.is_dir():
+        return sum(p.stat().st_size for p in ruta.rglob('*') if p.is_file())
+    return ruta.stat().st_size
+
+
+class CacheExportaciones:
+    """Índice de exportaciones generadas, guardado junto a los archivos"""
+    
+    def __init__(self, carpeta: Path = EXPORTS_PATH):
+        self.carpeta = Path(carpeta)
+        self.ruta_indice = self.carpeta / ARCHIVO_INDICE
+    
+    def leer_indice(self) -> dict[str, dict]:
+        """Lee el índice (vacío si no existe o está dañado)"""
+        try:
+            return json.loads(self.ruta_indice.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+    
+    def escribir_indice(self, indice: dict[str, dict]):
+        """Reemplaza el índice de forma atómica"""
+        temporal = self.ruta_indice.with_suffix('.tmp')
+        temporal.write_text(json.dumps(indice, indent=1), encoding='utf-8')
+        temporal.replace(self.ruta_indice)
+    
+    def obtener(self, clave: str) -> str | None:
+        """
+        Busca una exportación ya generada
+        
+        Args:
+            clave: Clave calculada con clave_exportacion
+        
+        Returns:
+            Nombre del archivo (relativo a la carpeta) o None si no existe
+        """
+        with _lock:
+            entrada = self.leer_indice().get(clave)
+        if entrada and (self.carpeta / entrada['archivo']).exists():
+            return entrada['archivo']
+        return None
+    
+    def guardar(self, clave: str, tipo: str, archivo: str):
+        """
+        Registra una exportación recién generada
+        
+        Args:
+            clave: Clave calculada con clave_exportacion
+            tipo: Tipo de exportación
+            archivo: Nombre del archivo o carpeta generada, relativo a la carpeta
+        """
+        with _lock:
+            indice = self.leer_indice()
+            indice[clave] = {'tipo': tipo, 'archivo': archivo, 'creado': time.time()}
+            self.escribir_indice(indice)
+    
+    def obtener_o_generar(self, db_manager, tipo: str, parametros: dict, tablas: tuple[str, ...],
+                          generar: Callable[[], str]) -> tuple[str, bool]:
+        """
+        Devuelve la exportación guardada o la genera si los datos cambiaron
+        
+        Las versiones se leen antes de generar: si los datos cambian mientras
+        tanto, la próxima solicitud no encuentra la clave y vuelve a generar.
+        
+        Args:
+            db_manager: Gestor de base de datos
+            tipo: Tipo de exportación
+            parametros: Parámetros que afectan el contenido del archivo
+            tablas: Tablas que lee la exportación
+            generar: Función que genera el archivo y devuelve su nombre
+        
+        Returns:
+            Tupla (nombre del archivo, True si se reutilizó uno existente)
+        """
+        clave = clave_exportacion(tipo, parametros, db_manager.obtener_versiones(tablas))
+        archivo = self.obtener(clave)
+        if archivo is not None:
+            logger.info(f"Exportación reutilizada: {archivo}")
+            return archivo, True
+        
+        archivo = generar()
+        self.guardar(clave, tipo, archivo)
+        self.podar()
+        return archivo, False
+    
+    def podar(self, max_dias: float | None = None, max_mb: float | None = None) -> int:
+        """
+        Elimina exportaciones viejas de la carpeta
+        
+        Primero borra lo que supera la antigüedad máxima y después, si la
+        carpeta sigue ocupando más del máximo, lo más antiguo hasta entrar.
+        
+        Args:
+            max_dias: Antigüedad máxima (por defecto EXPORT_CONFIG['retencion_dias'])
+            max_mb: Tamaño total máximo (por defecto EXPORT_CONFIG['retencion_mb'])
+        
+        Returns:
+            Cantidad de archivos o carpetas eliminados
+        """
+        max_dias = EXPORT_CONFIG['retencion_dias'] if max_dias is None else max_dias
+        max_mb = EXPORT_CONFIG['retencion_mb'] if max_mb is None else max_mb
+        limite = time.time() - max_dias * 86400
+        
+        with _lock:
+            entradas = []
+            for ruta in self.carpeta.iterdir():
+                if ruta.name.startswith('.'):
+                    continue
+                try:
+                    entradas.append((ruta.stat().st_mtime, tamanio_en_disco(ruta), ruta))
+                except OSError:
+                    continue
+            entradas.sort(key=lambda e: e[0])
+            
+            total = sum(tamanio for _, tamanio, _ in entradas)
+            eliminadas = set()
+            for modificado, tamanio, ruta in entradas:
+                if modificado >= limite and total <= max_mb * 1024 * 1024:
+                    break
+                try:
+                    if ruta.is_dir():
+                        shutil.rmtree(ruta)
+                    else:
+                        ruta.unlink()
+                except OSError as e:
+                    logger.warning(f"No se pudo eliminar la exportación {ruta.name}: {e}")
+                    continue
+                total -= tamanio
+                eliminadas.add(ruta.name)
+            
+            if eliminadas:
+                indice = self.leer_indice()
+                self.escribir_indice({
+                    clave: entrada for clave, entrada in indice.items()
+                    if Path(entrada['archivo']).parts[0] not in eliminadas
+                })
+                logger.info(f"Exportaciones eliminadas por retención: {len(eliminadas)}")
+        
+        return len(eliminadas)
+
+
+def exportar_con_cache(db_manager, carpeta: Path, tipo: str, parametros: dict,
+                       tablas: tuple[str, ...], generar: Callable[[], str]) -> str:
+    """
+    Atajo de CacheExportaciones.obtener_o_generar para las vistas
+    
+    Returns:
+        Nombre del archivo, indicando si se reutilizó uno existente
+    """
+    archivo, reutilizado = CacheExportaciones(carpeta).obtener_o_generar(
+        db_manager, tipo, parametros, tablas, generar
+    )
+    return f"{archivo} (sin cambios, reutilizado)" if reutilizado else archivo
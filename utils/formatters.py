@@ -0,0 +1,74 @@
+"""
+Formateo de datos para mostrar
+Convierte fechas y montos a texto una sola vez por lote de registros
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65536)
+def fecha_a_texto(valor) -> str:
+    """
+    Convierte una fecha ISO (YYYY-MM-DD) al formato DD/MM/YYYY
+
+    Args:
+        valor: Fecha tal como viene de la base de datos
+
+    Returns:
+        Fecha formateada, '-' si está vacía o el valor original si no es válida
+    """
+    if not valor:
+        return '-'
+
+    try:
+        return datetime.strptime(str(valor), '%Y-%m-%d').strftime('%d/%m/%Y')
+    except ValueError:
+        return str(valor)
+
+
+@lru_cache(maxsize=65536)
+def monto_a_texto(monto: float) -> str:
+    """
+    Formatea un monto para mostrar en pantalla ($1,234.56)
+
+    Args:
+        monto: Valor numérico
+
+    Returns:
+        String formateado
+    """
+    return f"${monto:,.2f}"
+
+
+def preparar_para_mostrar(registros: Iterable[dict], fechas: tuple = (), montos: tuple = ()) -> list[dict]:
+    """
+    Agrega a cada registro los campos '<campo>_texto' con su forma de presentación
+
+    Los registros que ya fueron preparados no se vuelven a formatear, por lo que
+    las mismas filas pueden compartirse entre tablas y exportaciones.
+
+    Args:
+        registros: Diccionarios obtenidos de la base de datos
+        fechas: Nombres de los campos de fecha a formatear
+        montos: Nombres de los campos de monto a formatear
+
+    Returns:
+        La misma lista de registros
+    """
+    registros = registros if isinstance(registros, list) else list(registros)
+
+    for campo in fechas:
+        clave = f"{campo}_texto"
+        for registro in registros:
+            if clave not in registro:
+                registro[clave] = fecha_a_texto(registro.get(campo))
+
+    for campo in montos:
+        clave = f"{campo}_texto"
+        for registro in registros:
+            if clave not in registro:
+                registro[clave] = monto_a_texto(registro.get(campo) or 0)
+
+    return registros
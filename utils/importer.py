@@ -0,0 +1,499 @@
+"""
+Importador de planillas
+Carga en bloque socios y cuotas desde archivos Excel (.xlsx) o CSV heredados,
+leyendo, validando y escribiendo por lotes
+"""
+
+import csv
+import re
+import time
+import unicodedata
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+from config.settings import CATEGORIAS_BASQUET, EXPORTS_PATH, IMPORT_CONFIG, MESES
+from utils.export_cache import nombre_unico
+from utils.validators import (
+    PATRON_SEPARADORES_DNI,
+    como_texto,
+    errores_vacios,
+    limpiar_texto,
+    limpiar_textos,
+    por_valores_unicos,
+    primer_error,
+    validar_dnis,
+    validar_emails,
+    validar_fechas,
+    validar_montos,
+    validar_telefonos,
+)
+
+# Campos de cada tipo de importación y nombres de columna con que suelen venir
+CAMPOS_IMPORTACION = {
+    'socios': {
+        'dni': ('dni', 'documento', 'nro documento', 'numero documento', 'doc'),
+        'apellido': ('apellido', 'apellidos'),
+        'nombre': ('nombre', 'nombres'),
+        'categoria': ('categoria', 'cat', 'division'),
+        'fecha_nacimiento': ('fecha nacimiento', 'fecha de nacimiento', 'nacimiento', 'fecha nac'),
+        'telefono': ('telefono', 'tel', 'celular', 'movil'),
+        'email': ('email', 'e mail', 'correo', 'mail'),
+        'direccion': ('direccion', 'domicilio'),
+        'fecha_inscripcion': ('fecha inscripcion', 'fecha de inscripcion', 'inscripcion', 'alta', 'fecha alta'),
+        'observaciones': ('observaciones', 'obs', 'notas')
+    },
+    'cuotas': {
+        'dni': ('dni', 'documento', 'nro documento', 'numero documento', 'doc'),
+        'mes': ('mes',),
+        'anio': ('anio', 'ano', 'año'),
+        'monto': ('monto', 'importe', 'valor'),
+        'fecha_pago': ('fecha pago', 'fecha de pago', 'fecha', 'pagado'),
+        'metodo_pago': ('metodo pago', 'metodo de pago', 'forma de pago', 'medio de pago'),
+        'recibo_numero': ('recibo', 'recibo numero', 'nro recibo', 'numero recibo'),
+        'observaciones': ('observaciones', 'obs', 'notas')
+    }
+}
+
+CAMPOS_OBLIGATORIOS = {
+    'socios': ('dni', 'apellido', 'nombre', 'categoria'),
+    'cuotas': ('dni', 'mes', 'anio', 'monto')
+}
+
+# Separadores que se prueban al leer un CSV
+SEPARADORES_CSV = ',;\t|'
+
+
+class ImportacionCancelada(Exception):
+    """Se pidió cancelar la importación en curso"""
+
+
+def normalizar_encabezado(texto) -> str:
+    """Pasa un nombre de columna a minúsculas, sin acentos ni signos"""
+    texto = unicodedata.normalize('NFKD', str(texto or '')).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(re.findall(r'[a-z0-9]+', texto.lower()))
+
+
+def detectar_mapeo(encabezados: list[str], tipo: str) -> dict[str, int]:
+    """
+    Asocia cada campo de la importación con una columna del archivo
+    
+    Args:
+        encabezados: Nombres de las columnas del archivo
+        tipo: 'socios' o 'cuotas'
+    
+    Returns:
+        Diccionario campo -> índice de columna (solo los campos encontrados)
+    """
+    normalizados = [normalizar_encabezado(e) for e in encabezados]
+    mapeo = {}
+    for campo, alias in CAMPOS_IMPORTACION[tipo].items():
+        for nombre in (campo.replace('_', ' '), *alias):
+            nombre = normalizar_encabezado(nombre)
+            if nombre in normalizados and normalizados.index(nombre) not in mapeo.values():
+                mapeo[campo] = normalizados.index(nombre)
+                break
+    return mapeo
+
+
+# ==================== LECTURA ====================
+
+def formato_csv(ruta: Path):
+    """Detecta la codificación (UTF-8 o Windows) y el separador de un CSV"""
+    with open(ruta, 'rb') as archivo:
+        muestra = archivo.read(65536)
+    try:
+        muestra.decode('utf-8-sig')
+        codificacion = 'utf-8-sig'
+    except UnicodeDecodeError:
+        codificacion = 'cp1252'
+    
+    # Los títulos de arriba de la tabla (una sola celda) confunden al Sniffer
+    lineas = [
+        linea for linea in muestra.decode(codificacion, errors='ignore').splitlines()
+        if any(separador in linea for separador in SEPARADORES_CSV)
+    ]
+    try:
+        dialecto = csv.Sniffer().sniff('\n'.join(lineas), delimiters=SEPARADORES_CSV)
+    except csv.Error:
+        # Sin un patrón claro, el separador que aparece en más líneas
+        separador = max(SEPARADORES_CSV, key=lambda s: sum(s in linea for linea in lineas))
+        dialecto = type('DialectoCSV', (csv.excel,), {'delimiter': separador})
+    return codificacion, dialecto
+
+
+def iterar_filas(ruta: Path) -> Iterator[tuple[int, tuple]]:
+    """
+    Recorre un .xlsx (modo solo lectura) o un CSV fila por fila
+    
+    La fila de encabezados se devuelve con número 0.
+    
+    Args:
+        ruta: Archivo a leer
+    
+    Yields:
+        Tuplas (número de fila en el archivo, valores)
+    """
+    ruta = Path(ruta)
+    if ruta.suffix.lower() in ('.xlsx', '.xlsm'):
+        wb = openpyxl.load_workbook(str(ruta), read_only=True, data_only=True)
+        try:
+            filas = wb.active.iter_rows(values_only=True)
+            yield from _con_encabezado(filas)
+        finally:
+            wb.close()
+    elif ruta.suffix.lower() in ('.csv', '.txt'):
+        codificacion, dialecto = formato_csv(ruta)
+        with open(ruta, newline='', encoding=codificacion) as archivo:
+            yield from _con_encabezado(csv.reader(archivo, dialecto))
+    else:
+        raise ValueError(f"Formato de archivo no soportado: {ruta.suffix}")
+
+
+def _con_encabezado(filas) -> Iterator[tuple[int, tuple]]:
+    """
+    Numera las filas y marca como encabezado (0) la primera con dos o más celdas
+    
+    Así se saltean los títulos que suelen tener las planillas viejas arriba de la tabla.
+    """
+    encabezado = False
+    for numero, valores in enumerate(filas, start=1):
+        completas = sum(1 for v in valores if v not in (None, ''))
+        if not completas:
+            continue
+        if not encabezado:
+            if completas >= 2:
+                encabezado = True
+                yield 0, tuple(valores)
+        else:
+            yield numero, tuple(valores)
+
+
+def leer_encabezados(ruta: Path) -> list[str]:
+    """Nombres de las columnas del archivo (para armar el mapeo antes de importar)"""
+    filas = iterar_filas(ruta)
+    try:
+        _, encabezados = next(filas, (0, ()))
+    finally:
+        filas.close()
+    return [str(e).strip() if e is not None else '' for e in encabezados]
+
+
+def contar_filas(ruta: Path) -> int | None:
+    """Cantidad aproximada de filas de datos (para la barra de progreso)"""
+    ruta = Path(ruta)
+    if ruta.suffix.lower() in ('.xlsx', '.xlsm'):
+        wb = openpyxl.load_workbook(str(ruta), read_only=True)
+        try:
+            return max((wb.active.max_row or 1) - 1, 0)
+        finally:
+            wb.close()
+    with open(ruta, 'rb') as archivo:
+        return max(sum(bloque.count(b'\n') for bloque in iter(lambda: archivo.read(1 << 20), b'')) - 1, 0)
+
+
+# ==================== CONVERSIÓN DE VALORES ====================
+
+def a_texto(valor) -> str:
+    """Texto limpio; los números enteros de Excel pierden el '.0'"""
+    if valor is None:
+        return ''
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    return limpiar_texto(str(valor))
+
+
+def a_dni(valor) -> str:
+    """DNI solo con dígitos"""
+    return PATRON_SEPARADORES_DNI.sub('', a_texto(valor))
+
+
+def a_mes(valor) -> int | None:
+    """Número de mes a partir de un número o del nombre del mes"""
+    texto = normalizar_encabezado(valor)
+    if texto.isdigit():
+        return int(texto)
+    for numero, nombre in enumerate(NOMBRES_MESES, start=1):
+        if texto and (texto == nombre or (len(texto) >= 3 and nombre.startswith(texto))):
+            return numero
+    return None
+
+
+def a_categoria(valor) -> str | None:
+    """Categoría tal como figura en la configuración, escrita de cualquier forma"""
+    return CATEGORIAS_NORMALIZADAS.get(normalizar_encabezado(valor))
+
+
+NOMBRES_MESES = [normalizar_encabezado(m) for m in MESES]
+CATEGORIAS_NORMALIZADAS = {normalizar_encabezado(c): c for c in CATEGORIAS_BASQUET}
+
+
+def en_rango(valores: pd.Series, minimo: int, maximo: int) -> pd.Series:
+    """Códigos de error para una columna numérica que debe estar entre dos valores"""
+    errores = errores_vacios(valores)
+    errores[valores.isna()] = 'formato'
+    errores[valores.notna() & ~valores.between(minimo, maximo).fillna(False).astype(bool)] = 'fuera_de_rango'
+    return errores
+
+
+# Los sets y diccionarios de registros existentes se consultan directamente:
+# Series.isin y Series.map los convertirían completos en cada lote.
+
+def pertenecen(claves: pd.Series, conjunto: set) -> pd.Series:
+    """Indica qué claves están en el conjunto"""
+    return pd.Series([clave in conjunto for clave in claves], index=claves.index, dtype=bool)
+
+
+def buscar(claves: pd.Series, diccionario: dict, tipo: str = 'object') -> pd.Series:
+    """Valor del diccionario para cada clave (NA si no está)"""
+    return pd.Series([diccionario.get(clave) for clave in claves], index=claves.index, dtype=tipo)
+
+
+def como_registros(df: pd.DataFrame) -> list[dict]:
+    """Filas de un DataFrame como diccionarios con tipos de Python (None en lugar de NA)"""
+    valores = df.astype(object).where(df.notna(), None)
+    return [dict(zip(valores.columns, fila, strict=True)) for fila in valores.itertuples(index=False, name=None)]
+
+
+# ==================== VALIDACIÓN POR LOTES ====================
+# Cada lote se valida por columnas: los validadores devuelven un código de
+# error por fila y de cada fila rechazada se informa el primero encontrado.
+
+def a_columnas(lote: list[tuple[int, dict]]) -> pd.DataFrame:
+    """Lote de filas crudas como DataFrame indexado por número de fila"""
+    numeros = [numero for numero, _ in lote]
+    return pd.DataFrame.from_records([crudo for _, crudo in lote], index=numeros)
+
+
+def separar(df: pd.DataFrame, motivos: pd.Series) -> tuple[list[dict], list[tuple[int, str]]]:
+    """Divide un lote validado en registros válidos y rechazos (número de fila, motivo)"""
+    rechazadas = motivos.notna()
+    rechazos = list(zip(motivos.index[rechazadas].tolist(), motivos[rechazadas].tolist(), strict=True))
+    return como_registros(df[~rechazadas]), rechazos
+
+
+def validar_lote_socios(lote: list[tuple[int, dict]], dnis: set) -> tuple[list[dict], list[tuple[int, str]]]:
+    """
+    Valida un lote de socios
+    
+    Args:
+        lote: Tuplas (número de fila, valores crudos por campo)
+        dnis: DNIs ya registrados o importados en lotes anteriores (se actualiza)
+    
+    Returns:
+        Tupla (socios válidos, rechazos como (número de fila, motivo))
+    """
+    crudo = a_columnas(lote)
+    vacia = pd.Series(pd.NA, index=crudo.index, dtype='string')
+    
+    def columna(campo: str) -> pd.Series:
+        return crudo.get(campo, vacia)
+    
+    dni, error_dni = validar_dnis(columna('dni'))
+    apellido, nombre = limpiar_textos(columna('apellido')), limpiar_textos(columna('nombre'))
+    categoria = por_valores_unicos(como_texto(columna('categoria')), a_categoria)
+    fecha_nacimiento, error_nacimiento = validar_fechas(columna('fecha_nacimiento'))
+    fecha_inscripcion, error_inscripcion = validar_fechas(columna('fecha_inscripcion'))
+    email, error_email = validar_emails(columna('email'))
+    telefono, error_telefono = validar_telefonos(columna('telefono'))
+        
+    error_nombre = errores_vacios(crudo).mask(apellido.isna() | nombre.isna(), 'vacio')
+    error_categoria = errores_vacios(crudo).mask(categoria.isna(), 'desconocido')
+    otros = primer_error(
+        ('DNI', error_dni), ('Apellido y nombre', error_nombre), ('Categoría', error_categoria),
+        ('Fecha de nacimiento', error_nacimiento), ('Fecha de inscripción', error_inscripcion),
+        ('Email', error_email), ('Teléfono', error_telefono)
+    )
+    # Un DNI repetido en el archivo se acepta solo en la primera fila válida
+    candidatos = dni.where(otros.isna())
+    error_duplicado = errores_vacios(crudo).mask(
+        pertenecen(dni, dnis) | (candidatos.notna() & candidatos.duplicated()), 'duplicado'
+    )
+    motivos = primer_error(('DNI', error_dni), ('DNI', error_duplicado)).fillna(otros)
+    
+    socios = pd.DataFrame({
+        'dni': dni, 'apellido': apellido, 'nombre': nombre, 'categoria': categoria,
+        'fecha_nacimiento': fecha_nacimiento, 'telefono': telefono, 'email': email,
+        'direccion': limpiar_textos(columna('direccion')),
+        'fecha_inscripcion': fecha_inscripcion,
+        'observaciones': limpiar_textos(columna('observaciones'))
+    })
+    validos, rechazos = separar(socios, motivos)
+    dnis.update(socio['dni'] for socio in validos)
+    return validos, rechazos
+
+
+def validar_lote_cuotas(lote: list[tuple[int, dict]], ids_por_dni: dict[str, int],
+                        pagadas: set) -> tuple[list[dict], list[tuple[int, str]]]:
+    """
+    Valida un lote de cuotas
+    
+    Args:
+        lote: Tuplas (número de fila, valores crudos por campo)
+        ids_por_dni: DNI (solo dígitos) -> ID de socio
+        pagadas: Períodos (socio_id, mes, anio) ya registrados o importados (se actualiza)
+    
+    Returns:
+        Tupla (cuotas válidas, rechazos como (número de fila, motivo))
+    """
+    crudo = a_columnas(lote)
+    vacia = pd.Series(pd.NA, index=crudo.index, dtype='string')
+    
+    def columna(campo: str) -> pd.Series:
+        return crudo.get(campo, vacia)
+    
+    dni, error_dni = validar_dnis(columna('dni'))
+    socio_id = buscar(dni, ids_por_dni, 'Int64')
+    mes = por_valores_unicos(como_texto(columna('mes')), a_mes, 'Int64')
+    anio = pd.to_numeric(como_texto(columna('anio')), errors='coerce').astype('Int64')
+    monto, error_monto = validar_montos(columna('monto'))
+    fecha_pago, error_fecha = validar_fechas(columna('fecha_pago'))
+        
+    error_socio = errores_vacios(crudo).mask(error_dni.isna() & socio_id.isna(), 'no_registrado')
+    otros = primer_error(
+        ('DNI', error_dni), ('DNI', error_socio), ('Mes', en_rango(mes, 1, 12)),
+        ('Año', en_rango(anio, 1900, 2100)), ('Monto', error_monto), ('Fecha de pago', error_fecha)
+    )
+    # El período ya pagado se controla al final, solo sobre las filas válidas
+    periodos = pd.Series(list(zip(socio_id, mes, anio, strict=True)), index=crudo.index).where(otros.isna())
+    error_periodo = errores_vacios(crudo).mask(
+        periodos.notna() & (pertenecen(periodos, pagadas) | periodos.duplicated()), 'duplicado'
+    )
+    motivos = otros.fillna(primer_error(('Período', error_periodo)))
+    
+    cuotas = pd.DataFrame({
+        'socio_id': socio_id, 'mes': mes, 'anio': anio, 'monto': monto, 'fecha_pago': fecha_pago,
+        'metodo_pago': limpiar_textos(columna('metodo_pago')),
+        'recibo_numero': limpiar_textos(columna('recibo_numero')),
+        'observaciones': limpiar_textos(columna('observaciones'))
+    })
+    validos, rechazos = separar(cuotas, motivos)
+    pagadas.update((cuota['socio_id'], cuota['mes'], cuota['anio']) for cuota in validos)
+    return validos, rechazos
+
+
+# ==================== IMPORTACIÓN ====================
+
+class DataImporter:
+    """Clase para importar socios y cuotas desde planillas"""
+    
+    def __init__(self):
+        self.exports_path = EXPORTS_PATH
+        self.tamanio_lote = IMPORT_CONFIG['lote']
+    
+    def importar(self, db_manager, ruta: Path, tipo: str, mapeo: dict[str, int] | None = None,
+                 progreso=None, cancelacion=None) -> dict:
+        """
+        Importa un archivo completo en una sola transacción
+        
+        Args:
+            db_manager: Gestor de base de datos
+            ruta: Archivo .xlsx o .csv
+            tipo: 'socios' o 'cuotas'
+            mapeo: Campo -> índice de columna (por defecto, detectado por los encabezados)
+            progreso: Función opcional que recibe la cantidad de filas leídas
+            cancelacion: threading.Event opcional para cancelar (no se importa nada)
+        
+        Returns:
+            Diccionario con 'leidas', 'importadas', 'rechazadas', 'archivo_rechazos' y 'segundos'
+        """
+        inicio = time.perf_counter()
+        # El archivo se abre una sola vez: la primera fila es el encabezado
+        filas = iterar_filas(ruta)
+        _, encabezados = next(filas, (0, ()))
+        encabezados = [str(e).strip() if e is not None else '' for e in encabezados]
+        mapeo = mapeo if mapeo is not None else detectar_mapeo(encabezados, tipo)
+        faltantes = [c for c in CAMPOS_OBLIGATORIOS[tipo] if c not in mapeo]
+        if faltantes:
+            filas.close()
+            raise ValueError(f"Faltan columnas obligatorias: {', '.join(faltantes)}")
+        
+        # Todo lo que se consulta a la base se lee antes de abrir la transacción
+        ids_por_dni = db_manager.obtener_ids_por_dni()
+        if tipo == 'socios':
+            dnis = set(ids_por_dni)
+            
+            def validar(lote):
+                return validar_lote_socios(lote, dnis)
+            insertar = db_manager.importar_socios
+        else:
+            pagadas = db_manager.obtener_periodos_pagados()
+            
+            def validar(lote):
+                return validar_lote_cuotas(lote, ids_por_dni, pagadas)
+            insertar = db_manager.importar_cuotas
+        
+        resultado = {'leidas': 0, 'rechazadas': 0, 'archivo_rechazos': None}
+        informe = InformeRechazos(self.exports_path, tipo, [encabezados[i] for i in mapeo.values()])
+        
+        def lotes():
+            try:
+                while True:
+                    lote = [
+                        (numero, {campo: valores[i] if i < len(valores) else None for campo, i in mapeo.items()})
+                        for numero, valores in islice(filas, self.tamanio_lote)
+                    ]
+                    if not lote:
+                        break
+                    if cancelacion is not None and cancelacion.is_set():
+                        raise ImportacionCancelada("Importación cancelada")
+                    
+                    validos, rechazos = validar(lote)
+                    crudas = dict(lote) if rechazos else {}
+                    informe.agregar([
+                        (numero, motivo, [crudas[numero].get(c) for c in mapeo]) for numero, motivo in rechazos
+                    ])
+                    
+                    resultado['leidas'] += len(lote)
+                    resultado['rechazadas'] += len(rechazos)
+                    if progreso:
+                        progreso(resultado['leidas'])
+                    if validos:
+                        yield validos
+            finally:
+                filas.close()
+        
+        try:
+            resultado['importadas'] = insertar(lotes())
+        finally:
+            filas.close()
+            resultado['archivo_rechazos'] = informe.nombre_archivo()
+        
+        resultado['segundos'] = time.perf_counter() - inicio
+        return resultado
+
+
+class InformeRechazos:
+    """CSV con las filas rechazadas y el motivo, creado solo si hay rechazos"""
+    
+    def __init__(self, carpeta: Path, tipo: str, columnas: list[str]):
+        self.ruta = carpeta / nombre_unico(f"rechazos_{tipo}", '.csv')
+        self.columnas = columnas
+        self.filas = 0
+    
+    def agregar(self, rechazos: list[tuple[int, str, list]]):
+        """
+        Agrega las filas rechazadas de un lote con sus valores originales
+        
+        El archivo se abre una vez por lote y se cierra al terminar de escribirlo.
+        
+        Args:
+            rechazos: Tuplas (número de fila, motivo, valores)
+        """
+        if not rechazos:
+            return
+        # Separador ';' y BOM para que Excel lo abra directamente (al agregar no se repite)
+        with open(self.ruta, 'a' if self.filas else 'w', newline='', encoding='utf-8-sig') as archivo:
+            escritor = csv.writer(archivo, delimiter=';')
+            if not self.filas:
+                escritor.writerow(["Fila", "Motivo", *self.columnas])
+            for numero, motivo, valores in rechazos:
+                escritor.writerow([numero, motivo, *('' if v is None else v for v in valores)])
+        self.filas += len(rechazos)
+    
+    def nombre_archivo(self) -> str | None:
+        """Nombre del archivo generado (None si no hubo rechazos)"""
+        return self.ruta.name if self.filas else None
@@ -6,13 +6,115 @@ Crea recibos de cuotas y reportes financieros
 from reportlab.lib import colors
 from reportlab.lib. pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.lib.units import cm
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, KeepTogether
 from reportlab.pdfgen import canvas
+from reportlab.lib.utils import ImageReader
+from reportlab.graphics.shapes import Drawing
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab import rl_config
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+import math
+import multiprocessing
+import os
+import time
 
-from config.settings import CLUB_INFO, COLORS, EXPORTS_PATH, ASSETS_PATH
+from config.settings import CLUB_INFO, COLORS, EXPORTS_PATH, ASSETS_PATH, MESES
+from utils.export_cache import nombre_unico
+from utils.formatters import fecha_a_texto, monto_a_texto
+
+# Por debajo de esta cantidad no conviene pagar el arranque de los procesos
+MIN_RECIBOS_PROCESOS = 20
+
+# Nombre del form XObject con la parte fija del recibo
+PLANTILLA_RECIBO = 'plantilla_recibo'
+
+
+@contextmanager
+def sin_ascii85():
+    """
+    Desactiva la codificación ASCII85 de reportlab mientras dura el bloque
+    
+    Es lo más lento al incrustar el logo (reportlab la hace en Python puro) y
+    agranda el archivo un 25%. La opción es global, así que se restaura al salir
+    para no cambiar el resto de los PDFs.
+    """
+    anterior = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = anterior
+
+
+@lru_cache(maxsize=4)
+def cargar_imagen(ruta: str) -> ImageReader | None:
+    """
+    Lee y decodifica una imagen una sola vez por proceso
+    
+    Args:
+        ruta: Ruta de la imagen
+    
+    Returns:
+        ImageReader reutilizable o None si no se puede leer
+    """
+    try:
+        return ImageReader(ruta)
+    except OSError:
+        return None
+
+
+def datos_recibo(cuota: dict) -> dict:
+    """
+    Arma los datos de un recibo a partir de una cuota con los datos del socio
+    
+    Args:
+        cuota: Fila de DatabaseManager.obtener_cuotas_periodo
+    
+    Returns:
+        Diccionario listo para PDFGenerator.dibujar_recibo
+    """
+    return {
+        'socio': f"{cuota['apellido']}, {cuota['nombre']}",
+        'dni': cuota['dni'],
+        'categoria': cuota['categoria'],
+        'periodo': f"{MESES[cuota['mes'] - 1]} {cuota['anio']}",
+        'monto': cuota['monto'],
+        'metodo_pago': cuota.get('metodo_pago') or '-',
+        'fecha': cuota.get('fecha_pago_texto') or fecha_a_texto(cuota.get('fecha_pago')),
+        'recibo_numero': cuota.get('recibo_numero') or f"REC-{cuota['id']:06d}",
+        'cuota_id': cuota['id']
+    }
+
+
+def generar_recibos_en_proceso(lote: list[dict], carpeta: str) -> list[str]:
+    """
+    Genera un PDF por recibo; se ejecuta en un proceso del pool
+    
+    Args:
+        lote: Datos de los recibos (ver datos_recibo)
+        carpeta: Carpeta de destino
+    
+    Returns:
+        Nombres de los archivos generados
+    """
+    generador = PDFGenerator()
+    archivos = []
+    for datos in lote:
+        # Las cuotas de una cobranza comparten el número de recibo: el ID de la
+        # cuota evita que un archivo pise al anterior
+        filename = f"recibo_{datos['recibo_numero']}_{datos['cuota_id']}.pdf"
+        c = canvas.Canvas(str(Path(carpeta) / filename), pagesize=letter)
+        generador.dibujar_recibo(c, datos)
+        c.save()
+        archivos.append(filename)
+    return archivos
 
 
 class PDFGenerator:
@@ -33,18 +135,34 @@ class PDFGenerator:
             Nombre del archivo generado
         """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"recibo_{datos['recibo_numero']}_{timestamp}. pdf"
+        filename = f"recibo_{datos['recibo_numero']}_{timestamp}.pdf"
         filepath = self. exports_path / filename
         
         c = canvas.Canvas(str(filepath), pagesize=letter)
+        self.dibujar_recibo(c, datos)
+        c.save()
+        return filename
+    
+    def dibujar_plantilla_recibo(self, c: canvas.Canvas):
+        """
+        Define en el documento la parte fija del recibo (logo, encabezado, títulos
+        y pie) como un form XObject, que cada página reutiliza sin redibujarlo
+        
+        Args:
+            c: Canvas de destino
+        """
+        if c.hasForm(PLANTILLA_RECIBO):
+            return
+        
         width, height = letter
+        c.beginForm(PLANTILLA_RECIBO)
         
         # Logo (si existe)
-        if self.logo_path. exists():
-            try:
-                c.drawImage(str(self.logo_path), 50, height - 120, width=100, height=100, preserveAspectRatio=True)
-            except:
-                pass
+        logo = cargar_imagen(str(self.logo_path)) if self.logo_path.exists() else None
+        if logo is not None:
+            # El logo se codifica acá, una vez por documento
+            with sin_ascii85():
+                c.drawImage(logo, 50, height - 120, width=100, height=100, preserveAspectRatio=True)
         
         # Encabezado del club
         c.setFont("Helvetica-Bold", 18)
@@ -64,6 +182,32 @@ class PDFGenerator:
         c.setFont("Helvetica-Bold", 16)
         c.drawString(50, height - 165, "RECIBO DE PAGO - CUOTA MENSUAL")
         
+        # Títulos de las secciones
+        c.setFillColorRGB(0, 0, 0)
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(50, height - 220, "DATOS DEL SOCIO")
+        c.drawString(50, height - 325, "DETALLES DEL PAGO")
+        
+        # Pie de página
+        c.setFont("Helvetica-Oblique", 9)
+        c.drawString(50, 35, f"{CLUB_INFO['nombre']} - {CLUB_INFO['direccion']}")
+        
+        c.endForm()
+    
+    def dibujar_recibo(self, c: canvas.Canvas, datos: dict):
+        """
+        Dibuja un recibo en la página actual del canvas
+        
+        Args:
+            c: Canvas de destino
+            datos: Diccionario con los datos del recibo
+        """
+        width, height = letter
+        
+        # Parte fija, compartida por todas las páginas del documento
+        self.dibujar_plantilla_recibo(c)
+        c.doForm(PLANTILLA_RECIBO)
+        
         # Número de recibo y fecha
         c.setFillColorRGB(0, 0, 0)
         c.setFont("Helvetica-Bold", 12)
@@ -72,11 +216,7 @@ class PDFGenerator:
         c.drawString(width - 200, height - 180, f"Fecha: {datos['fecha']}")
         
         # Datos del socio
-        y_position = height - 220
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(50, y_position, "DATOS DEL SOCIO")
-        
-        y_position -= 25
+        y_position = height - 245
         c.setFont("Helvetica", 11)
         c.drawString(70, y_position, f"Nombre: {datos['socio']}")
         
@@ -87,12 +227,7 @@ class PDFGenerator:
         c.drawString(70, y_position, f"Categoría: {datos['categoria']}")
         
         # Detalles del pago
-        y_position -= 40
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(50, y_position, "DETALLES DEL PAGO")
-        
-        y_position -= 25
-        c.setFont("Helvetica", 11)
+        y_position -= 65
         c.drawString(70, y_position, f"Período: {datos['periodo']}")
         
         y_position -= 20
@@ -102,14 +237,486 @@ class PDFGenerator:
         y_position -= 40
         c.setFillColorRGB(0.11, 0.44, 0.72)
         c.setFont("Helvetica-Bold", 14)
-        c.drawString(70, y_position, f"MONTO TOTAL: ${datos['monto']:,. 2f}")
+        c.drawString(70, y_position, f"MONTO TOTAL: ${datos['monto']:,.2f}")
         
         # Pie de página
         c.setFillColorRGB(0, 0, 0)
-        c.setFont("Helvetica-Italic", 9)
+        c.setFont("Helvetica-Oblique", 9)
         footer_text = f"Recibo generado electrónicamente el {datetime.now().strftime('%d/%m/%Y %H:%M')}"
         c.drawString(50, 50, footer_text)
-        c.drawString(50, 35, f"{CLUB_INFO['nombre']} - {CLUB_INFO['direccion']}")
+    
+    def generar_recibo_cobranza(self, datos: dict) -> str:
+        """
+        Genera un único recibo con las cuotas de una cobranza en lote
+        
+        Args:
+            datos: Diccionario con 'recibo_numero', 'fecha', 'periodo', 'categoria',
+                   'metodo_pago', 'total' y 'pagos' (socio, dni y monto de cada cuota)
+        
+        Returns:
+            Nombre del archivo generado
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"recibo_{datos['recibo_numero']}_{timestamp}.pdf"
+        filepath = self.exports_path / filename
+        
+        doc = SimpleDocTemplate(
+            str(filepath), pagesize=A4,
+            leftMargin=2 * cm, rightMargin=2 * cm, topMargin=1.5 * cm, bottomMargin=1.5 * cm,
+            title=f"Recibo {datos['recibo_numero']}", author=CLUB_INFO['nombre']
+        )
+        styles = getSampleStyleSheet()
+        titulo = ParagraphStyle('titulo', parent=styles['Title'], textColor=colors.HexColor(COLORS['primary']))
+        subtitulo = ParagraphStyle(
+            'subtitulo', parent=styles['Heading2'], textColor=colors.HexColor(COLORS['secondary'])
+        )
+        
+        filas = [
+            [indice, pago['socio'], pago['dni'], monto_a_texto(pago['monto'])]
+            for indice, pago in enumerate(datos['pagos'], start=1)
+        ]
+        filas.append(["", "TOTAL", f"{len(datos['pagos'])} cuotas", monto_a_texto(datos['total'])])
+        tabla = self.tabla_reporte(["#", "Socio", "DNI", "Monto"], filas,
+                                   [1.2 * cm, 8.3 * cm, 3.5 * cm, 4 * cm], numericas=(0, 3))
+        tabla.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold')
+        ]))
+        
+        elementos = [
+            Paragraph(f"{CLUB_INFO['nombre']} - {CLUB_INFO['ciudad']}", titulo),
+            Paragraph(f"RECIBO DE PAGO - COBRANZA DE CUOTAS N° {datos['recibo_numero']}", subtitulo),
+            Paragraph(
+                f"Período: {datos['periodo']} · Categoría: {datos['categoria']} · "
+                f"Método de pago: {datos['metodo_pago']} · Fecha: {datos['fecha']}",
+                styles['Normal']
+            ),
+            Spacer(1, 0.5 * cm),
+            tabla,
+            Spacer(1, 0.5 * cm),
+            Paragraph(
+                f"Recibo generado electrónicamente el {datetime.now().strftime('%d/%m/%Y %H:%M')} - "
+                f"{CLUB_INFO['direccion']}",
+                styles['Italic']
+            )
+        ]
+        
+        doc.build(elementos)
+        return filename
+    
+    def generar_recibos_lote(self, cuotas: list[dict], combinar: bool = False,
+                             procesos: int | None = None, progreso=None) -> dict:
+        """
+        Genera los recibos de un conjunto de cuotas
+        
+        Con combinar=False cada recibo es un PDF propio y se reparten en lotes entre
+        varios procesos; con combinar=True se genera un único PDF con una página
+        por recibo.
+        
+        Args:
+            cuotas: Filas de DatabaseManager.obtener_cuotas_periodo
+            combinar: Generar un solo PDF de varias páginas
+            procesos: Cantidad de procesos (por defecto, uno por núcleo)
+            progreso: Función opcional que recibe la cantidad de recibos generados
+        
+        Returns:
+            Diccionario con 'carpeta', 'archivos', 'cantidad', 'segundos' y 'recibos_por_segundo'
+        """
+        inicio = time.perf_counter()
+        recibos = [datos_recibo(cuota) for cuota in cuotas]
+        
+        if combinar:
+            carpeta = self.exports_path
+            filename = nombre_unico('recibos', '.pdf')
+            c = canvas.Canvas(str(carpeta / filename), pagesize=letter)
+            for cantidad, datos in enumerate(recibos, start=1):
+                self.dibujar_recibo(c, datos)
+                c.showPage()
+                if progreso and cantidad % 50 == 0:
+                    progreso(cantidad)
+            c.save()
+            archivos = [filename]
+        else:
+            carpeta = self.exports_path / nombre_unico('recibos')
+            carpeta.mkdir(parents=True, exist_ok=True)
+            archivos = self.generar_recibos_paralelo(recibos, carpeta, procesos, progreso)
         
+        segundos = time.perf_counter() - inicio
+        return {
+            'carpeta': carpeta,
+            'archivos': archivos,
+            'cantidad': len(recibos),
+            'segundos': segundos,
+            'recibos_por_segundo': len(recibos) / segundos if segundos else 0.0
+        }
+    
+    def generar_recibos_paralelo(self, recibos: list[dict], carpeta: Path,
+                                 procesos: int | None = None, progreso=None) -> list[str]:
+        """
+        Reparte la generación de recibos individuales en un pool de procesos
+        
+        Args:
+            recibos: Datos de los recibos
+            carpeta: Carpeta de destino
+            procesos: Cantidad de procesos (por defecto, uno por núcleo)
+            progreso: Función opcional que recibe la cantidad de recibos generados
+        
+        Returns:
+            Nombres de los archivos generados
+        """
+        procesos = procesos or os.cpu_count() or 1
+        if procesos == 1 or len(recibos) < MIN_RECIBOS_PROCESOS:
+            archivos = generar_recibos_en_proceso(recibos, str(carpeta))
+            if progreso:
+                progreso(len(archivos))
+            return archivos
+        
+        # Lotes chicos para repartir bien la carga, grandes para no pagar de más en IPC
+        tamanio = max(1, math.ceil(len(recibos) / (procesos * 4)))
+        lotes = [recibos[i:i + tamanio] for i in range(0, len(recibos), tamanio)]
+        
+        archivos = []
+        # 'spawn' evita heredar los hilos de Qt al crear los procesos
+        contexto = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(procesos, len(lotes)), mp_context=contexto) as pool:
+            futuros = [pool.submit(generar_recibos_en_proceso, lote, str(carpeta)) for lote in lotes]
+            try:
+                for futuro in as_completed(futuros):
+                    archivos.extend(futuro.result())
+                    if progreso:
+                        progreso(len(archivos))
+            except BaseException:
+                # Cancelación o error: descartar los lotes que no empezaron
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        return archivos
+    
+    # ==================== REPORTES FINANCIEROS ====================
+    
+    def generar_reporte_financiero(self, datos: dict) -> str:
+        """
+        Genera el estado financiero de un período en PDF
+        
+        Args:
+            datos: Resultado de utils.reportes.datos_reporte_financiero
+        
+        Returns:
+            Nombre del archivo generado
+        """
+        filename = nombre_unico(f"reporte_financiero_{datos['desde']}_{datos['hasta']}", '.pdf')
+        filepath = self.exports_path / filename
+        
+        doc = SimpleDocTemplate(
+            str(filepath), pagesize=A4,
+            leftMargin=2 * cm, rightMargin=2 * cm, topMargin=1.5 * cm, bottomMargin=1.5 * cm,
+            title=f"{datos['titulo']} - {datos['periodo']}", author=CLUB_INFO['nombre']
+        )
+        styles = getSampleStyleSheet()
+        titulo = ParagraphStyle('titulo', parent=styles['Title'], textColor=colors.HexColor(COLORS['primary']))
+        seccion = ParagraphStyle('seccion', parent=styles['Heading2'], textColor=colors.HexColor(COLORS['dark']))
+        
+        resumen = datos['resumen']
+        elementos = [
+            Paragraph(f"{CLUB_INFO['nombre']} - {datos['titulo']}", titulo),
+            Paragraph(
+                f"Período: {datos['periodo']} ({fecha_a_texto(datos['desde'])} al {fecha_a_texto(datos['hasta'])})",
+                styles['Normal']
+            ),
+            Spacer(1, 0.5 * cm),
+            Paragraph("Resumen", seccion),
+            self.tabla_reporte(
+                ["Concepto", "Monto"],
+                [
+                    ["Saldo inicial", monto_a_texto(resumen['saldo_inicial'])],
+                    ["Ingresos", monto_a_texto(resumen['ingresos'])],
+                    ["Egresos", monto_a_texto(resumen['egresos'])],
+                    ["Resultado del período", monto_a_texto(resumen['resultado'])],
+                    ["Saldo final", monto_a_texto(resumen['saldo_final'])]
+                ],
+                [10 * cm, 5 * cm],
+                numericas=(1,)
+            )
+        ]
+        
+        for tipo, nombre in (('ingresos', "Ingresos por categoría"), ('egresos', "Egresos por categoría")):
+            total = resumen[tipo] or 1
+            elementos += [
+                Paragraph(nombre, seccion),
+                self.tabla_reporte(
+                    ["Categoría", "Movimientos", "Total", "%"],
+                    [
+                        [fila['categoria'], fila['cantidad'], monto_a_texto(fila['total']),
+                         f"{fila['total'] / total * 100:.1f}%"]
+                        for fila in datos[tipo]
+                    ] or [["Sin movimientos", "", "", ""]],
+                    [7 * cm, 3 * cm, 4 * cm, 2 * cm],
+                    numericas=(1, 2, 3)
+                )
+            ]
+        
+        if datos['evolucion']:
+            elementos.append(KeepTogether([
+                Paragraph("Evolución mensual", seccion),
+                self.grafico_evolucion(datos['evolucion'])
+            ]))
+        
+        elementos += [
+            Paragraph(
+                f"Socios con cuotas adeudadas a {datos['referencia_morosos']} ({len(datos['morosos'])})", seccion
+            ),
+            self.tabla_reporte(
+                ["Socio", "DNI", "Categoría", "Último pago", "Meses"],
+                [
+                    [f"{socio['apellido']}, {socio['nombre']}", socio['dni'], socio['categoria'],
+                     socio['fecha_ultimo_pago_texto'], socio['meses_adeudados'] or '-']
+                    for socio in datos['morosos']
+                ] or [["Sin deudores", "", "", "", ""]],
+                [6 * cm, 2.5 * cm, 2.5 * cm, 3 * cm, 2 * cm],
+                numericas=(4,)
+            ),
+            Spacer(1, 0.5 * cm),
+            Paragraph(
+                f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')} - {CLUB_INFO['direccion']}",
+                styles['Italic']
+            )
+        ]
+        
+        doc.build(elementos)
+        return filename
+    
+    def generar_reporte_atrasos(self, datos: dict, progreso=None) -> str:
+        """
+        Genera el reporte de antigüedad de la deuda en PDF
+        
+        Se dibuja página por página: el detalle de socios se lee del iterador
+        y cada página se arma con las filas que entran, sin juntar el listado
+        completo.
+        
+        Args:
+            datos: Resultado de utils.reportes.datos_reporte_atrasos
+            progreso: Función opcional que recibe la cantidad de socios escritos
+        
+        Returns:
+            Nombre del archivo generado
+        """
+        filename = nombre_unico(f"atrasos_{datos['fecha_corte']}", '.pdf')
+        filepath = self.exports_path / filename
+        
+        ancho_pagina, alto_pagina = A4
+        margen = 2 * cm
+        ancho = ancho_pagina - 2 * margen
+        alto_fila = 0.55 * cm
+        generado = datetime.now().strftime('%d/%m/%Y %H:%M')
+        
+        c = canvas.Canvas(str(filepath), pagesize=A4)
+        c.setTitle(f"{datos['titulo']} al {fecha_a_texto(datos['fecha_corte'])}")
+        c.setAuthor(CLUB_INFO['nombre'])
+        
+        def pie():
+            c.setFont("Helvetica-Oblique", 8)
+            c.setFillColor(colors.grey)
+            c.drawString(margen, 1.2 * cm, f"Generado el {generado} - {CLUB_INFO['direccion']}")
+            c.drawRightString(ancho_pagina - margen, 1.2 * cm, f"Página {c.getPageNumber()}")
+        
+        def seccion(texto: str, y: float) -> float:
+            c.setFont("Helvetica-Bold", 12)
+            c.setFillColor(colors.HexColor(COLORS['dark']))
+            c.drawString(margen, y - 0.5 * cm, texto)
+            return y - 0.8 * cm
+        
+        def dibujar(tabla: Table, y: float) -> float:
+            _, alto = tabla.wrapOn(c, ancho, y)
+            tabla.drawOn(c, margen, y - alto)
+            return y - alto
+        
+        # Encabezado y resumen por categoría y tramo
+        y = alto_pagina - 1.5 * cm
+        c.setFont("Helvetica-Bold", 16)
+        c.setFillColor(colors.HexColor(COLORS['primary']))
+        c.drawCentredString(ancho_pagina / 2, y - 0.6 * cm, f"{CLUB_INFO['nombre']} - {datos['titulo']}")
+        c.setFont("Helvetica", 10)
+        c.setFillColor(colors.black)
+        c.drawCentredString(ancho_pagina / 2, y - 1.2 * cm,
+                            f"Cuotas vencidas al {fecha_a_texto(datos['fecha_corte'])}")
+        y -= 1.8 * cm
+        
+        def celda(acumulado: dict) -> str:
+            if not acumulado['socios']:
+                return "-"
+            return f"{acumulado['socios']} socios\n{monto_a_texto(acumulado['monto'])}"
+        
+        resumen = datos['resumen']
+        filas = [
+            [categoria] + [celda(tramo) for tramo in valores['tramos']] + [celda(valores['total'])]
+            for categoria, valores in resumen['categorias'].items()
+        ] or [["Sin deudores"] + [""] * (len(datos['tramos']) + 1)]
+        filas.append(["Total"] + [celda(tramo) for tramo in resumen['totales']] + [celda(resumen['total'])])
+        
+        y = seccion("Deuda por categoría y antigüedad", y)
+        columnas = len(datos['tramos']) + 1
+        tabla = self.tabla_reporte(
+            ["Categoría"] + datos['tramos'] + ["Total"], filas,
+            [3 * cm] + [(ancho - 3 * cm) / columnas] * columnas,
+            numericas=tuple(range(1, columnas + 1))
+        )
+        tabla.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold')
+        ]))
+        y = dibujar(tabla, y) - 0.6 * cm
+        
+        # Detalle: una tabla por página con las filas que entran
+        titulo_detalle = "Detalle por socio"
+        if datos['categoria']:
+            titulo_detalle += f" - {datos['categoria']}"
+        y = seccion(titulo_detalle, y)
+        encabezados = ["Socio", "DNI", "Categoría", "Desde", "Cuotas", "Días", "Adeudado"]
+        anchos = [5 * cm, 2.2 * cm, 2 * cm, 2.2 * cm, 1.5 * cm, 1.4 * cm, 2.7 * cm]
+        ultimo_tramo = len(datos['tramos']) - 1
+        
+        def volcar(pendientes: list, alertas: list, y: float) -> float:
+            tabla = self.tabla_reporte(encabezados, pendientes, anchos, numericas=(4, 5, 6),
+                                       alto_fila=alto_fila)
+            tabla.setStyle(TableStyle([
+                ('TEXTCOLOR', (5, fila), (5, fila), colors.HexColor(COLORS['danger'])) for fila in alertas
+            ]))
+            return dibujar(tabla, y)
+        
+        pendientes, alertas = [], []
+        capacidad = int((y - 2 * cm) // alto_fila) - 1
+        cantidad = 0
+        for cantidad, socio in enumerate(datos['socios'], start=1):
+            if capacidad < 1:
+                pie()
+                c.showPage()
+                y = alto_pagina - 1.5 * cm
+                capacidad = int((y - 2 * cm) // alto_fila) - 1
+            
+            periodo = socio['primer_periodo']
+            pendientes.append([
+                f"{socio['apellido']}, {socio['nombre']}"[:32],
+                socio['dni'],
+                socio['categoria'],
+                f"{MESES[periodo % 12][:3]} {periodo // 12}",
+                socio['cuotas_impagas'],
+                socio['dias_atraso'],
+                monto_a_texto(socio['monto_adeudado'])
+            ])
+            if socio['tramo'] == ultimo_tramo:
+                alertas.append(len(pendientes))
+            
+            if len(pendientes) == capacidad:
+                y = volcar(pendientes, alertas, y)
+                pendientes, alertas = [], []
+                capacidad = 0
+            
+            if progreso and cantidad % 1000 == 0:
+                progreso(cantidad)
+        
+        if pendientes or not cantidad:
+            volcar(pendientes or [["Sin cuotas vencidas"] + [""] * 6], alertas, y)
+        
+        pie()
         c.save()
-        return filename
\ No newline at end of file
+        return filename
+    
+    def tabla_reporte(self, encabezados: list, filas: list, anchos: list, numericas: tuple = (),
+                      alto_fila: float | None = None) -> Table:
+        """
+        Arma una tabla con el estilo de los reportes
+        
+        Args:
+            encabezados: Títulos de las columnas
+            filas: Filas de datos
+            anchos: Ancho de cada columna
+            numericas: Índices de las columnas que se alinean a la derecha
+            alto_fila: Alto fijo de cada fila (None para ajustarlo al contenido)
+        
+        Returns:
+            Table de platypus
+        """
+        alturas = [alto_fila] * (len(filas) + 1) if alto_fila else None
+        tabla = Table([encabezados, *filas], colWidths=anchos, rowHeights=alturas, repeatRows=1)
+        tabla.setStyle(TableStyle([
+            *[('ALIGN', (col, 1), (col, -1), 'RIGHT') for col in numericas],
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['primary'])),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['background'])]),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['border']))
+        ]))
+        return tabla
+    
+    def grafico_evolucion(self, evolucion: list[dict]) -> Drawing:
+        """
+        Gráfico de barras de ingresos y egresos por mes con la línea de saldo
+        
+        Args:
+            evolucion: Resultado de DatabaseManager.obtener_evolucion_mensual
+        
+        Returns:
+            Drawing listo para agregar al documento
+        """
+        etiquetas = [f"{MESES[int(f['periodo'][5:7]) - 1][:3]} {f['periodo'][2:4]}" for f in evolucion]
+        ingresos = [f['ingresos'] for f in evolucion]
+        egresos = [f['egresos'] for f in evolucion]
+        saldos = [f['saldo'] for f in evolucion]
+        
+        def formato_monto(valor):
+            if max(ingresos + egresos + saldos) >= 1_000_000:
+                return f"${valor / 1_000_000:,.1f}M"
+            return f"${valor / 1000:,.0f}k"
+        
+        dibujo = Drawing(17 * cm, 8 * cm)
+        
+        # Barras con el eje de montos a la izquierda
+        barras = VerticalBarChart()
+        barras.x, barras.y = 1.8 * cm, 1.5 * cm
+        barras.width, barras.height = 13 * cm, 5.5 * cm
+        barras.data = [ingresos, egresos]
+        barras.categoryAxis.categoryNames = etiquetas
+        barras.categoryAxis.labels.fontName = 'Helvetica'
+        barras.categoryAxis.labels.fontSize = 7
+        barras.valueAxis.valueMin = 0
+        barras.valueAxis.labels.fontName = 'Helvetica'
+        barras.valueAxis.labels.fontSize = 7
+        barras.valueAxis.labelTextFormat = formato_monto
+        barras.bars[0].fillColor = colors.HexColor(COLORS['success'])
+        barras.bars[1].fillColor = colors.HexColor(COLORS['danger'])
+        dibujo.add(barras)
+        
+        # Saldo acumulado con su propia escala, a la derecha
+        linea = HorizontalLineChart()
+        linea.x, linea.y = barras.x, barras.y
+        linea.width, linea.height = barras.width, barras.height
+        linea.data = [saldos]
+        linea.joinedLines = 1
+        linea.lines[0].strokeColor = colors.HexColor(COLORS['primary'])
+        linea.lines[0].strokeWidth = 2
+        linea.categoryAxis.visible = False
+        linea.valueAxis.joinAxis = linea.categoryAxis
+        linea.valueAxis.joinAxisMode = 'right'
+        linea.valueAxis.labels.fontName = 'Helvetica'
+        linea.valueAxis.labels.fontSize = 7
+        linea.valueAxis.labels.boxAnchor = 'w'
+        linea.valueAxis.labels.dx = 4
+        linea.valueAxis.labelTextFormat = formato_monto
+        linea.valueAxis.strokeColor = colors.HexColor(COLORS['primary'])
+        dibujo.add(linea)
+        
+        leyenda = Legend()
+        leyenda.x, leyenda.y = 1.8 * cm, 0.4 * cm
+        leyenda.alignment = 'right'
+        leyenda.columnMaximum = 1
+        leyenda.fontName = 'Helvetica'
+        leyenda.fontSize = 8
+        leyenda.colorNamePairs = [
+            (colors.HexColor(COLORS['success']), 'Ingresos'),
+            (colors.HexColor(COLORS['danger']), 'Egresos'),
+            (colors.HexColor(COLORS['primary']), 'Saldo')
+        ]
+        dibujo.add(leyenda)
+        
+        return dibujo
@@ -0,0 +1,126 @@
+"""
+Datos de los reportes financieros
+Arma el contenido de los reportes a partir de consultas agregadas
+"""
+
+import calendar
+from datetime import date
+
+from config.settings import MESES, TRAMOS_ATRASO
+
+
+def datos_reporte_financiero(db_manager, anio: int, mes: int | None = None) -> dict:
+    """
+    Reúne los totales de un estado financiero mensual o anual
+
+    Todas las cifras salen de consultas agregadas (totales por categoría,
+    evolución mensual y deudores), sin traer transacciones individuales.
+
+    Args:
+        db_manager: Gestor de base de datos
+        anio: Año del reporte
+        mes: Mes del reporte (1-12) o None para el reporte anual
+
+    Returns:
+        Diccionario listo para PDFGenerator.generar_reporte_financiero
+    """
+    if mes:
+        desde = date(anio, mes, 1)
+        hasta = date(anio, mes, calendar.monthrange(anio, mes)[1])
+        titulo = "Estado Financiero Mensual"
+        periodo = f"{MESES[mes - 1]} {anio}"
+    else:
+        desde = date(anio, 1, 1)
+        hasta = date(anio, 12, 31)
+        titulo = "Estado Financiero Anual"
+        periodo = f"Año {anio}"
+
+    # La evolución siempre abarca el año hasta el final del período
+    evolucion = db_manager.obtener_evolucion_mensual(f"{anio}-01-01", hasta.isoformat())
+    totales = db_manager.obtener_totales_por_categoria(desde.isoformat(), hasta.isoformat())
+    saldo_inicial = db_manager.obtener_saldo_al(desde.isoformat())
+
+    ingresos = [t for t in totales if t['tipo'] == 'ingreso']
+    egresos = [t for t in totales if t['tipo'] == 'egreso']
+    total_ingresos = sum(t['total'] for t in ingresos)
+    total_egresos = sum(t['total'] for t in egresos)
+
+    # Deudores al último mes del período (o al mes actual si el período no terminó)
+    hoy = date.today()
+    referencia = min(hasta, hoy) if desde <= hoy else hasta
+    morosos = db_manager.obtener_socios_morosos(referencia.year, referencia.month)
+
+    return {
+        'titulo': titulo,
+        'periodo': periodo,
+        'desde': desde.isoformat(),
+        'hasta': hasta.isoformat(),
+        'resumen': {
+            'saldo_inicial': saldo_inicial,
+            'ingresos': total_ingresos,
+            'egresos': total_egresos,
+            'resultado': total_ingresos - total_egresos,
+            'saldo_final': saldo_inicial + total_ingresos - total_egresos
+        },
+        'ingresos': ingresos,
+        'egresos': egresos,
+        'evolucion': evolucion,
+        'morosos': morosos,
+        'referencia_morosos': f"{MESES[referencia.month - 1]} {referencia.year}"
+    }
+
+
+def resumen_atrasos(filas: list[dict]) -> dict:
+    """
+    Ordena el resumen de atrasos como tabla de categorías por tramos
+
+    Args:
+        filas: Resultado de DatabaseManager.obtener_resumen_atrasos
+
+    Returns:
+        Diccionario con 'categorias' (categoría -> lista de tramos con 'socios'
+        y 'monto', más 'total'), 'totales' (lo mismo por tramo para todo el
+        club) y 'total' (socios y monto adeudado en total)
+    """
+    def vacio():
+        return {'socios': 0, 'monto': 0.0}
+
+    categorias = {}
+    totales = [vacio() for _ in TRAMOS_ATRASO]
+    total = vacio()
+    for fila in filas:
+        if fila['categoria'] not in categorias:
+            categorias[fila['categoria']] = {'tramos': [vacio() for _ in TRAMOS_ATRASO], 'total': vacio()}
+        categoria = categorias[fila['categoria']]
+        for acumulado in (categoria['tramos'][fila['tramo']], categoria['total'], totales[fila['tramo']], total):
+            acumulado['socios'] += fila['socios']
+            acumulado['monto'] += fila['monto']
+
+    return {'categorias': categorias, 'totales': totales, 'total': total}
+
+
+def datos_reporte_atrasos(db_manager, fecha_corte: date, categoria: str | None = None) -> dict:
+    """
+    Reúne el resumen y el detalle del reporte de antigüedad de deuda
+
+    El detalle se entrega como iterador: los socios se leen de la base a
+    medida que el PDF o el Excel los escriben, así que se recorre una sola vez.
+
+    Args:
+        db_manager: Gestor de base de datos
+        fecha_corte: Fecha a la que se calcula el atraso
+        categoria: Limita el detalle a una categoría (el resumen es siempre de todo el club)
+
+    Returns:
+        Diccionario listo para PDFGenerator.generar_reporte_atrasos y
+        ExcelExporter.exportar_atrasos
+    """
+    fecha = fecha_corte.isoformat()
+    return {
+        'titulo': "Antigüedad de la Deuda",
+        'fecha_corte': fecha,
+        'categoria': categoria,
+        'tramos': [nombre for _, nombre in TRAMOS_ATRASO],
+        'resumen': resumen_atrasos(db_manager.obtener_resumen_atrasos(fecha)),
+        'socios': db_manager.iterar_atrasos(fecha, categoria)
+    }
@@ -0,0 +1,100 @@
+"""
+Series temporales financieras
+Mantiene en memoria los totales por período y los actualiza de forma incremental
+"""
+
+import math
+
+
+class SerieFinanciera:
+    """Serie de ingresos, egresos y balance acumulado por período"""
+
+    def __init__(self, granularidad: str = 'mes'):
+        """
+        Inicializa la serie vacía
+
+        Args:
+            granularidad: 'mes' o 'semana'
+        """
+        self.granularidad = granularidad
+        self.periodos = {}  # periodo -> [ingresos, egresos]
+        self.cantidad = 0
+        self.ultimo_id = 0
+
+    def reiniciar(self):
+        """Descarta todos los períodos acumulados"""
+        self.periodos = {}
+        self.cantidad = 0
+        self.ultimo_id = 0
+
+    def agregar(self, filas: list[dict]):
+        """
+        Suma a la serie filas ya agregadas por período
+
+        Args:
+            filas: Resultado de DatabaseManager.obtener_series_financieras
+        """
+        for fila in filas:
+            totales = self.periodos.setdefault(fila['periodo'], [0.0, 0.0])
+            totales[0] += fila['ingresos']
+            totales[1] += fila['egresos']
+            self.cantidad += fila['cantidad']
+            self.ultimo_id = max(self.ultimo_id, fila['ultimo_id'])
+
+    def actualizar(self, db_manager) -> bool:
+        """
+        Incorpora solo las transacciones nuevas desde la última actualización
+
+        Si se eliminaron transacciones la serie se reconstruye completa.
+
+        Args:
+            db_manager: Gestor de base de datos
+
+        Returns:
+            True si la serie cambió
+        """
+        estado = db_manager.obtener_estado_transacciones()
+        if estado['cantidad'] == self.cantidad and estado['ultimo_id'] == self.ultimo_id:
+            return False
+
+        nuevas = db_manager.obtener_series_financieras(self.granularidad, self.ultimo_id)
+        if self.cantidad + sum(f['cantidad'] for f in nuevas) != estado['cantidad']:
+            self.reiniciar()
+            nuevas = db_manager.obtener_series_financieras(self.granularidad)
+
+        self.agregar(nuevas)
+        return True
+
+    def puntos(self, max_puntos: int = 24) -> list[dict]:
+        """
+        Devuelve la serie lista para graficar, reducida a max_puntos
+
+        Los períodos consecutivos se agrupan sumando ingresos y egresos;
+        cada grupo se rotula con su primer período y el balance es el
+        acumulado al final del grupo.
+
+        Args:
+            max_puntos: Cantidad máxima de puntos a devolver
+
+        Returns:
+            Lista de diccionarios con 'periodo', 'ingresos', 'egresos' y 'balance'
+        """
+        periodos = sorted(self.periodos)
+        tamanio = max(1, math.ceil(len(periodos) / max_puntos))
+
+        puntos = []
+        balance = 0.0
+        for inicio in range(0, len(periodos), tamanio):
+            grupo = periodos[inicio:inicio + tamanio]
+            ingresos = sum(self.periodos[p][0] for p in grupo)
+            egresos = sum(self.periodos[p][1] for p in grupo)
+            balance += ingresos - egresos
+
+            puntos.append({
+                'periodo': grupo[0],
+                'ingresos': ingresos,
+                'egresos': egresos,
+                'balance': balance
+            })
+
+        return puntos
@@ -0,0 +1,49 @@
+"""
+Instantáneas en disco
+Guarda y recupera pequeños diccionarios JSON (por ejemplo, métricas del dashboard)
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def guardar_snapshot(path: Path, datos: dict):
+    """
+    Guarda un diccionario en formato JSON de forma atómica
+
+    Args:
+        path: Ruta del archivo
+        datos: Datos serializables a JSON
+    """
+    temporal = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, ensure_ascii=False)
+        os.replace(temporal, path)
+    except OSError as e:
+        logger.error(f"Error al guardar snapshot {path}: {e}")
+
+
+def cargar_snapshot(path: Path) -> dict | None:
+    """
+    Lee un snapshot guardado previamente
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        Diccionario con los datos o None si no existe o está dañado
+    """
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Snapshot ilegible {path}: {e}")
+        return None
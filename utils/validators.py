@@ -1,11 +1,40 @@
 """
 Validadores de datos
-Funciones para validar entradas de usuario
+Funciones para validar entradas de usuario, de a un valor o por columnas
 """
 
 import re
+from collections.abc import Callable, Iterable, Sequence
 from datetime import datetime
 
+import pandas as pd
+
+# Patrones compilados una sola vez
+PATRON_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PATRON_SEPARADORES_DNI = re.compile(r'[\s.,-]')
+PATRON_DNI_AGRUPADO = re.compile(r'\d{1,2}([\s.,-])\d{3}\1\d{3}')
+PATRON_SEPARADORES_TELEFONO = re.compile(r'[\s()-]')
+PATRON_ESPACIOS = re.compile(r'\s+')
+PATRON_ESPACIOS_REPETIDOS = re.compile(r'\s{2,}|[^\S ]')
+
+# Códigos de error de los validadores por lote y su descripción
+MENSAJES_ERROR = {
+    'vacio': "dato obligatorio vacío",
+    'no_numerico': "debe contener solo números",
+    'longitud': "cantidad de dígitos incorrecta",
+    'formato': "formato inválido",
+    'fecha_invalida': "fecha inválida",
+    'no_positivo': "debe ser mayor a cero",
+    'fuera_de_rango': "fuera del rango permitido",
+    'duplicado': "repetido o ya registrado",
+    'desconocido': "valor no reconocido",
+    'no_registrado': "no corresponde a ningún socio"
+}
+
+FORMATOS_FECHA = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%d/%m/%y', '%d.%m.%Y')
+
+Columna = pd.Series | Sequence
+
 
 def validar_dni(dni:  str) -> bool:
     """
@@ -20,7 +49,7 @@ def validar_dni(dni:  str) -> bool:
     if not dni:
         return False
     
-    dni_limpio = dni.strip().replace('. ', '').replace(',', '')
+    dni_limpio = PATRON_SEPARADORES_DNI.sub('', dni)
     
     if not dni_limpio.isdigit():
         return False
@@ -31,6 +60,24 @@ def validar_dni(dni:  str) -> bool:
     return True
 
 
+def normalizar_dni(dni) -> int | None:
+    """
+    Convierte un DNI escrito de cualquier forma en el número que se usa como clave
+    
+    Args:
+        dni: DNI con o sin puntos, como texto o número
+    
+    Returns:
+        DNI como entero o None si no es numérico
+    """
+    if dni is None:
+        return None
+    dni_limpio = PATRON_SEPARADORES_DNI.sub('', str(dni))
+    if not dni_limpio.isascii() or not dni_limpio.isdigit():
+        return None
+    return int(dni_limpio)
+
+
 def validar_email(email: str) -> bool:
     """
     Valida formato de email
@@ -44,8 +91,7 @@ def validar_email(email: str) -> bool:
     if not email:
         return True  # Email es opcional
     
-    patron = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(patron, email) is not None
+    return PATRON_EMAIL.match(email) is not None
 
 
 def validar_telefono(telefono: str) -> bool:
@@ -156,4 +202,225 @@ def formatear_monto(monto: float) -> str:
     Returns:
         String formateado
     """
-    return f"${monto:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
\ No newline at end of file
+    return f"${monto:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+
+# ==================== VALIDACIÓN POR LOTES ====================
+# Los validadores por lote reciben columnas completas y resuelven con
+# conversiones de pandas lo que se pueda; las operaciones de texto se aplican
+# solo a los valores que las necesitan.
+
+def como_texto(valores: Columna) -> pd.Series:
+    """
+    Convierte una columna (lista o Series) a texto sin espacios en los extremos
+    
+    Los números enteros leídos de Excel como float pierden el '.0' y los
+    valores vacíos quedan como NA.
+    
+    Args:
+        valores: Columna de valores de cualquier tipo
+    
+    Returns:
+        Series de tipo string
+    """
+    serie = valores if isinstance(valores, pd.Series) else pd.Series(list(valores), dtype=object)
+    flotantes = pd.Series([isinstance(v, float) for v in serie], index=serie.index, dtype=bool)
+    if flotantes.any():
+        serie = serie.astype(object)
+        serie[flotantes] = [int(v) if v.is_integer() else v for v in serie[flotantes]]
+    texto = serie.astype('string').str.strip()
+    return texto.mask(texto == '')
+
+
+def por_valores_unicos(texto: pd.Series, funcion: Callable, tipo: str = 'string') -> pd.Series:
+    """
+    Aplica una función de a un valor sobre cada valor distinto de la columna
+    
+    Para columnas con pocos valores distintos (categorías, meses, medios de
+    pago) evita repetir la misma conversión en cada fila.
+    
+    Args:
+        texto: Columna de texto (NA se mantiene como NA)
+        funcion: Conversión de un valor
+        tipo: Tipo de pandas del resultado
+    
+    Returns:
+        Series con el resultado de la función para cada fila
+    """
+    codigos, unicos = pd.factorize(texto)
+    # El código -1 de los NA toma el último elemento, que queda vacío
+    resultado = pd.array([funcion(valor) for valor in unicos] + [None], dtype=tipo)
+    return pd.Series(resultado[codigos], index=texto.index)
+
+
+def limpiar_textos(valores: Columna) -> pd.Series:
+    """Versión por lote de limpiar_texto (vacíos como NA)"""
+    texto = como_texto(valores)
+    espacios = texto.str.contains(PATRON_ESPACIOS_REPETIDOS).fillna(False).astype(bool)
+    if espacios.any():
+        texto[espacios] = texto[espacios].str.replace(PATRON_ESPACIOS, ' ', regex=True)
+    return texto
+
+
+def errores_vacios(serie: pd.Series) -> pd.Series:
+    """Columna de códigos de error sin errores, con el índice de la serie"""
+    return pd.Series(pd.NA, index=serie.index, dtype='string')
+
+
+def solo_digitos(texto: pd.Series, separadores: re.Pattern) -> tuple[pd.Series, pd.Series]:
+    """
+    Quita los separadores de los valores que no son solo dígitos
+    
+    Returns:
+        Tupla (texto sin separadores, máscara de valores numéricos)
+    """
+    numericos = texto.str.isdigit().fillna(False).astype(bool)
+    con_separadores = texto.notna() & ~numericos
+    if con_separadores.any():
+        texto = texto.copy()
+        texto[con_separadores] = texto[con_separadores].str.replace(separadores, '', regex=True)
+        numericos = texto.str.isdigit().fillna(False).astype(bool)
+    return texto.mask(texto == ''), numericos
+
+
+def validar_dnis(valores: Columna, obligatorio: bool = True) -> tuple[pd.Series, pd.Series]:
+    """
+    Valida y normaliza una columna de DNIs
+    
+    Args:
+        valores: DNIs con o sin puntos, como texto o número
+        obligatorio: Si un DNI vacío es un error
+    
+    Returns:
+        Tupla (DNIs solo con dígitos, códigos de error o NA por fila)
+    """
+    texto = como_texto(valores)
+    dnis, numericos = solo_digitos(texto, PATRON_SEPARADORES_DNI)
+    # Sin ceros a la izquierda, igual que el DNI normalizado de la base
+    dnis[numericos] = dnis[numericos].str.lstrip('0')
+    errores = errores_vacios(dnis)
+    
+    vacios = dnis.isna()
+    if obligatorio:
+        errores[vacios] = 'vacio'
+    errores[~vacios & ~numericos] = 'no_numerico'
+    
+    # Los separadores solo valen entre grupos de miles (12.345.678): '1234567.5'
+    # no es el DNI 12345675
+    con_separadores = numericos & ~texto.str.isdigit().fillna(False).astype(bool)
+    if con_separadores.any():
+        agrupados = texto[con_separadores].str.fullmatch(PATRON_DNI_AGRUPADO).astype(bool)
+        errores[agrupados.index[~agrupados]] = 'formato'
+    
+    errores[numericos & ~dnis.str.len().between(7, 8)] = 'longitud'
+    return dnis, errores
+
+
+def validar_emails(valores: Columna) -> tuple[pd.Series, pd.Series]:
+    """
+    Valida y normaliza una columna de emails (opcionales)
+    
+    Returns:
+        Tupla (emails en minúsculas, códigos de error o NA por fila)
+    """
+    emails = como_texto(valores).str.lower()
+    errores = errores_vacios(emails)
+    validos = emails.str.fullmatch(PATRON_EMAIL).fillna(True).astype(bool)
+    errores[~validos] = 'formato'
+    return emails, errores
+
+
+def validar_telefonos(valores: Columna) -> tuple[pd.Series, pd.Series]:
+    """
+    Valida y normaliza una columna de teléfonos argentinos (opcionales)
+    
+    Returns:
+        Tupla (teléfonos solo con dígitos, códigos de error o NA por fila)
+    """
+    telefonos, numericos = solo_digitos(como_texto(valores), PATRON_SEPARADORES_TELEFONO)
+    errores = errores_vacios(telefonos)
+    
+    errores[telefonos.notna() & ~numericos] = 'no_numerico'
+    errores[numericos & ~telefonos.str.len().between(10, 13)] = 'longitud'
+    return telefonos, errores
+
+
+def validar_fechas(valores: Columna, formatos: Iterable[str] = FORMATOS_FECHA,
+                   obligatorio: bool = False) -> tuple[pd.Series, pd.Series]:
+    """
+    Valida una columna de fechas y las normaliza a formato ISO
+    
+    Acepta fechas de Excel y textos en cualquiera de los formatos dados.
+    Cada fecha distinta se convierte una sola vez y cada formato se prueba a
+    la vez sobre todas las que siguen sin reconocerse.
+    
+    Args:
+        valores: Fechas como date/datetime o texto
+        formatos: Formatos de texto aceptados, en orden de prioridad
+        obligatorio: Si una fecha vacía es un error
+    
+    Returns:
+        Tupla (fechas 'YYYY-MM-DD' o NA, códigos de error o NA por fila)
+    """
+    texto = como_texto(valores)
+    codigos, unicos = pd.factorize(texto)
+    # Las fechas de Excel y los textos con hora se comparan solo por el día
+    unicos = pd.Series(unicos, dtype='string').str.split(' ').str[0]
+    
+    fechas = pd.Series(pd.NaT, index=unicos.index, dtype='datetime64[ns]')
+    for formato in formatos:
+        pendientes = fechas.isna()
+        if not pendientes.any():
+            break
+        fechas[pendientes] = pd.to_datetime(unicos[pendientes], format=formato, errors='coerce')
+    
+    iso = fechas.dt.strftime('%Y-%m-%d').astype('string').array
+    iso = pd.Series(iso.take(codigos, allow_fill=True), index=texto.index)
+    errores = errores_vacios(texto)
+    errores[texto.notna() & iso.isna()] = 'fecha_invalida'
+    if obligatorio:
+        errores[texto.isna()] = 'vacio'
+    return iso, errores
+
+
+def validar_montos(valores: Columna) -> tuple[pd.Series, pd.Series]:
+    """
+    Valida una columna de montos y los convierte a número
+    
+    Acepta números y textos como '$ 5.000,50' o '5000.50'.
+    
+    Returns:
+        Tupla (montos como float o NaN, códigos de error o NA por fila)
+    """
+    texto = como_texto(valores)
+    montos = pd.to_numeric(texto, errors='coerce').astype('float64')
+    
+    # Solo los textos con signo o separadores de miles pasan por la limpieza
+    pendientes = montos.isna() & texto.notna()
+    if pendientes.any():
+        limpios = texto[pendientes].str.replace(r'[$\s]', '', regex=True)
+        con_coma = limpios.str.contains(',', regex=False).fillna(False).astype(bool)
+        limpios[con_coma] = limpios[con_coma].str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+        montos[pendientes] = pd.to_numeric(limpios, errors='coerce').astype('float64')
+    
+    errores = errores_vacios(texto)
+    errores[texto.isna()] = 'vacio'
+    errores[texto.notna() & montos.isna()] = 'formato'
+    errores[montos <= 0] = 'no_positivo'
+    return montos, errores
+
+
+def primer_error(*columnas: tuple[str, pd.Series]) -> pd.Series:
+    """
+    Combina los errores de varias columnas en un motivo por fila
+    
+    Args:
+        columnas: Tuplas (nombre del campo, códigos de error) en orden de prioridad
+    
+    Returns:
+        Series con 'campo: descripción' del primer error de cada fila, o NA
+    """
+    motivo = None
+    for campo, errores in columnas:
+        descripcion = por_valores_unicos(errores, lambda codigo, campo=campo: f"{campo}: {MENSAJES_ERROR[codigo]}")
+        motivo = descripcion if motivo is None else motivo.fillna(descripcion)
+    return motivo